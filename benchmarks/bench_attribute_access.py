@@ -0,0 +1,75 @@
+# Copyright 2008-2025 pydicom authors. See LICENSE file for details.
+"""Benchmarks for Dataset attribute access by element keyword."""
+
+from pydicom import Dataset
+from pydicom.datadict import get_entry, tag_for_keyword
+
+
+class TimeKeywordAccess:
+    """Time tests for element access using keywords."""
+
+    def setup(self):
+        """Setup the benchmark."""
+        self.no_runs = 10000
+
+        self.ds = Dataset()
+        self.ds.PatientID = "12345678"
+        self.ds.PatientName = "CITIZEN^Jan"
+        self.ds.ImagePositionPatient = [0.0, 0.0, 0.0]
+
+    def time_getattr(self):
+        """Time getting element values by keyword."""
+        ds = self.ds
+        for ii in range(self.no_runs):
+            ds.PatientID
+            ds.ImagePositionPatient
+
+    def time_getattr_missing(self):
+        """Time getting non-element attributes."""
+        ds = self.ds
+        for ii in range(self.no_runs):
+            getattr(ds, "StudyInstanceUID", None)
+
+    def time_setattr_existing(self):
+        """Time setting the values of existing elements by keyword."""
+        ds = self.ds
+        for ii in range(self.no_runs):
+            ds.PatientID = "87654321"
+
+    def time_setattr_new(self):
+        """Time adding new elements by keyword."""
+        for ii in range(self.no_runs):
+            ds = Dataset()
+            ds.PatientID = "12345678"
+
+    def time_contains(self):
+        """Time checking element membership by keyword."""
+        ds = self.ds
+        for ii in range(self.no_runs):
+            "PatientID" in ds
+            "StudyInstanceUID" in ds
+
+    def time_delattr(self):
+        """Time deleting and re-adding an element by keyword."""
+        ds = self.ds
+        for ii in range(self.no_runs):
+            del ds.PatientName
+            ds.PatientName = "CITIZEN^Jan"
+
+
+class TimeDictionaryLookup:
+    """Time tests for the data dictionary lookups."""
+
+    def setup(self):
+        """Setup the benchmark."""
+        self.no_runs = 10000
+
+    def time_tag_for_keyword(self):
+        """Time looking up tags by keyword."""
+        for ii in range(self.no_runs):
+            tag_for_keyword("PatientID")
+
+    def time_get_entry_repeater(self):
+        """Time looking up a repeating group element entry."""
+        for ii in range(self.no_runs):
+            get_entry(0x60003000)
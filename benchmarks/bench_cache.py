@@ -0,0 +1,48 @@
+# Copyright 2008-2025 pydicom authors. See LICENSE file for details.
+"""Benchmarks for the dataset cache format."""
+
+import pickle
+
+from pydicom import dcmread
+from pydicom.cache import dumps, loads
+from pydicom.data import get_testdata_file
+
+
+class TimeCache:
+    """Time tests for serializing and restoring datasets."""
+
+    params = ["CT_small.dcm", "rtplan.dcm"]
+    param_names = ["filename"]
+
+    def setup(self, filename):
+        """Setup the benchmark."""
+        self.no_runs = 100
+        self.path = get_testdata_file(filename)
+        self.ds = dcmread(self.path)
+        self.cached = dumps(self.ds)
+        self.pickled = pickle.dumps(self.ds)
+
+    def time_dcmread(self, filename):
+        """Time reading the dataset from file."""
+        for ii in range(self.no_runs):
+            dcmread(self.path)
+
+    def time_dumps(self, filename):
+        """Time serializing the dataset using the cache format."""
+        for ii in range(self.no_runs):
+            dumps(self.ds)
+
+    def time_loads(self, filename):
+        """Time restoring the dataset from the cache format."""
+        for ii in range(self.no_runs):
+            loads(self.cached)
+
+    def time_pickle_dumps(self, filename):
+        """Time serializing the dataset using pickle."""
+        for ii in range(self.no_runs):
+            pickle.dumps(self.ds)
+
+    def time_pickle_loads(self, filename):
+        """Time restoring the dataset using pickle."""
+        for ii in range(self.no_runs):
+            pickle.loads(self.pickled)
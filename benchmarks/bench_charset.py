@@ -0,0 +1,100 @@
+# Copyright 2008-2025 pydicom authors. See LICENSE file for details.
+"""Benchmarks for the charset module."""
+
+from io import BytesIO
+
+from pydicom import dcmread
+from pydicom.charset import (
+    convert_encodings,
+    decode_bytes,
+    decode_elements,
+    TEXT_VR_DELIMS,
+)
+from pydicom.data import get_charset_files
+from pydicom.dataelem import DataElement
+
+
+# Files using ISO 2022 code extensions with multi-byte character sets
+MULTI_BYTE_FILES = [
+    "chrH31.dcm",
+    "chrH32.dcm",
+    "chrI2.dcm",
+    "chrJapMulti.dcm",
+    "chrKoreanMulti.dcm",
+    "chrX1.dcm",
+    "chrX2.dcm",
+]
+
+
+class TimeDecodeMultiByteFiles:
+    """Time tests for decoding datasets using multi-byte character sets."""
+
+    def setup(self):
+        """Setup the benchmark."""
+        self.no_runs = 100
+        self.buffers = []
+        for name in MULTI_BYTE_FILES:
+            with open(get_charset_files(name)[0], "rb") as f:
+                self.buffers.append(f.read())
+
+    def time_read_and_decode(self):
+        """Time reading the datasets and decoding all the elements."""
+        for ii in range(self.no_runs):
+            for buffer in self.buffers:
+                ds = dcmread(BytesIO(buffer))
+                for elem in ds:
+                    pass
+
+
+class TimeDecodeBytes:
+    """Time tests for charset.decode_bytes()."""
+
+    def setup(self):
+        """Setup the benchmark."""
+        self.no_runs = 10000
+        self.encodings = ["iso8859", "iso2022_jp"]
+        # Yamada^Tarou=山田^太郎=やまだ^たろう
+        self.value = (
+            b"Yamada^Tarou=\x1b$B;3ED\x1b(B^\x1b$BB@O:\x1b(B="
+            b"\x1b$B$d$^$@\x1b(B^\x1b$B$?$m$&\x1b(B"
+        )
+
+    def time_decode_code_extensions(self):
+        """Time decoding a repeated value that uses code extensions."""
+        for ii in range(self.no_runs):
+            decode_bytes(self.value, self.encodings, TEXT_VR_DELIMS)
+
+    def time_decode_single_byte(self):
+        """Time decoding a value with no code extensions."""
+        for ii in range(self.no_runs):
+            decode_bytes(b"Buc^J\xe9r\xf4me", ["latin_1"], TEXT_VR_DELIMS)
+
+    def time_convert_encodings(self):
+        """Time converting Specific Character Set values."""
+        for ii in range(self.no_runs):
+            convert_encodings(["ISO 2022 IR 6", "ISO 2022 IR 87"])
+
+    def time_decode_default(self):
+        """Time decoding a value using the default encoding."""
+        for ii in range(self.no_runs):
+            decode_bytes(b"CITIZEN^Jan", ["iso8859"], TEXT_VR_DELIMS)
+
+    def time_decode_utf8(self):
+        """Time decoding a value using UTF-8."""
+        for ii in range(self.no_runs):
+            decode_bytes(b"Buc^J\xc3\xa9r\xc3\xb4me", ["UTF8"], TEXT_VR_DELIMS)
+
+
+class TimeDecodeElements:
+    """Time tests for decoding multiple elements."""
+
+    def setup(self):
+        """Setup the benchmark."""
+        self.no_runs = 100
+        self.values = [b"Buc^J\xe9r\xf4me", b"D\xe9partement"] * 50
+
+    def time_decode_elements(self):
+        """Time decoding 100 elements together."""
+        for ii in range(self.no_runs):
+            elements = [DataElement(0x00081040, "LO", v) for v in self.values]
+            decode_elements(elements, "ISO_IR 100")
@@ -0,0 +1,42 @@
+# Copyright 2008-2025 pydicom authors. See LICENSE file for details.
+"""Benchmarks for the SR concept collections."""
+
+from pydicom.sr.codedict import codes, Collection
+from pydicom.sr.coding import Code
+
+
+class TimeCollectionLookup:
+    """Time tests for looking up codes in the concept collections."""
+
+    def setup(self):
+        """Setup the benchmark."""
+        self.no_runs = 1000
+        self.sct = Collection("SCT")
+        self.cid = Collection("CID4")
+        self.code = Code("24028007", "SCT", "Right")
+
+    def time_getattr_scheme(self):
+        """Time getting codes from a coding scheme collection by keyword."""
+        for ii in range(self.no_runs):
+            self.sct.Transverse
+
+    def time_getattr_cid(self):
+        """Time getting codes from a CID collection by keyword."""
+        for ii in range(self.no_runs):
+            self.cid.ThoracicSpine
+
+    def time_contains_code(self):
+        """Time checking if a code is in a collection."""
+        for ii in range(self.no_runs):
+            self.code in codes.CID244
+            self.code in self.sct
+
+    def time_dir_substring(self):
+        """Time filtering the keywords by substring."""
+        for ii in range(10):
+            self.sct.dir("spine", "aorta")
+
+    def time_dir_prefix(self):
+        """Time filtering the keywords by prefix."""
+        for ii in range(self.no_runs):
+            self.sct.dir("Thoracic", prefix=True)
@@ -0,0 +1,36 @@
+# Copyright 2008-2025 pydicom authors. See LICENSE file for details.
+"""Benchmarks for copying and cloning datasets."""
+
+import copy
+
+from pydicom import dcmread
+from pydicom.data import get_testdata_file
+
+
+class TimeDatasetCopy:
+    """Time tests for making independent copies of a dataset."""
+
+    def setup(self):
+        """Setup the benchmark."""
+        self.no_runs = 100
+        self.ds = dcmread(get_testdata_file("MR_small.dcm"))
+        for elem in self.ds.iterall():
+            pass
+
+    def time_deepcopy(self):
+        """Time deep copying the dataset."""
+        for ii in range(self.no_runs):
+            copy.deepcopy(self.ds)
+
+    def time_clone(self):
+        """Time cloning the dataset."""
+        for ii in range(self.no_runs):
+            self.ds.clone()
+
+    def time_clone_and_modify(self):
+        """Time cloning the dataset and changing some of its elements."""
+        for ii in range(self.no_runs):
+            ds = self.ds.clone()
+            ds.PatientName = "ANON"
+            ds.PatientID = "0000"
+            del ds.PatientBirthDate
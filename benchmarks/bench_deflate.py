@@ -0,0 +1,58 @@
+# Copyright 2008-2025 pydicom authors. See LICENSE file for details.
+"""Benchmarks for reading and writing deflated datasets."""
+
+import os
+import tempfile
+
+from pydicom import dcmread, Dataset
+from pydicom.data import get_testdata_file
+from pydicom.uid import DeflatedExplicitVRLittleEndian
+
+
+class TimeDeflate:
+    """Time tests for datasets using Deflated Explicit VR Little Endian."""
+
+    def setup(self):
+        """Setup the benchmark."""
+        self.no_runs = 5
+        self.tdir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tdir.name, "deflated.dcm")
+        self.dst = os.path.join(self.tdir.name, "out.dcm")
+
+        ds = dcmread(get_testdata_file("CT_small.dcm"))
+        ds.file_meta.TransferSyntaxUID = DeflatedExplicitVRLittleEndian
+        ds.ReferencedImageSequence = []
+        for ii in range(1000):
+            item = Dataset()
+            item.ReferencedSOPClassUID = "1.2.840.10008.5.1.4.1.1.2"
+            item.ReferencedSOPInstanceUID = f"1.2.3.4.{ii}"
+            ds.ReferencedImageSequence.append(item)
+
+        ds.Rows = ds.Columns = 2048
+        ds.PixelData = os.urandom(2048 * 2048 * 2)
+        ds.save_as(self.path)
+        self.ds = dcmread(self.path)
+
+    def teardown(self):
+        """Clean up after the benchmark."""
+        self.tdir.cleanup()
+
+    def time_read(self):
+        """Time reading a deflated dataset."""
+        for ii in range(self.no_runs):
+            dcmread(self.path)
+
+    def time_read_stop_before_pixels(self):
+        """Time reading a deflated dataset up to the pixel data."""
+        for ii in range(self.no_runs):
+            dcmread(self.path, stop_before_pixels=True)
+
+    def time_read_deferred(self):
+        """Time reading a deflated dataset with deferred values."""
+        for ii in range(self.no_runs):
+            dcmread(self.path, defer_size=1024)
+
+    def time_write(self):
+        """Time writing a deflated dataset."""
+        for ii in range(self.no_runs):
+            self.ds.save_as(self.dst)
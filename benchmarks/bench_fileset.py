@@ -0,0 +1,167 @@
+# Copyright 2008-2025 pydicom authors. See LICENSE file for details.
+"""Benchmarks for loading, searching, adding to and writing a File-set."""
+
+import os
+from pathlib import Path
+import shutil
+from tempfile import TemporaryDirectory
+
+from pydicom import dcmread, examples
+from pydicom.fileset import FileSet
+
+from .synthetic import write_dicomdir
+
+
+class TimeFileSetLoad:
+    """Time tests for loading a File-set."""
+
+    def setup(self):
+        """Setup the benchmark."""
+        self.no_runs = 10
+
+        self.path = examples.get_path("dicomdir")
+
+    def time_load_path(self):
+        """Time loading a File-set from the path to its DICOMDIR."""
+        for ii in range(self.no_runs):
+            FileSet(self.path)
+
+    def time_load_dataset(self):
+        """Time loading a File-set from a DICOMDIR dataset."""
+        for ii in range(self.no_runs):
+            FileSet(dcmread(self.path))
+
+
+class TimeFileSetAdd:
+    """Time tests for adding instances to a File-set."""
+
+    def setup(self):
+        """Setup the benchmark."""
+        self.no_runs = 5
+
+        self.paths = [ii.path for ii in FileSet(examples.get_path("dicomdir"))]
+
+    def time_add(self):
+        """Time adding instances one at a time."""
+        for ii in range(self.no_runs):
+            fs = FileSet()
+            for path in self.paths:
+                fs.add(path)
+
+    def time_add_many(self):
+        """Time adding instances using FileSet.add_many()."""
+        for ii in range(self.no_runs):
+            FileSet().add_many(self.paths)
+
+
+class TimeFileSetFind:
+    """Time tests for FileSet.find() and FileSet.find_values()."""
+
+    def setup(self):
+        """Setup the benchmark."""
+        self.no_runs = 100
+
+        self.fs = FileSet(examples.get_path("dicomdir"))
+        self.uids = [ii.SOPInstanceUID for ii in self.fs]
+
+    def time_find_sop_instance(self):
+        """Time finding each instance by SOP Instance UID."""
+        fs = self.fs
+        for ii in range(self.no_runs):
+            for uid in self.uids:
+                fs.find(SOPInstanceUID=uid)
+
+    def time_find_patient(self):
+        """Time finding instances by Patient ID and Study Date."""
+        fs = self.fs
+        for ii in range(self.no_runs):
+            fs.find(PatientID="98890234", StudyDate="20030505")
+
+    def time_find_values(self):
+        """Time finding the unique Study Instance UIDs."""
+        fs = self.fs
+        for ii in range(self.no_runs):
+            fs.find_values("StudyInstanceUID")
+
+
+class TimeFileSetWrite:
+    """Time tests for FileSet.write()."""
+
+    def setup(self):
+        """Setup the benchmark."""
+        self.no_runs = 10
+
+        self.tdir = TemporaryDirectory()
+        self.root = Path(self.tdir.name)
+        src = Path(examples.get_path("dicomdir")).parent
+        for path in src.iterdir():
+            if path.name == "DICOMDIR":
+                shutil.copyfile(path, self.root / path.name)
+            elif path.is_dir():
+                shutil.copytree(path, self.root / path.name)
+
+        # Write once so the File-set uses the pydicom File ID layout
+        FileSet(self.root / "DICOMDIR").write()
+        self.ds = examples.ct
+
+    def teardown(self):
+        """Teardown the benchmark."""
+        self.tdir.cleanup()
+
+    def time_write_add(self):
+        """Time adding and removing an instance."""
+        path = self.root / "DICOMDIR"
+        for ii in range(self.no_runs):
+            fs = FileSet(path)
+            fs.add(self.ds)
+            fs.write()
+            fs.remove(fs.find(SOPInstanceUID=self.ds.SOPInstanceUID))
+            fs.write()
+
+    def time_write_unchanged(self):
+        """Time writing an unchanged File-set."""
+        path = self.root / "DICOMDIR"
+        for ii in range(self.no_runs):
+            FileSet(path).write()
+
+
+class TimeFileSetLarge:
+    """Time and peak memory tests for a File-set with many instances."""
+
+    timeout = 900
+
+    def setup_cache(self):
+        """Write the File-set to the benchmark's cache directory."""
+        return os.fspath(write_dicomdir(os.path.abspath("fileset")))
+
+    def setup(self, path):
+        """Setup the benchmark."""
+        self.fs = FileSet(path)
+        self.uids = [ii.SOPInstanceUID for ii in self.fs][::1000]
+        self.ds = examples.ct
+
+    def time_load(self, path):
+        """Time loading the File-set."""
+        FileSet(path)
+
+    def time_find_sop_instance(self, path):
+        """Time finding instances by SOP Instance UID."""
+        fs = self.fs
+        for uid in self.uids:
+            fs.find(SOPInstanceUID=uid)
+
+    def time_find_values(self, path):
+        """Time finding the unique Series Instance UIDs."""
+        self.fs.find_values("SeriesInstanceUID")
+
+    def time_write_add(self, path):
+        """Time adding and removing an instance."""
+        fs = self.fs
+        fs.add(self.ds)
+        fs.write()
+        fs.remove(fs.find(SOPInstanceUID=self.ds.SOPInstanceUID))
+        fs.write()
+
+    def peakmem_load(self, path):
+        """Peak memory when loading the File-set."""
+        FileSet(path)
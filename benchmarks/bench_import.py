@@ -0,0 +1,32 @@
+# Copyright 2008-2025 pydicom authors. See LICENSE file for details.
+"""Benchmarks for the time taken to import pydicom."""
+
+
+class TimeImport:
+    """Time tests for importing pydicom and its subpackages.
+
+    Each benchmark is run in a new interpreter so the import isn't cached.
+    """
+
+    def timeraw_import_pydicom(self):
+        """Time ``import pydicom``."""
+        return "import pydicom"
+
+    def timeraw_import_sr(self):
+        """Time ``import pydicom.sr``."""
+        return "import pydicom.sr"
+
+    def timeraw_import_codedict(self):
+        """Time ``import pydicom.sr.codedict``."""
+        return "import pydicom.sr.codedict"
+
+    def timeraw_first_code_lookup(self):
+        """Time importing and using the concepts dictionary."""
+        return "from pydicom.sr import codes; codes.SCT.Transverse"
+
+    def timeraw_first_private_lookup(self):
+        """Time importing and using the private data dictionary."""
+        return (
+            "from pydicom.datadict import get_private_entry; "
+            "get_private_entry(0x00090000, 'ACUSON')"
+        )
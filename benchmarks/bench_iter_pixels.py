@@ -0,0 +1,75 @@
+# Copyright 2008-2025 pydicom authors. See LICENSE file for details.
+"""Benchmarks for decoding the pixel data of multi-frame datasets."""
+
+import os
+
+from pydicom import dcmread
+from pydicom.data import get_testdata_file
+from pydicom.pixels import iter_pixels, pixel_array, shared_pixel_array
+
+from .synthetic import write_multiframe
+
+
+class TimeIterPixels:
+    """Time and peak memory tests for iter_pixels() and pixel_array()."""
+
+    timeout = 600
+
+    def setup_cache(self):
+        """Write the dataset to the benchmark's cache directory."""
+        return os.fspath(write_multiframe(os.path.abspath("multiframe.dcm")))
+
+    def setup(self, path):
+        """Setup the benchmark."""
+        nr_frames = dcmread(path, specific_tags=["NumberOfFrames"]).NumberOfFrames
+        self.indices = range(0, nr_frames, 10)
+
+    def time_iter_pixels(self, path):
+        """Time iterating through all the frames."""
+        for arr in iter_pixels(path):
+            pass
+
+    def time_iter_pixels_indices(self, path):
+        """Time iterating through every tenth frame."""
+        for arr in iter_pixels(path, indices=self.indices):
+            pass
+
+    def time_pixel_array(self, path):
+        """Time decoding all the frames."""
+        pixel_array(path)
+
+    def time_pixel_array_index(self, path):
+        """Time decoding a single frame."""
+        pixel_array(path, index=0)
+
+    def peakmem_iter_pixels(self, path):
+        """Peak memory when iterating through all the frames."""
+        for arr in iter_pixels(path):
+            pass
+
+    def peakmem_pixel_array(self, path):
+        """Peak memory when decoding all the frames."""
+        pixel_array(path)
+
+
+class TimeSharedPixelArray:
+    """Time tests for decoding RLE Lossless frames in worker processes."""
+
+    params = [1, 2, 4]
+    param_names = ["max_workers"]
+
+    def setup(self, max_workers):
+        """Setup the benchmark."""
+        self.no_runs = 10
+        self.path = get_testdata_file("rtdose_rle.dcm")
+
+    def time_pixel_array(self, max_workers):
+        """Time decoding all the frames in the main process."""
+        for ii in range(self.no_runs):
+            pixel_array(self.path)
+
+    def time_shared_pixel_array(self, max_workers):
+        """Time decoding all the frames into shared memory."""
+        for ii in range(self.no_runs):
+            with shared_pixel_array(self.path, max_workers=max_workers) as arr:
+                pass
@@ -0,0 +1,120 @@
+# Copyright 2008-2025 pydicom authors. See LICENSE file for details.
+"""Benchmarks for encoding and decoding datasets using the DICOM JSON Model."""
+
+from importlib.util import find_spec
+from io import StringIO
+import json
+
+from pydicom import config, dcmread, jsonrep, Dataset
+from pydicom.data import get_testdata_file
+from pydicom.jsonrep import dump_json
+
+from .synthetic import sequence_dataset
+
+
+class TimeToJson:
+    """Time tests for encoding datasets as JSON."""
+
+    def setup(self):
+        """Setup the benchmark."""
+        self.no_runs = 100
+        self.ds = dcmread(get_testdata_file("CT_small.dcm"))
+        self.ds.decode()
+
+    def time_to_json(self):
+        """Time encoding a dataset using Dataset.to_json()."""
+        for ii in range(self.no_runs):
+            self.ds.to_json()
+
+    def time_to_json_dict_dumps(self):
+        """Time encoding a dataset using a JSON dict and json.dumps()."""
+        for ii in range(self.no_runs):
+            json.dumps(self.ds.to_json_dict(), sort_keys=True)
+
+    def time_dump_json_array(self):
+        """Time streaming multiple datasets as a JSON array."""
+        dump_json((self.ds for ii in range(self.no_runs)), StringIO())
+
+
+class TimeFromJson:
+    """Time tests for decoding datasets from JSON."""
+
+    params = ["json", "orjson"]
+    param_names = ["backend"]
+
+    def setup(self, backend):
+        """Setup the benchmark."""
+        if backend != "json" and find_spec(backend) is None:
+            raise NotImplementedError(f"{backend} is not installed")
+
+        self.original = config.settings.json_backend
+        config.settings.json_backend = backend
+
+        self.no_runs = 10
+        ds = dcmread(get_testdata_file("CT_small.dcm"), stop_before_pixels=True)
+        self.ct = ds.to_json()
+        self.rtplan = dcmread(get_testdata_file("rtplan.dcm")).to_json()
+        # A study metadata document with many instances
+        self.study = f"[{', '.join([self.ct] * 200)}]"
+
+    def teardown(self, backend):
+        """Teardown the benchmark."""
+        config.settings.json_backend = self.original
+
+    def time_from_json_ct(self, backend):
+        """Time decoding a CT dataset."""
+        for ii in range(self.no_runs):
+            Dataset.from_json(self.ct)
+
+    def time_from_json_rtplan(self, backend):
+        """Time decoding a dataset with nested sequences."""
+        for ii in range(self.no_runs):
+            Dataset.from_json(self.rtplan)
+
+    def time_from_json_study(self, backend):
+        """Time decoding a study metadata document."""
+        for ds in jsonrep.loads(self.study):
+            Dataset.from_json(ds)
+
+    def time_from_json_study_deferred(self, backend):
+        """Time decoding a study metadata document and accessing a few
+        elements using deferred conversion.
+        """
+        for obj in jsonrep.loads(self.study):
+            ds = Dataset.from_json(obj, defer_conversion=True)
+            ds.SOPInstanceUID
+            ds.PatientName
+            ds.Rows
+            ds.Columns
+            ds.InstanceNumber
+
+
+class TimeJsonLargeSequence:
+    """Time and peak memory tests for a JSON round trip of a sequence with
+    many items.
+    """
+
+    timeout = 600
+
+    def setup(self):
+        """Setup the benchmark."""
+        self.ds = sequence_dataset()
+        self.json = self.ds.to_json()
+
+    def time_to_json(self):
+        """Time encoding the dataset as JSON."""
+        self.ds.to_json()
+
+    def time_from_json(self):
+        """Time decoding the dataset from JSON."""
+        Dataset.from_json(self.json)
+
+    def time_round_trip(self):
+        """Time encoding the dataset as JSON and decoding it again."""
+        Dataset.from_json(self.ds.to_json())
+
+    def peakmem_round_trip(self):
+        """Peak memory when encoding the dataset as JSON and decoding it
+        again.
+        """
+        Dataset.from_json(self.ds.to_json())
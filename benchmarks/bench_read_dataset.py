@@ -0,0 +1,131 @@
+# Copyright 2008-2025 pydicom authors. See LICENSE file for details.
+"""Benchmarks for reading datasets with dcmread()."""
+
+import os
+
+from pydicom import dcmread
+from pydicom.data import get_testdata_file
+
+from .synthetic import write_multiframe, write_sequence
+
+
+class TimeReadDataset:
+    """Time tests for reading small datasets."""
+
+    def setup(self):
+        """Setup the benchmark."""
+        self.no_runs = 100
+
+        self.ct = get_testdata_file("CT_small.dcm")
+        self.rtplan = get_testdata_file("rtplan.dcm")
+        self.implicit = get_testdata_file("MR_small_implicit.dcm")
+        self.big_endian = get_testdata_file("MR_small_bigendian.dcm")
+
+    def time_read_explicit(self):
+        """Time reading an explicit VR little endian dataset."""
+        for ii in range(self.no_runs):
+            dcmread(self.ct)
+
+    def time_read_implicit(self):
+        """Time reading an implicit VR little endian dataset."""
+        for ii in range(self.no_runs):
+            dcmread(self.implicit)
+
+    def time_read_big_endian(self):
+        """Time reading an explicit VR big endian dataset."""
+        for ii in range(self.no_runs):
+            dcmread(self.big_endian)
+
+    def time_read_sequences(self):
+        """Time reading a dataset with nested sequences."""
+        for ii in range(self.no_runs):
+            dcmread(self.rtplan)
+
+    def time_read_and_convert(self):
+        """Time reading a dataset and converting all its elements."""
+        for ii in range(self.no_runs):
+            for elem in dcmread(self.rtplan).iterall():
+                pass
+
+    def time_read_defer_size(self):
+        """Time reading a dataset using `defer_size`."""
+        for ii in range(self.no_runs):
+            dcmread(self.ct, defer_size=256)
+
+    def time_read_specific_tags(self):
+        """Time reading a dataset using `specific_tags`."""
+        for ii in range(self.no_runs):
+            dcmread(self.ct, specific_tags=["PatientName", "StudyInstanceUID"])
+
+    def time_read_stop_before_pixels(self):
+        """Time reading a dataset using `stop_before_pixels`."""
+        for ii in range(self.no_runs):
+            dcmread(self.ct, stop_before_pixels=True)
+
+
+class TimeReadLargeFile:
+    """Time and peak memory tests for reading a large multi-frame dataset."""
+
+    timeout = 600
+
+    def setup_cache(self):
+        """Write the dataset to the benchmark's cache directory."""
+        return os.fspath(write_multiframe(os.path.abspath("multiframe.dcm")))
+
+    def time_read(self, path):
+        """Time reading the dataset."""
+        dcmread(path)
+
+    def time_read_defer_size(self, path):
+        """Time reading the dataset using `defer_size`."""
+        dcmread(path, defer_size="1 KB")
+
+    def time_read_specific_tags(self, path):
+        """Time reading the dataset using `specific_tags`."""
+        dcmread(path, specific_tags=["PatientName", "NumberOfFrames"])
+
+    def time_read_stop_before_pixels(self, path):
+        """Time reading the dataset using `stop_before_pixels`."""
+        dcmread(path, stop_before_pixels=True)
+
+    def peakmem_read(self, path):
+        """Peak memory when reading the dataset."""
+        dcmread(path)
+
+    def peakmem_read_defer_size(self, path):
+        """Peak memory when reading the dataset using `defer_size`."""
+        dcmread(path, defer_size="1 KB")
+
+
+class TimeReadLargeSequence:
+    """Time and peak memory tests for reading a sequence with many items."""
+
+    timeout = 600
+
+    def setup_cache(self):
+        """Write the dataset to the benchmark's cache directory."""
+        return os.fspath(write_sequence(os.path.abspath("sequence.dcm")))
+
+    def time_read(self, path):
+        """Time reading the dataset."""
+        dcmread(path)
+
+    def time_read_and_convert(self, path):
+        """Time reading the dataset and converting all its elements."""
+        for elem in dcmread(path).iterall():
+            pass
+
+    def time_read_defer_size(self, path):
+        """Time reading the dataset using `defer_size`."""
+        dcmread(path, defer_size="1 KB")
+
+    def peakmem_read(self, path):
+        """Peak memory when reading the dataset."""
+        dcmread(path)
+
+    def peakmem_read_and_convert(self, path):
+        """Peak memory when reading the dataset and converting all its
+        elements.
+        """
+        for elem in dcmread(path).iterall():
+            pass
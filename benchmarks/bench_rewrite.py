@@ -0,0 +1,50 @@
+# Copyright 2008-2025 pydicom authors. See LICENSE file for details.
+"""Benchmarks for writing and patching modified datasets with large Pixel Data."""
+
+import os
+import tempfile
+
+from pydicom import dcmread
+from pydicom.data import get_testdata_file
+from pydicom.filewriter import dcmpatch, dcmrewrite, dcmwrite
+
+
+class TimeRewrite:
+    """Time tests for writing a dataset after changing its header."""
+
+    def setup(self):
+        """Setup the benchmark."""
+        self.no_runs = 5
+        self.tdir = tempfile.TemporaryDirectory()
+        self.src = os.path.join(self.tdir.name, "src.dcm")
+        self.dst = os.path.join(self.tdir.name, "dst.dcm")
+
+        ds = dcmread(get_testdata_file("CT_small.dcm"))
+        ds.Rows = ds.Columns = 4096
+        ds.NumberOfFrames = 4
+        ds.PixelData = b"\x00\x01" * 4096 * 4096 * 4
+        ds.save_as(self.src)
+
+    def teardown(self):
+        """Clean up after the benchmark."""
+        self.tdir.cleanup()
+
+    def time_dcmwrite(self):
+        """Time writing a modified dataset with dcmwrite()."""
+        for ii in range(self.no_runs):
+            ds = dcmread(self.src, defer_size=1024)
+            ds.PatientName = "ANON"
+            dcmwrite(self.dst, ds)
+
+    def time_dcmrewrite(self):
+        """Time writing a modified dataset with dcmrewrite()."""
+        for ii in range(self.no_runs):
+            ds = dcmread(self.src, defer_size=1024)
+            ds.PatientName = "ANON"
+            dcmrewrite(self.dst, ds)
+
+    def time_dcmpatch(self):
+        """Time changing an element value in-place with dcmpatch()."""
+        for ii in range(self.no_runs):
+            ds = dcmread(self.src, defer_size=1024)
+            dcmpatch(ds, {"PatientID": "ANON"})
@@ -0,0 +1,129 @@
+# Copyright 2008-2025 pydicom authors. See LICENSE file for details.
+"""Benchmarks for encoding datasets with write_dataset() and dcmwrite()."""
+
+import os
+import tempfile
+
+from pydicom import dcmread, dcmwrite, Dataset
+from pydicom.data import get_testdata_file
+from pydicom.filebase import DicomBytesIO, DicomFile
+from pydicom.filewriter import write_dataset
+
+from .synthetic import sequence_dataset, write_multiframe
+
+
+class TimeWriteDataset:
+    """Time tests for encoding datasets with many elements."""
+
+    def setup(self):
+        """Setup the benchmark."""
+        self.no_runs = 10
+        self.tdir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tdir.name, "out.dcm")
+
+        self.rtplan = dcmread(get_testdata_file("rtplan.dcm"))
+        for elem in self.rtplan.iterall():
+            pass
+
+        self.ct = dcmread(get_testdata_file("CT_small.dcm"))
+
+        self.seq = Dataset()
+        self.seq.ReferencedImageSequence = []
+        for ii in range(1000):
+            item = Dataset()
+            item.ReferencedSOPClassUID = "1.2.840.10008.5.1.4.1.1.2"
+            item.ReferencedSOPInstanceUID = f"1.2.3.4.{ii}"
+            item.ReferencedFrameNumber = ii
+            item.ImagePositionPatient = [0.0, 0.0, float(ii)]
+            self.seq.ReferencedImageSequence.append(item)
+
+    def teardown(self):
+        """Clean up after the benchmark."""
+        self.tdir.cleanup()
+
+    def _write_buffer(self, ds):
+        fp = DicomBytesIO()
+        fp.is_implicit_VR = False
+        fp.is_little_endian = True
+        write_dataset(fp, ds)
+
+    def _write_file(self, ds):
+        with DicomFile(self.path, "wb") as fp:
+            fp.is_implicit_VR = False
+            fp.is_little_endian = True
+            write_dataset(fp, ds)
+
+    def time_converted_elements_buffer(self):
+        """Time encoding converted elements to a buffer."""
+        for ii in range(self.no_runs):
+            self._write_buffer(self.rtplan)
+
+    def time_converted_elements_file(self):
+        """Time encoding converted elements to a file."""
+        for ii in range(self.no_runs):
+            self._write_file(self.rtplan)
+
+    def time_raw_elements_file(self):
+        """Time writing raw elements to a file."""
+        for ii in range(self.no_runs):
+            self._write_file(self.ct)
+
+    def time_sequence_items_file(self):
+        """Time encoding a sequence with many items to a file."""
+        for ii in range(self.no_runs):
+            self._write_file(self.seq)
+
+
+class TimeWriteLargeSequence:
+    """Time and peak memory tests for writing a sequence with many items."""
+
+    timeout = 600
+
+    def setup(self):
+        """Setup the benchmark."""
+        self.ds = sequence_dataset()
+
+    def time_write_buffer(self):
+        """Time writing the dataset to a buffer."""
+        dcmwrite(DicomBytesIO(), self.ds)
+
+    def peakmem_write_buffer(self):
+        """Peak memory when writing the dataset to a buffer."""
+        dcmwrite(DicomBytesIO(), self.ds)
+
+
+class TimeWriteLargeFile:
+    """Time and peak memory tests for writing a large multi-frame dataset."""
+
+    timeout = 600
+
+    def setup_cache(self):
+        """Write the dataset to the benchmark's cache directory."""
+        return os.fspath(write_multiframe(os.path.abspath("multiframe.dcm")))
+
+    def setup(self, path):
+        """Setup the benchmark."""
+        self.tdir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tdir.name, "out.dcm")
+
+    def teardown(self, path):
+        """Clean up after the benchmark."""
+        self.tdir.cleanup()
+
+    def time_write(self, path):
+        """Time reading and writing the dataset."""
+        dcmwrite(self.path, dcmread(path))
+
+    def time_write_deferred(self, path):
+        """Time reading the dataset using `defer_size` and writing it."""
+        dcmwrite(self.path, dcmread(path, defer_size="1 KB"))
+
+    def peakmem_write(self, path):
+        """Peak memory when reading and writing the dataset."""
+        dcmwrite(self.path, dcmread(path))
+
+    def peakmem_write_deferred(self, path):
+        """Peak memory when reading the dataset using `defer_size` and
+        writing it.
+        """
+        dcmwrite(self.path, dcmread(path, defer_size="1 KB"))
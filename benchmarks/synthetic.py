@@ -0,0 +1,350 @@
+# Copyright 2008-2025 pydicom authors. See LICENSE file for details.
+"""Generators for the large synthetic datasets used by the benchmarks.
+
+The size of the generated data can be changed by setting the
+``PYDICOM_BENCHMARK_SCALE`` environment variable, which is used as a multiplier
+for the default number of frames, sequence items and directory records. With the
+default scale of ``1`` the multi-frame dataset has 1 GiB of pixel data, while
+the sequence and DICOMDIR each have 100,000 items.
+"""
+
+import os
+from pathlib import Path
+from struct import pack
+
+from pydicom import dcmwrite
+from pydicom.dataset import Dataset, FileMetaDataset
+from pydicom.filebase import DicomBytesIO
+from pydicom.filewriter import write_dataset
+from pydicom.uid import (
+    CTImageStorage,
+    ExplicitVRLittleEndian,
+    MediaStorageDirectoryStorage,
+    generate_uid,
+)
+
+
+SCALE = float(os.environ.get("PYDICOM_BENCHMARK_SCALE", 1))
+
+# The maximum length of a native Pixel Data value
+_MAX_LENGTH = 0xFFFFFFFE
+
+# (0004,1200), (0004,1202), (0004,1400) and (0004,1420) using explicit VR
+#   little endian
+_FIRST_OFFSET = b"\x04\x00\x00\x12UL\x04\x00"
+_LAST_OFFSET = b"\x04\x00\x02\x12UL\x04\x00"
+_NEXT_OFFSET = b"\x04\x00\x00\x14UL\x04\x00"
+_LOWER_OFFSET = b"\x04\x00\x20\x14UL\x04\x00"
+
+
+def scaled(value: int) -> int:
+    """Return `value` multiplied by the benchmark scale."""
+    return max(1, int(value * SCALE))
+
+
+def _file_meta(sop_class_uid: str, sop_instance_uid: str) -> FileMetaDataset:
+    """Return file meta information for an explicit VR little endian dataset."""
+    meta = FileMetaDataset()
+    meta.MediaStorageSOPClassUID = sop_class_uid
+    meta.MediaStorageSOPInstanceUID = sop_instance_uid
+    meta.TransferSyntaxUID = ExplicitVRLittleEndian
+
+    return meta
+
+
+def write_multiframe(
+    path: str | os.PathLike,
+    nr_frames: int | None = None,
+    rows: int = 512,
+    columns: int = 512,
+) -> Path:
+    """Write a multi-frame dataset with 16-bit native pixel data.
+
+    The frames are written one at a time so that datasets larger than the
+    available memory can be created.
+
+    Parameters
+    ----------
+    path : str | os.PathLike
+        The path to write the dataset to.
+    nr_frames : int, optional
+        The number of frames, default ``scaled(2048)`` (1 GiB of pixel data).
+        Limited to the maximum that will fit in a native *Pixel Data* value.
+    rows : int, optional
+        The number of rows in each frame, default ``512``.
+    columns : int, optional
+        The number of columns in each frame, default ``512``.
+
+    Returns
+    -------
+    pathlib.Path
+        The path to the written dataset.
+    """
+    frame_length = rows * columns * 2
+    nr_frames = min(nr_frames or scaled(2048), _MAX_LENGTH // frame_length)
+
+    ds = Dataset()
+    ds.SOPClassUID = CTImageStorage
+    ds.SOPInstanceUID = generate_uid()
+    ds.PatientName = "Citizen^Jan"
+    ds.PatientID = "12345678"
+    ds.StudyInstanceUID = generate_uid()
+    ds.SeriesInstanceUID = generate_uid()
+    ds.Modality = "CT"
+    ds.NumberOfFrames = nr_frames
+    ds.SamplesPerPixel = 1
+    ds.PhotometricInterpretation = "MONOCHROME2"
+    ds.Rows = rows
+    ds.Columns = columns
+    ds.BitsAllocated = 16
+    ds.BitsStored = 16
+    ds.HighBit = 15
+    ds.PixelRepresentation = 0
+    ds.file_meta = _file_meta(ds.SOPClassUID, ds.SOPInstanceUID)
+
+    # The first 4 bytes of each frame are the frame index
+    frame = bytearray(bytes(range(256)) * (frame_length // 256))
+    path = Path(path)
+    with open(path, "wb") as f:
+        dcmwrite(f, ds, enforce_file_format=True)
+        # Pixel Data, OW, explicit VR little endian
+        f.write(b"\xe0\x7f\x10\x00OW\x00\x00")
+        f.write(pack("<L", nr_frames * frame_length))
+        for idx in range(nr_frames):
+            frame[:4] = pack("<L", idx)
+            f.write(frame)
+
+    return path
+
+
+def sequence_dataset(nr_items: int | None = None) -> Dataset:
+    """Return a dataset with a sequence containing `nr_items` items.
+
+    Parameters
+    ----------
+    nr_items : int, optional
+        The number of items in the *Referenced Image Sequence*, default
+        ``scaled(100000)``.
+
+    Returns
+    -------
+    pydicom.dataset.Dataset
+        The dataset containing the sequence.
+    """
+    nr_items = nr_items or scaled(100_000)
+    prefix = generate_uid()
+
+    ds = Dataset()
+    ds.SOPClassUID = CTImageStorage
+    ds.SOPInstanceUID = generate_uid()
+    ds.PatientName = "Citizen^Jan"
+    ds.PatientID = "12345678"
+    items = []
+    for idx in range(nr_items):
+        item = Dataset()
+        item.ReferencedSOPClassUID = CTImageStorage
+        item.ReferencedSOPInstanceUID = f"{prefix[:50]}.{idx}"
+        item.ReferencedFrameNumber = idx % 1000 + 1
+        item.ReferencedSegmentNumber = 1
+        items.append(item)
+
+    ds.ReferencedImageSequence = items
+    ds.file_meta = _file_meta(ds.SOPClassUID, ds.SOPInstanceUID)
+
+    return ds
+
+
+def write_sequence(path: str | os.PathLike, nr_items: int | None = None) -> Path:
+    """Write the dataset from :func:`sequence_dataset` to `path`.
+
+    Returns
+    -------
+    pathlib.Path
+        The path to the written dataset.
+    """
+    path = Path(path)
+    dcmwrite(path, sequence_dataset(nr_items), enforce_file_format=True)
+
+    return path
+
+
+def _encode_record(record: Dataset) -> bytearray:
+    """Return the encoded directory record `record` as an item."""
+    fp = DicomBytesIO()
+    fp.is_little_endian = True
+    fp.is_implicit_VR = False
+    write_dataset(fp, record)
+    value = fp.getvalue()
+
+    return bytearray(b"\xfe\xff\x00\xe0" + pack("<L", len(value)) + value)
+
+
+def _record(record_type: str, **kwargs: object) -> Dataset:
+    """Return a directory record with placeholders for the offsets."""
+    record = Dataset()
+    record.OffsetOfTheNextDirectoryRecord = 0
+    record.RecordInUseFlag = 0xFFFF
+    record.OffsetOfReferencedLowerLevelDirectoryEntity = 0
+    record.DirectoryRecordType = record_type
+    for keyword, value in kwargs.items():
+        setattr(record, keyword, value)
+
+    return record
+
+
+def write_dicomdir(
+    root: str | os.PathLike,
+    nr_instances: int | None = None,
+    nr_series_instances: int = 100,
+    nr_study_series: int = 10,
+) -> Path:
+    """Write a File-set with one study per patient.
+
+    The records are encoded directly, rather than by using
+    :class:`~pydicom.fileset.FileSet`, and the referenced files are empty.
+    The File IDs use the same structure as *pydicom* so the instances don't
+    need to be moved when the File-set is written.
+
+    Parameters
+    ----------
+    root : str | os.PathLike
+        The directory to write the File-set to.
+    nr_instances : int, optional
+        The number of IMAGE records, default ``scaled(100000)``.
+    nr_series_instances : int, optional
+        The number of instances in each series, default ``100``.
+    nr_study_series : int, optional
+        The number of series in each study, default ``10``.
+
+    Returns
+    -------
+    pathlib.Path
+        The path to the DICOMDIR file.
+    """
+    nr_instances = nr_instances or scaled(100_000)
+    root = Path(root)
+    prefix = generate_uid()[:50]
+
+    # The encoded records, in the order they're written
+    records: list[bytearray] = []
+    # The index of each record's next sibling and its first child
+    siblings: dict[int, int] = {}
+    children: dict[int, int] = {}
+
+    def add(record: Dataset, previous: int | None, parent: int | None) -> int:
+        index = len(records)
+        records.append(_encode_record(record))
+        if previous is not None:
+            siblings[previous] = index
+        elif parent is not None:
+            children[parent] = index
+
+        return index
+
+    nr_study_instances = nr_series_instances * nr_study_series
+    patients: list[int] = []
+    patient = None
+    instance = 0
+    while instance < nr_instances:
+        pt_idx = instance // nr_study_instances
+        pt_id = f"PT{pt_idx:06d}"
+        patient = add(
+            _record("PATIENT", PatientID=f"{pt_idx:08d}", PatientName="Citizen^Jan"),
+            patient,
+            None,
+        )
+        patients.append(patient)
+        study = add(
+            _record(
+                "STUDY",
+                StudyInstanceUID=f"{prefix}.{pt_idx}",
+                StudyDate="20250101",
+                StudyTime="120000",
+                StudyDescription="Synthetic",
+                AccessionNumber="1",
+                StudyID="1",
+            ),
+            None,
+            patient,
+        )
+        series = None
+        for se_idx in range(nr_study_series):
+            if instance >= nr_instances:
+                break
+
+            se_id = f"SE{se_idx:06d}"
+            series = add(
+                _record(
+                    "SERIES",
+                    Modality="CT",
+                    SeriesInstanceUID=f"{prefix}.{pt_idx}.{se_idx}",
+                    SeriesNumber=se_idx + 1,
+                ),
+                series,
+                study,
+            )
+            image = None
+            for im_idx in range(nr_series_instances):
+                if instance >= nr_instances:
+                    break
+
+                file_id = [pt_id, "ST000000", se_id, f"IM{im_idx:06d}"]
+                image = add(
+                    _record(
+                        "IMAGE",
+                        ReferencedFileID=file_id,
+                        ReferencedSOPClassUIDInFile=CTImageStorage,
+                        ReferencedSOPInstanceUIDInFile=f"{prefix}.{instance}",
+                        ReferencedTransferSyntaxUIDInFile=ExplicitVRLittleEndian,
+                        InstanceNumber=im_idx + 1,
+                    ),
+                    image,
+                    series,
+                )
+                path = root.joinpath(*file_id)
+                path.parent.mkdir(parents=True, exist_ok=True)
+                path.touch()
+                instance += 1
+
+    ds = Dataset()
+    ds.FileSetID = "SYNTHETIC"
+    ds.OffsetOfTheFirstDirectoryRecordOfTheRootDirectoryEntity = 0
+    ds.OffsetOfTheLastDirectoryRecordOfTheRootDirectoryEntity = 0
+    ds.FileSetConsistencyFlag = 0
+    ds.file_meta = _file_meta(MediaStorageDirectoryStorage, generate_uid())
+
+    fp = DicomBytesIO()
+    dcmwrite(fp, ds, enforce_file_format=True)
+    header = bytearray(fp.getvalue())
+    # Directory Record Sequence, undefined length
+    header += b"\x04\x00\x20\x12SQ\x00\x00\xff\xff\xff\xff"
+
+    offsets = []
+    offset = len(header)
+    for record in records:
+        offsets.append(offset)
+        offset += len(record)
+
+    for index, record in enumerate(records):
+        if (sibling := siblings.get(index)) is not None:
+            idx = record.index(_NEXT_OFFSET) + 8
+            record[idx : idx + 4] = pack("<L", offsets[sibling])
+
+        if (child := children.get(index)) is not None:
+            idx = record.index(_LOWER_OFFSET) + 8
+            record[idx : idx + 4] = pack("<L", offsets[child])
+
+    # The offsets to the first and last PATIENT records
+    first = offsets[patients[0]]
+    last = offsets[patients[-1]]
+    for element, offset in ((_FIRST_OFFSET, first), (_LAST_OFFSET, last)):
+        idx = header.index(element) + 8
+        header[idx : idx + 4] = pack("<L", offset)
+
+    with open(root / "DICOMDIR", "wb") as f:
+        f.write(header)
+        f.writelines(records)
+        # Sequence Delimitation Item
+        f.write(b"\xfe\xff\xdd\xe0\x00\x00\x00\x00")
+
+    return root / "DICOMDIR"
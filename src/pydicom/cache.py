@@ -0,0 +1,328 @@
+# Copyright 2008-2025 pydicom authors. See LICENSE file for details.
+"""Compact serialization of datasets for caching.
+
+The cache format stores the encoded value of each element together with the
+encoding state of the dataset, so that a :class:`~pydicom.dataset.Dataset` or
+:class:`~pydicom.dataset.FileDataset` can be recreated without having to parse
+the original DICOM file again. All elements are restored as
+:class:`~pydicom.dataelem.RawDataElement` and are converted when first accessed,
+the same as a dataset returned by :func:`~pydicom.filereader.dcmread`.
+
+.. versionadded:: 3.1
+"""
+
+import copy
+from io import BytesIO
+import json
+from struct import Struct, pack, unpack_from
+from typing import Any, BinaryIO, cast
+
+from pydicom.charset import default_encoding
+from pydicom.dataelem import DataElement, RawDataElement
+from pydicom.dataset import Dataset, FileDataset, FileMetaDataset
+from pydicom.filebase import DicomBytesIO
+from pydicom.filereader import read_deferred_data_element
+from pydicom.filewriter import correct_ambiguous_vr_element, write_data_element
+from pydicom.tag import BaseTag
+from pydicom.valuerep import AMBIGUOUS_VR, EXPLICIT_VR_LENGTH_32
+
+
+_MAGIC = b"PYDCACHE"
+_VERSION = 1
+
+# Element record: tag, flags, VR, length, value tell, length of stored value
+_RECORD = Struct("<IB2sIqI")
+_UINT32 = Struct("<I")
+_UNDEFINED_LENGTH = 0xFFFFFFFF
+
+# Element record flags
+_IMPLICIT_VR = 0x01
+_LITTLE_ENDIAN = 0x02
+_NO_VR = 0x04
+_NO_VALUE = 0x08
+
+# Avoid decoding the VR for every element on load
+_VR_CACHE: dict[bytes, str] = {}
+
+
+def _encode_element(
+    elem: DataElement,
+    ds: Dataset,
+    is_implicit_vr: bool,
+    is_little_endian: bool,
+    encodings: str | list[str],
+) -> RawDataElement:
+    """Return a raw data element for the converted element `elem`."""
+    if elem.VR in AMBIGUOUS_VR:
+        # Don't modify the element in `ds`
+        elem = cast(
+            DataElement,
+            correct_ambiguous_vr_element(copy.copy(elem), ds, is_little_endian),
+        )
+        if elem.VR in AMBIGUOUS_VR:
+            # Unresolved ambiguous VRs can only be written using implicit VR
+            is_implicit_vr = True
+
+    fp = DicomBytesIO()
+    fp.is_implicit_VR = is_implicit_vr
+    fp.is_little_endian = is_little_endian
+    write_data_element(fp, elem, encodings)
+    encoded = fp.getvalue()
+
+    endianness = "<" if is_little_endian else ">"
+    vr: str | None = elem.VR
+    if is_implicit_vr:
+        offset = 8
+        length = unpack_from(f"{endianness}L", encoded, 4)[0]
+    else:
+        vr = encoded[4:6].decode(default_encoding)
+        if vr in EXPLICIT_VR_LENGTH_32:
+            offset = 12
+            length = unpack_from(f"{endianness}L", encoded, 8)[0]
+        else:
+            offset = 8
+            length = unpack_from(f"{endianness}H", encoded, 6)[0]
+
+    # Undefined length values are stored without the sequence delimiter
+    end = -8 if length == _UNDEFINED_LENGTH else len(encoded)
+
+    return RawDataElement(
+        elem.tag,
+        vr,
+        length,
+        encoded[offset:end],
+        0,
+        is_implicit_vr,
+        is_little_endian,
+    )
+
+
+def _dump_elements(ds: Dataset, out: list[bytes]) -> None:
+    """Add the encoded element table and values for `ds` to `out`."""
+    is_implicit_vr, is_little_endian = ds.original_encoding
+    if is_implicit_vr is None:
+        is_implicit_vr = False
+
+    if is_little_endian is None:
+        is_little_endian = True
+
+    # Converted elements are encoded using the same character set that will
+    #   be used to decode them on access
+    encodings = ds.original_character_set or ds._character_set
+
+    # Deferred values are only left for later if the dataset was read from a
+    #   file on disk, otherwise they can't be retrieved after loading
+    buffer = ds.buffer if isinstance(ds, FileDataset) else None
+
+    records = []
+    values = []
+    for tag in sorted(ds._dict):
+        elem = ds._dict[tag]
+        if isinstance(elem, DataElement):
+            elem = _encode_element(
+                elem, ds, is_implicit_vr, is_little_endian, cast(list[str], encodings)
+            )
+        elif buffer is not None and elem.value is None and elem.length:
+            ds = cast(FileDataset, ds)
+            elem = read_deferred_data_element(
+                ds.fileobj_type, cast(BinaryIO, buffer), ds.timestamp, elem
+            )
+
+        flags = 0
+        if elem.is_implicit_VR:
+            flags |= _IMPLICIT_VR
+        if elem.is_little_endian:
+            flags |= _LITTLE_ENDIAN
+        if elem.VR is None:
+            flags |= _NO_VR
+        if elem.value is None:
+            flags |= _NO_VALUE
+
+        value = elem.value or b""
+        records.append(
+            _RECORD.pack(
+                elem.tag,
+                flags,
+                (elem.VR or "").encode(default_encoding),
+                elem.length,
+                elem.value_tell,
+                len(value),
+            )
+        )
+        values.append(value)
+
+    out.append(_UINT32.pack(len(records)))
+    out.extend(records)
+    out.extend(values)
+
+
+def _load_elements(
+    data: memoryview, offset: int
+) -> tuple[dict[BaseTag, DataElement | RawDataElement], int]:
+    """Return the raw elements from the encoded element table in `data`
+    starting at `offset` and the offset to the end of the element values.
+    """
+    nr_elements = _UINT32.unpack_from(data, offset)[0]
+    offset += 4
+    end = offset + nr_elements * _RECORD.size
+    position = end
+
+    vr_cache = _VR_CACHE
+    elements: dict[BaseTag, DataElement | RawDataElement] = {}
+    for tag, flags, vr, length, tell, value_length in _RECORD.iter_unpack(
+        data[offset:end]
+    ):
+        if flags & _NO_VALUE:
+            value = None
+        else:
+            value = data[position : position + value_length].tobytes()
+            position += value_length
+
+        if flags & _NO_VR:
+            elem_vr = None
+        elif (elem_vr := vr_cache.get(vr)) is None:
+            elem_vr = vr_cache.setdefault(vr, vr.decode(default_encoding))
+
+        tag = BaseTag(tag)
+        elements[tag] = RawDataElement(
+            tag,
+            elem_vr,
+            length,
+            value,
+            tell,
+            bool(flags & _IMPLICIT_VR),
+            bool(flags & _LITTLE_ENDIAN),
+        )
+
+    return elements, position
+
+
+def dumps(ds: Dataset) -> bytes:
+    """Return `ds` serialized using the cache format.
+
+    .. versionadded:: 3.1
+
+    The serialized dataset contains:
+
+    * The encoded value of each element. Elements that haven't been converted
+      yet keep the value read from file, while converted elements are encoded
+      using the dataset's original encoding.
+    * The dataset's :attr:`~pydicom.dataset.Dataset.original_encoding` and
+      :attr:`~pydicom.dataset.Dataset.original_character_set`.
+    * For :class:`~pydicom.dataset.FileDataset`, the preamble, file meta
+      information, and filename and modification time of the file the dataset
+      was read from. Elements whose reading was deferred are only retrieved
+      later if the dataset was read from a file on disk, otherwise their values
+      are read and stored.
+
+    Parameters
+    ----------
+    ds : pydicom.dataset.Dataset
+        The :class:`~pydicom.dataset.Dataset` or
+        :class:`~pydicom.dataset.FileDataset` to serialize.
+
+    Returns
+    -------
+    bytes
+        The serialized dataset, use :func:`loads` to restore it.
+    """
+    is_implicit_vr, is_little_endian = ds.original_encoding
+    header: dict[str, Any] = {
+        "file_dataset": isinstance(ds, FileDataset),
+        "is_implicit_vr": is_implicit_vr,
+        "is_little_endian": is_little_endian,
+        "character_set": ds.original_character_set,
+    }
+    preamble = b""
+    if isinstance(ds, FileDataset):
+        filename = ds.filename if isinstance(ds.filename, str) else None
+        header["filename"] = filename
+        header["timestamp"] = ds.timestamp if filename else None
+        header["has_preamble"] = ds.preamble is not None
+        preamble = ds.preamble or b""
+
+    encoded_header = json.dumps(header).encode("utf-8")
+    out = [
+        _MAGIC,
+        pack("<BI", _VERSION, len(encoded_header)),
+        encoded_header,
+        _UINT32.pack(len(preamble)),
+        preamble,
+    ]
+    if isinstance(ds, FileDataset):
+        _dump_elements(ds.file_meta, out)
+
+    _dump_elements(ds, out)
+
+    return b"".join(out)
+
+
+def loads(data: bytes | bytearray | memoryview) -> Dataset:
+    """Return a dataset from data serialized using :func:`dumps`.
+
+    .. versionadded:: 3.1
+
+    Parameters
+    ----------
+    data : bytes | bytearray | memoryview
+        The serialized dataset.
+
+    Returns
+    -------
+    pydicom.dataset.Dataset | pydicom.dataset.FileDataset
+        The restored dataset, with the same class, encoding and character set
+        as the serialized one. All elements are
+        :class:`~pydicom.dataelem.RawDataElement` and are converted when first
+        accessed.
+
+    Raises
+    ------
+    ValueError
+        If `data` isn't in the cache format or uses an unsupported version.
+    """
+    view = memoryview(data)
+    if bytes(view[:8]) != _MAGIC:
+        raise ValueError("The data is not a serialized pydicom dataset")
+
+    version, header_length = unpack_from("<BI", view, 8)
+    if version != _VERSION:
+        raise ValueError(f"Unsupported dataset cache format version '{version}'")
+
+    offset = 13 + header_length
+    header = json.loads(view[13:offset].tobytes())
+    preamble_length = _UINT32.unpack_from(view, offset)[0]
+    offset += 4
+    preamble = view[offset : offset + preamble_length].tobytes()
+    offset += preamble_length
+
+    if header["file_dataset"]:
+        meta_elements, offset = _load_elements(view, offset)
+        file_meta = FileMetaDataset(meta_elements)
+        file_meta.set_original_encoding(False, True, default_encoding)
+
+    elements = _load_elements(view, offset)[0]
+    is_implicit_vr = header["is_implicit_vr"]
+    is_little_endian = header["is_little_endian"]
+    character_set = header["character_set"]
+    if not header["file_dataset"]:
+        ds = Dataset(elements)
+        ds.set_original_encoding(is_implicit_vr, is_little_endian, character_set)
+        return ds
+
+    filename = header["filename"]
+    ds = FileDataset(
+        filename or BytesIO(),
+        elements,
+        preamble=preamble if header["has_preamble"] else None,
+        file_meta=file_meta,
+        is_implicit_VR=is_implicit_vr,
+        is_little_endian=is_little_endian,
+    )
+    if not filename:
+        ds.buffer = None
+        ds.fileobj_type = None
+
+    ds.timestamp = header["timestamp"]
+    ds.set_original_encoding(is_implicit_vr, is_little_endian, character_set)
+
+    return ds
@@ -2,12 +2,13 @@
 """Handle alternate character sets for character strings."""
 
 import codecs
+from functools import lru_cache
 import re
 from typing import (
     TYPE_CHECKING,
     cast,
 )
-from collections.abc import MutableSequence, Sequence
+from collections.abc import Callable, Iterable, MutableSequence, Sequence
 
 from pydicom import config
 from pydicom.misc import warn_and_log
@@ -94,6 +95,15 @@ CODES_TO_ENCODINGS = {
 ENCODINGS_TO_CODES = {v: k for k, v in CODES_TO_ENCODINGS.items()}
 ENCODINGS_TO_CODES["shift_jis"] = ESC + b")I"
 
+# The maximum number of entries in the converted encodings cache
+_ENCODINGS_CACHE_SIZE = 256
+# Cache of {DICOM encodings: Python encodings} for values that converted
+#   without any corrections or warnings
+_converted_encodings: dict[tuple[str, ...], list[str]] = {}
+
+# Values up to this length using code extensions have their decoded value cached
+_MAX_CACHED_VALUE_LENGTH = 256
+
 # Multi-byte character sets except Korean are handled by Python.
 # To decode them, the escape sequence shall be preserved in the input byte
 # string, and will be removed during decoding by Python.
@@ -295,6 +305,32 @@ custom_encoders = {
 }
 
 
+# Python encodings that are decoded natively by bytes.decode() without a
+#   codec lookup
+_NATIVE_ENCODINGS = frozenset(("UTF8", "utf_8", "utf-8", "latin_1", "ascii"))
+
+
+@lru_cache(maxsize=64)
+def _python_decoder(encoding: str) -> Callable[[bytes], tuple[str, int]]:
+    """Return the decoding function for the Python codec `encoding`.
+
+    Only a few codecs are handled natively by :meth:`bytes.decode`, for the
+    others (including the default encoding) the codec lookup takes
+    several times longer than decoding a typical element value.
+
+    Raises
+    ------
+    LookupError
+        If `encoding` is not a known Python codec.
+    """
+    return codecs.lookup(encoding).decode
+
+
+def _decode_default(value: bytes) -> str:
+    """Return `value` decoded using the default encoding."""
+    return _python_decoder(default_encoding)(value)[0]
+
+
 def decode_bytes(value: bytes, encodings: Sequence[str], delimiters: set[int]) -> str:
     """Decode an encoded byte `value` into a unicode string using `encodings`.
 
@@ -329,11 +365,15 @@ def decode_bytes(value: bytes, encodings: Sequence[str], delimiters: set[int]) -
         If :attr:`~pydicom.config.settings.reading_validation_mode`
         is ``RAISE`` and the given encodings are invalid.
     """
-    # shortcut for the common case - no escape sequences present
+    # shortcut for the common case - no escape sequences present, so the
+    # value can be decoded with a single call to the codec
     if ESC not in value:
         first_encoding = encodings[0]
         try:
-            return value.decode(first_encoding)
+            if first_encoding in _NATIVE_ENCODINGS:
+                return value.decode(first_encoding)
+
+            return _python_decoder(first_encoding)(value)[0]
         except LookupError:
             if config.settings.reading_validation_mode == config.RAISE:
                 raise
@@ -355,6 +395,33 @@ def decode_bytes(value: bytes, encodings: Sequence[str], delimiters: set[int]) -
             )
             return value.decode(first_encoding, errors="replace")
 
+    # Values using code extensions are comparatively expensive to decode and
+    # short values (names, institutions, etc) are often repeated, so cache them
+    if len(value) <= _MAX_CACHED_VALUE_LENGTH:
+        try:
+            return _decode_escaped_value(value, tuple(encodings), frozenset(delimiters))
+        except (UnicodeError, ValueError):
+            # Decoding failed, use the uncached path to warn or raise
+            pass
+
+    return _decode_with_code_extensions(value, encodings, delimiters)
+
+
+decode_string = decode_bytes
+
+
+def _decode_with_code_extensions(
+    value: bytes,
+    encodings: Sequence[str],
+    delimiters: set[int] | frozenset[int],
+    strict: bool = False,
+) -> str:
+    """Decode a byte string `value` that contains escape sequences.
+
+    See :func:`decode_bytes` for the parameter descriptions, if `strict` is
+    ``True`` then any decoding errors will be raised regardless of the
+    value of :attr:`~pydicom.config.settings.reading_validation_mode`.
+    """
     # Each part of the value that starts with an escape sequence is decoded
     # separately. If it starts with an escape sequence, the
     # corresponding encoding is used, otherwise (e.g. the first part if it
@@ -370,15 +437,30 @@ def decode_bytes(value: bytes, encodings: Sequence[str], delimiters: set[int]) -
     # decode each byte string fragment with it's corresponding encoding
     # and join them all together
     return "".join(
-        [_decode_fragment(fragment, encodings, delimiters) for fragment in fragments]
+        [
+            _decode_fragment(fragment, encodings, delimiters, strict)
+            for fragment in fragments
+        ]
     )
 
 
-decode_string = decode_bytes
+@lru_cache(maxsize=1024)
+def _decode_escaped_value(
+    value: bytes, encodings: tuple[str, ...], delimiters: frozenset[int]
+) -> str:
+    """Return the decoded `value`, caching the result.
+
+    Decoding is always strict so that only successfully decoded values are
+    cached, errors are raised rather than handled.
+    """
+    return _decode_with_code_extensions(value, encodings, delimiters, strict=True)
 
 
 def _decode_fragment(
-    byte_str: bytes, encodings: Sequence[str], delimiters: set[int]
+    byte_str: bytes,
+    encodings: Sequence[str],
+    delimiters: set[int] | frozenset[int],
+    strict: bool = False,
 ) -> str:
     """Decode a byte string encoded with a single encoding.
 
@@ -398,6 +480,10 @@ def _decode_fragment(
     delimiters: set of int
         A set of characters or character codes, each of which resets the
         encoding in `byte_str`.
+    strict : bool, optional
+        If ``True`` then raise an exception if `byte_str` cannot be decoded
+        regardless of the value of
+        :attr:`~pydicom.config.settings.reading_validation_mode`.
 
     Returns
     -------
@@ -425,11 +511,11 @@ def _decode_fragment(
     """
     try:
         if byte_str.startswith(ESC):
-            return _decode_escaped_fragment(byte_str, encodings, delimiters)
+            return _decode_escaped_fragment(byte_str, encodings, delimiters, strict)
         # no escape sequence - use first encoding
         return byte_str.decode(encodings[0])
     except UnicodeError:
-        if config.settings.reading_validation_mode == config.RAISE:
+        if strict or config.settings.reading_validation_mode == config.RAISE:
             raise
         warn_and_log(
             "Failed to decode byte string with encodings: "
@@ -440,7 +526,10 @@ def _decode_fragment(
 
 
 def _decode_escaped_fragment(
-    byte_str: bytes, encodings: Sequence[str], delimiters: set[int]
+    byte_str: bytes,
+    encodings: Sequence[str],
+    delimiters: set[int] | frozenset[int],
+    strict: bool = False,
 ) -> str:
     """Decodes a byte string starting with an escape sequence.
 
@@ -475,7 +564,7 @@ def _decode_escaped_fragment(
 
     # unknown escape code - use first encoding
     msg = "Found unknown escape sequence in encoded string value"
-    if config.settings.reading_validation_mode == config.RAISE:
+    if strict or config.settings.reading_validation_mode == config.RAISE:
         raise ValueError(msg)
 
     warn_and_log(f"{msg} - using encoding {encodings[0]}")
@@ -690,16 +779,32 @@ def convert_encodings(encodings: None | str | MutableSequence[str]) -> list[str]
         if not encodings[0]:
             encodings[0] = "ISO_IR 6"
 
+    key = tuple(encodings)
+    if key in _converted_encodings:
+        return _converted_encodings[key][:]
+
     py_encodings = []
+    is_valid = True
     for encoding in encodings:
         try:
             py_encodings.append(python_encoding[encoding])
         except KeyError:
+            is_valid = False
             py_encodings.append(_python_encoding_for_corrected_encoding(encoding))
 
     if len(encodings) > 1:
+        is_valid = is_valid and not any(
+            encoding in STAND_ALONE_ENCODINGS for encoding in encodings
+        )
         py_encodings = _handle_illegal_standalone_encodings(encodings, py_encodings)
 
+    # Only cache conversions that don't depend on the validation mode
+    if is_valid:
+        if len(_converted_encodings) >= _ENCODINGS_CACHE_SIZE:
+            _converted_encodings.clear()
+
+        _converted_encodings[key] = py_encodings[:]
+
     return py_encodings
 
 
@@ -812,8 +917,38 @@ def decode_element(
     if not dicom_character_set:
         dicom_character_set = ["ISO_IR 6"]
 
-    encodings = convert_encodings(dicom_character_set)
+    _decode_element(elem, convert_encodings(dicom_character_set))
+
+
+def decode_elements(
+    elements: Iterable["DataElement"], dicom_character_set: str | list[str] | None
+) -> None:
+    """Apply the DICOM character encoding to multiple data elements.
+
+    .. versionadded:: 3.1
+
+    Equivalent to calling :func:`decode_element` for each element, except
+    that `dicom_character_set` is only converted to the Python encodings once.
+
+    Parameters
+    ----------
+    elements : Iterable[dataelem.DataElement]
+        The :class:`DataElement<pydicom.dataelem.DataElement>` instances
+        to be decoded. Elements that are empty or that don't use a text VR
+        affected by the character set are ignored.
+    dicom_character_set : str or list of str or None
+        The value of (0008,0005) *Specific Character Set*, which may be a
+        single value, a multiple value (code extension), or may also be ``''``
+        or ``None``, in which case ``'ISO_IR 6'`` will be used.
+    """
+    encodings = convert_encodings(dicom_character_set or ["ISO_IR 6"])
+    for elem in elements:
+        if not elem.is_empty:
+            _decode_element(elem, encodings)
+
 
+def _decode_element(elem: "DataElement", encodings: list[str]) -> None:
+    """Decode the value of `elem` using the Python `encodings`."""
     # decode the string value to unicode
     # PN is special case as may have 3 components with different chr sets
     if elem.VR == VR.PN:
@@ -0,0 +1,252 @@
+# Copyright 2008-2025 pydicom authors. See LICENSE file for details.
+"""Pydicom command line interface program for `pydicom extract`"""
+
+import argparse
+from base64 import b64encode
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor
+import csv
+import glob
+import json
+import os
+from pathlib import Path
+import re
+import sys
+from typing import Any, cast
+
+from pydicom import dcmread
+from pydicom.cli.main import (
+    EXTRA_ALLOWED_IDENTIFIERS,
+    eval_element,
+    re_file_spec_object,
+    re_kywd_or_item,
+    re_match_tag,
+)
+from pydicom.datadict import tag_for_keyword
+from pydicom.dataset import Dataset
+from pydicom.multival import MultiValue
+from pydicom.sequence import Sequence
+
+
+def add_subparser(subparsers: argparse._SubParsersAction) -> None:
+    subparser = subparsers.add_parser(
+        "extract",
+        description=(
+            "Extract data element values from many DICOM files. Arguments can "
+            "also be read from a file, one per line, using @filename"
+        ),
+        fromfile_prefix_chars="@",
+    )
+    subparser.add_argument(
+        "files",
+        nargs="+",
+        help=(
+            "The DICOM files to extract the values from, as paths, directories "
+            "(searched recursively) or glob patterns such as 'data/**/*.dcm'"
+        ),
+    )
+    subparser.add_argument(
+        "-e",
+        "--element",
+        action="append",
+        required=True,
+        type=element_parser,
+        dest="elements",
+        metavar="ELEMENT",
+        help=(
+            "The data element to extract, can be used multiple times. Uses the "
+            "same format as the `element` part of `pydicom show`: "
+            "StudyDate, (0001,0001), BeamSequence[0].BeamNumber"
+        ),
+    )
+    subparser.add_argument(
+        "-f",
+        "--format",
+        choices=["csv", "json"],
+        default="csv",
+        help="Write the values as CSV (default) or as JSON lines",
+    )
+    subparser.add_argument(
+        "-j",
+        "--jobs",
+        type=positive_int,
+        default=None,
+        help=(
+            "The number of worker processes to use when reading the files, "
+            "default is the number of CPUs"
+        ),
+    )
+
+    subparser.set_defaults(func=do_command)
+
+
+# The class properties that can be used in an element expression
+_ALLOWED_IDENTIFIERS = {
+    v for values in EXTRA_ALLOWED_IDENTIFIERS.values() for v in values
+}
+
+
+def element_parser(element: str) -> str:
+    """Return `element` if it's a valid data element expression.
+
+    Note: this is used as an argparse 'type' for adding parsing arguments.
+    """
+    if not re_file_spec_object.match(element):
+        raise argparse.ArgumentTypeError(
+            f"Component '{element}' is not valid syntax for a "
+            "data element, sequence, or sequence item"
+        )
+
+    # Check the identifiers here, otherwise a misspelled keyword would give
+    #   an empty value for every file
+    for component in element.split("."):
+        identifier = cast(re.Match, re.match(re_kywd_or_item, component)).group(1)
+        if (
+            tag_for_keyword(identifier) is None
+            and not re.match(re_match_tag, identifier)
+            and identifier not in _ALLOWED_IDENTIFIERS
+        ):
+            raise argparse.ArgumentTypeError(
+                f"'{identifier}' is not a known DICOM keyword, "
+                "tag or allowed class property"
+            )
+
+    return element
+
+
+def positive_int(value: str) -> int:
+    """Return `value` as an :class:`int` if it's greater than 0.
+
+    Note: this is used as an argparse 'type' for adding parsing arguments.
+    """
+    try:
+        number = int(value)
+    except ValueError:
+        number = 0
+
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"'{value}' is not a positive integer")
+
+    return number
+
+
+def element_tag(element: str) -> int | None:
+    """Return the tag of the top-level element used by the `element`
+    expression, or ``None`` if it doesn't use a top-level element.
+    """
+    identifier = re.split(r"[.\[]", element, maxsplit=1)[0]
+    if match := re.match(re_match_tag, identifier):
+        return int("".join(match.groups()), 16)
+
+    return tag_for_keyword(identifier)
+
+
+def iter_files(filespecs: Iterable[str]) -> Iterator[str]:
+    """Yield the paths to the files matching `filespecs`."""
+    for filespec in filespecs:
+        if os.path.isdir(filespec):
+            paths = [os.fspath(p) for p in sorted(Path(filespec).rglob("*"))]
+        elif glob.has_magic(filespec):
+            paths = sorted(glob.glob(filespec, recursive=True))
+        else:
+            yield filespec
+            continue
+
+        yield from (p for p in paths if os.path.isfile(p))
+
+
+def extract_values(path: str, elements: list[str]) -> list[Any]:
+    """Return the values for `elements` from the DICOM file at `path`.
+
+    Only the top-level data elements used by `elements` are read from the
+    file. The value is ``None`` for any elements not in the dataset, or
+    sequence items that don't exist.
+    """
+    tags = [tag for elem in elements if (tag := element_tag(elem)) is not None]
+    # Not forced, so that non-DICOM files are reported as errors rather than
+    #   giving an empty row
+    ds = dcmread(path, specific_tags=tags)
+
+    values = []
+    for element in elements:
+        try:
+            values.append(eval_element(ds, element))
+        except argparse.ArgumentTypeError:
+            values.append(None)
+
+    return values
+
+
+def _extract(item: tuple[str, list[str]]) -> tuple[list[Any] | None, str]:
+    """Return the values from :func:`extract_values` formatted for output,
+    or ``None`` and an error message if the file can't be read.
+    """
+    path, elements = item
+    try:
+        values = extract_values(path, elements)
+    except Exception as exc:
+        return None, f"Error reading '{path}': {exc}"
+
+    return [json_value(value) for value in values], ""
+
+
+def json_value(value: Any) -> Any:
+    """Return `value` as a type that can be serialized as JSON."""
+    if value is None or isinstance(value, bool | int | float | str):
+        return value
+
+    if isinstance(value, bytes):
+        return b64encode(value).decode("ascii")
+
+    if isinstance(value, Dataset):
+        return value.to_json_dict()
+
+    if isinstance(value, MultiValue | Sequence | list | tuple):
+        return [json_value(v) for v in value]
+
+    return str(value)
+
+
+def csv_value(value: Any) -> str:
+    """Return a formatted `value` as :class:`str` for CSV output."""
+    if value is None:
+        return ""
+
+    if isinstance(value, list):
+        # The DICOM multi-value delimiter
+        return "\\".join(csv_value(v) for v in value)
+
+    if isinstance(value, dict):
+        return json.dumps(value)
+
+    return str(value)
+
+
+def do_command(args: argparse.Namespace) -> None:
+    elements: list[str] = args.elements
+    paths = list(iter_files(args.files))
+    items = [(path, elements) for path in paths]
+
+    if args.format == "csv":
+        writer = csv.writer(sys.stdout, lineterminator="\n")
+        writer.writerow(["filename", *elements])
+
+    # The results are written in the same order as `paths` as they're returned
+    pool = None
+    if args.jobs == 1 or len(items) < 2:
+        results: Iterator[tuple[list[Any] | None, str]] = map(_extract, items)
+    else:
+        pool = ProcessPoolExecutor(args.jobs)
+        results = pool.map(_extract, items, chunksize=16)
+
+    try:
+        for path, (values, error) in zip(paths, results):
+            if values is None:
+                print(error, file=sys.stderr)
+            elif args.format == "csv":
+                writer.writerow([path, *[csv_value(v) for v in values]])
+            else:
+                print(json.dumps({"filename": path, **dict(zip(elements, values))}))
+    finally:
+        if pool is not None:
+            pool.shutdown(cancel_futures=True)
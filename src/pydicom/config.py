@@ -3,6 +3,7 @@
 
 # doc strings following items are picked up by sphinx for documentation
 
+from importlib.util import find_spec
 import logging
 import os
 from contextlib import contextmanager
@@ -254,6 +255,9 @@ class Settings:
         # Chunk size to use when reading from buffered DataElement values
         self._buffered_read_size = 8192
 
+        # The JSON parser to use when decoding the DICOM JSON Model
+        self._json_backend = "auto"
+
     @property
     def buffered_read_size(self) -> int:
         """Get or set the chunk size when reading from buffered
@@ -320,6 +324,42 @@ class Settings:
     def infer_sq_for_un_vr(self, value: bool) -> None:
         self._infer_sq_for_un_vr = value
 
+    @property
+    def json_backend(self) -> str:
+        """Get or set the parser used when decoding the DICOM JSON Model with
+        :meth:`Dataset.from_json()<pydicom.dataset.Dataset.from_json>`.
+
+        .. versionadded:: 3.1
+
+        Parameters
+        ----------
+        backend : str
+            One of:
+
+            * ``"auto"`` (default): use the fastest available parser
+            * ``"json"``: use the standard library's :mod:`json` module
+            * ``"orjson"``: use `orjson <https://github.com/ijl/orjson>`_
+            * ``"simdjson"``: use `pysimdjson
+              <https://github.com/TkTech/pysimdjson>`_
+        """
+        return self._json_backend
+
+    @json_backend.setter
+    def json_backend(self, backend: str) -> None:
+        if backend not in ("auto", "json", "orjson", "simdjson"):
+            raise ValueError(
+                f"Invalid JSON backend '{backend}', must be 'auto', 'json', "
+                "'orjson' or 'simdjson'"
+            )
+
+        if backend not in ("auto", "json") and find_spec(backend) is None:
+            raise ImportError(
+                f"The '{backend}' JSON backend is not available as the package "
+                "is not installed"
+            )
+
+        self._json_backend = backend
+
 
 settings = Settings()
 """The global configuration object of type :class:`Settings` to access some
@@ -1,11 +1,14 @@
 # Copyright 2008-2018 pydicom authors. See LICENSE file for details.
 """Access dicom dictionary information"""
 
+from functools import lru_cache
+import sys
+from typing import Any
+
 # the actual dict of {tag: (VR, VM, name, is_retired, keyword), ...}
 # those with tags like "(50xx,0005)"
 from pydicom._dicom_dict import DicomDictionary, RepeatersDictionary
 from pydicom.misc import warn_and_log
-from pydicom._private_dict import private_dictionaries
 from pydicom.tag import Tag, BaseTag, TagType
 
 
@@ -22,6 +25,19 @@ for mask_x in RepeatersDictionary:
     masks[mask_x] = (mask1, mask2)
 
 
+PrivateDictionariesType = dict[str, dict[str, tuple[str, str, str, str]]]
+
+
+def _private_dictionaries() -> PrivateDictionariesType:
+    """Return the private data dictionaries, importing them on first use"""
+    # The private dictionary is large and rarely needed, so defer the import
+    #   until a private element is looked up
+    from pydicom._private_dict import private_dictionaries
+
+    return private_dictionaries
+
+
+@lru_cache(maxsize=4096)
 def mask_match(tag: int) -> str | None:
     """Return the repeaters tag mask for `tag`.
 
@@ -146,6 +162,9 @@ def add_dict_entries(
 
     # Update the reverse mapping from name to tag
     keyword_dict.update({val[4]: tag for tag, val in new_entries_dict.items()})
+    _keyword_tags.update(
+        {sys.intern(val[4]): BaseTag(tag) for tag, val in new_entries_dict.items()}
+    )
 
 
 def add_private_dict_entry(
@@ -228,7 +247,7 @@ def add_private_dict_entries(
         f"{tag >> 16:04X}xx{tag & 0xff:02X}": value
         for tag, value in new_entries_dict.items()
     }
-    private_dictionaries.setdefault(private_creator, {}).update(new_entries)
+    _private_dictionaries().setdefault(private_creator, {}).update(new_entries)
 
 
 def get_entry(tag: TagType) -> tuple[str, str, str, str, str]:
@@ -457,6 +476,12 @@ def keyword_for_tag(tag: TagType) -> str:
 # Provide for the 'reverse' lookup. Given the keyword, what is the tag?
 keyword_dict: dict[str, int] = {dictionary_keyword(tag): tag for tag in DicomDictionary}
 
+# Interned keywords mapped to precomputed tags, used by the Dataset attribute
+#   access hot path to avoid calling Tag() on every lookup
+_keyword_tags: dict[str, BaseTag] = {
+    sys.intern(kw): BaseTag(tag) for kw, tag in keyword_dict.items()
+}
+
 
 def tag_for_keyword(keyword: str) -> int | None:
     """Return the tag of the element corresponding to `keyword`.
@@ -477,6 +502,12 @@ def tag_for_keyword(keyword: str) -> int | None:
     return keyword_dict.get(keyword)
 
 
+def _tag_for_keyword_fast(keyword: str) -> BaseTag | None:
+    """Return the tag corresponding to `keyword` as a :class:`BaseTag`"""
+    # Faster implementation of `tag_for_keyword` that skips the Tag() conversion
+    return _keyword_tags.get(keyword)
+
+
 def repeater_has_tag(tag: int) -> bool:
     """Return ``True`` if `tag` is in the DICOM repeaters data dictionary.
 
@@ -495,6 +526,7 @@ def repeater_has_tag(tag: int) -> bool:
 
 
 REPEATER_KEYWORDS = [val[4] for val in RepeatersDictionary.values()]
+_REPEATER_KEYWORDS = frozenset(REPEATER_KEYWORDS)
 
 
 def repeater_has_keyword(keyword: str) -> bool:
@@ -511,7 +543,7 @@ def repeater_has_keyword(keyword: str) -> bool:
         ``True`` if the keyword corresponding to an element present in the
         official DICOM repeaters data dictionary, ``False`` otherwise.
     """
-    return keyword in REPEATER_KEYWORDS
+    return keyword in _REPEATER_KEYWORDS
 
 
 # PRIVATE DICTIONARY handling
@@ -547,7 +579,7 @@ def get_private_entry(tag: TagType, private_creator: str) -> tuple[str, str, str
         tag = Tag(tag)
 
     try:
-        private_dict = private_dictionaries[private_creator]
+        private_dict = _private_dictionaries()[private_creator]
     except KeyError as exc:
         raise KeyError(
             f"Private creator '{private_creator}' not in the private dictionary"
@@ -654,3 +686,10 @@ def private_dictionary_description(tag: TagType, private_creator: str) -> str:
         or if the private creator is not valid.
     """
     return get_private_entry(tag, private_creator)[2]
+
+
+def __getattr__(name: str) -> Any:
+    if name == "private_dictionaries":
+        return _private_dictionaries()
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
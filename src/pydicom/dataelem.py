@@ -12,6 +12,7 @@ from collections.abc import Callable, MutableSequence
 import copy
 from io import BufferedIOBase
 import json
+from time import perf_counter
 from typing import Any, TYPE_CHECKING, NamedTuple
 
 from pydicom import config  # don't import datetime_conversion directly
@@ -834,6 +835,75 @@ class DataElement:  # noqa: PLW1641
         return str(self)
 
 
+class _DeferredJsonDataElement(DataElement):
+    """A :class:`DataElement` created from a DICOM JSON Model attribute object
+    whose value is only converted when first accessed.
+
+    Used by :meth:`Dataset.from_json()<pydicom.dataset.Dataset.from_json>`
+    when `defer_conversion` is ``True``.
+    """
+
+    def __init__(
+        self,
+        dataset_class: type["Dataset"],
+        tag: BaseTag,
+        vr: str,
+        value: Any,
+        value_key: str | None,
+        bulk_data_uri_handler: (
+            Callable[[str, str, str], BulkDataType]
+            | Callable[[str], BulkDataType]
+            | None
+        ) = None,
+    ) -> None:
+        # The element's `_value` attribute is set on conversion
+        self.tag = tag
+        self.VR = vr
+        self.validation_mode = config.settings.reading_validation_mode
+        self.file_tell = None
+        self.is_undefined_length = False
+        self.private_creator = None
+        self._json = (dataset_class, value, value_key, bulk_data_uri_handler)
+
+    def __getattr__(self, name: str) -> Any:
+        """Convert the JSON value when `_value` is first accessed."""
+        if name != "_value" or "_json" not in self.__dict__:
+            raise AttributeError(
+                f"'{type(self).__name__}' object has no attribute '{name}'"
+            )
+
+        dataset_class, value, value_key, handler = self._json
+        if self.VR == VR_.SQ and value_key == "Value" and isinstance(value, list):
+            # Sequence items are also converted on access
+            self.value = [
+                dataset_class.from_json(item or {}, handler, defer_conversion=True)
+                for item in value
+            ]
+        else:
+            elem = DataElement.from_json(
+                dataset_class, f"{self.tag:08X}", self.VR, value, value_key, handler
+            )
+            self._value = elem._value
+
+        self.__dict__.pop("_json", None)
+
+        return self._value
+
+    @property
+    def is_buffered(self) -> bool:
+        """Return ``True`` if the element's value is a :class:`io.BufferedIOBase`
+        instance, ``False`` otherwise.
+        """
+        # Unconverted JSON values are never buffered
+        return "_json" not in self.__dict__ and super().is_buffered
+
+    @DataElement.value.setter  # type: ignore[attr-defined]
+    def value(self, val: Any) -> None:
+        # Setting the value discards the unconverted JSON value
+        self.__dict__.pop("_json", None)
+        DataElement.value.fset(self, val)  # type: ignore[attr-defined]
+
+
 class RawDataElement(NamedTuple):
     """Container for the data from a raw (mostly) undecoded element."""
 
@@ -904,6 +974,10 @@ def convert_raw_data_element(
     pydicom.dataelem.DataElement
         A :class:`~pydicom.dataelem.DataElement` instance created from `raw`.
     """
+    timing = hooks.timing_event
+    if timing is not None:
+        start = perf_counter()
+
     data: dict[str, Any] = {}
     if config.data_element_callback:
         raw = config.data_element_callback(raw, **config.data_element_callback_kwargs)
@@ -920,7 +994,7 @@ def convert_raw_data_element(
         hooks.raw_element_vr(raw, data, encoding=encoding, ds=ds)
         hooks.raw_element_value(raw, data, encoding=encoding, ds=ds)
 
-    return DataElement(
+    elem = DataElement(
         raw.tag,
         data["VR"],
         data["value"],
@@ -928,6 +1002,10 @@ def convert_raw_data_element(
         raw.length == 0xFFFFFFFF,
         already_converted=True,
     )
+    if timing is not None:
+        timing("convert_element", perf_counter() - start, len(raw.value or b""))
+
+    return elem
 
 
 def _DataElement_from_raw(
@@ -16,7 +16,6 @@ Dataset (dict subclass)
 """
 import copy
 import io
-import json
 import os
 import os.path
 from pathlib import Path
@@ -35,6 +34,7 @@ from importlib.util import find_spec as have_package
 from itertools import chain, takewhile
 import sys
 import traceback
+import weakref
 from types import SimpleNamespace, TracebackType
 from typing import (
     TypeAlias,
@@ -59,15 +59,22 @@ from pydicom.config import logger
 from pydicom.datadict import (
     dictionary_description,
     dictionary_VR,
-    tag_for_keyword,
+    _dictionary_vr_fast,
+    _tag_for_keyword_fast,
     keyword_for_tag,
     repeater_has_keyword,
     get_private_entry,
 )
-from pydicom.dataelem import DataElement, convert_raw_data_element, RawDataElement
+from pydicom.dataelem import (
+    DataElement,
+    convert_raw_data_element,
+    RawDataElement,
+    _DeferredJsonDataElement,
+)
 from pydicom.filebase import ReadableBuffer, WriteableBuffer
 from pydicom.fileutil import path_from_pathlike, PathType
 from pydicom.misc import warn_and_log, find_keyword_candidates
+from pydicom.multival import ConstrainedList
 from pydicom.pixels import compress, convert_color_space, decompress, pixel_array
 from pydicom.pixels.utils import (
     reshape_pixel_array,
@@ -247,6 +254,64 @@ def _dict_equal(a: "Dataset", b: Any, exclude: list[str] | None = None) -> bool:
 
 _DatasetValue = DataElement | RawDataElement
 _DatasetType: TypeAlias = "Dataset | MutableMapping[BaseTag, _DatasetValue]"
+_Dataset = TypeVar("_Dataset", bound="Dataset")
+
+
+def _copy_shared_element(elem: DataElement) -> DataElement:
+    """Return a copy of the element `elem` shared by cloned datasets.
+
+    The copy has its own container for multi-valued values and sequence items
+    are cloned, the values themselves aren't copied.
+    """
+    elem = copy.copy(elem)
+    # Use __dict__ to avoid converting elements with a deferred conversion
+    value = elem.__dict__.get("_value")
+    if isinstance(value, pydicom.Sequence):
+        value = copy.copy(value)
+        value._list = [item.clone() for item in value._list]
+        elem._value = value
+    elif isinstance(value, ConstrainedList):
+        value = copy.copy(value)
+        value._list = list(value._list)
+        elem._value = value
+    elif isinstance(value, list):
+        elem._value = list(value)
+
+    return elem
+
+
+class _CloneFamily:
+    """The datasets that may share elements with each other through cloning.
+
+    Only weak references to the datasets are kept, and pickling or copying
+    the family returns a new, empty one.
+    """
+
+    def __init__(self) -> None:
+        self._members: dict[int, weakref.ref["Dataset"]] = {}
+
+    def __reduce__(self) -> tuple[type["_CloneFamily"], tuple[()]]:
+        return _CloneFamily, ()
+
+    def add(self, ds: "Dataset") -> None:
+        """Add the dataset `ds` to the family."""
+        key = id(ds)
+        members = self._members
+
+        def remove(ref: weakref.ref["Dataset"]) -> None:
+            members.pop(key, None)
+
+        members[key] = weakref.ref(ds, remove)
+
+    def detach(self, owner: "Dataset", tag: BaseTag, elem: DataElement) -> None:
+        """Give every other dataset that shares the element `elem` with `owner`
+        its own copy of it.
+        """
+        for ref in list(self._members.values()):
+            ds = ref()
+            if ds is not None and ds is not owner and ds._dict.get(tag) is elem:
+                ds._dict[tag] = _copy_shared_element(elem)
+                ds._shared_elements.discard(tag)
 
 
 class Dataset:  # noqa: PLW1641
@@ -416,6 +481,12 @@ class Dataset:  # noqa: PLW1641
         # True if the dataset is a sequence item with undefined length
         self.is_undefined_length_sequence_item = False
 
+        # The tags of the elements shared with the dataset this one was
+        #   cloned from, and of the elements shared with clones of this one
+        self._shared_elements: set[BaseTag] = set()
+        self._lent_elements: set[BaseTag] = set()
+        self._clone_family: _CloneFamily | None = None
+
         # known private creator blocks
         self._private_blocks: dict[tuple[int, str], PrivateBlock] = {}
 
@@ -544,7 +615,7 @@ class Dataset:  # noqa: PLW1641
             :class:`~pydicom.dataelem.DataElement` if present, ``None``
             otherwise.
         """
-        tag = tag_for_keyword(name)
+        tag = _tag_for_keyword_fast(name)
         # Test against None as (0000,0000) is a possible tag
         if tag is not None:
             return self[tag]
@@ -572,6 +643,10 @@ class Dataset:  # noqa: PLW1641
             ``True`` if the corresponding element is in the :class:`Dataset`,
             ``False`` otherwise.
         """
+        # Fast path for element keywords, the most common usage
+        if isinstance(name, str) and (tag := _tag_for_keyword_fast(name)) is not None:
+            return tag in self._dict
+
         try:
             return Tag(name) in self._dict
         except Exception as exc:
@@ -603,11 +678,11 @@ class Dataset:  # noqa: PLW1641
         # May be multi-valued, but let pydicom.charset handle all logic on that
         dicom_character_set = self._character_set
 
-        # Shortcut to the decode function in pydicom.charset
-        decode_data_element = pydicom.charset.decode_element
+        # Non-sequence elements are collected and decoded together so the
+        # character set only needs to be converted once
+        elements: list[DataElement] = []
 
         # Callback for walk(), to decode the chr strings if necessary
-        # This simply calls the pydicom.charset.decode_element function
         def decode_callback(ds: "Dataset", data_element: DataElement) -> None:
             """Callback to decode `data_element`."""
             if data_element.VR == VR_.SQ:
@@ -615,12 +690,84 @@ class Dataset:  # noqa: PLW1641
                     dset._parent_encoding = dicom_character_set
                     dset.decode()
             else:
-                decode_data_element(data_element, dicom_character_set)
+                elements.append(data_element)
 
         self.walk(decode_callback, recursive=False)
+        pydicom.charset.decode_elements(elements, dicom_character_set)
+
+    def clone(self: _Dataset) -> _Dataset:
+        """Return a copy-on-write copy of the dataset.
+
+        .. versionadded:: 3.1
+
+        Unlike :meth:`copy`, adding, changing or deleting elements in the clone
+        doesn't affect the original dataset (and vice versa). Unlike
+        :func:`copy.deepcopy`, the elements and sequence items aren't copied
+        until needed: an element shared with the original is copied the first
+        time it's accessed by tag or keyword in the clone. When the original
+        accesses a shared element it keeps its own element and the clones that
+        still share it are given a copy instead. Only the element and its
+        container for multiple values are copied, so large values such as
+        *Pixel Data* are never duplicated. Sequence items are cloned in the
+        same way.
+
+        If the dataset has :attr:`~Dataset.file_meta` then it'll also be
+        cloned.
+
+        Examples
+        --------
+
+        >>> ds = Dataset()
+        >>> ds.PatientName = "CITIZEN^Jan"
+        >>> clone = ds.clone()
+        >>> clone.PatientName = "ANON"
+        >>> ds.PatientName
+        'CITIZEN^Jan'
+
+        Returns
+        -------
+        Dataset
+            The clone, with the same class as the original.
+
+        Notes
+        -----
+        Elements returned by :meth:`get_item`, :meth:`elements`, :meth:`items`
+        and :meth:`values`, as well as any element references obtained before
+        the dataset was cloned, may be shared with a clone and shouldn't be
+        modified in-place.
+        """
+        clone = copy.copy(self)
+        clone._dict = dict(self._dict)
+
+        # Raw elements are immutable and don't need copying on access
+        shared = {k for k, v in self._dict.items() if isinstance(v, DataElement)}
+        self._lent_elements.update(shared)
+        clone._shared_elements = shared
+        clone._lent_elements = set()
+
+        if self._clone_family is None:
+            self._clone_family = _CloneFamily()
+            self._clone_family.add(self)
+
+        clone._clone_family = self._clone_family
+        clone._clone_family.add(clone)
+
+        clone._private_blocks = {}
+        clone._pixel_array = None
+        clone._pixel_array_opts = dict(self._pixel_array_opts)
+        clone._pixel_id = {}
+        if getattr(self, "file_meta", None) is not None:
+            clone.file_meta = self.file_meta.clone()
+
+        return clone
 
     def copy(self) -> "Dataset":
-        """Return a shallow copy of the dataset."""
+        """Return a shallow copy of the dataset.
+
+        See Also
+        --------
+        Dataset.clone
+        """
         return copy.copy(self)
 
     def __delattr__(self, name: str) -> None:
@@ -652,7 +799,7 @@ class Dataset:  # noqa: PLW1641
             The keyword for the DICOM element or the class attribute to delete.
         """
         # First check if a valid DICOM keyword and if we have that data element
-        tag = cast(BaseTag, tag_for_keyword(name))
+        tag = _tag_for_keyword_fast(name)
         if tag is not None and tag in self._dict:
             del self._dict[tag]
 
@@ -904,11 +1051,10 @@ class Dataset:  # noqa: PLW1641
               element's value. Otherwise returns the class attribute's
               value (if present).
         """
-        tag = tag_for_keyword(name)
-        if tag is not None:  # None means `name` isn't a DICOM element keyword
-            tag = Tag(tag)
-            if tag in self._dict:
-                return self[tag].value
+        tag = _tag_for_keyword_fast(name)
+        # None means `name` isn't a DICOM element keyword
+        if tag is not None and tag in self._dict:
+            return self[tag].value
 
         # no tag or tag not contained in the dataset
         if name == "_dict":
@@ -1085,6 +1231,17 @@ class Dataset:  # noqa: PLW1641
                 from pydicom.filewriter import correct_ambiguous_vr_element
 
                 self[tag] = correct_ambiguous_vr_element(self[tag], self, elem[6])
+        elif tag in self._shared_elements:
+            # The element is shared with the original dataset, so copy it
+            #   before the caller has a chance to modify it
+            self._shared_elements.remove(tag)
+            self._lent_elements.discard(tag)
+            self._dict[tag] = _copy_shared_element(elem)
+        elif tag in self._lent_elements:
+            # The element is shared with clones of the dataset, so give them
+            #   their own copy before the caller has a chance to modify it
+            self._lent_elements.remove(tag)
+            cast(_CloneFamily, self._clone_family).detach(self, tag, elem)
 
         return cast(DataElement, self._dict.get(tag))
 
@@ -2708,11 +2865,11 @@ class Dataset:  # noqa: PLW1641
                 object.__setattr__(self, name, value)
             return
 
-        tag = tag_for_keyword(name)
+        tag = _tag_for_keyword_fast(name)
         if tag is not None:  # successfully mapped name to a tag
-            if tag not in self:
+            if tag not in self._dict:
                 # don't have this tag yet->create the data_element instance
-                vr = dictionary_VR(tag)
+                vr = _dictionary_vr_fast(tag)
                 elem = DataElement(tag, vr, value)
             else:
                 # already have this data_element, just changing its value
@@ -2825,6 +2982,8 @@ class Dataset:  # noqa: PLW1641
             self._pixel_id = {}
 
         self._dict[elem_tag] = elem
+        self._shared_elements.discard(elem_tag)
+        self._lent_elements.discard(elem_tag)
 
         if elem.VR == VR_.SQ and isinstance(elem, DataElement):
             if not isinstance(elem.value, pydicom.Sequence):
@@ -3114,17 +3273,27 @@ class Dataset:  # noqa: PLW1641
             | Callable[[str], None | str | int | float | bytes]
             | None
         ) = None,
+        *,
+        defer_conversion: bool = False,
+        bulk_data_uri_batch_handler: jsonrep.BulkDataBatchHandlerType | None = None,
     ) -> "Dataset":
         """Return a :class:`Dataset` from a DICOM JSON Model object.
 
         See the DICOM Standard, Part 18, :dcm:`Annex F<part18/chapter_F.html>`.
 
+        .. versionchanged:: 3.1
+
+            Added the `defer_conversion` and `bulk_data_uri_batch_handler`
+            keyword parameters.
+
         Parameters
         ----------
         json_dataset : dict, str, bytes or bytearray
             :class:`dict`, :class:`str`, :class:`bytes` or :class:`bytearray`
             representing a DICOM Data Set formatted based on the :dcm:`DICOM
-            JSON Model<part18/chapter_F.html>`.
+            JSON Model<part18/chapter_F.html>`. JSON documents are parsed using
+            the backend set by :attr:`config.settings.json_backend
+            <pydicom.config.Settings.json_backend>`.
         bulk_data_uri_handler : callable, optional
             Callable function that accepts either the tag, vr and
             "BulkDataURI" value or just the "BulkDataURI" value of the JSON
@@ -3134,13 +3303,49 @@ class Dataset:  # noqa: PLW1641
             corresponding element will have an "empty" value such as
             ``""``, ``b""`` or ``None`` depending on the `vr` (i.e. the
             Value Multiplicity will be 0).
+        defer_conversion : bool, optional
+            If ``True`` then the value of each element is kept in its JSON form
+            and only converted when the value is first accessed, similar to
+            how :class:`~pydicom.dataelem.RawDataElement` values are converted
+            when reading a DICOM file. Elements in sequence items are also
+            converted on access. Any errors in the JSON values, and calls to the
+            `bulk_data_uri_handler`, will occur when the value is accessed
+            rather than when the dataset is created. Default ``False``.
+        bulk_data_uri_batch_handler : callable, optional
+            Callable function that accepts a list of ``(tag, vr, uri)`` for
+            every "BulkDataURI" in the dataset, including those in sequence
+            items, and returns a sequence of the corresponding values. Allows
+            retrieving all the bulk data for the dataset in a single request,
+            or concurrently using :func:`~pydicom.jsonrep.concurrent_bulk_data_handler`.
+            If `defer_conversion` is ``True`` then it's called separately for
+            each element when the element's value is first accessed. Cannot be
+            used with `bulk_data_uri_handler`.
 
         Returns
         -------
         Dataset
         """
         if isinstance(json_dataset, str | bytes | bytearray):
-            json_dataset = cast(dict[str, Any], json.loads(json_dataset))
+            json_dataset = cast(dict[str, Any], jsonrep.loads(json_dataset))
+
+        if bulk_data_uri_batch_handler is not None:
+            if bulk_data_uri_handler is not None:
+                raise ValueError(
+                    "Only one of 'bulk_data_uri_handler' and "
+                    "'bulk_data_uri_batch_handler' may be used"
+                )
+
+            if defer_conversion:
+                batch_handler = bulk_data_uri_batch_handler
+
+                def _handler(tag: str, vr: str, uri: str) -> Any:
+                    return batch_handler([(tag, vr, uri)])[0]
+
+                bulk_data_uri_handler = _handler
+            else:
+                bulk_data_uri_handler = jsonrep.resolve_bulk_data(
+                    json_dataset, bulk_data_uri_batch_handler
+                )
 
         dataset = cls()
         for tag, mapping in json_dataset.items():
@@ -3149,21 +3354,42 @@ class Dataset:  # noqa: PLW1641
             #   one of ('Value', 'BulkDataURI', 'InlineBinary') but may have
             #   none of those if the element's VM is 0
             vr = mapping["vr"]
-            unique_value_keys = tuple(
-                set(mapping.keys()) & set(jsonrep.JSON_VALUE_KEYS)
-            )
-            if len(unique_value_keys) == 0:
-                value_key = None
-                value = [""]
-            else:
-                value_key = unique_value_keys[0]
-                value = mapping[value_key]
+            value_key = jsonrep._value_key(mapping)
+            value = [""] if value_key is None else mapping[value_key]
+            # The VR of UN elements may change on conversion so don't defer them
+            if defer_conversion and vr != VR_.UN:
+                elem_tag = BaseTag(int(tag, 16))
+                dataset._dict[elem_tag] = _DeferredJsonDataElement(
+                    cls, elem_tag, vr, value, value_key, bulk_data_uri_handler
+                )
+                continue
+
             data_element = DataElement.from_json(
                 cls, tag, vr, value, value_key, bulk_data_uri_handler
             )
             dataset.add(data_element)
+
+        if defer_conversion:
+            dataset._set_deferred_private_creators()
+
         return dataset
 
+    def _set_deferred_private_creators(self) -> None:
+        """Set the private creator for elements added by :meth:`from_json` when
+        `defer_conversion` is used.
+
+        The deferred elements are added directly to the dataset, so this does
+        the equivalent of :meth:`__setitem__` once all the elements are
+        available.
+        """
+        for tag, elem in self._dict.items():
+            if not tag.is_private or not isinstance(elem, _DeferredJsonDataElement):
+                continue
+
+            private_creator_tag = Tag(tag.group, tag.element >> 8)
+            if private_creator_tag in self._dict and tag != private_creator_tag:
+                elem.private_creator = self[private_creator_tag].value
+
     def to_json_dict(
         self,
         bulk_data_threshold: int = 1024,
@@ -3187,7 +3413,13 @@ class Dataset:  # noqa: PLW1641
             "vr" key and either the "InlineBinary" or the "BulkDataURI" key).
         suppress_invalid_tags : bool, optional
             Flag to specify if errors while serializing tags should be logged
-            and the tag dropped or if the error should be bubbled up.
+            and the tag dropped or if the error should be bubbled up. Also
+            applies to the tags in any sequence items.
+
+            .. versionchanged:: 3.1
+
+                Invalid tags in sequence items are dropped rather than the
+                entire sequence.
 
         Returns
         -------
@@ -3201,10 +3433,24 @@ class Dataset:  # noqa: PLW1641
                 json_key = f"{key:08X}"
                 try:
                     data_element = self[key]
-                    json_dataset[json_key] = data_element.to_json_dict(
-                        bulk_data_element_handler=bulk_data_element_handler,
-                        bulk_data_threshold=bulk_data_threshold,
-                    )
+                    if data_element.VR == VR_.SQ:
+                        # Only drop the invalid tags in the sequence items
+                        json_dataset[json_key] = {
+                            "vr": data_element.VR,
+                            "Value": [
+                                item.to_json_dict(
+                                    bulk_data_threshold,
+                                    bulk_data_element_handler,
+                                    suppress_invalid_tags,
+                                )
+                                for item in data_element.value
+                            ],
+                        }
+                    else:
+                        json_dataset[json_key] = data_element.to_json_dict(
+                            bulk_data_element_handler=bulk_data_element_handler,
+                            bulk_data_threshold=bulk_data_threshold,
+                        )
                 except Exception as exc:
                     if not suppress_invalid_tags:
                         logger.error(f"Error while processing tag {json_key}")
@@ -3247,7 +3493,13 @@ class Dataset:  # noqa: PLW1641
                 example below) to create DICOM-conformant JSON.
         suppress_invalid_tags : bool, optional
             Flag to specify if errors while serializing tags should be logged
-            and the tag dropped or if the error should be bubbled up.
+            and the tag dropped or if the error should be bubbled up. Also
+            applies to the tags in any sequence items.
+
+            .. versionchanged:: 3.1
+
+                Invalid tags in sequence items are dropped rather than the
+                entire sequence.
 
         Returns
         -------
@@ -3255,6 +3507,12 @@ class Dataset:  # noqa: PLW1641
             :class:`Dataset` serialized into a string based on the DICOM JSON
             Model.
 
+        See Also
+        --------
+        pydicom.jsonrep.dump_json
+            Write the JSON representation of one or more datasets directly to
+            a file-like.
+
         Examples
         --------
         >>> def my_json_dumps(data):
@@ -3262,11 +3520,16 @@ class Dataset:  # noqa: PLW1641
         >>> ds.to_json(dump_handler=my_json_dumps)
         """
         if dump_handler is None:
-
-            def json_dump(d: Any) -> str:
-                return json.dumps(d, sort_keys=True)
-
-            dump_handler = json_dump
+            # Encode element by element rather than building the entire
+            #   JSON dict first, the result is the same as json.dumps()
+            return "".join(
+                jsonrep.iter_json(
+                    self,
+                    bulk_data_threshold,
+                    bulk_data_element_handler,
+                    suppress_invalid_tags,
+                )
+            )
 
         return dump_handler(
             self.to_json_dict(
@@ -5,12 +5,14 @@ from collections.abc import Iterator
 from io import BytesIO, BufferedIOBase
 import os
 from struct import pack, unpack
+from time import perf_counter
 from typing import Any
 
 from pydicom import config
 from pydicom.misc import warn_and_log
 from pydicom.filebase import DicomBytesIO, DicomIO, ReadableBuffer
 from pydicom.fileutil import buffer_length, reset_buffer_position
+from pydicom.hooks import hooks
 from pydicom.tag import Tag, ItemTag, SequenceDelimiterTag
 
 
@@ -441,8 +443,19 @@ def generate_frames(
         extended_offsets=extended_offsets,
         endianness=endianness,
     )
+    timing = hooks.timing_event
+    if timing is None:
+        for fragments in fragmented_frames:
+            yield b"".join(fragments)
+
+        return
+
+    start = perf_counter()
     for fragments in fragmented_frames:
-        yield b"".join(fragments)
+        frame = b"".join(fragments)
+        timing("extract_frame", perf_counter() - start, len(frame))
+        yield frame
+        start = perf_counter()
 
 
 def get_frame(
@@ -500,6 +513,38 @@ def get_frame(
     ----------
     DICOM Standard Part 5, :dcm:`Annex A <part05/chapter_A.html>`
     """
+    timing = hooks.timing_event
+    if timing is None:
+        return _get_frame(
+            buffer,
+            index,
+            extended_offsets=extended_offsets,
+            number_of_frames=number_of_frames,
+            endianness=endianness,
+        )
+
+    start = perf_counter()
+    frame = _get_frame(
+        buffer,
+        index,
+        extended_offsets=extended_offsets,
+        number_of_frames=number_of_frames,
+        endianness=endianness,
+    )
+    timing("extract_frame", perf_counter() - start, len(frame))
+
+    return frame
+
+
+def _get_frame(
+    buffer: bytes | bytearray | ReadableBuffer,
+    index: int,
+    *,
+    extended_offsets: tuple[list[int], list[int]] | tuple[bytes, bytes] | None,
+    number_of_frames: int | None,
+    endianness: str,
+) -> bytes:
+    """Return the specified frame at `index`, see :func:`get_frame`."""
     if isinstance(buffer, bytes | bytearray):
         buffer = BytesIO(buffer)
 
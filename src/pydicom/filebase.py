@@ -6,6 +6,7 @@ import os
 from struct import Struct
 from types import TracebackType
 from typing import TYPE_CHECKING, cast, Any, TypeVar, Protocol
+import zlib
 
 if TYPE_CHECKING:  # pragma: no cover
     from collections.abc import Callable
@@ -16,6 +17,16 @@ ExitException = tuple[
 ]
 Self = TypeVar("Self", bound="DicomIO")
 
+# The US, UL and tag (un)packers for big and little endian
+_STRUCTS = {
+    endianness: (
+        Struct(f"{endianness}H"),
+        Struct(f"{endianness}L"),
+        Struct(f"{endianness}2H"),
+    )
+    for endianness in "><"
+}
+
 
 class ReadableBuffer(Protocol):
     def read(self, size: int = ..., /) -> bytes: ...  # pragma: no cover
@@ -124,13 +135,13 @@ class DicomIO:
 
         self._little_endian = value
 
-        endianness = "><"[value]
-        self._us_packer = Struct(f"{endianness}H").pack
-        self._us_unpacker = Struct(f"{endianness}H").unpack
-        self._ul_packer = Struct(f"{endianness}L").pack
-        self._ul_unpacker = Struct(f"{endianness}L").unpack
-        self._tag_packer = Struct(f"{endianness}2H").pack
-        self._tag_unpacker = Struct(f"{endianness}2H").unpack
+        us, ul, tag = _STRUCTS["><"[value]]
+        self._us_packer = us.pack
+        self._us_unpacker = us.unpack
+        self._ul_packer = ul.pack
+        self._ul_unpacker = ul.unpack
+        self._tag_packer = tag.pack
+        self._tag_unpacker = tag.unpack
 
     @property
     def is_implicit_VR(self) -> bool:
@@ -305,3 +316,283 @@ class DicomBytesIO(DicomIO):
         super().__init__(buffer)
 
         self.getvalue = buffer.getvalue
+
+
+# The maximum number of deflated bytes to read from the source at once
+_INFLATE_INPUT_SIZE = 64 * 1024
+# The maximum number of bytes to inflate at once, this is also the amount of
+#   inflated data kept before the current position to allow seeking backwards
+_INFLATE_CHUNK_SIZE = 256 * 1024
+
+
+class _InflateBuffer:
+    """A readable buffer-like that inflates deflated data from `buffer` as it's
+    read.
+
+    Only a limited amount of inflated data is kept in memory. Seeking forward
+    inflates and discards the data being skipped over, while seeking backwards
+    past the kept data restarts inflating from the beginning.
+    """
+
+    def __init__(self, buffer: ReadableBuffer) -> None:
+        self._buffer: ReadableBuffer | None = buffer
+        self.name: str | None = getattr(buffer, "name", None)
+        # The offset to the start of the deflated data in `buffer`
+        self._start = buffer.tell()
+        self._reset()
+
+    def __deepcopy__(self, memo: dict[int, Any]) -> "_InflateBuffer":
+        # The source buffer is shared, only the inflation state is new
+        buffer = _InflateBuffer.__new__(_InflateBuffer)
+        buffer._buffer = self._buffer
+        buffer.name = self.name
+        buffer._start = self._start
+        buffer._reset()
+
+        return buffer
+
+    def __getstate__(self) -> dict[str, Any]:
+        # The inflation state can't be pickled, and if the source has a name
+        #   then its handle is dropped and it's re-opened by name as needed
+        return {
+            "_buffer": None if self.name else self._buffer,
+            "name": self.name,
+            "_start": self._start,
+            "_position": self._position,
+        }
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        self._buffer = state["_buffer"]
+        self.name = state["name"]
+        self._start = state["_start"]
+        self._reset()
+        self._position = int(state["_position"])
+
+    def _reset(self) -> None:
+        """Restart inflating from the start of the deflated data."""
+        self._decompressor = zlib.decompressobj(-zlib.MAX_WBITS)
+        self._input_tell = self._start
+        self._at_end = False
+        # The inflated data kept in memory and its offset in the inflated data
+        self._data = bytearray()
+        self._offset = 0
+        self._position = 0
+
+    def _read_input(self) -> bytes:
+        """Return the next chunk of deflated data."""
+        buffer = self._buffer
+        if buffer is None or getattr(buffer, "closed", False):
+            # Re-open the source if it's a file that's been closed
+            if not self.name or not os.path.exists(self.name):
+                raise ValueError(
+                    "Unable to read the deflated data as the buffer has been closed"
+                )
+
+            with open(self.name, "rb") as f:
+                f.seek(self._input_tell)
+                data = f.read(_INFLATE_INPUT_SIZE)
+        else:
+            buffer.seek(self._input_tell)
+            data = buffer.read(_INFLATE_INPUT_SIZE)
+
+        self._input_tell += len(data)
+
+        return data
+
+    def _inflate(self) -> bool:
+        """Inflate the next chunk of data, returning ``False`` if there's no
+        more data available.
+        """
+        decompressor = self._decompressor
+        while not self._at_end:
+            if decompressor.eof:
+                self._at_end = True
+                break
+
+            data = decompressor.unconsumed_tail or self._read_input()
+            if data:
+                inflated = decompressor.decompress(data, _INFLATE_CHUNK_SIZE)
+            else:
+                # Truncated deflated data
+                inflated = decompressor.flush()
+                self._at_end = True
+
+            if inflated:
+                # Discard data that's no longer needed
+                excess = self._position - self._offset - _INFLATE_CHUNK_SIZE
+                if excess > 0:
+                    excess = min(excess, len(self._data))
+                    del self._data[:excess]
+                    self._offset += excess
+
+                self._data += inflated
+                return True
+
+        return False
+
+    def read(self, size: int = -1, /) -> bytes:
+        """Return up to `size` bytes of inflated data."""
+        if size is None or size < 0:
+            while self._inflate():
+                pass
+
+            size = self._offset + len(self._data) - self._position
+
+        end = self._position + size
+        while self._offset + len(self._data) < end and self._inflate():
+            pass
+
+        start = self._position - self._offset
+        data = bytes(self._data[start : start + size])
+        self._position += len(data)
+
+        return data
+
+    def seek(self, offset: int, whence: int = os.SEEK_SET, /) -> int:
+        """Change the position in the inflated data."""
+        if whence == os.SEEK_CUR:
+            offset += self._position
+        elif whence == os.SEEK_END:
+            while self._inflate():
+                pass
+
+            offset += self._offset + len(self._data)
+
+        if offset < 0:
+            raise ValueError(f"Negative seek position {offset}")
+
+        if offset < self._offset:
+            self._reset()
+
+        self._position = offset
+
+        return offset
+
+    def tell(self) -> int:
+        """Return the current position in the inflated data."""
+        return self._position
+
+    def getvalue(self) -> bytes:
+        """Return the entire inflated data."""
+        position = self._position
+        self.seek(0)
+        data = self.read()
+        self._position = position
+
+        return data
+
+
+class DicomInflateIO(DicomIO):
+    """Wrapper for reading a dataset encoded using *Deflated Explicit VR Little
+    Endian* from a buffer-like, with the data inflated as it's read.
+
+    .. versionadded:: 3.1
+
+    Only a limited amount of the inflated data is kept in memory, so large
+    datasets can be read without having to inflate the entire dataset at once.
+    Seeking backwards to data that's no longer kept requires inflating the
+    data again from the start.
+
+    See Also
+    --------
+    :class:`~pydicom.filebase.DicomIO`
+    :class:`~pydicom.filebase.DicomDeflateIO`
+    """
+
+    def __init__(self, buffer: ReadableBuffer) -> None:
+        """Create a new DicomInflateIO instance.
+
+        Parameters
+        ----------
+        buffer : buffer-like
+            The buffer-like to read the deflated data from, starting at its
+            current position. If `buffer` is a file that's been closed then it
+            will be re-opened using its ``name`` as required.
+        """
+        buffer = _InflateBuffer(buffer)
+        super().__init__(buffer)
+
+        self.getvalue = buffer.getvalue
+
+
+class _DeflateBuffer:
+    """A writeable buffer-like that deflates data as it's written to `buffer`."""
+
+    def __init__(self, buffer: DicomIO | WriteableBuffer, level: int) -> None:
+        self._buffer = buffer
+        self.name: str | None = getattr(buffer, "name", None)
+        self._compressor = zlib.compressobj(level, wbits=-zlib.MAX_WBITS)
+        self._position = 0
+        self.bytes_written = 0
+
+    def write(self, b: bytes | bytearray | memoryview, /) -> int:
+        """Deflate `b` and write the result to the buffer."""
+        if deflated := self._compressor.compress(b):
+            self._buffer.write(deflated)
+            self.bytes_written += len(deflated)
+
+        nr_bytes = len(b) if not isinstance(b, memoryview) else b.nbytes
+        self._position += nr_bytes
+
+        return nr_bytes
+
+    def flush(self) -> None:
+        """Write any remaining deflated data to the buffer."""
+        if deflated := self._compressor.flush():
+            self._buffer.write(deflated)
+            self.bytes_written += len(deflated)
+
+    def seek(self, offset: int, whence: int = os.SEEK_SET, /) -> int:
+        """Deflated data can only be written sequentially."""
+        if whence == os.SEEK_CUR:
+            offset += self._position
+
+        if whence == os.SEEK_END or offset != self._position:
+            raise OSError("Seeking is not supported when deflating data")
+
+        return offset
+
+    def tell(self) -> int:
+        """Return the number of bytes written before deflation."""
+        return self._position
+
+
+class DicomDeflateIO(DicomIO):
+    """Wrapper for writing a dataset encoded using *Deflated Explicit VR Little
+    Endian* to a buffer-like, with the data deflated as it's written.
+
+    .. versionadded:: 3.1
+
+    The encoded data can only be written sequentially and :meth:`finish` must
+    be called after all the data has been written.
+
+    See Also
+    --------
+    :class:`~pydicom.filebase.DicomIO`
+    :class:`~pydicom.filebase.DicomInflateIO`
+    """
+
+    def __init__(
+        self,
+        buffer: "DicomIO | WriteableBuffer",
+        level: int = zlib.Z_DEFAULT_COMPRESSION,
+    ) -> None:
+        """Create a new DicomDeflateIO instance.
+
+        Parameters
+        ----------
+        buffer : buffer-like
+            The buffer-like to write the deflated data to.
+        level : int, optional
+            The compression level to use, see :func:`zlib.compressobj`.
+        """
+        self._deflater = _DeflateBuffer(buffer, level)
+        super().__init__(self._deflater)
+
+    def finish(self) -> int:
+        """Write any remaining deflated data and return the total number of
+        deflated bytes written.
+        """
+        self._deflater.flush()
+
+        return self._deflater.bytes_written
@@ -1,13 +1,11 @@
 # Copyright 2008-2021 pydicom authors. See LICENSE file for details.
 """Read a dicom media file"""
 
-
-# Need zlib and io.BytesIO for deflate-compressed file
 import os
 from struct import Struct, unpack
+from time import perf_counter
 from typing import BinaryIO, Any, cast
 from collections.abc import Callable, MutableSequence, Iterator
-import zlib
 
 from pydicom import config
 from pydicom.charset import default_encoding, convert_encodings
@@ -21,13 +19,14 @@ from pydicom.dataelem import (
 )
 from pydicom.dataset import Dataset, FileDataset, FileMetaDataset
 from pydicom.errors import InvalidDicomError
-from pydicom.filebase import ReadableBuffer, DicomBytesIO
+from pydicom.filebase import ReadableBuffer, DicomInflateIO
 from pydicom.fileutil import (
     read_undefined_length_value,
     path_from_pathlike,
     PathType,
     _unpack_tag,
 )
+from pydicom.hooks import hooks
 from pydicom.misc import size_in_bytes, warn_and_log
 from pydicom.sequence import Sequence
 from pydicom.tag import (
@@ -826,6 +825,11 @@ def read_partial(
     dcmread
         More generic file reading function.
     """
+    timing = hooks.timing_event
+    if timing is not None:
+        start = perf_counter()
+        start_tell = fileobj.tell()
+
     # Read File Meta Information
 
     # Read preamble (if present)
@@ -833,6 +837,9 @@ def read_partial(
     # Read any File Meta Information group (0002,eeee) elements (if present)
     file_meta = _read_file_meta_info(fileobj)
 
+    if timing is not None:
+        timing("read_meta", perf_counter() - start, fileobj.tell() - start_tell)
+
     # Read Dataset
 
     # Read any Command Set group (0000,eeee) elements (if present)
@@ -888,15 +895,9 @@ def read_partial(
         #     then "deflate" compression applied.
         #  All that is needed here is to decompress and then
         #     use as normal in a file-like object
-        zipped = fileobj.read()
-        name = cast(str, getattr(fileobj, "name", None))
-
-        # -MAX_WBITS part is from comp.lang.python answer:
-        # groups.google.com/group/comp.lang.python/msg/e95b3b38a71e6799
-        unzipped = zlib.decompress(zipped, -zlib.MAX_WBITS)
-        buffer = DicomBytesIO(unzipped)
-        buffer.name = name
-        fileobj = cast(BinaryIO, buffer)  # a file-like object
+        # The data is inflated as it's read so that only the parts needed
+        #     are decompressed, e.g. when stopping before the pixel data
+        fileobj = cast(BinaryIO, DicomInflateIO(fileobj))
         is_implicit_VR = False
     elif transfer_syntax in pydicom.uid.PrivateTransferSyntaxes:
         # Replace with the registered UID as it has the encoding information
@@ -910,6 +911,10 @@ def read_partial(
         #        by Standard PS 3.5-2008 A.4 (p63)
         is_implicit_VR = False
 
+    if timing is not None:
+        start = perf_counter()
+        start_tell = fileobj.tell()
+
     # Try and decode the dataset
     #   By this point we should be at the start of the dataset and have
     #   the transfer syntax (whether read from the file meta or guessed at)
@@ -927,6 +932,9 @@ def read_partial(
             raise
         # warning already logged in read_dataset
 
+    if timing is not None:
+        timing("read_dataset", perf_counter() - start, fileobj.tell() - start_tell)
+
     # Add the command set elements to the dataset (if any)
     if command_set:
         dataset.update(command_set)
@@ -1137,6 +1145,10 @@ def read_deferred_data_element(
     """
     if config.debugging:
         logger.debug(f"Reading deferred element {raw_data_elem.tag}")
+
+    timing = hooks.timing_event
+    if timing is not None:
+        start = perf_counter()
     # If it wasn't read from a file, then return an error
     if filename_or_obj is None:
         raise OSError("Deferred read -- original filename not stored. Cannot re-open")
@@ -1187,5 +1199,8 @@ def read_deferred_data_element(
             f"original {raw_data_elem.tag!r}"
         )
 
+    if timing is not None:
+        timing("read_deferred", perf_counter() - start, len(elem.value or b""))
+
     # Everything is ok, now this object should act like usual DataElement
     return elem
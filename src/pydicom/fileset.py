@@ -1,24 +1,32 @@
 # Copyright 2008-2020 pydicom authors. See LICENSE file for details.
 """DICOM File-set handling."""
 
-from collections.abc import Iterator, Iterable, Callable
-import copy
+from collections.abc import Iterator, Iterable, Callable, MutableSequence
+from concurrent.futures import ThreadPoolExecutor
+from io import BytesIO
 import os
 from pathlib import Path
 import re
 import shutil
+from struct import Struct
 from tempfile import TemporaryDirectory
-from typing import Optional, Union, Any, cast
+from typing import NamedTuple, Optional, Union, Any, cast
 import uuid
 
 from pydicom.charset import default_encoding
-from pydicom.datadict import tag_for_keyword, dictionary_description
-from pydicom.dataelem import DataElement
+from pydicom.datadict import (
+    tag_for_keyword,
+    dictionary_description,
+    dictionary_VR,
+    keyword_for_tag,
+)
+from pydicom.dataelem import DataElement, RawDataElement
 from pydicom.dataset import Dataset, FileMetaDataset, FileDataset
 from pydicom.filebase import DicomBytesIO, DicomFileLike
-from pydicom.filereader import dcmread
+from pydicom.filereader import dcmread, read_dataset
 from pydicom.filewriter import write_dataset, write_data_element, write_file_meta_info
 from pydicom.misc import warn_and_log
+from pydicom.multival import MultiValue
 from pydicom.tag import Tag, BaseTag
 import pydicom.uid as sop
 from pydicom.uid import (
@@ -28,6 +36,8 @@ from pydicom.uid import (
     ImplicitVRLittleEndian,
     MediaStorageDirectoryStorage,
 )
+from pydicom.valuerep import EXPLICIT_VR_LENGTH_16, EXPLICIT_VR_LENGTH_32
+from pydicom.values import convert_string, convert_value
 
 
 # Regex for conformant File ID paths - PS3.10 Section 8.5
@@ -71,6 +81,44 @@ _FIRST_OFFSET = "OffsetOfTheFirstDirectoryRecordOfTheRootDirectoryEntity"
 _NEXT_OFFSET = "OffsetOfTheNextDirectoryRecord"
 _LOWER_OFFSET = "OffsetOfReferencedLowerLevelDirectoryEntity"
 _LAST_OFFSET = "OffsetOfTheLastDirectoryRecordOfTheRootDirectoryEntity"
+# DICOMDIR datasets are read with the *Directory Record Sequence* deferred
+#   so its records can be read without being parsed
+_DEFER_SIZE = 1024
+# Directory record elements read when loading a DICOMDIR
+_NEXT_OFFSET_TAG = 0x00041400
+_LOWER_OFFSET_TAG = 0x00041420
+_IN_USE_TAG = 0x00041410
+_RECORD_TYPE_TAG = 0x00041430
+_FILE_ID_TAG = 0x00041500
+# The elements used for each record type's RecordNode.key
+_KEY_TAGS = {
+    "PATIENT": (0x00100020,),
+    "STUDY": (0x0020000D, 0x00041511),
+    "SERIES": (0x0020000E,),
+    "PRIVATE": (0x00041432,),
+}
+_INSTANCE_KEY_TAGS = (0x00041511,)
+_RECORD_TAGS = {
+    _NEXT_OFFSET_TAG,
+    _LOWER_OFFSET_TAG,
+    _IN_USE_TAG,
+    _RECORD_TYPE_TAG,
+    _FILE_ID_TAG,
+    *_INSTANCE_KEY_TAGS,
+}.union(*_KEY_TAGS.values())
+_ITEM_HEADER = Struct("<HHL")
+_EXPLICIT_HEADER = Struct("<HH2sH")
+_UINT32 = Struct("<L")
+_LENGTH_16_VRS = {vr.encode() for vr in EXPLICIT_VR_LENGTH_16}
+_LENGTH_32_VRS = {vr.encode() for vr in EXPLICIT_VR_LENGTH_32}
+# Directory record elements indexed by FileSet.find() and FileSet.find_values()
+_INDEXED_KEYWORDS = (
+    "PatientID",
+    "StudyInstanceUID",
+    "SeriesInstanceUID",
+    "Modality",
+    "SOPInstanceUID",
+)
 
 
 def generate_filename(
@@ -172,6 +220,251 @@ def is_conformant_file_id(path: Path) -> bool:
     return False
 
 
+def _index_key(value: Any) -> Any:
+    """Return a hashable key for an element value."""
+    if isinstance(value, MultiValue | list | tuple | set):
+        return tuple(value)
+
+    return value
+
+
+def _is_match(value: Any, query: Any, VR: str | None) -> bool:
+    """Return ``True`` if the element `value` matches the `query` value.
+
+    Parameters
+    ----------
+    value : object
+        The element value.
+    query : object
+        The value to match against, one of:
+
+        * A :class:`list`, :class:`tuple` or :class:`set` of values, which
+          matches if the element value is equal to any of the query values or
+          to the query itself.
+        * For elements with a **DA** or **TM** VR, a :class:`str` range of
+          values such as ``"20200101-20201231"``, which matches inclusively.
+          Either the lower or upper limit may be omitted.
+        * Any other value, which matches if equal to the element value.
+    VR : str | None
+        The element's VR.
+    """
+    if isinstance(query, list | tuple | set):
+        return value == query or any(_is_match(value, v, VR) for v in query)
+
+    if VR in ("DA", "TM") and isinstance(query, str) and "-" in query:
+        if not value or isinstance(value, MultiValue):
+            return False
+
+        value = str(value).strip()
+        lower, _, upper = query.partition("-")
+        return value >= lower.strip() and (
+            not upper or value[: len(upper.strip())] <= upper.strip()
+        )
+
+    return bool(value == query)
+
+
+class _EncodedRecord(NamedTuple):
+    """A directory record read from a DICOMDIR that hasn't been parsed.
+
+    Only the elements needed to build the record hierarchy are decoded, the
+    record is parsed using :meth:`decode` when its dataset is first needed.
+    """
+
+    offset: int
+    value: memoryview
+    is_implicit_VR: bool
+    encoding: str | MutableSequence[str]
+    record_type: str
+    next_offset: int
+    lower_offset: int
+    file_id: str | MutableSequence[str] | None
+    # The tag and encoded value of the element used for the record's key
+    key_tag: int
+    key_value: bytes
+    # The positions of the encoded offset values in `value` if the record can
+    #   be written again without being re-encoded, otherwise None
+    next_position: int | None
+    lower_position: int | None
+
+    def decode(self) -> Dataset:
+        """Return the directory record as a :class:`~pydicom.dataset.Dataset`."""
+        ds = read_dataset(
+            BytesIO(self.value),
+            self.is_implicit_VR,
+            True,
+            len(self.value),
+            parent_encoding=self.encoding,
+            at_top_level=False,
+        )
+        ds.is_undefined_length_sequence_item = False
+        ds.file_tell = self.offset
+        ds.seq_item_tell = self.offset
+
+        return ds
+
+    def decode_key(self) -> Any:
+        """Return the value of the element used for the record's key."""
+        elem = RawDataElement(
+            BaseTag(self.key_tag),
+            None,
+            len(self.key_value),
+            self.key_value,
+            0,
+            self.is_implicit_VR,
+            True,
+        )
+        return convert_value(dictionary_VR(self.key_tag), elem, self.encoding)
+
+
+def _scan_record(
+    value: memoryview, is_implicit_VR: bool
+) -> dict[int, tuple[int, bytes]] | None:
+    """Return the position and encoded value of the elements in `value` needed
+    to link or write the directory record, or ``None`` if the record must be
+    parsed instead.
+    """
+    elements = {}
+    offset = 0
+    end = len(value)
+    while offset < end:
+        if offset + 8 > end:
+            return None
+
+        if is_implicit_VR:
+            group, elem, length = _ITEM_HEADER.unpack_from(value, offset)
+            offset += 8
+        else:
+            group, elem, vr, length = _EXPLICIT_HEADER.unpack_from(value, offset)
+            if vr in _LENGTH_32_VRS:
+                length = _UINT32.unpack_from(value, offset + 8)[0]
+                offset += 12
+            elif vr in _LENGTH_16_VRS:
+                offset += 8
+            else:
+                return None
+
+        if length == 0xFFFFFFFF:
+            return None
+
+        tag = group << 16 | elem
+        # Group lengths are removed when records are encoded
+        if tag in _RECORD_TAGS or (elem == 0 and group > 6):
+            elements[tag] = (offset, value[offset : offset + length].tobytes())
+
+        offset += length
+
+    return elements if offset == end else None
+
+
+def _read_encoded_records(ds: Dataset) -> list[_EncodedRecord] | None:
+    """Return the directory records in a DICOMDIR dataset without parsing them.
+
+    Parameters
+    ----------
+    ds : pydicom.dataset.Dataset
+        The DICOMDIR dataset, read with the value of the *Directory Record
+        Sequence* deferred. The encoded value of the sequence is read and
+        added to the dataset.
+
+    Returns
+    -------
+    list[_EncodedRecord] | None
+        The directory records, or ``None`` if the *Directory Record Sequence*
+        wasn't deferred or contains records that can only be parsed, such as
+        undefined length items.
+    """
+    if not isinstance(ds, FileDataset) or not isinstance(ds.filename, str):
+        return None
+
+    elem = ds.get_item(0x00041220, keep_deferred=True)
+    if (
+        not isinstance(elem, RawDataElement)
+        or elem.value is not None
+        or not elem.is_little_endian
+        or ds.file_meta.TransferSyntaxUID
+        not in (ExplicitVRLittleEndian, ImplicitVRLittleEndian)
+    ):
+        return None
+
+    with open(ds.filename, "rb") as f:
+        f.seek(elem.value_tell)
+        value = f.read(elem.length)
+
+    # Keep the encoded sequence so it can still be parsed if required
+    ds._dict[elem.tag] = elem._replace(value=value)
+
+    encoding = ds._character_set
+    buffer = memoryview(value)
+    records = []
+    offset = 0
+    while offset < len(value):
+        if offset + 8 > len(value):
+            return None
+
+        group, element, length = _ITEM_HEADER.unpack_from(buffer, offset)
+        if (group, element) != (0xFFFE, 0xE000) or length == 0xFFFFFFFF:
+            return None
+
+        item = buffer[offset + 8 : offset + 8 + length]
+        elements = _scan_record(item, elem.is_implicit_VR)
+        if elements is None or len(item) != length:
+            return None
+
+        values = {tag: value for tag, (_, value) in elements.items()}
+
+        # Invalid records are parsed so the usual exceptions are raised
+        record_type = convert_string(values.get(_RECORD_TYPE_TAG, b""), True)
+        key_tags = _KEY_TAGS.get(cast(str, record_type), _INSTANCE_KEY_TAGS)
+        links = [
+            values.get(tag, b"\x00" * 4)
+            for tag in (_NEXT_OFFSET_TAG, _LOWER_OFFSET_TAG)
+        ]
+        if (
+            not record_type
+            or not isinstance(record_type, str)
+            or (key_tag := next((t for t in key_tags if t in values), None)) is None
+            or any(len(link) != 4 for link in links)
+        ):
+            return None
+
+        file_id = None
+        if _FILE_ID_TAG in values:
+            file_id = convert_string(values[_FILE_ID_TAG], True)
+
+        # Records are written as-is if they already match how they'd be encoded
+        next_position = lower_position = None
+        if (
+            _NEXT_OFFSET_TAG in elements
+            and _LOWER_OFFSET_TAG in elements
+            and values.get(_IN_USE_TAG) == b"\xff\xff"
+            # No group length elements
+            and all(tag & 0xFFFF for tag in elements)
+        ):
+            next_position = elements[_NEXT_OFFSET_TAG][0]
+            lower_position = elements[_LOWER_OFFSET_TAG][0]
+
+        records.append(
+            _EncodedRecord(
+                elem.value_tell + offset,
+                item,
+                elem.is_implicit_VR,
+                encoding,
+                record_type,
+                _UINT32.unpack(links[0])[0],
+                _UINT32.unpack(links[1])[0],
+                file_id,
+                key_tag,
+                values[key_tag],
+                next_position,
+                lower_position,
+            )
+        )
+        offset += 8 + length
+
+    return records
+
+
 class RecordNode(Iterable["RecordNode"]):
     """Representation of a DICOMDIR's directory record.
 
@@ -196,7 +489,9 @@ class RecordNode(Iterable["RecordNode"]):
         self.children: list[RecordNode] = []
         self.instance: FileInstance | None = None
         self._parent: RecordNode | None = None
-        self._record: Dataset
+        self._dataset: Dataset
+        # A directory record read from a DICOMDIR that hasn't been parsed yet
+        self._encoded: _EncodedRecord | None = None
 
         if record:
             self._set_record(record)
@@ -234,6 +529,45 @@ class RecordNode(Iterable["RecordNode"]):
 
         node.parent = current
 
+    def _add_leaves(self, leaves: Iterable["RecordNode"]) -> None:
+        """Add multiple leaves to the tree.
+
+        The same as calling :meth:`add` for each leaf, except the keys for
+        each node's children are only found once.
+
+        Parameters
+        ----------
+        leaves : Iterable[pydicom.fileset.RecordNode]
+            The leaf nodes to be added to the tree.
+        """
+        # {node: {child key: child node}}
+        lookup: dict[RecordNode, dict[str, RecordNode]] = {}
+
+        def children(node: RecordNode) -> dict[str, RecordNode]:
+            if (keys := lookup.get(node)) is None:
+                keys = lookup[node] = {}
+                for child in node.children:
+                    keys.setdefault(child.key, child)
+
+            return keys
+
+        root = self.root
+        for leaf in leaves:
+            # Move back down from the branch's furthest ancestor, inserting
+            #   at the point where the node is unique
+            node = leaf.root
+            current = root
+            keys = children(current)
+            while node.key in keys and node.children:
+                current = keys[node.key]
+                node = node.children[0]
+                keys = children(current)
+
+            # The node is new so can't already be one of the children
+            node._parent = current
+            current.children.append(node)
+            keys.setdefault(node.key, node)
+
     @property
     def ancestors(self) -> list["RecordNode"]:
         """Return a list of the current node's ancestors, ordered from nearest
@@ -294,10 +628,12 @@ class RecordNode(Iterable["RecordNode"]):
         "Return the number of nodes to the level below the tree root"
         return len(list(self.reverse())) - 1
 
-    def _encode_record(self, force_implicit: bool = False) -> int:
+    def _encode_record(self, force_implicit: bool = False) -> bytes:
         """Encode the node's directory record.
 
-        * Encodes the record as explicit VR little endian
+        * Encodes the record as explicit VR little endian, or if the record was
+          read from a DICOMDIR and hasn't been parsed then its existing
+          encoding is used when possible
         * Sets the ``RecordNode._offset_next`` and ``RecordNode._offset_lower``
           attributes to the position of the start of the values of the *Offset
           of the Next Directory Record* and *Offset of Referenced Lower Level
@@ -316,13 +652,24 @@ class RecordNode(Iterable["RecordNode"]):
 
         Returns
         -------
-        int
-            The length of the encoded directory record.
+        bytes
+            The encoded directory record.
 
         See Also
         --------
         :meth:`~pydicom.fileset.RecordNode._update_record_offsets`
         """
+        encoded = self._encoded
+        if (
+            encoded is not None
+            and encoded.next_position is not None
+            and encoded.lower_position is not None
+            and encoded.is_implicit_VR == force_implicit
+        ):
+            self._offset_next = encoded.next_position
+            self._offset_lower = encoded.lower_position
+            return encoded.value.tobytes()
+
         fp = DicomBytesIO()
         fp.is_little_endian = True
         fp.is_implicit_VR = force_implicit
@@ -344,7 +691,7 @@ class RecordNode(Iterable["RecordNode"]):
 
             write_data_element(fp, self._record[tag], encoding)
 
-        return len(fp.getvalue())
+        return fp.getvalue()
 
     @property
     def _file_id(self) -> Path | None:
@@ -356,6 +703,16 @@ class RecordNode(Iterable["RecordNode"]):
             The *Referenced File ID* from the directory record as a
             :class:`pathlib.Path` or ``None`` if the element value is null.
         """
+        if self._encoded is not None:
+            file_id = self._encoded.file_id
+            if not file_id:
+                return None
+
+            if isinstance(file_id, str):
+                return Path(file_id)
+
+            return Path(*file_id)
+
         if "ReferencedFileID" in self._record:
             elem = self._record["ReferencedFileID"]
             if elem.VM == 1:
@@ -414,6 +771,9 @@ class RecordNode(Iterable["RecordNode"]):
     @property
     def key(self) -> str:
         """Return a unique key for the node's record as :class:`str`."""
+        if self._encoded is not None:
+            return cast(str, self._encoded.decode_key())
+
         rtype = self.record_type
         if rtype == "PATIENT":
             # PS3.3, Annex F.5.1: Each Patient ID is unique within a File-set
@@ -593,9 +953,33 @@ class RecordNode(Iterable["RecordNode"]):
         except (AttributeError, ValueError) as exc:
             raise ValueError(f"{msg} a required element") from exc
 
+    @property
+    def _record(self) -> Dataset:
+        """Return the node's directory record dataset, parsing it first if it
+        was read from a DICOMDIR and hasn't been used yet.
+        """
+        if self._encoded is not None:
+            self._set_record(self._encoded.decode())
+
+        try:
+            return self._dataset
+        except AttributeError:
+            raise AttributeError(
+                f"'{type(self).__name__}' object has no attribute '_record'"
+            ) from None
+
+    @_record.setter
+    def _record(self, ds: Dataset) -> None:
+        """Set the node's directory record dataset."""
+        self._encoded = None
+        self._dataset = ds
+
     @property
     def record_type(self) -> str:
         """Return the record's *Directory Record Type* as :class:`str`."""
+        if self._encoded is not None:
+            return self._encoded.record_type
+
         return cast(str, self._record.DirectoryRecordType)
 
     def remove(self, node: "RecordNode") -> None:
@@ -812,6 +1196,15 @@ class FileInstance:
         if self.for_addition:
             return False
 
+        if self.node._encoded is not None:
+            # Avoid parsing the record
+            file_id = self.node._encoded.file_id
+            if not file_id:
+                return True
+
+            components = [file_id] if isinstance(file_id, str) else list(file_id)
+            return components != self.FileID.split(os.path.sep)
+
         if self["ReferencedFileID"].VM == 1:
             file_id = self.FileID.split(os.path.sep)
             return [self.ReferencedFileID] != file_id
@@ -946,6 +1339,171 @@ class FileInstance:
         return cast(UID, self.ReferencedTransferSyntaxUIDInFile)
 
 
+class _InstanceIndex:
+    """Hash indexes of directory record element values for the instances in
+    a File-set.
+    """
+
+    def __init__(self, instances: Iterable[FileInstance]) -> None:
+        """Create a new index.
+
+        Parameters
+        ----------
+        instances : Iterable[pydicom.fileset.FileInstance]
+            The instances to add to the index.
+        """
+        # {keyword: {value: [FileInstance, ...]}}, created when first used
+        self._values: dict[str, dict[Any, list[FileInstance]]] = {}
+        # The order the instances were added in
+        self.order: dict[FileInstance, int] = {}
+        for instance in instances:
+            self.add(instance)
+
+    @staticmethod
+    def _add_value(
+        index: dict[Any, list[FileInstance]], keyword: str, instance: FileInstance
+    ) -> None:
+        """Add the value of the element with `keyword` in `instance` to
+        `index`.
+        """
+        # Avoid parsing unchanged instance records
+        encoded = instance.node._encoded
+        if (
+            keyword == "SOPInstanceUID"
+            and encoded is not None
+            and encoded.key_tag == 0x00041511
+        ):
+            value = encoded.decode_key()
+        else:
+            try:
+                value = instance[keyword].value
+            except KeyError:
+                return
+
+        index.setdefault(_index_key(value), []).append(instance)
+
+    def add(self, instance: FileInstance) -> None:
+        """Add `instance` to the index."""
+        self.order[instance] = len(self.order)
+        for kw, index in self._values.items():
+            self._add_value(index, kw, instance)
+
+    def values(self, keyword: str) -> dict[Any, list[FileInstance]]:
+        """Return the index for `keyword`, which must be one of the indexed
+        keywords.
+        """
+        if (index := self._values.get(keyword)) is None:
+            index = self._values[keyword] = {}
+            for instance in self.order:
+                self._add_value(index, keyword, instance)
+
+        return index
+
+    def lookup(self, keyword: str, query: Any) -> set[FileInstance]:
+        """Return the instances with `keyword` values that may match `query`.
+
+        Parameters
+        ----------
+        keyword : str
+            The element keyword, must be one of the indexed keywords.
+        query : object
+            The value to find, if a :class:`list`, :class:`tuple` or
+            :class:`set` then also find each of the values it contains.
+        """
+        index = self.values(keyword)
+        queries = [query]
+        if isinstance(query, list | tuple | set):
+            queries.extend(query)
+
+        matches: set[FileInstance] = set()
+        for value in queries:
+            try:
+                matches.update(index.get(_index_key(value), []))
+            except TypeError:
+                # Unhashable value
+                continue
+
+        return matches
+
+    def present(self, keyword: str) -> set[FileInstance]:
+        """Return the instances that have an element with `keyword`."""
+        return {ii for instances in self.values(keyword).values() for ii in instances}
+
+
+def _map_threads(
+    func: Callable[[Any], Any], items: list[Any], max_workers: int | None
+) -> list[Any]:
+    """Return the result of calling `func` for each of `items`, using a
+    thread pool with at most `max_workers` threads if there's more than one
+    item.
+    """
+    if max_workers == 1 or len(items) < 2:
+        return [func(item) for item in items]
+
+    with ThreadPoolExecutor(max_workers) as pool:
+        return list(pool.map(func, items))
+
+
+def _stage_files(
+    files: list[tuple[Callable, Any, Path]], max_workers: int | None
+) -> None:
+    """Copy or move files to their destinations in a File-set.
+
+    Parameters
+    ----------
+    files : list[tuple[Callable, str | pathlib.Path, pathlib.Path]]
+        The function to use, such as :func:`shutil.copyfile` or
+        :func:`shutil.move`, and the source and destination paths for each
+        file. Each destination must be unique and must not be the source of
+        another file.
+    max_workers : int | None
+        The maximum number of files to copy or move at the same time, if
+        ``None`` then use the :class:`~concurrent.futures.ThreadPoolExecutor`
+        default.
+    """
+    for parent in sorted({dst.parent for _, _, dst in files}):
+        parent.mkdir(parents=True, exist_ok=True)
+
+    def stage(file: tuple[Callable, Any, Path]) -> None:
+        fn, src, dst = file
+        if isinstance(src, str | os.PathLike):
+            src = os.fspath(src)
+
+        fn(src, os.fspath(dst))
+
+    _map_threads(stage, files, max_workers)
+
+
+def _is_file_format(ds: Dataset) -> bool:
+    """Return ``True`` if `ds` was read from a file in the DICOM File Format
+    with all the required *File Meta Information* elements.
+    """
+    if not isinstance(ds, FileDataset) or ds.preamble is None:
+        return False
+
+    return all(
+        tag in ds.file_meta and not ds.file_meta[tag].is_empty
+        for tag in (0x00020001, 0x00020002, 0x00020003, 0x00020010, 0x00020012)
+    )
+
+
+def _save_instance(src: "DSPathType", dst: str) -> None:
+    """Write the instance `src` to `dst` in the DICOM File Format."""
+    ds = src if isinstance(src, Dataset) else dcmread(src)
+    ds.save_as(dst, enforce_file_format=True)
+
+
+class _NewInstance(NamedTuple):
+    """An instance read by :meth:`FileSet.add_many`."""
+
+    ds_or_path: "DSPathType"
+    uid: str
+    # The directory records or the exception raised when creating them
+    records: list[Dataset] | ValueError
+    # True if the instance can be copied to the stage as-is
+    copy: bool
+
+
 DSPathType = Dataset | str | os.PathLike
 
 
@@ -982,6 +1540,8 @@ class FileSet:
         self._ds = Dataset()
         # The File-set's managed SOP Instances as list of FileInstance
         self._instances: list[FileInstance] = []
+        # Indexes of the directory record values for the instances
+        self._index: _InstanceIndex | None = None
         # Use alphanumeric or numeric File IDs
         self._use_alphanumeric = False
 
@@ -1029,15 +1589,141 @@ class FileSet:
         else:
             ds = ds_or_path
 
-        key = ds.SOPInstanceUID
-        have_instance = [ii for ii in self if ii.SOPInstanceUID == key]
+        instance = self._existing_instance(ds.SOPInstanceUID)
+        if instance is not None:
+            return instance
+
+        # If not already in the File-set, stage for addition
+        instance = self._create_instance(self._recordify(ds))
+        self._tree.add(instance.node)
+
+        # Save the dataset to the stage
+        self._stage["+"][instance.SOPInstanceUID] = instance
+        self._add_instance(instance)
+        instance._apply_stage("+")
+        ds.save_as(instance.path, enforce_file_format=True)
+
+        return instance
+
+    def add_many(
+        self, ds_or_paths: Iterable[DSPathType], max_workers: int | None = None
+    ) -> list[FileInstance]:
+        """Stage multiple instances for addition to the File-set.
+
+        .. versionadded:: 3.1
+
+        The same as calling :meth:`~pydicom.fileset.FileSet.add` for each
+        instance, except that the instances are read and staged concurrently.
+        Only the elements preceding the *Pixel Data* are read from each path
+        when creating the directory records, and instances that are already in
+        the DICOM File Format are copied to the stage without being encoded
+        again.
+
+        Parameters
+        ----------
+        ds_or_paths : Iterable[pydicom.dataset.Dataset | str | PathLike]
+            The instances to add to the File-set, either as
+            :class:`~pydicom.dataset.Dataset` or the paths to the instances.
+        max_workers : int | None, optional
+            The maximum number of instances to read or stage at the same time,
+            if ``None`` (default) then use the
+            :class:`~concurrent.futures.ThreadPoolExecutor` default.
+
+        Returns
+        -------
+        list[FileInstance]
+            The :class:`~pydicom.fileset.FileInstance` for each of the
+            instances, in the same order as `ds_or_paths`.
+
+        Raises
+        ------
+        ValueError
+            If unable to create the directory records for one of the instances,
+            in which case none of the instances are added.
+
+        See Also
+        --------
+        :meth:`~pydicom.fileset.FileSet.add`
+        """
+
+        def read(ds_or_path: DSPathType) -> _NewInstance:
+            if isinstance(ds_or_path, str | os.PathLike):
+                ds: Dataset = dcmread(ds_or_path, stop_before_pixels=True)
+            else:
+                ds = ds_or_path
+
+            try:
+                records: list[Dataset] | ValueError = list(self._recordify(ds))
+            except ValueError as exc:
+                # Only raised if the instance isn't already in the File-set
+                records = exc
+
+            return _NewInstance(
+                ds_or_path,
+                ds.SOPInstanceUID,
+                records,
+                not isinstance(ds_or_path, Dataset) and _is_file_format(ds),
+            )
+
+        items = _map_threads(read, list(ds_or_paths), max_workers)
+        index = self._instance_index().values("SOPInstanceUID")
+        for item in items:
+            if (
+                isinstance(item.records, ValueError)
+                and item.uid not in self._stage["-"]
+                and item.uid not in index
+            ):
+                raise item.records
+
+        instances = []
+        new: dict[str, FileInstance] = {}
+        files: list[tuple[Callable, DSPathType, FileInstance]] = []
+        for item in items:
+            instance = new.get(item.uid) or self._existing_instance(item.uid)
+            if instance is None:
+                records = cast(list[Dataset], item.records)
+                instance = new[item.uid] = self._create_instance(records)
+                fn: Callable = shutil.copyfile if item.copy else _save_instance
+                files.append((fn, item.ds_or_path, instance))
+
+            instances.append(instance)
+
+        # Add the new instances to the tree in one pass, then stage them
+        self._tree._add_leaves(instance.node for instance in new.values())
+        for instance in new.values():
+            self._stage["+"][instance.SOPInstanceUID] = instance
+            self._add_instance(instance)
+            instance._apply_stage("+")
+
+        _stage_files(
+            [(fn, src, Path(instance.path)) for fn, src, instance in files],
+            max_workers,
+        )
+
+        return instances
+
+    def _existing_instance(self, key: str) -> FileInstance | None:
+        """Return the instance with *SOP Instance UID* `key` if it's already
+        in the File-set, cancelling any staging for removal.
+
+        Parameters
+        ----------
+        key : str
+            The *SOP Instance UID* of the instance.
+
+        Returns
+        -------
+        FileInstance | None
+            The instance if it's already in the File-set, otherwise ``None``.
+        """
+        have_instance = self._instance_index().values("SOPInstanceUID").get(key, [])
 
         # If staged for removal, keep instead - check this now because
         #   `have_instance` is False when instance staged for removal
         if key in self._stage["-"]:
             instance = self._stage["-"][key]
             del self._stage["-"][key]
-            self._instances.append(instance)
+            self._add_instance(instance)
             instance._apply_stage("+")
 
             return cast(FileInstance, instance)
@@ -1047,11 +1733,28 @@ class FileSet:
         if have_instance:
             return have_instance[0]
 
-        # If not already in the File-set, stage for addition
-        # Create the directory records and tree nodes for the dataset
+        return None
+
+    @staticmethod
+    def _create_instance(records: Iterable[Dataset]) -> FileInstance:
+        """Return a new instance for the directory records `records`.
+
+        Parameters
+        ----------
+        records : Iterable[pydicom.dataset.Dataset]
+            The directory records for the instance, ordered from highest to
+            lowest level.
+
+        Returns
+        -------
+        FileInstance
+            The new instance, which still needs to be added to the tree and
+            staged for addition.
+        """
+        # Create the tree nodes for the directory records
         # For instances that won't contain PRIVATE records we shouldn't have
         #   to worry about exceeding the maximum component depth of 8
-        record_gen = self._recordify(ds)
+        record_gen = iter(records)
         record = next(record_gen)
         parent = RecordNode(record)
         node = parent  # Maybe only be a single record
@@ -1062,15 +1765,14 @@ class FileSet:
 
         instance = FileInstance(node)
         node.instance = instance
-        self._tree.add(node)
 
-        # Save the dataset to the stage
-        self._stage["+"][instance.SOPInstanceUID] = instance
-        self._instances.append(instance)
-        instance._apply_stage("+")
-        ds.save_as(instance.path, enforce_file_format=True)
+        return instance
 
-        return cast(FileInstance, instance)
+    def _add_instance(self, instance: FileInstance) -> None:
+        """Add `instance` to the File-set's managed instances."""
+        self._instances.append(instance)
+        if self._index is not None:
+            self._index.add(instance)
 
     def add_custom(self, ds_or_path: DSPathType, leaf: RecordNode) -> FileInstance:
         """Stage an instance for addition to the File-set using custom records.
@@ -1166,14 +1868,14 @@ class FileSet:
             )
 
         key = ds.SOPInstanceUID
-        have_instance = [ii for ii in self if ii.SOPInstanceUID == key]
+        have_instance = self._instance_index().values("SOPInstanceUID").get(key, [])
 
         # If staged for removal, keep instead - check this now because
         #   `have_instance` is False when instance staged for removal
         if key in self._stage["-"]:
             instance = self._stage["-"][key]
             del self._stage["-"][key]
-            self._instances.append(instance)
+            self._add_instance(instance)
             instance._apply_stage("+")
 
             return cast(FileInstance, instance)
@@ -1193,7 +1895,7 @@ class FileSet:
 
         # Save the dataset to the stage
         self._stage["+"][instance.SOPInstanceUID] = instance
-        self._instances.append(instance)
+        self._add_instance(instance)
         instance._apply_stage("+")
         ds.save_as(instance.path, enforce_file_format=True)
 
@@ -1203,6 +1905,7 @@ class FileSet:
         """Clear the File-set."""
         self._tree.children = []
         self._instances = []
+        self._index = None
         self._path = None
         self._ds = Dataset()
         self._id = None
@@ -1219,10 +1922,20 @@ class FileSet:
         self._stage["t"] = TemporaryDirectory()
         self._stage["path"] = Path(self._stage["t"].name)
 
-    def copy(self, path: str | os.PathLike, force_implicit: bool = False) -> "FileSet":
+    def copy(
+        self,
+        path: str | os.PathLike,
+        force_implicit: bool = False,
+        max_workers: int | None = None,
+    ) -> "FileSet":
         """Copy the File-set to a new root directory and return the copied
         File-set.
 
+        .. versionchanged:: 3.1
+
+            Added the `max_workers` keyword parameter, the instances are now
+            copied concurrently.
+
         Changes staged to the original :class:`~pydicom.fileset.FileSet` will
         be applied to the new File-set. The original
         :class:`~pydicom.fileset.FileSet` will remain staged.
@@ -1235,6 +1948,10 @@ class FileSet:
             If ``True`` force the DICOMDIR file to be encoded using *Implicit
             VR Little Endian* which is non-conformant to the DICOM Standard
             (default ``False``).
+        max_workers : int, optional
+            The maximum number of instances to copy at the same time, default
+            is to use the :class:`~concurrent.futures.ThreadPoolExecutor`
+            default. Use ``1`` to copy the instances one at a time.
 
         Returns
         -------
@@ -1264,12 +1981,16 @@ class FileSet:
             continue
 
         file_ids = []
+        files: list[tuple[Callable, str | Path, Path]] = []
         for instance in self:
-            file_ids.append(instance.ReferencedFileID)
-            dst = path / Path(instance.FileID)
-            dst.parent.mkdir(parents=True, exist_ok=True)
-            shutil.copyfile(instance.path, dst)
-            instance.node._record.ReferencedFileID = instance.FileID.split(os.path.sep)
+            file_id = instance.FileID
+            files.append((shutil.copyfile, instance.path, path / file_id))
+            # Avoid parsing unchanged records
+            if instance.node._file_id != Path(file_id):
+                file_ids.append((instance, instance.ReferencedFileID))
+                instance.node._record.ReferencedFileID = file_id.split(os.path.sep)
+
+        _stage_files(files, max_workers)
 
         # Create the DICOMDIR file
         p = path / "DICOMDIR"
@@ -1278,9 +1999,7 @@ class FileSet:
             self._write_dicomdir(f, copy_safe=True, force_implicit=force_implicit)
 
         # Reset the *Referenced File ID* values
-        # The order here doesn't matter because removed instances aren't
-        #   yielded by iter(self)
-        for instance, file_id in zip(self, file_ids):
+        for instance, file_id in file_ids:
             instance.node._record.ReferencedFileID = file_id
 
         # Reattach the removed nodes
@@ -1419,15 +2138,37 @@ class FileSet:
             self._ds.FileSetDescriptorFileID = self._descriptor
         self._stage["^"] = True
 
+    def _instance_index(self) -> _InstanceIndex:
+        """Return the indexes for the File-set's instances."""
+        if self._index is None:
+            self._index = _InstanceIndex(self._instances)
+
+        return self._index
+
     def find(self, load: bool = False, **kwargs: Any) -> list[FileInstance]:
         """Return matching instances in the File-set
 
+        .. versionchanged:: 3.1
+
+            Added support for matching against multiple values and for range
+            matching, and searches using the *Patient ID*, *Study Instance
+            UID*, *Series Instance UID*, *Modality* or *SOP Instance UID* now
+            use an index of the directory records rather than checking every
+            instance.
+
+        **Matching**
+
+        * A :class:`list`, :class:`tuple` or :class:`set` of values will match
+          if the element's value is any of the query values, such as
+          ``PatientID=['1234567', '7654321']``. For backwards compatibility a
+          multi-valued element will also match if equal to the query values.
+        * Elements with a VR of **DA** or **TM** support range matching, such
+          as ``StudyDate="20200101-20201231"``, ``StudyDate="20200101-"`` or
+          ``StudyTime="-1200"``.
+        * Any other value must be equal to the element's value.
+
         **Limitations**
 
-        * Only single value matching is supported so neither
-          ``PatientID=['1234567', '7654321']`` or ``PatientID='1234567',
-          PatientID='7654321'`` will work (although the first example will
-          work if the *Patient ID* is actually multi-valued).
         * Repeating group and private elements cannot be used when searching.
 
         Parameters
@@ -1464,13 +2205,35 @@ class FileSet:
 
             for kw, val in kwargs.items():
                 try:
-                    assert ds[kw].value == val
-                except (AssertionError, KeyError):
+                    elem = ds[kw]
+                except KeyError:
+                    return False
+
+                if not _is_match(elem.value, val, elem.VR):
                     return False
 
             return True
 
-        matches = [instance for instance in self if match(instance, **kwargs)]
+        instances: Iterable[FileInstance] = self
+        indexed = [kw for kw in kwargs if kw in _INDEXED_KEYWORDS]
+        if not load and indexed:
+            # Only check the instances that may match the indexed elements
+            index = self._instance_index()
+            candidates = set.intersection(
+                *[index.lookup(kw, kwargs[kw]) for kw in indexed]
+            )
+            instances = sorted(candidates, key=index.order.__getitem__)
+
+        matches = [instance for instance in instances if match(instance, **kwargs)]
+
+        if not load and not matches and not has_elements:
+            if len(indexed) == len(kwargs):
+                index = self._instance_index()
+                has_elements = bool(
+                    set.intersection(*[index.present(kw) for kw in indexed])
+                )
+            elif indexed:
+                has_elements = any(all(kw in ii for kw in kwargs) for ii in self)
 
         if not load and not has_elements:
             warn_and_log(
@@ -1489,6 +2252,12 @@ class FileSet:
     ) -> list[Any] | dict[str | int, list[Any]]:
         """Return a list of unique values for given element(s).
 
+        .. versionchanged:: 3.1
+
+            Searching all instances for the *Patient ID*, *Study Instance
+            UID*, *Series Instance UID*, *Modality* or *SOP Instance UID* now
+            uses an index of the directory records.
+
         Parameters
         ----------
         elements : str, int or pydicom.tag.BaseTag, or list of these
@@ -1515,13 +2284,29 @@ class FileSet:
         element_list = elements if isinstance(elements, list) else [elements]
         has_element = {element: False for element in element_list}
         results: dict[str | int, list[Any]] = {element: [] for element in element_list}
-        iter_instances = instances or iter(self)
+
+        # Use the index for all instances when searching the directory records
+        remaining = element_list
+        if not load and not instances:
+            index = self._instance_index()
+            remaining = []
+            for element in element_list:
+                kw = element if isinstance(element, str) else keyword_for_tag(element)
+                if kw not in _INDEXED_KEYWORDS:
+                    remaining.append(element)
+                    continue
+
+                values = index.values(kw)
+                has_element[element] = bool(values)
+                results[element] = [v[0][element].value for v in values.values()]
+
+        iter_instances = (instances or iter(self)) if remaining else []
         instance: Dataset | FileInstance
         for instance in iter_instances:
             if load:
                 instance = instance.load()
 
-            for element in element_list:
+            for element in remaining:
                 if element not in instance:
                     continue
 
@@ -1595,6 +2380,12 @@ class FileSet:
     ) -> None:
         """Load an existing File-set.
 
+        .. versionchanged:: 3.1
+
+            When loading from a path, the directory records are linked using
+            only their offset and record type elements and the remaining
+            contents of each record are parsed when first needed.
+
         Existing File-sets that do not use the same directory structure as
         *pydicom* will be staged to be moved to a new structure. This is
         because the DICOM Standard attaches no semantics to *how* the files
@@ -1617,7 +2408,9 @@ class FileSet:
         if isinstance(ds_or_path, Dataset):
             ds = ds_or_path
         else:
-            ds = dcmread(ds_or_path)
+            # Defer reading the *Directory Record Sequence* so the records
+            #   can be linked without parsing them
+            ds = dcmread(ds_or_path, defer_size=_DEFER_SIZE)
 
         sop_class = ds.file_meta.get("MediaStorageSOPClassUID", None)
         if sop_class != MediaStorageDirectoryStorage:
@@ -1667,6 +2460,10 @@ class FileSet:
         # Create the record tree
         self._parse_records(ds, include_orphans, raise_orphans)
 
+        # Read any other deferred values, as the DICOMDIR may be overwritten
+        for tag in ds.keys():
+            ds.get_item(tag)
+
         bad_instances = []
         for instance in self:
             # Check that the referenced file exists
@@ -1715,40 +2512,67 @@ class FileSet:
         """
         # First pass: get the offsets for each record
         records = {}
-        for record in cast(Iterable[Dataset], ds.DirectoryRecordSequence):
-            offset = cast(int, record.seq_item_tell)
-            node = RecordNode(record)
-            node._offset = offset
-            records[offset] = node
+        encoded_records = _read_encoded_records(ds)
+        if encoded_records is not None:
+            # Only the elements needed to link the records have been read
+            for encoded in encoded_records:
+                node = RecordNode()
+                node._encoded = encoded
+                node._offset = encoded.offset
+                records[encoded.offset] = node
+        else:
+            for record in cast(Iterable[Dataset], ds.DirectoryRecordSequence):
+                offset = cast(int, record.seq_item_tell)
+                node = RecordNode(record)
+                node._offset = offset
+                records[offset] = node
+
+        def next_offset(node: RecordNode) -> int | None:
+            if node._encoded is not None:
+                return node._encoded.next_offset
+
+            return getattr(node._record, _NEXT_OFFSET, None)
+
+        def lower_offset(node: RecordNode) -> int | None:
+            if node._encoded is not None:
+                return node._encoded.lower_offset
+
+            return getattr(node._record, _LOWER_OFFSET, None)
+
+        def has_file_id(node: RecordNode) -> bool:
+            if node._encoded is not None:
+                return node._encoded.file_id is not None
+
+            return "ReferencedFileID" in node._record
 
         # Define the top-level nodes
         if records:
             node = records[ds[_FIRST_OFFSET].value]
             node.parent = self._tree
-            while getattr(node._record, _NEXT_OFFSET, None):
-                node = records[node._record[_NEXT_OFFSET].value]
+            while next_record := next_offset(node):
+                node = records[next_record]
                 node.parent = self._tree
 
         # Second pass: build the record hierarchy
         #   Records not in the hierarchy will be ignored
         #   Branches without a valid leaf node File ID will be removed
         def recurse_node(node: RecordNode) -> None:
-            child_offset = getattr(node._record, _LOWER_OFFSET, None)
+            child_offset = lower_offset(node)
             if child_offset:
                 child = records[child_offset]
                 child.parent = node
 
-                next_offset = getattr(child._record, _NEXT_OFFSET, None)
-                while next_offset:
-                    child = records[next_offset]
+                next_record = next_offset(child)
+                while next_record:
+                    child = records[next_record]
                     child.parent = node
-                    next_offset = getattr(child._record, _NEXT_OFFSET, None)
-            elif "ReferencedFileID" not in node._record:
+                    next_record = next_offset(child)
+            elif not has_file_id(node):
                 # No children = leaf node, leaf nodes must reference a File ID
                 del node.parent[node]
 
             # The leaf node references the FileInstance
-            if "ReferencedFileID" in node._record:
+            if has_file_id(node):
                 node.instance = FileInstance(node)
                 self._instances.append(node.instance)
 
@@ -1768,7 +2592,7 @@ class FileSet:
         # Determine which nodes are both orphaned and reference an instance
         missing_set = set(records.keys()) - {ii._offset for ii in self._tree}
         missing = [records[o] for o in missing_set]
-        missing = [r for r in missing if "ReferencedFileID" in r._record]
+        missing = [r for r in missing if has_file_id(r)]
 
         if missing and not include_orphans:
             warn_and_log(
@@ -1916,12 +2740,14 @@ class FileSet:
                 pass
             instance._apply_stage("-")
             self._instances.remove(instance)
+            self._index = None
 
         # Stage for removal if not already done
         elif instance.SOPInstanceUID not in self._stage["-"]:
             instance._apply_stage("-")
             self._stage["-"][instance.SOPInstanceUID] = instance
             self._instances.remove(instance)
+            self._index = None
 
     def __str__(self) -> str:
         """Return a string representation of the FileSet."""
@@ -1996,9 +2822,19 @@ class FileSet:
         path: str | os.PathLike | None = None,
         use_existing: bool = False,
         force_implicit: bool = False,
+        max_workers: int | None = None,
     ) -> None:
         """Write the File-set, or changes to the File-set, to the file system.
 
+        .. versionchanged:: 3.1
+
+            Added the `max_workers` keyword parameter, the instances are now
+            copied or moved concurrently. Directory records that haven't been
+            changed since the File-set was loaded are written using their
+            existing encoding with only their offsets updated, so adding
+            instances to a large File-set no longer requires every record to
+            be parsed and encoded again.
+
         .. warning::
 
             If modifying an existing File-set it's **strongly recommended**
@@ -2043,6 +2879,10 @@ class FileSet:
             If ``True`` force the DICOMDIR file to be encoded using *Implicit
             VR Little Endian* which is non-conformant to the DICOM Standard
             (default ``False``).
+        max_workers : int, optional
+            The maximum number of instances to copy or move at the same time,
+            default is to use the :class:`~concurrent.futures.ThreadPoolExecutor`
+            default. Use ``1`` to copy or move the instances one at a time.
 
         Raises
         ------
@@ -2116,12 +2956,15 @@ class FileSet:
         #   for a different (later) instance
         # Check for collisions between the new and old File IDs
         #   and copy any to the stage
-        fout = {Path(ii.FileID) for ii in self}
-        fin = {
-            ii.node._file_id for ii in self if ii.SOPInstanceUID not in self._stage["+"]
-        }
-        collisions = fout & fin
-        for instance in [ii for ii in self if ii.node._file_id in collisions]:
+        #   Instances that keep their File ID can't collide with another
+        file_ids = {ii: Path(ii.FileID) for ii in self}
+        fout = set(file_ids.values())
+        moved = [
+            ii
+            for ii, file_id in file_ids.items()
+            if not ii.for_addition and ii.node._file_id != file_id
+        ]
+        for instance in [ii for ii in moved if ii.node._file_id in fout]:
             self._stage["+"][instance.SOPInstanceUID] = instance
             instance._apply_stage("+")
             shutil.copyfile(
@@ -2129,20 +2972,19 @@ class FileSet:
                 instance.path,
             )
 
-        for instance in self:
-            dst = root / instance.FileID
-            dst.parent.mkdir(parents=True, exist_ok=True)
-            fn: Callable
-            src: Path | str
-            if instance.SOPInstanceUID in self._stage["+"]:
-                src = instance.path
-                fn = shutil.copyfile
-            else:
-                src = root / cast(Path, instance.node._file_id)
-                fn = shutil.move
+        files: list[tuple[Callable, str | Path, Path]] = []
+        for instance, file_id in file_ids.items():
+            dst = root / file_id
+            if instance.for_addition:
+                files.append((shutil.copyfile, instance.path, dst))
+            elif (src := root / cast(Path, instance.node._file_id)) != dst:
+                files.append((shutil.move, src, dst))
+
+            # Avoid parsing unchanged records
+            if instance.node._file_id != file_id:
+                instance.node._record.ReferencedFileID = list(file_id.parts)
 
-            fn(os.fspath(src), os.fspath(dst))
-            instance.node._record.ReferencedFileID = instance.FileID.split(os.path.sep)
+        _stage_files(files, max_workers)
 
         # Create the DICOMDIR file
         with open(p, "wb") as fp:
@@ -2203,41 +3045,62 @@ class FileSet:
         write_dataset(fp, ds[0x00041200:0x00041220])
 
         # Rebuild and encode the *Directory Record Sequence*
-        # Step 1: Determine the offsets for all the records
+        # Step 1: Encode the records and determine their offsets
+        #   Records that haven't been parsed since the File-set was loaded
+        #   keep their existing encoding
         offset = fp.tell() + seq_offset  # Start of the first seq. item tag
+        items = []
         for node in self._tree:
             # RecordNode._offset is the start of each record's seq. item tag
             node._offset = offset
-            offset += 8  # a sequence item's (tag + length)
-            # Copy safe - only modifies RecordNode._offset
-            offset += node._encode_record(force_implicit)
+            # Copy safe - only modifies RecordNode._offset, _offset_next and
+            #   _offset_lower
+            value = bytearray(node._encode_record(force_implicit))
             # If the sequence item has undefined length then it uses a
             #   sequence item delimiter item
-            if node._record.is_undefined_length_sequence_item:
-                offset += 8
-
-        # Step 2: Update the records and add to *Directory Record Sequence*
-        ds.DirectoryRecordSequence = []
-        for node in self._tree:
-            record = node._record
-            if not copy_safe:
-                node._update_record_offsets()
-            else:
-                record = copy.deepcopy(record)
-                next_elem = record[_NEXT_OFFSET]
-                next_elem.value = 0
-                if node.next:
-                    next_elem.value = node.next._offset
-
-                lower_elem = record[_LOWER_OFFSET]
-                lower_elem.value = 0
-                if node.children:
-                    record[_LOWER_OFFSET].value = node.children[0]._offset
-
-            cast(list[Dataset], ds.DirectoryRecordSequence).append(record)
+            is_undefined_length = (
+                node._encoded is None and node._record.is_undefined_length_sequence_item
+            )
+            items.append((node, value, is_undefined_length))
+            # a sequence item's (tag + length) + record (+ delimiter)
+            offset += 8 + len(value) + (8 if is_undefined_length else 0)
+
+        # Step 2: Update the records' offsets and encode the sequence items
+        next_offsets = {
+            node: sibling._offset
+            for parent in (self._tree, *self._tree)
+            for node, sibling in zip(parent.children, parent.children[1:])
+        }
+        sequence = bytearray()
+        for node, value, is_undefined_length in items:
+            next_offset = next_offsets.get(node, 0)
+            lower_offset = node.children[0]._offset if node.children else 0
+            _UINT32.pack_into(value, node._offset_next, next_offset)
+            _UINT32.pack_into(value, node._offset_lower, lower_offset)
+            if not copy_safe and node._encoded is None:
+                node._record[_NEXT_OFFSET].value = next_offset
+                node._record[_LOWER_OFFSET].value = lower_offset
+
+            length = 0xFFFFFFFF if is_undefined_length else len(value)
+            sequence.extend(_ITEM_HEADER.pack(0xFFFE, 0xE000, length))
+            sequence.extend(value)
+            if is_undefined_length:
+                sequence.extend(_ITEM_HEADER.pack(0xFFFE, 0xE00D, 0))
 
         # Step 3: Encode *Directory Record Sequence* and the rest
-        write_dataset(fp, ds[0x00041220:])
+        fp.write_tag(0x00041220)
+        if not force_implicit:
+            fp.write(b"SQ\x00\x00")
+        fp.write_UL(len(sequence))
+        value_tell = fp.tell()
+        fp.write(sequence)
+        write_dataset(fp, ds[0x00041221:])
+
+        # The records are parsed from the encoded sequence when accessed
+        tag = BaseTag(0x00041220)
+        ds._dict[tag] = RawDataElement(
+            tag, "SQ", len(sequence), bytes(sequence), value_tell, force_implicit, True
+        )
 
         # Update the first and last record offsets
         if self._tree.children:
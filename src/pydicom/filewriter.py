@@ -1,28 +1,47 @@
 # Copyright 2008-2021 pydicom authors. See LICENSE file for details.
 """Functions related to writing DICOM data."""
 
-from collections.abc import Sequence, MutableSequence, Iterable
-from copy import deepcopy
-from io import BufferedIOBase
-from struct import pack
+from collections.abc import Sequence, MutableSequence, Iterable, Mapping
+from copy import copy, deepcopy
+from io import (
+    BufferedIOBase,
+    BytesIO,
+    BufferedRandom,
+    BufferedReader,
+    BufferedWriter,
+    FileIO,
+)
+import os
+from struct import Struct, pack, unpack
+import tempfile
 from typing import BinaryIO, Any, cast
 from collections.abc import Callable
-import zlib
 
 from pydicom import config
+from pydicom.config import logger
 from pydicom.charset import default_encoding, convert_encodings, encode_string
 from pydicom.dataelem import (
     convert_raw_data_element,
     DataElement,
     RawDataElement,
 )
-from pydicom.dataset import Dataset, validate_file_meta, FileMetaDataset
-from pydicom.filebase import DicomFile, DicomBytesIO, DicomIO, WriteableBuffer
+from pydicom.dataset import Dataset, FileDataset, validate_file_meta, FileMetaDataset
+from pydicom.datadict import dictionary_VR
+from pydicom.filereader import data_element_offset_to_value, dcmread
+from pydicom.filebase import (
+    _DeflateBuffer,
+    DicomFile,
+    DicomBytesIO,
+    DicomDeflateIO,
+    DicomIO,
+    WriteableBuffer,
+)
 from pydicom.fileutil import (
     path_from_pathlike,
     PathType,
     buffer_remaining,
     read_buffer,
+    read_undefined_length_value,
     reset_buffer_position,
 )
 from pydicom.misc import warn_and_log
@@ -30,6 +49,7 @@ from pydicom.multival import MultiValue
 from pydicom.tag import (
     Tag,
     BaseTag,
+    TagType,
     ItemTag,
     ItemDelimiterTag,
     SequenceDelimiterTag,
@@ -633,24 +653,91 @@ def write_TM(fp: DicomIO, elem: DataElement) -> None:
         fp.write(val)
 
 
-def write_data_element(
-    fp: DicomIO,
-    elem: DataElement | RawDataElement,
-    encodings: str | list[str] | None = None,
-) -> None:
-    """Write the data_element to file fp according to
-    dicom media storage rules.
-    """
-    # Write element's tag
-    fp.write_tag(elem.tag)
+# Element header packers for (is_implicit_VR, is_little_endian), the explicit
+#   VR headers are for VRs with a 2 or 4 byte length field
+_IMPLICIT_HEADER = {True: Struct("<2HL").pack, False: Struct(">2HL").pack}
+_EXPLICIT_HEADER = {True: Struct("<2H2sH").pack, False: Struct(">2H2sH").pack}
+_EXPLICIT_HEADER_32 = {True: Struct("<2H2s2xL").pack, False: Struct(">2H2s2xL").pack}
+_SEQUENCE_DELIMITER = {
+    True: pack("<2HL", 0xFFFE, 0xE0DD, 0),
+    False: pack(">2HL", 0xFFFE, 0xE0DD, 0),
+}
+
+# Elements are encoded in memory and written to the destination in blocks of
+#   at least this size, values larger than this are written directly
+_WRITE_BUFFER_SIZE = 1024 * 1024
+
+# The types that are known not to keep a reference to the object passed to
+#   write(), so the in-memory buffer can be written without making a copy
+_VIEW_WRITERS = (
+    FileIO,
+    BufferedWriter,
+    BufferedRandom,
+    BytesIO,
+    _DeflateBuffer,
+)
+
+
+def _element_header(
+    tag: int, vr: str | None, length: int, is_implicit_vr: bool, is_little_endian: bool
+) -> bytes:
+    """Return the encoded tag, VR and length of an element."""
+    if is_implicit_vr:
+        return _IMPLICIT_HEADER[is_little_endian](tag >> 16, tag & 0xFFFF, length)
+
+    vr = cast(str, vr)
+    packer = (_EXPLICIT_HEADER_32 if vr in EXPLICIT_VR_LENGTH_32 else _EXPLICIT_HEADER)[
+        is_little_endian
+    ]
+
+    return packer(tag >> 16, tag & 0xFFFF, vr.encode(default_encoding), length)
+
 
-    # write into a buffer to avoid seeking back which can be expansive
+def _write_buffer(fp: DicomIO) -> DicomBytesIO:
+    """Return an empty in-memory buffer with the same encoding as `fp`."""
     buffer = DicomBytesIO()
     buffer.is_little_endian = fp.is_little_endian
     buffer.is_implicit_VR = fp.is_implicit_VR
 
+    return buffer
+
+
+def _flush(buffer: DicomBytesIO, fp: DicomIO) -> None:
+    """Write the contents of `buffer` to `fp` and empty it."""
+    if buffer is fp:
+        return
+
+    parent = cast(BytesIO, buffer.parent)
+    if type(getattr(fp.write, "__self__", None)) in _VIEW_WRITERS:
+        with parent.getbuffer() as view:
+            fp.write(view)
+    else:
+        # Other file-likes may keep the object, and the view is released
+        #   and the buffer truncated once written
+        fp.write(parent.getvalue())
+
+    parent.seek(0)
+    parent.truncate()
+
+
+def _write_element(
+    buffer: DicomBytesIO,
+    elem: DataElement | RawDataElement,
+    encodings: list[str],
+    fp: DicomIO,
+) -> None:
+    """Encode `elem` to `buffer`.
+
+    The element is encoded in-place by writing the value after a placeholder
+    for the header and then packing the header once the length of the encoded
+    value is known. Buffered and large values are written directly to `fp`
+    after flushing `buffer`, which may be `fp` itself.
+    """
+    tag = elem.tag
     vr: str | None = elem.VR
-    if not fp.is_implicit_VR and vr and len(vr) != 2:
+    is_implicit_vr = buffer.is_implicit_VR
+    is_little_endian = buffer.is_little_endian
+    if not is_implicit_vr and vr and len(vr) != 2:
         msg = (
             f"Cannot write ambiguous VR of '{vr}' for data element with "
             f"tag {elem.tag!r}.\nSet the correct VR before "
@@ -658,10 +745,13 @@ def write_data_element(
         )
         raise ValueError(msg)
 
+    value: Any = None
+    fn: Any = None
+    param: Any = None
     if elem.is_raw:
         elem = cast(RawDataElement, elem)
         # raw data element values can be written as they are
-        buffer.write(cast(bytes, elem.value))
+        value = cast(bytes, elem.value)
         is_undefined_length = elem.length == 0xFFFFFFFF
     else:
         elem = cast(DataElement, elem)
@@ -670,91 +760,119 @@ def write_data_element(
                 f"write_data_element: unknown Value Representation '{vr}'"
             )
 
-        encodings = encodings or [default_encoding]
-        encodings = convert_encodings(encodings)
         fn, param = writers[cast(VR, vr)]
         is_undefined_length = elem.is_undefined_length
-        if not elem.is_empty:
-            if vr in CUSTOMIZABLE_CHARSET_VR or vr == VR.SQ:
-                fn(buffer, elem, encodings=encodings)  # type: ignore[operator]
-            else:
-                # Many numeric types use the same writer but with
-                # numeric format parameter
-                if param is not None:
-                    fn(buffer, elem, param)  # type: ignore[operator]
-                elif not elem.is_buffered:
-                    # defer writing a buffered value until after we have written the
-                    # tag and length in the file
-                    fn(buffer, elem)  # type: ignore[operator]
+        is_empty = elem.is_empty
 
     # valid pixel data with undefined length shall contain encapsulated
     # data, e.g. sequence items - raise ValueError otherwise (see #238)
-    if is_undefined_length and elem.tag == 0x7FE00010:
+    if is_undefined_length and tag == 0x7FE00010:
         if elem.is_buffered:
-            value = cast(BufferedIOBase, elem.value)
-            with reset_buffer_position(value):
-                pixel_data_bytes = value.read(4)
+            with reset_buffer_position(cast(BufferedIOBase, elem.value)):
+                pixel_data_bytes = cast(BufferedIOBase, elem.value).read(4)
         else:
             pixel_data_bytes = cast(bytes, elem.value)[:4]
 
         # Big endian encapsulation is non-conformant
-        tag = b"\xfe\xff\x00\xe0" if fp.is_little_endian else b"\xff\xfe\xe0\x00"
-        if not pixel_data_bytes.startswith(tag):
+        item = b"\xfe\xff\x00\xe0" if is_little_endian else b"\xff\xfe\xe0\x00"
+        if not pixel_data_bytes.startswith(item):
             raise ValueError(
                 "The (7FE0,0010) 'Pixel Data' element value hasn't been "
                 "encapsulated as required for a compressed transfer syntax - "
                 "see pydicom.encaps.encapsulate() for more information"
             )
 
-    value_length = (
-        buffer.tell()
-        if not elem.is_buffered
-        else buffer_remaining(cast(BufferedIOBase, elem.value))
-    )
+    header_length = 12 if not is_implicit_vr and vr in EXPLICIT_VR_LENGTH_32 else 8
+    header_start = buffer.tell()
+    if value is not None or elem.is_buffered:
+        # The length of the value is already known
+        value_length = (
+            len(value)
+            if value is not None
+            else buffer_remaining(cast(BufferedIOBase, elem.value))
+        )
+    else:
+        # Encode the value after a placeholder for the header
+        buffer.write(bytes(header_length))
+        if not is_empty:
+            elem = cast(DataElement, elem)
+            if vr in CUSTOMIZABLE_CHARSET_VR or vr == VR.SQ:
+                fn(buffer, elem, encodings=encodings)
+            elif param is not None:
+                # Many numeric types use the same writer but with
+                # numeric format parameter
+                fn(buffer, elem, param)
+            else:
+                fn(buffer, elem)
+
+        value_length = buffer.tell() - header_start - header_length
 
     if (
-        not fp.is_implicit_VR
-        and vr not in EXPLICIT_VR_LENGTH_32
+        header_length == 8
+        and not is_implicit_vr
         and not is_undefined_length
         and value_length > 0xFFFF
     ):
         # see PS 3.5, section 6.2.2 for handling of this case
         warn_and_log(
-            f"The value for the data element {elem.tag} exceeds the "
+            f"The value for the data element {tag} exceeds the "
             f"size of 64 kByte and cannot be written in an explicit transfer "
             f"syntax. The data element VR is changed from '{vr}' to 'UN' "
             f"to allow saving the data."
         )
         vr = VR.UN
+        if value is None and not elem.is_buffered:
+            # The header is now 4 bytes longer than the placeholder
+            value_start = header_start + header_length
+            value = buffer.getvalue()[value_start : value_start + value_length]
+            buffer.seek(header_start)
+
+    header = _element_header(
+        tag,
+        vr,
+        0xFFFFFFFF if is_undefined_length else value_length,
+        is_implicit_vr,
+        is_little_endian,
+    )
+    if value is not None:
+        buffer.write(header)
+        if buffer is not fp and len(value) >= _WRITE_BUFFER_SIZE:
+            _flush(buffer, fp)
+            fp.write(value)
+        else:
+            buffer.write(value)
+    elif elem.is_buffered:
+        # Stream the buffered value directly to `fp`
+        buffer.write(header)
+        _flush(buffer, fp)
+        fn(fp, elem)
+    else:
+        value_end = buffer.tell()
+        buffer.seek(header_start)
+        buffer.write(header)
+        buffer.seek(value_end)
 
-    # write the VR for explicit transfer syntax
-    if not fp.is_implicit_VR:
-        vr = cast(str, vr)
-        fp.write(bytes(vr, default_encoding))
+    if is_undefined_length:
+        buffer.write(_SEQUENCE_DELIMITER[is_little_endian])
 
-        if vr in EXPLICIT_VR_LENGTH_32:
-            fp.write_US(0)  # reserved 2 bytes
 
-    if (
-        not fp.is_implicit_VR
-        and vr not in EXPLICIT_VR_LENGTH_32
-        and not is_undefined_length
-    ):
-        fp.write_US(value_length)  # Explicit VR length field is 2 bytes
-    else:
-        # write the proper length of the data_element in the length slot,
-        # unless is SQ with undefined length.
-        fp.write_UL(0xFFFFFFFF if is_undefined_length else value_length)
-
-    # if the value is buffered, now we want to write the value directly to the fp
-    if elem.is_buffered:
-        fn(fp, elem)  # type: ignore[operator]
-    else:
-        fp.write(buffer.getvalue())
+def write_data_element(
+    fp: DicomIO,
+    elem: DataElement | RawDataElement,
+    encodings: str | list[str] | None = None,
+) -> None:
+    """Write the data_element to file fp according to
+    dicom media storage rules.
+    """
+    encodings = convert_encodings(encodings or [default_encoding])
+    if isinstance(fp, DicomBytesIO):
+        _write_element(fp, elem, encodings, fp)
+        return
 
-    if is_undefined_length:
-        fp.write_tag(SequenceDelimiterTag)
-        fp.write_UL(0)  # 4-byte 'length' of delimiter data item
+    # encode in memory to avoid seeking back which can be expensive
+    buffer = _write_buffer(fp)
+    _write_element(buffer, elem, encodings, fp)
+    _flush(buffer, fp)
 
 
 EncodingType = tuple[bool | None, bool | None]
@@ -831,15 +949,25 @@ def write_dataset(
         None | str | list[str], dataset.get("SpecificCharacterSet", parent_encoding)
     )
 
+    encodings = convert_encodings(dataset_encoding or [default_encoding])
+
     fpStart = fp.tell()
 
+    # Encode in memory and write to `fp` in large blocks rather than using
+    #   several small writes for every element
+    buffer = fp if isinstance(fp, DicomBytesIO) else _write_buffer(fp)
+
     # data_elements must be written in tag order
     for tag in sorted(dataset.keys()):
         # do not write retired Group Length (see PS3.5, 7.2)
         if tag.element == 0 and tag.group > 6:
             continue
 
-        write_data_element(fp, get_item(tag), dataset_encoding)
+        _write_element(buffer, get_item(tag), encodings, fp)
+        if buffer is not fp and buffer.tell() >= _WRITE_BUFFER_SIZE:
+            _flush(buffer, fp)
+
+    _flush(buffer, fp)
 
     return fp.tell() - fpStart
 
@@ -1455,17 +1583,13 @@ def dcmwrite(
             # See PS3.5 section A.5
             # When writing, the entire dataset following the file meta data
             #   is encoded normally, then "deflate" compression applied
-            buffer = DicomBytesIO()
-            buffer.is_implicit_VR, buffer.is_little_endian = encoding
+            #   as the encoded data is written to file
+            deflater = DicomDeflateIO(fp)
+            deflater.is_implicit_VR, deflater.is_little_endian = encoding
             with dataset:  # catch exceptions
-                write_dataset(buffer, dataset)
-
-            # Compress the encoded data and write to file
-            compressor = zlib.compressobj(wbits=-zlib.MAX_WBITS)
-            deflated = bytearray(compressor.compress(buffer.getvalue()))
-            deflated += compressor.flush()
-            fp.write(deflated)
-            if len(deflated) % 2:
+                write_dataset(deflater, dataset)
+
+            if deflater.finish() % 2:
                 fp.write(b"\x00")
 
         else:
@@ -1477,6 +1601,569 @@ def dcmwrite(
             fp.close()
 
 
+# The maximum number of bytes to read at once when copying part of a file
+_COPY_CHUNK_SIZE = 1024 * 1024
+
+
+def _copy_byte_range(src: BinaryIO, dst: BinaryIO, offset: int, length: int) -> None:
+    """Copy `length` bytes from `src` starting at `offset` to the current
+    position of `dst`.
+
+    If both `src` and `dst` are files on disk then the copy is made by the
+    operating system using :func:`os.copy_file_range` or :func:`os.sendfile`,
+    when available, otherwise the bytes are copied in chunks.
+    """
+    copied = 0
+    if isinstance(src, BufferedReader | FileIO) and isinstance(
+        dst, BufferedWriter | BufferedRandom | FileIO
+    ):
+        dst.flush()
+        position = dst.tell()
+        src_fd, dst_fd = src.fileno(), dst.fileno()
+        # Both calls write to the current position of `dst_fd` and leave the
+        #   position of `src_fd` unchanged
+        funcs = (
+            (False, getattr(os, "copy_file_range", None)),
+            (True, getattr(os, "sendfile", None)),
+        )
+        for is_sendfile, func in funcs:
+            if func is None:
+                continue
+
+            try:
+                while copied < length:
+                    if is_sendfile:
+                        nr_bytes = func(
+                            dst_fd, src_fd, offset + copied, length - copied
+                        )
+                    else:
+                        nr_bytes = func(
+                            src_fd, dst_fd, length - copied, offset + copied
+                        )
+
+                    if not nr_bytes:
+                        break
+
+                    copied += nr_bytes
+            except OSError:
+                # Not supported for the file types or file systems
+                continue
+
+            break
+
+        # Make sure the position of `dst` matches its file descriptor
+        dst.seek(position + copied)
+
+    src.seek(offset + copied)
+    while copied < length:
+        chunk = src.read(min(_COPY_CHUNK_SIZE, length - copied))
+        if not chunk:
+            break
+
+        dst.write(chunk)
+        copied += len(chunk)
+
+    if copied != length:
+        raise EOFError(
+            f"Expected {length} bytes to copy from offset {offset} but only "
+            f"{copied} bytes are available"
+        )
+
+
+def _unchanged_elements(
+    dataset: FileDataset, fp: BinaryIO, encoding: tuple[bool, bool]
+) -> tuple[list[BaseTag], int, int]:
+    """Return the unchanged elements at the end of `dataset` that can be
+    copied as-is from the file-like `fp` it was read from.
+
+    Parameters
+    ----------
+    dataset : pydicom.dataset.FileDataset
+        The dataset read from `fp`.
+    fp : file-like
+        The file-like the dataset was read from.
+    encoding : tuple[bool, bool]
+        The encoding that will be used to write `dataset`.
+
+    Returns
+    -------
+    tuple[list[BaseTag], int, int]
+        The tags of the unchanged elements, and the offset and length of their
+        encoded data in `fp`. If there are no elements that can be copied
+        then returns ``([], 0, 0)``.
+    """
+    if (
+        dataset.original_character_set != dataset._character_set
+        or dataset.file_meta.get("TransferSyntaxUID") == DeflatedExplicitVRLittleEndian
+    ):
+        return [], 0, 0
+
+    # Find the trailing RawDataElements that use the same encoding
+    elements: list[RawDataElement] = []
+    for tag in sorted(dataset._dict, reverse=True):
+        elem = dataset._dict[tag]
+        if not isinstance(elem, RawDataElement):
+            break
+
+        if (elem.is_implicit_VR, elem.is_little_endian) != encoding:
+            break
+
+        elements.append(elem)
+
+    if not elements:
+        return [], 0, 0
+
+    elements.reverse()
+
+    # The elements must be contiguous in `fp`, otherwise an element between
+    #   them has been deleted
+    start = 0
+    offsets: list[tuple[int, int]] = []
+    for idx, elem in enumerate(elements):
+        offset = elem.value_tell - data_element_offset_to_value(encoding[0], elem.VR)
+        if idx and offset != offsets[-1][1]:
+            start = idx
+
+        if elem.length != 0xFFFFFFFF:
+            end = elem.value_tell + elem.length
+        elif elem.value is not None:
+            end = elem.value_tell + len(elem.value) + 8
+        else:
+            # Deferred undefined length value, skip to the end of it
+            fp.seek(elem.value_tell)
+            read_undefined_length_value(
+                fp, encoding[1], SequenceDelimiterTag, defer_size=0
+            )
+            end = fp.tell()
+
+        offsets.append((offset, end))
+
+    # Check the first copied element is where we expect it to be
+    offset = offsets[start][0]
+    fp.seek(offset)
+    tag_bytes = fp.read(4)
+    if len(tag_bytes) != 4:
+        return [], 0, 0
+
+    group, elem_nr = unpack(f"{'<' if encoding[1] else '>'}HH", tag_bytes)
+    if (group << 16 | elem_nr) != elements[start].tag:
+        return [], 0, 0
+
+    tags = [elem.tag for elem in elements[start:]]
+    return tags, offset, offsets[-1][1] - offset
+
+
+def dcmrewrite(
+    filename: PathType | BinaryIO,
+    dataset: FileDataset,
+    /,
+    *,
+    enforce_file_format: bool = False,
+    overwrite: bool = True,
+) -> None:
+    """Write a modified `dataset` to `filename`, copying the encoded data for
+    unchanged elements from the file it was read from.
+
+    .. versionadded:: 3.1
+
+    The elements at the end of the dataset that haven't been accessed or
+    changed since the dataset was read (typically including *Pixel Data*) are
+    copied as-is from the original file, rather than read into memory and
+    encoded again, while all other elements are encoded by :func:`dcmwrite`.
+    This makes it much faster to write a dataset with large deferred elements
+    after changing some of its other elements, such as when de-identifying.
+
+    The unchanged elements can only be copied if:
+
+    * `dataset` was read from a file or buffer that's still available and
+      the file hasn't been modified since it was read.
+    * The encoding and character set used to write `dataset` match those used
+      when it was read, and the transfer syntax isn't *Deflated Explicit VR
+      Little Endian*.
+
+    If any of these conditions aren't met then `dataset` will be written
+    normally using :func:`dcmwrite`. When the source and destination are
+    both files on disk, the copy is made by the operating system using
+    :func:`os.copy_file_range` or :func:`os.sendfile` when available.
+
+    Parameters
+    ----------
+    filename : str, PathLike or file-like
+        The file path or file-like to write the encoded `dataset` to. Must not
+        be the same file that `dataset` was read from.
+    dataset : pydicom.dataset.FileDataset
+        The dataset to write, as returned by :func:`~pydicom.filereader.dcmread`.
+        Using the `defer_size` parameter of :func:`~pydicom.filereader.dcmread`
+        avoids reading large elements into memory.
+    enforce_file_format : bool, optional
+        If ``True`` then ensure `dataset` is written in the DICOM File
+        Format or raise an exception if that isn't possible, see
+        :func:`dcmwrite` for more information. Default ``False``.
+    overwrite : bool, optional
+        If ``False`` and `filename` is a :class:`str` or PathLike, then raise a
+        :class:`FileExistsError` if a file already exists with the given filename
+        (default ``True``).
+
+    Raises
+    ------
+    ValueError
+        If `filename` is the file that `dataset` was read from.
+
+    See Also
+    --------
+    pydicom.filewriter.dcmwrite
+        Write a dataset to file, encoding all of its elements.
+    """
+    filename = path_from_pathlike(filename)
+    src_path = dataset.filename if isinstance(dataset.filename, str) else None
+    if (
+        isinstance(filename, str)
+        and src_path
+        and os.path.exists(filename)
+        and os.path.samefile(filename, src_path)
+    ):
+        raise ValueError(
+            "dcmrewrite: unable to write to the same file the dataset was read from"
+        )
+
+    # Use the same source as deferred reads
+    src: BinaryIO | None = None
+    owns_src = False
+    buffer = cast(BinaryIO | None, dataset.buffer)
+    if buffer is not None and not getattr(buffer, "closed", False):
+        src = buffer
+    elif src_path and os.path.exists(src_path):
+        if dataset.timestamp is None or (
+            os.stat(src_path).st_mtime == dataset.timestamp
+        ):
+            src = cast(BinaryIO, dataset.fileobj_type(src_path, "rb"))
+            owns_src = True
+
+    tags: list[BaseTag] = []
+    try:
+        if src is not None:
+            file_meta = getattr(dataset, "file_meta", FileMetaDataset())
+            encoding = _determine_encoding(
+                dataset, file_meta.get("TransferSyntaxUID"), None, None, False
+            )
+            tags, offset, length = _unchanged_elements(dataset, src, encoding)
+
+        if not tags:
+            dcmwrite(
+                filename,
+                dataset,
+                enforce_file_format=enforce_file_format,
+                overwrite=overwrite,
+            )
+            return
+
+        logger.debug(
+            f"Copying {len(tags)} unchanged elements ({length} bytes) starting "
+            f"at offset {offset}"
+        )
+        # Write the other elements, then copy the unchanged ones. `head` is a
+        #   shallow copy with its own mapping so `dataset` isn't modified
+        head = copy(dataset)
+        copied = set(tags)
+        head._dict = {k: v for k, v in dataset._dict.items() if k not in copied}
+        head._shared_elements = dataset._shared_elements - copied
+        head._lent_elements = set()
+        head._private_blocks = {}
+
+        fp = filename
+        if isinstance(filename, str):
+            fp = open(filename, "wb" if overwrite else "xb")
+
+        fp = cast(BinaryIO, fp)
+        try:
+            dcmwrite(fp, head, enforce_file_format=enforce_file_format)
+            _copy_byte_range(cast(BinaryIO, src), fp, offset, length)
+        finally:
+            if isinstance(filename, str):
+                fp.close()
+    finally:
+        if owns_src:
+            cast(BinaryIO, src).close()
+
+
+# VRs whose values can be padded with trailing spaces without changing them
+_SPACE_PADDED_VRS = {
+    VR.AE,
+    VR.CS,
+    VR.DA,
+    VR.DS,
+    VR.DT,
+    VR.IS,
+    VR.LO,
+    VR.LT,
+    VR.PN,
+    VR.SH,
+    VR.ST,
+    VR.TM,
+    VR.UC,
+    VR.UR,
+    VR.UT,
+}
+
+
+def _encode_value(
+    elem: DataElement, encoding: tuple[bool, bool], encodings: str | list[str]
+) -> bytes:
+    """Return the encoded value of the non-sequence element `elem`."""
+    fp = DicomBytesIO()
+    fp.is_implicit_VR, fp.is_little_endian = encoding
+    if elem.is_empty:
+        return b""
+
+    fn, param = writers[cast(VR, elem.VR)]
+    if elem.VR in CUSTOMIZABLE_CHARSET_VR:
+        fn(fp, elem, encodings=convert_encodings(encodings))  # type: ignore[operator]
+    elif param is not None:
+        fn(fp, elem, param)  # type: ignore[operator]
+    else:
+        fn(fp, elem)  # type: ignore[operator]
+
+    return fp.getvalue()
+
+
+def _encoded_length(
+    fp: BinaryIO, tag: BaseTag, value_tell: int, encoding: tuple[bool, bool]
+) -> int | None:
+    """Return the length of the value of the element with `tag` at `value_tell`
+    in `fp`, or ``None`` if the element isn't found there.
+    """
+    endianness = "<" if encoding[1] else ">"
+    if encoding[0]:
+        fp.seek(value_tell - 8)
+        header = fp.read(8)
+        if len(header) == 8:
+            group, elem, length = unpack(f"{endianness}HHL", header)
+            if (group << 16 | elem) == tag:
+                return cast(int, length)
+
+        return None
+
+    # Explicit VR with 4 byte length: tag, VR, 2 reserved bytes, length
+    fp.seek(value_tell - 12)
+    header = fp.read(12)
+    if len(header) == 12:
+        group, elem = unpack(f"{endianness}HH", header[:4])
+        vr = header[4:6].decode(default_encoding, errors="replace")
+        if (group << 16 | elem) == tag and vr in EXPLICIT_VR_LENGTH_32:
+            return cast(int, unpack(f"{endianness}L", header[8:])[0])
+
+    # Explicit VR with 2 byte length: tag, VR, length
+    header = header[-8:]
+    if len(header) == 8:
+        group, elem, vr_bytes, length = unpack(f"{endianness}HH2sH", header)
+        vr = vr_bytes.decode(default_encoding, errors="replace")
+        if (group << 16 | elem) == tag and vr not in EXPLICIT_VR_LENGTH_32:
+            return cast(int, length)
+
+    return None
+
+
+def dcmpatch(
+    dataset: FileDataset,
+    values: Mapping[TagType, Any],
+    /,
+    *,
+    allow_rewrite: bool = True,
+) -> bool:
+    """Change element values in `dataset` and the file it was read from,
+    overwriting the encoded values in-place when possible.
+
+    .. versionadded:: 3.1
+
+    An element's value can be overwritten in-place when its new encoded value
+    has the same length as the existing one, or is shorter and uses a VR that
+    allows trailing space padding (such as **LO**, **SH** or **PN**), in which
+    case the new value will be padded to the existing length. This makes
+    corrections like changing a *Patient ID* or a UID of the same length
+    much faster than writing the entire file again.
+
+    If any of the elements can't be changed in-place, such as when a value's
+    length changes, an element is added, the dataset uses the *Deflated
+    Explicit VR Little Endian* transfer syntax or *Specific Character Set* is
+    changed, then the new values are set in `dataset` and, if `allow_rewrite`
+    is ``True``, it's written to a temporary file using :func:`dcmrewrite`
+    which then replaces the original.
+
+    In either case, `dataset` is updated so that any deferred elements can
+    still be read from the modified file.
+
+    Parameters
+    ----------
+    dataset : pydicom.dataset.FileDataset
+        A dataset read from file using :func:`~pydicom.filereader.dcmread`.
+    values : Mapping[int | str | tuple[int, int], Any]
+        The new values to use, as ``{tag or keyword: value}``. Only top-level
+        elements of the dataset and its *File Meta Information* can be used.
+        The value for an element that's not in the DICOM dictionary, such as
+        a private element, must be a :class:`~pydicom.dataelem.DataElement`
+        if it needs to be added.
+    allow_rewrite : bool, optional
+        If ``True`` (default) then write the entire file when the elements
+        can't be changed in-place, otherwise raise an exception.
+
+    Returns
+    -------
+    bool
+        ``True`` if the values were changed in-place, ``False`` if the file
+        was written again.
+
+    Raises
+    ------
+    ValueError
+        If `dataset` wasn't read from a file, the file has been modified since
+        it was read, the values can't be changed in-place and `allow_rewrite`
+        is ``False``, or the VR of an element to be added can't be determined.
+
+    See Also
+    --------
+    pydicom.dataset.Dataset.update_raw_element
+        Change the encoded value of an element prior to its conversion.
+    """
+    path = dataset.filename
+    if not isinstance(path, str) or not os.path.exists(path):
+        raise ValueError(
+            "dcmpatch: the dataset must have been read from a file that still exists"
+        )
+
+    if dataset.timestamp is not None and os.stat(path).st_mtime != dataset.timestamp:
+        raise ValueError(
+            "dcmpatch: the file has been modified since the dataset was read"
+        )
+
+    file_meta = getattr(dataset, "file_meta", FileMetaDataset())
+    tags = {Tag(key): value for key, value in values.items()}
+    for tag, value in tags.items():
+        if isinstance(value, DataElement) and value.tag != tag:
+            raise ValueError(
+                f"dcmpatch: the tag of the element used for {tag} doesn't match"
+            )
+
+    can_patch = (
+        file_meta.get("TransferSyntaxUID") != DeflatedExplicitVRLittleEndian
+        and 0x00080005 not in tags
+    )
+    encodings = dataset.original_character_set or dataset._character_set
+
+    # Encode the new values and check they fit
+    patches: list[tuple[Dataset, BaseTag, int, bytes, DataElement]] = []
+    with open(path, "rb") as fp:
+        for tag, value in tags.items():
+            ds: Dataset = file_meta if tag.group == 2 else dataset
+            current = ds._dict.get(tag)
+            if not can_patch or current is None:
+                can_patch = False
+                break
+
+            encoding: tuple[bool | None, bool | None]
+            if isinstance(current, RawDataElement):
+                encoding = (current.is_implicit_VR, current.is_little_endian)
+                offset: int | None = current.value_tell
+                # Implicit VR elements need conversion to get the VR
+                vr = current.VR or ds[tag].VR
+            else:
+                encoding = (
+                    (False, True) if tag.group == 2 else dataset.original_encoding
+                )
+                offset = current.file_tell
+                vr = current.VR
+
+            if offset is None or None in encoding or vr in AMBIGUOUS_VR or vr == VR.SQ:
+                can_patch = False
+                break
+
+            if isinstance(value, DataElement):
+                if value.VR != vr:
+                    can_patch = False
+                    break
+
+                value = value.value
+
+            elem_encoding = cast(tuple[bool, bool], encoding)
+            elem = DataElement(tag, vr, value)
+            encoded = _encode_value(elem, elem_encoding, cast(list[str], encodings))
+            length = _encoded_length(fp, tag, offset, elem_encoding)
+            if length is not None and len(encoded) < length and vr in _SPACE_PADDED_VRS:
+                encoded += b" " * (length - len(encoded))
+
+            if len(encoded) != length:
+                can_patch = False
+                break
+
+            patches.append((ds, tag, offset, encoded, elem))
+
+    if can_patch:
+        with open(path, "r+b") as fp:
+            for _, _, offset, encoded, _ in patches:
+                fp.seek(offset)
+                fp.write(encoded)
+
+        for ds, tag, _, encoded, elem in patches:
+            if isinstance(ds._dict[tag], RawDataElement):
+                ds.update_raw_element(tag, value=encoded)
+            else:
+                ds[tag].value = elem.value
+
+        dataset.timestamp = os.stat(path).st_mtime
+        return True
+
+    if not allow_rewrite:
+        raise ValueError(
+            "dcmpatch: unable to change the element values in-place and "
+            "'allow_rewrite' is False"
+        )
+
+    # Check the VR of any added elements can be determined before changing
+    #   the dataset
+    changes: list[tuple[Dataset, BaseTag, Any]] = []
+    for tag, value in tags.items():
+        ds = file_meta if tag.group == 2 else dataset
+        if not isinstance(value, DataElement) and tag not in ds:
+            try:
+                value = DataElement(tag, dictionary_VR(tag), value)
+            except KeyError:
+                raise ValueError(
+                    f"dcmpatch: unable to add the element with tag {tag} as its "
+                    "VR can't be determined, use a 'DataElement' for the value "
+                    "instead"
+                ) from None
+
+        changes.append((ds, tag, value))
+
+    for ds, tag, value in changes:
+        if isinstance(value, DataElement):
+            ds[tag] = value
+        else:
+            ds[tag].value = value
+
+    # Write to a temporary file first so the original is available for
+    #   copying unchanged elements and isn't lost if the write fails
+    fd, tmp = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(path)))
+    os.close(fd)
+    try:
+        dcmrewrite(tmp, dataset)
+        os.replace(tmp, path)
+    except BaseException:
+        os.remove(tmp)
+        raise
+
+    # Update the offsets of the remaining raw elements to match the new file
+    written = dcmread(path, defer_size=0)
+    for ds, new in ((dataset, written), (file_meta, written.file_meta)):
+        for tag, current in ds._dict.items():
+            raw = new._dict.get(tag)
+            if isinstance(current, RawDataElement) and isinstance(raw, RawDataElement):
+                ds._dict[tag] = current._replace(value_tell=raw.value_tell)
+
+    dataset.timestamp = written.timestamp
+
+    return False
+
+
 # Map each VR to a function which can write it
 # for write_numbers, the Writer maps to a tuple (function, struct_format)
 #   (struct_format is python's struct module format)
@@ -1,7 +1,9 @@
 # Copyright 2008-2024 pydicom authors. See LICENSE file for details.
 
+from bisect import bisect_left
+import threading
 from typing import Any, TYPE_CHECKING, Protocol
-from collections.abc import MutableSequence, Callable
+from collections.abc import MutableSequence, Callable, Sequence
 
 from pydicom import config
 from pydicom.datadict import dictionary_VR, private_dictionary_VR
@@ -27,6 +29,9 @@ if TYPE_CHECKING:  # pragma: no cover
             **kwargs: Any,
         ) -> None: ...
 
+    class TimingHook(Protocol):
+        def __call__(self, stage: str, elapsed: float, nbytes: int) -> None: ...
+
 
 class Hooks:
     """Management class for callback functions.
@@ -49,6 +54,15 @@ class Hooks:
       appropriate for the VR, default :func:`raw_element_value`.
     * ``"raw_element_kwargs"``: `kwargs` :class:`dict` passed to the callback
       functions.
+
+    For instrumentation of the reading and pixel data decoding pipelines:
+
+    * ``"timing_event"``: function called with the name of a processing stage,
+      the time taken in seconds and the number of bytes processed, default
+      ``None`` (disabled). See :class:`TimingCollector` for the available
+      stages.
+
+      .. versionadded:: 3.1
     """
 
     def __init__(self) -> None:
@@ -56,8 +70,9 @@ class Hooks:
         self.raw_element_value: RawDataHook
         self.raw_element_vr: RawDataHook
         self.raw_element_kwargs: dict[str, Any] = {}
+        self.timing_event: TimingHook | None = None
 
-    def register_callback(self, hook: str, func: Callable) -> None:
+    def register_callback(self, hook: str, func: Callable | None) -> None:
         """Register the callback function `func` to a hook.
 
         Example
@@ -80,16 +95,23 @@ class Hooks:
         ----------
         hook : str
             The name of the hook to register the function to, allowed values
-            ``"raw_element_vr"`` and ``"raw_element_value"``.
-        func : Callable
+            ``"raw_element_vr"``, ``"raw_element_value"`` and ``"timing_event"``.
+        func : Callable | None
             The callback function to use with the hook. Only one callback function can
             be used per hook. For details on the required function signatures please
-            see the documentation for the corresponding calling function.
+            see the documentation for the corresponding calling function. For the
+            ``"timing_event"`` hook ``None`` may be used to disable the callback.
         """
+        if hook == "timing_event" and func is None:
+            self.timing_event = None
+            return
+
         if not callable(func):
             raise TypeError("'func' must be a callable function")
 
-        if hook == "raw_element_value":
+        if hook == "timing_event":
+            self.timing_event = func
+        elif hook == "raw_element_value":
             self.raw_element_value = func
         elif hook == "raw_element_vr":
             self.raw_element_vr = func
@@ -118,6 +140,184 @@ class Hooks:
             raise ValueError(f"Unknown hook '{hook}'")
 
 
+# The default upper bounds (in seconds) of the TimingCollector histogram bins
+TIMING_BINS = (1e-6, 1e-5, 1e-4, 1e-3, 1e-2, 1e-1, 1.0, 10.0)
+
+
+class StageTimings:
+    """The aggregated timing events for a single processing stage.
+
+    .. versionadded:: 3.1
+
+    Attributes
+    ----------
+    count : int
+        The number of events.
+    total : float
+        The total time taken, in seconds.
+    minimum : float
+        The shortest time taken by an event, in seconds.
+    maximum : float
+        The longest time taken by an event, in seconds.
+    nbytes : int
+        The total number of bytes processed.
+    histogram : list[int]
+        The number of events in each of the collector's histogram bins, with
+        the last bin containing the events longer than the largest bin.
+    """
+
+    def __init__(self, nr_bins: int) -> None:
+        self.count = 0
+        self.total = 0.0
+        self.minimum = float("inf")
+        self.maximum = 0.0
+        self.nbytes = 0
+        self.histogram = [0] * nr_bins
+
+    @property
+    def mean(self) -> float:
+        """Return the mean time taken per event, in seconds."""
+        return self.total / self.count if self.count else 0.0
+
+    @property
+    def throughput(self) -> float:
+        """Return the number of bytes processed per second."""
+        return self.nbytes / self.total if self.total else 0.0
+
+
+class TimingCollector:
+    """A callback function for the ``"timing_event"`` hook that aggregates the
+    timings for each processing stage.
+
+    .. versionadded:: 3.1
+
+    **Stages**
+
+    * ``"read_meta"``: reading the preamble and *File Meta Information*, the
+      number of bytes is the length of both.
+    * ``"read_dataset"``: parsing the dataset's elements, the number of bytes
+      is the length of the parsed data.
+    * ``"read_deferred"``: reading a deferred element value, the number of bytes
+      is the length of the value.
+    * ``"convert_element"``: converting a raw element to a
+      :class:`~pydicom.dataelem.DataElement`, the number of bytes is the length
+      of the raw value.
+    * ``"decode_charset"``: decoding an encoded text value using the character
+      set, the number of bytes is the length of the value.
+    * ``"extract_frame"``: getting an encapsulated frame from its fragments,
+      the number of bytes is the length of the frame.
+    * ``"decode_frame"``: decompressing a frame of pixel data using a
+      decoding plugin, the number of bytes is the length of the decoded frame.
+    * ``"convert_color_space"``: converting the color space of a
+      :class:`~numpy.ndarray`, the number of bytes is the size of the array.
+
+    Stages may be nested, e.g. ``"decode_charset"`` events occur during
+    ``"convert_element"``, so the total time for all stages may be longer
+    than the time spent.
+
+    Examples
+    --------
+
+    Collect the timings while reading a dataset and decoding its pixel data::
+
+        from pydicom import dcmread
+        from pydicom.hooks import TimingCollector
+
+        with TimingCollector() as collector:
+            ds = dcmread("path/to/dataset.dcm")
+            arr = ds.pixel_array
+
+        print(collector.summary())
+
+    Parameters
+    ----------
+    bins : Sequence[float], optional
+        The upper bounds of the histogram bins, in seconds. Default
+        ``(1e-6, 1e-5, 1e-4, 1e-3, 1e-2, 1e-1, 1.0, 10.0)``.
+
+    Attributes
+    ----------
+    bins : tuple[float, ...]
+        The upper bounds of the histogram bins, in seconds.
+    stages : dict[str, StageTimings]
+        The aggregated timings for each stage.
+    """
+
+    def __init__(self, bins: Sequence[float] | None = None) -> None:
+        self.bins: tuple[float, ...] = tuple(sorted(bins)) if bins else TIMING_BINS
+        self.stages: dict[str, StageTimings] = {}
+        self._lock = threading.Lock()
+        self._previous: list[TimingHook | None] = []
+
+    def __call__(self, stage: str, elapsed: float, nbytes: int) -> None:
+        """Add a timing event for `stage`."""
+        with self._lock:
+            timings = self.stages.get(stage)
+            if timings is None:
+                timings = self.stages[stage] = StageTimings(len(self.bins) + 1)
+
+            timings.count += 1
+            timings.total += elapsed
+            timings.nbytes += nbytes
+            timings.minimum = min(timings.minimum, elapsed)
+            timings.maximum = max(timings.maximum, elapsed)
+            timings.histogram[bisect_left(self.bins, elapsed)] += 1
+
+    def __enter__(self) -> "TimingCollector":
+        """Register the collector as the ``"timing_event"`` callback."""
+        self._previous.append(hooks.timing_event)
+        hooks.register_callback("timing_event", self)
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        """Restore the previous ``"timing_event"`` callback."""
+        hooks.register_callback("timing_event", self._previous.pop())
+
+    def clear(self) -> None:
+        """Remove all the collected timings."""
+        with self._lock:
+            self.stages.clear()
+
+    def summary(self) -> str:
+        """Return a table of the collected timings as :class:`str`."""
+        bins = [f"<={_format_seconds(b)}" for b in self.bins]
+        bins.append(f">{_format_seconds(self.bins[-1])}")
+        header = ["stage", "count", "total", "mean", "min", "max", "MB/s", *bins]
+
+        rows = [header]
+        for stage, timings in self.stages.items():
+            rows.append(
+                [
+                    stage,
+                    f"{timings.count}",
+                    _format_seconds(timings.total),
+                    _format_seconds(timings.mean),
+                    _format_seconds(timings.minimum),
+                    _format_seconds(timings.maximum),
+                    f"{timings.throughput / 1e6:.1f}",
+                    *[f"{nr}" for nr in timings.histogram],
+                ]
+            )
+
+        widths = [max(len(row[idx]) for row in rows) for idx in range(len(header))]
+        lines = []
+        for row in rows:
+            cells = [row[0].ljust(widths[0])]
+            cells.extend(v.rjust(w) for v, w in zip(row[1:], widths[1:]))
+            lines.append("  ".join(cells))
+
+        return "\n".join(lines)
+
+
+def _format_seconds(value: float) -> str:
+    """Return the time `value` formatted using an appropriate unit."""
+    for unit, scale in (("s", 1.0), ("ms", 1e-3), ("us", 1e-6)):
+        if value >= scale:
+            return f"{value / scale:.3g} {unit}"
+
+    return f"{value / 1e-9:.3g} ns"
+
+
 def _private_vr_for_tag(ds: "Dataset | None", tag: BaseTag) -> str:
     """Return the VR for a known private tag, otherwise "UN".
 
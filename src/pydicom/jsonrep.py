@@ -1,19 +1,31 @@
 # Copyright 2008-2021 pydicom authors. See LICENSE file for details.
 """Methods for converting Datasets and DataElements to/from json"""
 
+import asyncio
 import base64
-from inspect import signature
-from typing import TypeAlias, Any, cast, TYPE_CHECKING
-from collections.abc import Callable
-
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
+from functools import lru_cache
+from inspect import iscoroutinefunction, signature
+import json
+from typing import TypeAlias, Any, cast, TextIO, TYPE_CHECKING
+from collections.abc import Awaitable, Callable, Iterable, Iterator, Sequence
+from weakref import WeakKeyDictionary
+
+from pydicom import config
+from pydicom.config import logger
+from pydicom.fileutil import read_buffer, reset_buffer_position, buffer_length
 from pydicom.misc import warn_and_log
-from pydicom.valuerep import FLOAT_VR, INT_VR, VR
+from pydicom.valuerep import AMBIGUOUS_VR, BYTES_VR, FLOAT_VR, INT_VR, VR
 
 if TYPE_CHECKING:  # pragma: no cover
+    from pydicom.dataelem import DataElement
     from pydicom.dataset import Dataset
 
 
 JSON_VALUE_KEYS = ("Value", "BulkDataURI", "InlineBinary")
+# VRs whose "Value" items need converting individually
+_CONVERTED_VALUE_VRS = {VR.AT, VR.PN, VR.SQ}
 
 
 def convert_to_python_number(value: Any, vr: str) -> Any:
@@ -54,6 +66,9 @@ def convert_to_python_number(value: Any, vr: str) -> Any:
         return value
 
     if isinstance(value, list | tuple):
+        if None not in value:
+            return list(map(number_type, value))
+
         return [
             number_type(v) if v is not None else empty_value_for_VR(vr) for v in value
         ]
@@ -73,6 +88,243 @@ JSONValueType = list[ValueType] | InlineBinaryType | BulkDataURIType
 
 BulkDataType = None | str | int | float | bytes
 BulkDataHandlerType = Callable[[str, str, str], BulkDataType] | None
+BulkDataBatchHandlerType = Callable[
+    [list[tuple[str, str, str]]], Sequence[BulkDataType]
+]
+
+JSONLoaderType = Callable[[str | bytes | bytearray], Any]
+
+
+def _orjson_loader() -> JSONLoaderType:
+    import orjson
+
+    return cast(JSONLoaderType, orjson.loads)
+
+
+def _simdjson_loader() -> JSONLoaderType:
+    import simdjson
+
+    return cast(JSONLoaderType, simdjson.loads)
+
+
+# Faster JSON parsers in order of preference
+_JSON_BACKENDS: dict[str, Callable[[], JSONLoaderType]] = {
+    "orjson": _orjson_loader,
+    "simdjson": _simdjson_loader,
+}
+
+
+@lru_cache(maxsize=8)
+def _json_loader(backend: str) -> JSONLoaderType:
+    """Return the function to use to parse JSON for `backend`."""
+    if backend in _JSON_BACKENDS:
+        return _JSON_BACKENDS[backend]()
+
+    if backend == "auto":
+        for loader in _JSON_BACKENDS.values():
+            try:
+                return loader()
+            except ImportError:
+                pass
+
+    return json.loads
+
+
+def loads(s: str | bytes | bytearray) -> Any:
+    """Return the Python object for the JSON document `s`.
+
+    The JSON is parsed using the backend set by
+    :attr:`config.settings.json_backend<pydicom.config.Settings.json_backend>`.
+
+    .. versionadded:: 3.1
+
+    Parameters
+    ----------
+    s : str | bytes | bytearray
+        The JSON document to parse.
+
+    Returns
+    -------
+    Any
+        The parsed JSON document.
+    """
+    loader = _json_loader(config.settings.json_backend)
+    try:
+        return loader(s)
+    except ValueError:
+        if loader is json.loads:
+            raise
+
+        # The faster parsers are stricter than the json module, for example
+        #   they don't support NaN or integers larger than 64-bit
+        return json.loads(s)
+
+
+# The number of parameters for each handler, weakly referenced so the cache
+#   doesn't keep the handler (or any objects it references) alive
+_PARAMETER_COUNTS: "WeakKeyDictionary[Callable[..., Any], int]" = WeakKeyDictionary()
+
+
+def _parameter_count(func: Callable[..., Any]) -> int:
+    """Return the number of parameters for `func`."""
+    try:
+        return _PARAMETER_COUNTS[func]
+    except KeyError:
+        count = _PARAMETER_COUNTS[func] = len(signature(func).parameters)
+        return count
+    except TypeError:
+        # Unhashable or not weakly referenceable callable
+        return len(signature(func).parameters)
+
+
+def _value_key(mapping: dict[str, Any]) -> str | None:
+    """Return the key used for the value of the JSON element `mapping`, or
+    ``None`` if the element has no value.
+    """
+    for key in JSON_VALUE_KEYS:
+        if key in mapping:
+            return key
+
+    return None
+
+
+def _bulk_data_uris(json_dataset: dict[str, Any]) -> list[tuple[str, str, str]]:
+    """Return the ``(tag, vr, uri)`` for every element in the JSON dataset
+    `json_dataset` with a "BulkDataURI", including those in sequence items.
+    """
+    uris = []
+    for tag, mapping in json_dataset.items():
+        value_key = _value_key(mapping)
+        value = mapping.get(value_key) if value_key else None
+        if value_key == "BulkDataURI":
+            if isinstance(value, list) and value:
+                value = value[0]
+
+            # Invalid values are left to raise during conversion
+            if isinstance(value, str):
+                uris.append((tag, mapping["vr"], value))
+        elif mapping.get("vr") == VR.SQ and isinstance(value, list):
+            for item in value:
+                if isinstance(item, dict):
+                    uris.extend(_bulk_data_uris(item))
+
+    return uris
+
+
+def resolve_bulk_data(
+    json_dataset: dict[str, Any],
+    batch_handler: BulkDataBatchHandlerType,
+) -> Callable[[str, str, str], BulkDataType]:
+    """Retrieve the values for all the "BulkDataURI" elements in `json_dataset`
+    with a single call to `batch_handler`.
+
+    .. versionadded:: 3.1
+
+    Parameters
+    ----------
+    json_dataset : dict[str, Any]
+        The DICOM JSON Model object for the dataset.
+    batch_handler : callable
+        Callable function that accepts a list of ``(tag, vr, uri)`` for every
+        "BulkDataURI" in the dataset (including those in sequence items) and
+        returns a sequence containing the corresponding values.
+
+    Returns
+    -------
+    callable
+        A bulk data URI handler that accepts the tag, vr and "BulkDataURI" of
+        an element and returns the value retrieved by `batch_handler`.
+    """
+    uris = list(dict.fromkeys(_bulk_data_uris(json_dataset)))
+    values = batch_handler(uris) if uris else []
+    if len(values) != len(uris):
+        raise ValueError(
+            f"The bulk data batch handler returned {len(values)} values for "
+            f"{len(uris)} 'BulkDataURI' elements"
+        )
+
+    resolved = dict(zip(uris, values))
+
+    def handler(tag: str, vr: str, uri: str) -> BulkDataType:
+        return resolved[(tag, vr, uri)]
+
+    return handler
+
+
+def concurrent_bulk_data_handler(
+    handler: (
+        Callable[[str, str, str], BulkDataType]
+        | Callable[[str], BulkDataType]
+        | Callable[[str, str, str], Awaitable[BulkDataType]]
+        | Callable[[str], Awaitable[BulkDataType]]
+    ),
+    max_workers: int | None = None,
+) -> BulkDataBatchHandlerType:
+    """Return a batch handler that retrieves bulk data values concurrently.
+
+    .. versionadded:: 3.1
+
+    Parameters
+    ----------
+    handler : callable
+        Callable function or coroutine function that accepts either the tag,
+        vr and "BulkDataURI" value or just the "BulkDataURI" value and returns
+        the actual value of the data element. Regular functions are called
+        using a thread pool, while coroutine functions are awaited
+        concurrently in a new event loop, so the returned batch handler cannot
+        be used from a running event loop. Use :func:`asyncio.to_thread` to
+        call :meth:`Dataset.from_json()<pydicom.dataset.Dataset.from_json>`
+        from async code instead.
+    max_workers : int, optional
+        The maximum number of values to retrieve at the same time, default
+        is to use the :class:`~concurrent.futures.ThreadPoolExecutor` default
+        for regular functions and no limit for coroutine functions.
+
+    Returns
+    -------
+    callable
+        A batch handler suitable for use with the `bulk_data_uri_batch_handler`
+        parameter of :meth:`Dataset.from_json()
+        <pydicom.dataset.Dataset.from_json>`.
+
+    Examples
+    --------
+
+    Retrieve the bulk data for a dataset using up to 8 concurrent requests::
+
+        >>> def fetch(uri):
+        ...     return session.get(uri).content
+        >>> ds = Dataset.from_json(
+        ...     json_dataset,
+        ...     bulk_data_uri_batch_handler=concurrent_bulk_data_handler(fetch, 8),
+        ... )
+    """
+    nr_args = _parameter_count(handler)
+
+    def call(uri: tuple[str, str, str]) -> Any:
+        return handler(*uri) if nr_args == 3 else handler(uri[2])  # type: ignore
+
+    if iscoroutinefunction(handler):
+
+        async def gather(uris: list[tuple[str, str, str]]) -> list[BulkDataType]:
+            limit = asyncio.Semaphore(max_workers) if max_workers else nullcontext()
+
+            async def limited(uri: tuple[str, str, str]) -> BulkDataType:
+                async with limit:
+                    return cast(BulkDataType, await call(uri))
+
+            return await asyncio.gather(*(limited(uri) for uri in uris))
+
+        def async_batch(uris: list[tuple[str, str, str]]) -> list[BulkDataType]:
+            return asyncio.run(gather(uris))
+
+        return async_batch
+
+    def batch(uris: list[tuple[str, str, str]]) -> list[BulkDataType]:
+        with ThreadPoolExecutor(max_workers) as pool:
+            return list(pool.map(call, uris))
+
+    return batch
 
 
 class JsonDataElementConverter:
@@ -133,7 +385,7 @@ class JsonDataElementConverter:
         self.bulk_data_element_handler: BulkDataHandlerType
 
         handler = bulk_data_uri_handler
-        if handler and len(signature(handler).parameters) == 1:
+        if handler and _parameter_count(handler) == 1:
             # `handler` is Callable[[str], BulkDataType]
             def wrapper(tag: str, vr: str, value: str) -> BulkDataType:
                 x = cast(Callable[[str], BulkDataType], handler)
@@ -168,7 +420,15 @@ class JsonDataElementConverter:
                 return empty_value_for_VR(self.vr)
 
             val = cast(list[ValueType], self.value)
-            element_value = [self.get_regular_element_value(v) for v in val]
+            if self.vr in _CONVERTED_VALUE_VRS:
+                element_value = [self.get_regular_element_value(v) for v in val]
+            elif None in val:
+                empty_value = empty_value_for_VR(self.vr)
+                element_value = [empty_value if v is None else v for v in val]
+            else:
+                # All other values are used as-is, so convert them in one go
+                element_value = val
+
             if len(element_value) == 1 and self.vr != VR.SQ:
                 element_value = element_value[0]
 
@@ -285,15 +545,13 @@ class JsonDataElementConverter:
                 raise KeyError(f"Data element '{self.tag}' must have key 'vr'")
 
             vr = val["vr"]
-            unique_value_keys = tuple(set(val.keys()) & set(JSON_VALUE_KEYS))
-
-            if not unique_value_keys:
+            value_key = _value_key(val)
+            if value_key is None:
                 # data element with no value
                 elem = DataElement(
                     tag=int(key, 16), value=empty_value_for_VR(vr), VR=vr
                 )
             else:
-                value_key = unique_value_keys[0]
                 elem = DataElement.from_json(
                     self.dataset_class,
                     key,
@@ -347,3 +605,269 @@ class JsonDataElementConverter:
             comps[2] = value["Phonetic"]
 
         return "=".join(comps)
+
+
+# The number of bytes of binary data to base64 encode at a time when streaming,
+#   must be a multiple of 3 so the encoded chunks can be concatenated
+_BINARY_CHUNK_SIZE = 3 * 2**16
+_BINARY_VR = (BYTES_VR | AMBIGUOUS_VR) - {VR.US_SS}
+# Reuse a single encoder, json.dumps() creates a new one for each call when
+#   any of the default arguments are changed
+_encode = json.JSONEncoder(sort_keys=True).encode
+# The maximum number of non-binary, non-sequence elements to encode at a time
+_BATCH_SIZE = 64
+
+
+def _binary_element_chunks(
+    elem: "DataElement",
+    bulk_data_element_handler: Callable[["DataElement"], str] | None,
+    bulk_data_threshold: int,
+) -> Iterable[str]:
+    """Return the JSON representation of a binary data element as chunks."""
+    if elem.is_empty:
+        return (f'{{"vr": "{elem.VR}"}}',)
+
+    length = buffer_length(elem.value) if elem.is_buffered else len(elem.value)
+    # Base64 makes the encoded value 1/3 longer.
+    if bulk_data_element_handler is not None and length > (
+        (bulk_data_threshold // 4) * 3
+    ):
+        uri = json.dumps(bulk_data_element_handler(elem))
+        return (f'{{"BulkDataURI": {uri}, "vr": "{elem.VR}"}}',)
+
+    return _iter_inline_binary(elem, length)
+
+
+def _iter_inline_binary(elem: "DataElement", length: int) -> Iterator[str]:
+    """Yield the JSON representation of a binary data element with its value
+    base64 encoded in chunks.
+    """
+    logger.info(f"encode bulk data element '{elem.name}' inline")
+    yield '{"InlineBinary": "'
+    value = elem.value
+    if elem.is_buffered:
+        with reset_buffer_position(value):
+            value.seek(0)
+            for chunk in read_buffer(value, chunk_size=_BINARY_CHUNK_SIZE):
+                yield base64.b64encode(chunk).decode("ascii")
+    else:
+        view = memoryview(value)
+        for offset in range(0, length, _BINARY_CHUNK_SIZE):
+            yield base64.b64encode(view[offset : offset + _BINARY_CHUNK_SIZE]).decode(
+                "ascii"
+            )
+
+    yield f'", "vr": "{elem.VR}"}}'
+
+
+def iter_json(
+    ds: "Dataset",
+    bulk_data_threshold: int = 1024,
+    bulk_data_element_handler: Callable[["DataElement"], str] | None = None,
+    suppress_invalid_tags: bool = False,
+) -> Iterator[str]:
+    """Yield the JSON representation of `ds` in chunks.
+
+    The output is the same as :meth:`Dataset.to_json()
+    <pydicom.dataset.Dataset.to_json>` with the default `dump_handler`, however
+    only the data element currently being encoded is held in memory and the
+    values of binary elements are base64 encoded in chunks. The chunks may be
+    written to any file-like or asynchronous stream as they're produced.
+
+    .. versionadded:: 3.1
+
+    Parameters
+    ----------
+    ds : pydicom.dataset.Dataset
+        The dataset to encode.
+    bulk_data_threshold : int, optional
+        Threshold for the length of a base64-encoded binary data element
+        above which the element should be considered bulk data and the
+        value provided as a URI rather than included inline (default:
+        ``1024``). Ignored if no bulk data handler is given.
+    bulk_data_element_handler : callable, optional
+        Callable function that accepts a bulk data element and returns the
+        "BulkDataURI" as a :class:`str` for retrieving the value of the
+        data element via DICOMweb WADO-RS.
+    suppress_invalid_tags : bool, optional
+        Flag to specify if errors while serializing tags should be logged
+        and the tag dropped or if the error should be bubbled up. Also
+        applies to the tags in any sequence items.
+
+    Yields
+    ------
+    str
+        The next chunk of the JSON representation of `ds` based on the
+        DICOM JSON Model.
+    """
+    context = config.strict_reading if suppress_invalid_tags else nullcontext
+    # Small elements are encoded in batches as the overhead of calling the
+    #   JSON encoder for each element is significant
+    batch: dict[str, dict[str, Any]] = {}
+    separator = ""
+    yield "{"
+    for tag in sorted(ds.keys()):
+        json_key = f"{tag:08X}"
+        chunks: Iterable[str] | None = None
+        try:
+            with context():
+                elem = ds[tag]
+                if elem.VR == VR.SQ:
+                    chunks = _iter_sequence(
+                        elem.value,
+                        bulk_data_threshold,
+                        bulk_data_element_handler,
+                        suppress_invalid_tags,
+                    )
+                elif elem.VR in _BINARY_VR:
+                    chunks = _binary_element_chunks(
+                        elem, bulk_data_element_handler, bulk_data_threshold
+                    )
+                else:
+                    batch[json_key] = elem.to_json_dict(
+                        bulk_data_element_handler, bulk_data_threshold
+                    )
+        except Exception as exc:
+            if not suppress_invalid_tags:
+                logger.error(f"Error while processing tag {json_key}")
+                raise exc
+
+            logger.warning(f"Error while processing tag {json_key}: {exc}")
+            continue
+
+        if batch and (chunks is not None or len(batch) == _BATCH_SIZE):
+            # Strip the enclosing braces from the encoded batch
+            yield f"{separator}{_encode(batch)[1:-1]}"
+            batch.clear()
+            separator = ", "
+
+        if chunks is not None:
+            yield f'{separator}"{json_key}": '
+            yield from chunks
+            separator = ", "
+
+    if batch:
+        yield f"{separator}{_encode(batch)[1:-1]}"
+
+    yield "}"
+
+
+def _iter_sequence(
+    items: Iterable["Dataset"],
+    bulk_data_threshold: int,
+    bulk_data_element_handler: Callable[["DataElement"], str] | None,
+    suppress_invalid_tags: bool,
+) -> Iterator[str]:
+    """Yield the JSON representation of a sequence element in chunks."""
+    yield '{"Value": ['
+    separator = ""
+    for item in items:
+        if separator:
+            yield separator
+
+        yield from iter_json(
+            item, bulk_data_threshold, bulk_data_element_handler, suppress_invalid_tags
+        )
+        separator = ", "
+
+    yield '], "vr": "SQ"}'
+
+
+def iter_json_array(
+    datasets: Iterable["Dataset"],
+    bulk_data_threshold: int = 1024,
+    bulk_data_element_handler: Callable[["DataElement"], str] | None = None,
+    suppress_invalid_tags: bool = False,
+) -> Iterator[str]:
+    """Yield the JSON representation of `datasets` as a JSON array in chunks.
+
+    Each dataset is only taken from `datasets` when it's about to be encoded,
+    so an iterator or generator that reads or creates the datasets on demand can
+    be used to encode many datasets, such as the metadata for all the instances
+    in a study, without holding all of them in memory.
+
+    .. versionadded:: 3.1
+
+    Parameters
+    ----------
+    datasets : Iterable[pydicom.dataset.Dataset]
+        The datasets to encode.
+    bulk_data_threshold : int, optional
+        Threshold for the length of a base64-encoded binary data element
+        above which the element should be considered bulk data and the
+        value provided as a URI rather than included inline (default:
+        ``1024``). Ignored if no bulk data handler is given.
+    bulk_data_element_handler : callable, optional
+        Callable function that accepts a bulk data element and returns the
+        "BulkDataURI" as a :class:`str` for retrieving the value of the
+        data element via DICOMweb WADO-RS.
+    suppress_invalid_tags : bool, optional
+        Flag to specify if errors while serializing tags should be logged
+        and the tag dropped or if the error should be bubbled up.
+
+    Yields
+    ------
+    str
+        The next chunk of the JSON array.
+    """
+    yield "["
+    separator = ""
+    for ds in datasets:
+        if separator:
+            yield separator
+
+        yield from iter_json(
+            ds, bulk_data_threshold, bulk_data_element_handler, suppress_invalid_tags
+        )
+        separator = ", "
+
+    yield "]"
+
+
+def dump_json(
+    obj: "Dataset | Iterable[Dataset]",
+    fp: TextIO,
+    bulk_data_threshold: int = 1024,
+    bulk_data_element_handler: Callable[["DataElement"], str] | None = None,
+    suppress_invalid_tags: bool = False,
+) -> None:
+    """Write the JSON representation of a dataset or datasets to `fp`.
+
+    .. versionadded:: 3.1
+
+    Parameters
+    ----------
+    obj : pydicom.dataset.Dataset | Iterable[pydicom.dataset.Dataset]
+        The dataset to encode as a JSON object, or the datasets to encode as a
+        JSON array.
+    fp : TextIO
+        The text file-like to write the JSON to, must have a ``write()``
+        method.
+    bulk_data_threshold : int, optional
+        Threshold for the length of a base64-encoded binary data element
+        above which the element should be considered bulk data and the
+        value provided as a URI rather than included inline (default:
+        ``1024``). Ignored if no bulk data handler is given.
+    bulk_data_element_handler : callable, optional
+        Callable function that accepts a bulk data element and returns the
+        "BulkDataURI" as a :class:`str` for retrieving the value of the
+        data element via DICOMweb WADO-RS.
+    suppress_invalid_tags : bool, optional
+        Flag to specify if errors while serializing tags should be logged
+        and the tag dropped or if the error should be bubbled up.
+
+    See Also
+    --------
+    iter_json
+    iter_json_array
+    """
+    from pydicom.dataset import Dataset
+
+    func = iter_json if isinstance(obj, Dataset) else iter_json_array
+    for chunk in func(
+        obj,  # type: ignore[arg-type]
+        bulk_data_threshold,
+        bulk_data_element_handler,
+        suppress_invalid_tags,
+    ):
+        fp.write(chunk)
@@ -21,8 +21,11 @@ from pydicom.pixels.utils import (
     decompress,
     iter_pixels,
     get_packed_frame,
+    get_region_frames,
     pack_bits,
     pixel_array,
+    region_array,
     set_pixel_data,
+    shared_pixel_array,
     unpack_bits,
 )
@@ -0,0 +1,208 @@
+# Copyright 2008-2025 pydicom authors. See LICENSE file for details.
+"""Helpers for decoding pixel data into shared memory with
+:func:`~pydicom.pixels.shared_pixel_array`.
+
+These are kept separate from :mod:`pydicom.pixels.utils` so that
+:mod:`multiprocessing` is only imported when needed.
+"""
+
+from bisect import bisect_right
+from multiprocessing.shared_memory import SharedMemory
+from struct import unpack
+from typing import BinaryIO, Any, TYPE_CHECKING
+
+try:
+    import numpy as np
+
+    HAVE_NP = True
+except ImportError:
+    HAVE_NP = False
+
+from pydicom.encaps import (
+    encapsulate,
+    generate_fragmented_frames,
+    parse_basic_offsets,
+    parse_fragments,
+)
+
+if TYPE_CHECKING:  # pragma: no cover
+    from pydicom.pixels.decoders.base import Decoder
+
+
+class SharedMemoryBlock(SharedMemory):
+    """Shared memory that may still be in use by an array when released."""
+
+    def __del__(self) -> None:
+        # If the block is still used by an array then closing it fails and
+        #   the memory is instead unmapped with the array's final view
+        try:
+            self.close()
+        except (BufferError, OSError):
+            pass
+
+
+def release(shm: SharedMemory) -> None:
+    """Destroy the shared memory block `shm`."""
+    shm.unlink()
+    try:
+        shm.close()
+    except BufferError:
+        # Still in use by an array, see SharedMemoryBlock
+        pass
+
+
+# The state of each shared_pixel_array() worker process
+_WORKER: dict[str, Any] = {}
+
+
+def encapsulated_fragments(
+    f: BinaryIO,
+    number_of_frames: int,
+    extended_offsets: tuple[bytes, bytes] | None,
+) -> list[list[tuple[int, int]]]:
+    """Return the (position, length) of the fragments in each encapsulated frame.
+
+    Parameters
+    ----------
+    f : BinaryIO
+        A file-like containing encapsulated pixel data, positioned at the start
+        of the Basic Offset Table.
+    number_of_frames : int
+        The expected number of frames.
+    extended_offsets : tuple[bytes, bytes] | None
+        The encoded (7FE0,0001) *Extended Offset Table* and (7FE0,0002)
+        *Extended Offset Table Lengths* values, if any.
+
+    Returns
+    -------
+    list[list[tuple[int, int]]]
+        The absolute position of the first byte and the length of each
+        fragment's value, grouped by frame. Only the item tags are read, the
+        fragment values are skipped over where possible.
+    """
+    basic_start = f.tell()
+    basic_offsets = parse_basic_offsets(f)
+    first_item = f.tell()
+
+    if extended_offsets:
+        nr_offsets = len(extended_offsets[0]) // 8
+        offsets = unpack(f"<{nr_offsets}Q", extended_offsets[0])
+        lengths = unpack(f"<{nr_offsets}Q", extended_offsets[1])
+        return [
+            [(first_item + offset + 8, length)]
+            for offset, length in zip(offsets, lengths)
+        ]
+
+    nr_fragments, positions = parse_fragments(f)
+    fragments = []
+    for position in positions:
+        f.seek(position + 4)
+        fragments.append((position + 8, unpack("<L", f.read(4))[0]))
+
+    if basic_offsets:
+        frames: list[list[tuple[int, int]]] = [[] for _ in basic_offsets]
+        for fragment in fragments:
+            index = bisect_right(basic_offsets, fragment[0] - 8 - first_item) - 1
+            frames[index].append(fragment)
+
+        return frames
+
+    if nr_fragments in (1, number_of_frames):
+        return [[fragment] for fragment in fragments]
+
+    if number_of_frames == 1:
+        return [fragments]
+
+    # The frame boundaries can only be found using the JPEG EOI/EOC markers
+    f.seek(basic_start)
+    remaining = iter(fragments)
+    return [
+        [next(remaining) for _ in frame]
+        for frame in generate_fragmented_frames(f, number_of_frames=number_of_frames)
+    ]
+
+
+def read_fragments(f: BinaryIO, fragments: list[tuple[int, int]]) -> bytes:
+    """Return an encapsulated frame from the (position, length) of its
+    `fragments` in `f`.
+    """
+    values = []
+    for position, length in fragments:
+        f.seek(position)
+        values.append(f.read(length))
+
+    return b"".join(values)
+
+
+def decode_frame(
+    frame: bytes,
+    decoder: "Decoder",
+    opts: dict[str, Any],
+    raw: bool,
+    decoding_plugin: str,
+) -> "np.ndarray":
+    """Return the decoded encapsulated `frame`."""
+    arr, _ = decoder.as_array(
+        encapsulate([frame]),
+        validate=True,
+        raw=raw,
+        decoding_plugin=decoding_plugin,
+        **opts,
+    )
+
+    return arr
+
+
+def init_worker(
+    name: str,
+    shape: tuple[int, ...],
+    dtype: str,
+    path: str | None,
+    opts: dict[str, Any],
+    raw: bool,
+    decoding_plugin: str,
+) -> None:
+    """Attach a :func:`~pydicom.pixels.shared_pixel_array` worker process to the shared memory."""
+    from pydicom.pixels import get_decoder
+
+    _WORKER.update(
+        shm=SharedMemory(name),
+        shape=shape,
+        dtype=np.dtype(dtype),
+        path=path,
+        decoder=get_decoder(opts["transfer_syntax_uid"]),
+        opts=opts,
+        raw=raw,
+        decoding_plugin=decoding_plugin,
+    )
+
+
+def decode_into_shared(task: tuple[int, bytes | list[tuple[int, int]]]) -> None:
+    """Decode a frame into the shared memory of a :func:`~pydicom.pixels.shared_pixel_array`
+    worker process.
+
+    Parameters
+    ----------
+    task : tuple[int, bytes | list[tuple[int, int]]]
+        The index of the frame and either the encoded frame or the
+        (position, length) of its fragments in the worker's file.
+    """
+    state = _WORKER
+    index, frame = task
+    if not isinstance(frame, bytes):
+        with open(state["path"], "rb") as f:
+            frame = read_fragments(f, frame)
+
+    arr = decode_frame(
+        frame, state["decoder"], state["opts"], state["raw"], state["decoding_plugin"]
+    )
+    if arr.shape != state["shape"] or arr.dtype != state["dtype"]:
+        raise ValueError(
+            f"The shape {arr.shape} or dtype '{arr.dtype}' of the decoded frame "
+            f"at index {index} doesn't match the first frame"
+        )
+
+    out = np.ndarray(
+        arr.shape, arr.dtype, buffer=state["shm"].buf, offset=index * arr.nbytes
+    )
+    out[...] = arr
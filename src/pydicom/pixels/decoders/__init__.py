@@ -18,4 +18,6 @@ from pydicom.pixels.decoders.base import (
     HTJ2KDecoder,
     RLELosslessDecoder,
     DeflatedImageFrameCompressionDecoder,
+    load_plugin_preferences,
+    save_plugin_preferences,
 )
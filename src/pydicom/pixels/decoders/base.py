@@ -2,10 +2,13 @@
 """Pixel data decoding."""
 
 from collections.abc import Callable, Iterator, Iterable
+import json
 import logging
 from io import BufferedIOBase
+import os
 from math import ceil, floor
 import sys
+from time import perf_counter
 from typing import Any, BinaryIO, cast, TYPE_CHECKING
 
 try:
@@ -17,6 +20,7 @@ except ImportError:
 
 from pydicom import config
 from pydicom.encaps import get_frame, generate_frames
+from pydicom.hooks import hooks
 from pydicom.misc import warn_and_log
 from pydicom.pixels.common import (
     Buffer,
@@ -564,7 +568,7 @@ class DecodeRunner(RunnerBase):
         for name, func in self._decoders.items():
             try:
                 # Attempt to decode the frame
-                frame = func(src, self)
+                frame = self._decode_with(func, src)
 
                 # Decode success, if we were previously successful then
                 #   warn about the change to the new decoder
@@ -588,6 +592,18 @@ class DecodeRunner(RunnerBase):
             f"plugins:\n  {messages}"
         )
 
+    def _decode_with(self, func: DecodeFunction, src: bytes) -> bytes | bytearray:
+        """Return `src` decoded using the decoding function `func`."""
+        timing = hooks.timing_event
+        if timing is None:
+            return func(src, self)
+
+        start = perf_counter()
+        frame = func(src, self)
+        timing("decode_frame", perf_counter() - start, len(frame))
+
+        return frame
+
     def frame_dtype(self, index: int) -> "np.dtype":
         """Return a :class:`numpy.dtype` suitable for containing the pixel data for
         the decoded frame at `index`.
@@ -710,7 +726,7 @@ class DecodeRunner(RunnerBase):
             name, func = getattr(self, "_previous", (None, None))
             if func:
                 try:
-                    yield func(src, self)
+                    yield self._decode_with(func, src)
                     continue
                 except Exception:
                     LOGGER.warning(
@@ -1239,6 +1255,8 @@ class Decoder(CoderBase):
             The *Transfer Syntax UID* that the decoder supports.
         """
         super().__init__(uid, decoder=True)
+        # Labels of the plugins to try first, in order of preference
+        self._preferred: tuple[str, ...] = ()
 
     def as_array(
         self,
@@ -2028,6 +2046,99 @@ class Decoder(CoderBase):
         length_bytes *= runner.number_of_frames
         return runner.get_data(src, file_offset, ceil(length_bytes))
 
+    def calibrate(
+        self,
+        src: "Dataset | Buffer | BinaryIO",
+        *,
+        index: int | None = 0,
+        nr_repeats: int = 3,
+        **kwargs: Any,
+    ) -> dict[str, float]:
+        """Measure the time taken by each available plugin to decode `src` and
+        prefer the fastest plugins when no `decoding_plugin` is specified.
+
+        .. versionadded:: 3.1
+
+        Each plugin decodes the pixel data `nr_repeats` times using
+        :meth:`as_buffer` and the shortest time is kept. Plugins that fail to
+        decode the pixel data are placed after the others in the preferred
+        order. Use :func:`save_plugin_preferences` to keep the results for
+        later use.
+
+        Examples
+        --------
+
+        Prefer the fastest of the available plugins for *JPEG 2000* pixel
+        data::
+
+            from pydicom import examples
+            from pydicom.pixels import get_decoder
+
+            ds = examples.jpeg2k
+            decoder = get_decoder(ds.file_meta.TransferSyntaxUID)
+            print(decoder.calibrate(ds))
+
+        Parameters
+        ----------
+        src : :class:`~pydicom.dataset.Dataset` | buffer-like | file-like
+            Representative pixel data for the decoder, see :meth:`as_buffer`
+            for details.
+        index : int | None, optional
+            The index of the frame to decode, default ``0``. If ``None`` then
+            all frames will be decoded.
+        nr_repeats : int, optional
+            The number of times each plugin decodes the pixel data, default
+            ``3``.
+        **kwargs
+            Optional keyword parameters for controlling decoding, see
+            :meth:`as_buffer`.
+
+        Returns
+        -------
+        dict[str, float]
+            The shortest time taken by each successful plugin to decode the
+            pixel data in seconds, ordered from fastest to slowest.
+
+        Raises
+        ------
+        ValueError
+            If the decoder is for a transfer syntax with native pixel data.
+        RuntimeError
+            If none of the available plugins are able to decode the pixel
+            data.
+        """
+        if self.is_native:
+            raise ValueError(
+                f"The '{self.UID.name}' decoder doesn't use decoding plugins"
+            )
+
+        timings: dict[str, float] = {}
+        failures: list[str] = []
+        for label in self._validate_plugins():
+            try:
+                elapsed = []
+                for _ in range(max(nr_repeats, 1)):
+                    start = perf_counter()
+                    self.as_buffer(src, index=index, decoding_plugin=label, **kwargs)
+                    elapsed.append(perf_counter() - start)
+            except Exception as exc:
+                LOGGER.debug(f"The '{label}' plugin failed during calibration: {exc}")
+                failures.append(label)
+                continue
+
+            timings[label] = min(elapsed)
+
+        if not timings:
+            raise RuntimeError(
+                f"Unable to calibrate the '{self.UID.name}' decoder as none of "
+                "the available plugins were able to decode the pixel data"
+            )
+
+        timings = dict(sorted(timings.items(), key=lambda item: item[1]))
+        self.set_preferred_plugins([*timings, *failures])
+
+        return timings
+
     def iter_array(
         self,
         src: "Dataset | Buffer | BinaryIO",
@@ -2347,6 +2458,72 @@ class Decoder(CoderBase):
         for idx in indices:
             yield func(runner, idx), runner.pixel_properties(idx)
 
+    @property
+    def preferred_plugins(self) -> tuple[str, ...]:
+        """Return the labels of the plugins to try first when no
+        `decoding_plugin` is specified, in order of preference.
+
+        .. versionadded:: 3.1
+        """
+        return self._preferred
+
+    def set_preferred_plugins(self, plugins: Iterable[str]) -> None:
+        """Set the order to try the plugins in when no `decoding_plugin` is
+        specified.
+
+        .. versionadded:: 3.1
+
+        Parameters
+        ----------
+        plugins : Iterable[str]
+            The labels of the plugins to try first, in order of preference. Any
+            other available plugins are tried afterwards in the order they were
+            added. Use an empty iterable to remove the preference.
+
+        Raises
+        ------
+        ValueError
+            If any of the labels doesn't match a plugin that's been added to the
+            decoder.
+        """
+        plugins = tuple(plugins)
+        unknown = [
+            label
+            for label in plugins
+            if label not in self._available and label not in self._unavailable
+        ]
+        if unknown:
+            raise ValueError(
+                f"No plugin named '{unknown[0]}' has been added to "
+                f"'{self.UID.keyword}{type(self).__name__}'"
+            )
+
+        self._preferred = tuple(dict.fromkeys(plugins))
+
+    def _validate_plugins(self, plugin: str = "") -> dict[str, DecodeFunction]:
+        """Return available plugins, with any preferred plugins first.
+
+        Parameters
+        ----------
+        plugin : str, optional
+            If not used (default) then return all available plugins, otherwise
+            only return the plugin with a matching name (if it's available).
+
+        Returns
+        -------
+        dict[str, DecodeFunction]
+            A dict of available {plugin name: decode function} that can be used
+            to decode the corresponding pixel data.
+        """
+        plugins = cast(dict[str, DecodeFunction], super()._validate_plugins(plugin))
+        if plugin or not self._preferred:
+            return plugins
+
+        order = [label for label in self._preferred if label in plugins]
+        order.extend(label for label in plugins if label not in order)
+
+        return {label: plugins[label] for label in order}
+
 
 # Decoder names should be f"{UID.keyword}Decoder"
 # Uncompressed transfer syntaxes need no plugins
@@ -2562,3 +2739,56 @@ def get_decoder(uid: str) -> Decoder:
         raise NotImplementedError(
             f"No pixel data decoders have been implemented for '{uid.name}'"
         )
+
+
+def load_plugin_preferences(path: str | os.PathLike) -> None:
+    """Set the preferred decoding plugins from a file written by
+    :func:`save_plugin_preferences`.
+
+    .. versionadded:: 3.1
+
+    Preferences for transfer syntaxes without a decoder and for plugins that
+    haven't been added to a decoder are ignored, so the same file can be used
+    with different sets of installed plugins.
+
+    Parameters
+    ----------
+    path : str | os.PathLike
+        The path to the JSON file containing the preferences.
+    """
+    with open(path, encoding="utf-8") as f:
+        preferences: dict[str, list[str]] = json.load(f)
+
+    for uid, plugins in preferences.items():
+        if (item := _PIXEL_DATA_DECODERS.get(UID(uid))) is None:
+            continue
+
+        decoder = item[0]
+        decoder.set_preferred_plugins(
+            label
+            for label in plugins
+            if label in decoder._available or label in decoder._unavailable
+        )
+
+
+def save_plugin_preferences(path: str | os.PathLike) -> None:
+    """Write the preferred decoding plugins for each transfer syntax to a file.
+
+    .. versionadded:: 3.1
+
+    The preferences are set using :meth:`Decoder.calibrate` or
+    :meth:`Decoder.set_preferred_plugins` and can be restored in another
+    session using :func:`load_plugin_preferences`.
+
+    Parameters
+    ----------
+    path : str | os.PathLike
+        The path to write the JSON file containing the preferences to.
+    """
+    preferences = {
+        str(uid): list(decoder.preferred_plugins)
+        for uid, (decoder, _) in _PIXEL_DATA_DECODERS.items()
+        if decoder.preferred_plugins
+    }
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(preferences, f, indent=2)
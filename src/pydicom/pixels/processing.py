@@ -3,6 +3,7 @@
 
 from io import BytesIO
 from struct import unpack, unpack_from
+from time import perf_counter
 from typing import TYPE_CHECKING, cast
 
 try:
@@ -21,6 +22,7 @@ except ImportError:
     HAVE_PIL = False
 
 from pydicom.data import get_palette_files
+from pydicom.hooks import hooks
 from pydicom.misc import warn_and_log
 from pydicom.uid import UID
 from pydicom.valuerep import VR
@@ -946,13 +948,20 @@ def convert_color_space(
             f"unsigned {bit_depth}-bit integers"
         )
 
+    timing = hooks.timing_event
+    if timing is not None:
+        start = perf_counter()
+
     if len(arr.shape) == 4 and per_frame:
         for idx, frame in enumerate(arr):
             arr[idx] = converter(frame, bit_depth)
+    else:
+        arr = converter(arr, bit_depth)
 
-        return arr
+    if timing is not None:
+        timing("convert_color_space", perf_counter() - start, arr.nbytes)
 
-    return converter(arr, bit_depth)
+    return arr
 
 
 if HAVE_NP:
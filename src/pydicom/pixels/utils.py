@@ -2,6 +2,7 @@
 """Utilities for pixel data handling."""
 
 from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
 
 try:
     from collections.abc import Buffer  # type: ignore[attr-defined]
@@ -10,6 +11,7 @@ except ImportError:
 import math
 import importlib
 import logging
+import os
 from pathlib import Path
 from struct import pack, unpack, Struct
 from sys import byteorder
@@ -25,7 +27,7 @@ except ImportError:
 
 from pydicom.charset import default_encoding
 from pydicom._dicom_dict import DicomDictionary
-from pydicom.encaps import encapsulate, encapsulate_extended
+from pydicom.encaps import encapsulate, encapsulate_extended, generate_frames
 from pydicom.misc import warn_and_log
 from pydicom.tag import BaseTag
 from pydicom.uid import (
@@ -60,6 +62,13 @@ _IMAGE_PIXEL = {
     0x00280101: "bits_stored",
     0x00280103: "pixel_representation",
 }
+# The elements required by get_region_frames()
+_TILED_ELEMENTS = {
+    "Rows": "(0028,0010) 'Rows'",
+    "Columns": "(0028,0011) 'Columns'",
+    "TotalPixelMatrixRows": "(0048,0007) 'Total Pixel Matrix Rows'",
+    "TotalPixelMatrixColumns": "(0048,0006) 'Total Pixel Matrix Columns'",
+}
 # Default tags to look for with pixel_array() and iter_pixels()
 _DEFAULT_TAGS = {k for k in _IMAGE_PIXEL.keys()} | {0x7FE00001, 0x7FE00002}
 _PIXEL_KEYWORDS = {
@@ -1103,6 +1112,136 @@ def get_nr_frames(ds: "Dataset", warn: bool = True) -> int:
     return nr_frames
 
 
+def get_region_frames(
+    ds: "Dataset",
+    region: tuple[int, int, int, int],
+    *,
+    focal_plane: int = 0,
+    optical_path: int = 0,
+) -> dict[int, tuple[int, int]]:
+    """Return the frames of a tiled dataset that intersect a region of the
+    total pixel matrix.
+
+    .. versionadded:: 3.1
+
+    For datasets with a (0020,9311) *Dimension Organization Type* of
+    ``"TILED_FULL"``, such as VL Whole Slide Microscopy images, the frames are
+    tiles ordered first by column, then row, then focal plane and then optical
+    path, and their positions are calculated from the (0048,0006) *Total Pixel
+    Matrix Columns*, (0048,0007) *Total Pixel Matrix Rows*, (0028,0011)
+    *Columns* and (0028,0010) *Rows*. Otherwise the position of each frame is
+    taken from the (0048,021A) *Plane Position (Slide) Sequence* in the
+    (5200,9230) *Per-Frame Functional Groups Sequence*.
+
+    Examples
+    --------
+
+    Get the frames needed for a 512 x 512 pixel region of a VL Whole Slide
+    Microscopy image::
+
+        from pydicom import dcmread
+        from pydicom.pixels import get_region_frames
+
+        ds = dcmread("path/to/level.dcm", stop_before_pixels=True)
+        frames = get_region_frames(ds, (1024, 2048, 512, 512))
+
+    Parameters
+    ----------
+    ds : pydicom.dataset.Dataset
+        The dataset containing tiled pixel data.
+    region : tuple[int, int, int, int]
+        The (row, column, rows, columns) of the region, where (row, column) is
+        the position of the region's top left pixel in the total pixel matrix,
+        starting at (0, 0), and (rows, columns) is the size of the region.
+    focal_plane : int, optional
+        The index of the focal plane to use, starting at ``0`` (default). Only
+        available when the *Dimension Organization Type* is ``"TILED_FULL"``.
+    optical_path : int, optional
+        The index of the optical path to use, starting at ``0`` (default). Only
+        available when the *Dimension Organization Type* is ``"TILED_FULL"``.
+
+    Returns
+    -------
+    dict[int, tuple[int, int]]
+        The index of each frame that intersects the region, starting at ``0``,
+        and the (row, column) of the frame's top left pixel in the total pixel
+        matrix.
+    """
+    for keyword, element in _TILED_ELEMENTS.items():
+        if keyword not in ds:
+            raise AttributeError(
+                f"Unable to determine the tiled frames as the dataset has no "
+                f"{element} element"
+            )
+
+    rows, columns = ds.Rows, ds.Columns
+    total_rows, total_columns = ds.TotalPixelMatrixRows, ds.TotalPixelMatrixColumns
+    row, column, nr_rows, nr_columns = region
+    if (
+        row < 0
+        or column < 0
+        or nr_rows < 1
+        or nr_columns < 1
+        or row + nr_rows > total_rows
+        or column + nr_columns > total_columns
+    ):
+        raise ValueError(
+            f"The region {region} is not within the {total_rows} x {total_columns} "
+            "total pixel matrix"
+        )
+
+    nr_planes = ds.get("TotalPixelMatrixFocalPlanes", None) or 1
+    nr_paths = ds.get("NumberOfOpticalPaths", None) or 1
+    per_frame = ds.get("PerFrameFunctionalGroupsSequence", None)
+    frames = {}
+    if ds.get("DimensionOrganizationType", None) == "TILED_FULL" or not per_frame:
+        if not 0 <= focal_plane < nr_planes:
+            raise ValueError(f"'focal_plane' must be in the range [0, {nr_planes})")
+
+        if not 0 <= optical_path < nr_paths:
+            raise ValueError(f"'optical_path' must be in the range [0, {nr_paths})")
+
+        tiles_across = math.ceil(total_columns / columns)
+        tiles_down = math.ceil(total_rows / rows)
+        offset = (optical_path * nr_planes + focal_plane) * tiles_across * tiles_down
+        for tile_row in range(row // rows, (row + nr_rows - 1) // rows + 1):
+            for tile_column in range(
+                column // columns, (column + nr_columns - 1) // columns + 1
+            ):
+                index = offset + tile_row * tiles_across + tile_column
+                frames[index] = (tile_row * rows, tile_column * columns)
+
+        return frames
+
+    if nr_planes > 1 or nr_paths > 1 or focal_plane or optical_path:
+        raise ValueError(
+            "Selecting the focal plane or optical path is only supported when "
+            "the (0020,9311) 'Dimension Organization Type' is 'TILED_FULL'"
+        )
+
+    for index, item in enumerate(per_frame):
+        try:
+            position = item.PlanePositionSlideSequence[0]
+            tile_row = position.RowPositionInTotalImagePixelMatrix - 1
+            tile_column = position.ColumnPositionInTotalImagePixelMatrix - 1
+        except (AttributeError, IndexError, TypeError):
+            raise AttributeError(
+                f"Unable to determine the position of the frame at index {index} "
+                "as its (0048,021A) 'Plane Position (Slide) Sequence' is missing "
+                "or invalid"
+            )
+
+        if (
+            tile_row < row + nr_rows
+            and tile_row + rows > row
+            and tile_column < column + nr_columns
+            and tile_column + columns > column
+        ):
+            frames[index] = (tile_row, tile_column)
+
+    return frames
+
+
 def iter_pixels(
     src: "str | PathLike[str] | BinaryIO | Dataset",
     *,
@@ -1750,6 +1889,126 @@ def pixel_dtype(ds: "Dataset", as_float: bool = False) -> "np.dtype":
     return dtype
 
 
+def region_array(
+    src: "str | PathLike[str] | Dataset",
+    region: tuple[int, int, int, int],
+    *,
+    focal_plane: int = 0,
+    optical_path: int = 0,
+    max_workers: int | None = None,
+    raw: bool = False,
+    decoding_plugin: str = "",
+    **kwargs: Any,
+) -> "np.ndarray":
+    """Return a region of the total pixel matrix of a tiled dataset as
+    :class:`~numpy.ndarray`.
+
+    .. versionadded:: 3.1
+
+    .. warning::
+
+        This function requires `NumPy <https://numpy.org/>`_ and may require
+        the installation of additional packages to perform the actual pixel
+        data decompression. See the :doc:`pixel data decompression documentation
+        </guides/user/image_data_handlers>` for more information.
+
+    Only the frames that intersect the region are decoded, using
+    :func:`shared_pixel_array`, and the parts of each frame within the region
+    are then copied into the output array. When `src` is a path the other
+    frames aren't read from the file. See :func:`get_region_frames` for how the
+    frames are found.
+
+    Examples
+    --------
+
+    Return a 512 x 512 pixel region of a VL Whole Slide Microscopy image,
+    decoding the frames with 4 worker processes::
+
+        from pydicom.pixels import region_array
+
+        arr = region_array("path/to/level.dcm", (1024, 2048, 512, 512), max_workers=4)
+
+    Parameters
+    ----------
+    src : str | PathLike[str] | pydicom.dataset.Dataset
+
+        * :class:`str` | :class:`os.PathLike`: the path to a DICOM dataset
+          containing tiled pixel data, or
+        * :class:`~pydicom.dataset.Dataset`: a dataset instance
+    region : tuple[int, int, int, int]
+        The (row, column, rows, columns) of the region, where (row, column) is
+        the position of the region's top left pixel in the total pixel matrix,
+        starting at (0, 0), and (rows, columns) is the size of the region.
+    focal_plane : int, optional
+        The index of the focal plane to use, starting at ``0`` (default).
+    optical_path : int, optional
+        The index of the optical path to use, starting at ``0`` (default).
+    max_workers : int, optional
+        The maximum number of worker processes to use when decoding the frames,
+        see :func:`shared_pixel_array`.
+    raw : bool, optional
+        If ``True`` then return the decoded pixel data after only minimal
+        processing, see :func:`pixel_array` for more information.
+    decoding_plugin : str, optional
+        The name of the decoding plugin to use when decoding compressed
+        pixel data. If no `decoding_plugin` is specified (default) then all
+        available plugins will be tried and the result from the first successful
+        one used. For information on the available plugins for each
+        decoder see the :doc:`API documentation</reference/pixels.decoders>`.
+    **kwargs
+        Optional keyword parameters for controlling decoding, please see the
+        :doc:`decoding options documentation</guides/decoding/decoder_options>`
+        for more information.
+
+    Returns
+    -------
+    numpy.ndarray
+        The region with shape (rows, columns) for single sample data or
+        (rows, columns, samples) for multi-sample data. Any part of the region
+        not covered by a frame is set to ``0``.
+    """
+    from pydicom.dataset import Dataset
+    from pydicom.filereader import dcmread
+
+    ds = src if isinstance(src, Dataset) else dcmread(src, stop_before_pixels=True)
+    frames = get_region_frames(
+        ds, region, focal_plane=focal_plane, optical_path=optical_path
+    )
+    row, column, nr_rows, nr_columns = region
+    if not frames:
+        samples = ds.get("SamplesPerPixel", None) or 1
+        shape = (
+            (nr_rows, nr_columns) if samples == 1 else (nr_rows, nr_columns, samples)
+        )
+        return np.zeros(shape, dtype=pixel_dtype(ds))
+
+    indices = sorted(frames)
+    with shared_pixel_array(
+        src,
+        indices=indices,
+        max_workers=max_workers,
+        raw=raw,
+        decoding_plugin=decoding_plugin,
+        **kwargs,
+    ) as arr:
+        tiles = arr if len(indices) > 1 else arr[None, ...]
+        out = np.zeros((nr_rows, nr_columns, *tiles.shape[3:]), dtype=tiles.dtype)
+        for index, tile in zip(indices, tiles):
+            tile_row, tile_column = frames[index]
+            # The part of the tile within the region
+            top, bottom = max(tile_row, row), min(tile_row + ds.Rows, row + nr_rows)
+            left = max(tile_column, column)
+            right = min(tile_column + ds.Columns, column + nr_columns)
+            out[top - row : bottom - row, left - column : right - column] = tile[
+                top - tile_row : bottom - tile_row,
+                left - tile_column : right - tile_column,
+            ]
+
+        del arr, tiles, tile
+
+    return out
+
+
 def reshape_pixel_array(ds: "Dataset", arr: "np.ndarray") -> "np.ndarray":
     """Return a reshaped :class:`numpy.ndarray` `arr`.
 
@@ -2122,6 +2381,248 @@ def set_pixel_data(
         ds.SOPInstanceUID = ds.file_meta.MediaStorageSOPInstanceUID = generate_uid()
 
 
+@contextmanager
+def shared_pixel_array(
+    src: "str | PathLike[str] | Dataset",
+    *,
+    indices: Sequence[int] | None = None,
+    max_workers: int | None = None,
+    raw: bool = False,
+    decoding_plugin: str = "",
+    **kwargs: Any,
+) -> Iterator["np.ndarray"]:
+    """Return a context manager for decoding pixel data from `src` in worker
+    processes.
+
+    .. versionadded:: 3.1
+
+    .. warning::
+
+        This function requires `NumPy <https://numpy.org/>`_ and may require
+        the installation of additional packages to perform the actual pixel
+        data decompression. See the :doc:`pixel data decompression documentation
+        </guides/user/image_data_handlers>` for more information.
+
+    The output array is allocated in :mod:`shared memory
+    <multiprocessing.shared_memory>` and each frame of compressed pixel data
+    is decoded by a :class:`~concurrent.futures.ProcessPoolExecutor` worker
+    directly into its place in the array, so the decoded frames never have to
+    be sent back to the main process. When `src` is a path the workers are only
+    sent the position of each frame's fragments in the file, otherwise the
+    encoded frames are taken from the dataset and sent to the workers.
+
+    The shared memory is released when the context exits. If the array, or a
+    view of it, is still in use at that point then it remains valid and the
+    memory is released once it's no longer referenced. Pixel data using a
+    native transfer syntax doesn't need decompressing and is copied into the
+    array by the main process.
+
+    Examples
+    --------
+
+    Decode a multi-frame JPEG 2000 dataset using 4 worker processes::
+
+        from pydicom.pixels import shared_pixel_array
+
+        with shared_pixel_array("path/to/dataset.dcm", max_workers=4) as arr:
+            print(arr.shape, arr.mean())
+
+    Parameters
+    ----------
+    src : str | PathLike[str] | pydicom.dataset.Dataset
+
+        * :class:`str` | :class:`os.PathLike`: the path to a DICOM dataset
+          containing pixel data, or
+        * :class:`~pydicom.dataset.Dataset`: a dataset instance
+    indices : Sequence[int] | None, optional
+        If ``None`` (default) then decode all the frames in the pixel data,
+        otherwise only decode the frames specified by `indices`. The frames
+        are placed in the array in the same order as `indices`. When `src` is
+        a path only the specified frames are read from the file.
+    max_workers : int, optional
+        The maximum number of worker processes to use, default is to use the
+        :class:`~concurrent.futures.ProcessPoolExecutor` default. If ``1`` then
+        the frames will be decoded by the main process.
+    raw : bool, optional
+        If ``True`` then return the decoded pixel data after only minimal
+        processing, see :func:`pixel_array` for more information.
+    decoding_plugin : str, optional
+        The name of the decoding plugin to use when decoding compressed
+        pixel data. If no `decoding_plugin` is specified (default) then all
+        available plugins will be tried and the result from the first successful
+        one used. For information on the available plugins for each
+        decoder see the :doc:`API documentation</reference/pixels.decoders>`.
+    **kwargs
+        Optional keyword parameters for controlling decoding, please see the
+        :doc:`decoding options documentation</guides/decoding/decoder_options>`
+        for more information.
+
+    Yields
+    ------
+    numpy.ndarray
+        The decoded pixel data, with the same shape as returned by
+        :func:`pixel_array` for the number of frames in `indices`.
+    """
+    from concurrent.futures import ProcessPoolExecutor
+
+    from pydicom.dataset import Dataset
+    from pydicom.pixels import get_decoder
+    from pydicom.pixels._shared import (
+        SharedMemoryBlock,
+        decode_frame,
+        decode_into_shared,
+        encapsulated_fragments,
+        init_worker,
+        read_fragments,
+        release,
+    )
+
+    f: BinaryIO | None = None
+    path: str | None = None
+    if isinstance(src, Dataset):
+        ds = src
+        file_meta = getattr(ds, "file_meta", {})
+        if not (tsyntax := file_meta.get("TransferSyntaxUID", None)):
+            raise AttributeError(
+                "Unable to decode the pixel data as the dataset's 'file_meta' "
+                "has no (0002,0010) 'Transfer Syntax UID' element"
+            )
+
+        opts = as_pixel_options(ds, **kwargs)
+        opts["transfer_syntax_uid"] = UID(tsyntax)
+    else:
+        path = os.fspath(Path(src).resolve(strict=True))
+        f = open(path, "rb")
+
+    try:
+        if f is not None:
+            ds, opts = _array_common(f, list(_DEFAULT_TAGS), **kwargs)
+
+        tsyntax = opts["transfer_syntax_uid"]
+        try:
+            decoder = get_decoder(tsyntax)
+        except NotImplementedError:
+            raise NotImplementedError(
+                "Unable to decode the pixel data as a (0002,0010) 'Transfer Syntax "
+                f"UID' value of '{tsyntax.name}' is not supported"
+            )
+
+        nr_frames = opts["number_of_frames"]
+        if indices is None:
+            indices = range(nr_frames)
+
+        if not indices or not all(0 <= idx < nr_frames for idx in indices):
+            raise ValueError(
+                f"'indices' must contain one or more frame indices in the range "
+                f"[0, {nr_frames})"
+            )
+
+        tasks: list[tuple[int, bytes | list[tuple[int, int]]]] = []
+        frames: Iterator[np.ndarray]
+        if decoder.is_native:
+            # No decompression is needed so the frames are copied as-is
+            frames = (
+                frame
+                for frame, _ in decoder.iter_array(
+                    ds if f is None else f,
+                    indices=indices,
+                    validate=True,
+                    raw=raw,
+                    decoding_plugin=decoding_plugin,
+                    **opts,
+                )
+            )
+        else:
+            if f is not None:
+                fragments = encapsulated_fragments(
+                    f, nr_frames, opts.get("extended_offsets")
+                )
+                tasks.extend((slot, fragments[idx]) for slot, idx in enumerate(indices))
+            else:
+                wanted = set(indices)
+                encoded = {
+                    idx: frame
+                    for idx, frame in enumerate(
+                        generate_frames(
+                            ds[opts.get("pixel_keyword", "PixelData")].value,
+                            number_of_frames=nr_frames,
+                            extended_offsets=opts.get("extended_offsets"),
+                        )
+                    )
+                    if idx in wanted
+                }
+                tasks.extend((slot, encoded[idx]) for slot, idx in enumerate(indices))
+
+            # Each encapsulated frame is decoded on its own
+            opts["number_of_frames"] = 1
+            opts.pop("extended_offsets", None)
+            frames = (
+                decode_frame(
+                    (
+                        frame
+                        if isinstance(frame, bytes)
+                        else read_fragments(cast(BinaryIO, f), frame)
+                    ),
+                    decoder,
+                    opts,
+                    raw,
+                    decoding_plugin,
+                )
+                for _, frame in tasks
+            )
+
+        # The size of the shared memory is set by the first decoded frame
+        first = next(frames)
+        nr_frames = len(indices)
+        shm = SharedMemoryBlock(create=True, size=max(first.nbytes * nr_frames, 1))
+    except BaseException:
+        if f is not None:
+            f.close()
+
+        raise
+
+    shape = (nr_frames, *first.shape) if nr_frames > 1 else first.shape
+    arr = np.ndarray(shape, first.dtype, buffer=shm.buf)
+    volume = arr.reshape(nr_frames, *first.shape)
+    try:
+        volume[0] = first
+
+        if decoder.is_native or max_workers == 1 or len(tasks) < 3:
+            for index, frame in enumerate(frames, 1):
+                volume[index] = frame
+        else:
+            initargs = (
+                shm.name,
+                first.shape,
+                first.dtype.str,
+                path,
+                opts,
+                raw,
+                decoding_plugin,
+            )
+            with ProcessPoolExecutor(
+                max_workers, initializer=init_worker, initargs=initargs
+            ) as pool:
+                nr_workers = max_workers or os.cpu_count() or 1
+                chunksize = max(1, len(tasks) // (4 * nr_workers))
+                for _ in pool.map(decode_into_shared, tasks[1:], chunksize=chunksize):
+                    pass
+    except BaseException:
+        del arr, volume
+        release(shm)
+        raise
+    finally:
+        if f is not None:
+            f.close()
+
+    del first, frames, volume
+    try:
+        yield arr
+    finally:
+        del arr
+        release(shm)
+
+
 def unpack_bits(src: bytes, as_array: bool = True) -> "np.ndarray | bytes":
     """Unpack the bit-packed data in `src`.
 
@@ -1,51 +1,150 @@
 # Copyright 2008-2024 pydicom authors. See LICENSE file for details.
 """Access code dictionary information"""
 
-from itertools import chain
+from bisect import bisect_left
+from functools import cache
 import inspect
 from typing import cast, Any
-from collections.abc import KeysView, Iterable
+from collections.abc import Callable, KeysView
 
-from pydicom.sr.coding import Code
-from pydicom.sr._concepts_dict import concepts as CONCEPTS
-from pydicom.sr._cid_dict import name_for_cid, cid_concepts as CID_CONCEPTS
+from pydicom.sr.coding import Code, _snomed_mapping
 
 
-# Reverse lookup for cid names
-cid_for_name = {v: k for k, v in name_for_cid.items()}
+CIDValueType = dict[str, tuple[str, list[int]]]
+ConceptsType = dict[str, CIDValueType]
+SnomedMappingType = dict[str, dict[str, str]]
+
+
+# The concept and CID dictionaries are large, so they're only imported when
+#   first needed rather than on `import pydicom.sr`
+def _concepts() -> dict[str, ConceptsType]:
+    """Return the concepts dictionary as {scheme designator: concepts}."""
+    from pydicom.sr._concepts_dict import concepts
+
+    return cast(dict[str, ConceptsType], concepts)
+
+
+def _cid_concepts() -> dict[int, dict[str, list[str]]]:
+    """Return the CID dictionary as {CID: {scheme designator: keywords}}."""
+    from pydicom.sr._cid_dict import cid_concepts
 
+    return cid_concepts
 
-def _filtered(source: Iterable[str], filters: Iterable[str]) -> list[str]:
-    """Return a sorted list of filtered str.
 
-    Parameters
-    ----------
-    source : Iterable[str]
-        The iterable of str to be filtered.
-    filters : Iterable[str]
-        An iterable containing patterns for which values are to be included
-        in the results.
+def _name_for_cid() -> dict[int, str]:
+    """Return the CID names as {CID: name}."""
+    from pydicom.sr._cid_dict import name_for_cid
 
-    Returns
-    -------
-    List[str]
-        A sorted list of unique values from `source`, filtered by including
-        case-insensitive partial or full matches against the values
-        in `filters`.
+    return name_for_cid
+
+
+@cache
+def _cid_for_name() -> dict[str, int]:
+    """Return the reverse lookup for CID names as {name: CID}."""
+    return {v: k for k, v in _name_for_cid().items()}
+
+
+def _code_key(scheme_designator: str, value: str) -> tuple[str, str]:
+    """Return the (scheme designator, code value) used to index a code.
+
+    SNOMED RT codes are indexed using their SNOMED-CT equivalents, to match
+    the behavior of :meth:`Code.__eq__()<pydicom.sr.coding.Code.__eq__>`.
     """
-    if not filters:
-        return sorted(set(source))
+    if scheme_designator == "SRT" and value in _snomed_mapping()["SRT"]:
+        return "SCT", _snomed_mapping()["SRT"][value]
 
-    filters = [f.lower() for f in filters]
+    return scheme_designator, value
 
-    return sorted(
-        set(val for val in source if any((f in val.lower()) for f in filters))
-    )
 
+class _SearchIndex:
+    """Search index for the keywords and codes in a :class:`Collection`."""
 
-CIDValueType = dict[str, tuple[str, list[int]]]
-ConceptsType = dict[str, CIDValueType]
-SnomedMappingType = dict[str, dict[str, str]]
+    def __init__(self, collection: "Collection", size: tuple[int, ...]) -> None:
+        """Create a new search index.
+
+        Parameters
+        ----------
+        collection : Collection
+            The collection to be indexed.
+        size : tuple[int, ...]
+            The size of the collection's source data at the time of indexing,
+            used to detect changes to the source data.
+        """
+        self.size = size
+
+        # {keyword: [scheme designators]}
+        self.schemes: dict[str, list[str]] = {}
+        if collection.is_cid:
+            for scheme, keywords in collection._cid_data.items():
+                for kw in keywords:
+                    matches = self.schemes.setdefault(kw, [])
+                    if scheme not in matches:
+                        matches.append(scheme)
+        else:
+            self.schemes = {kw: [collection.name] for kw in collection._scheme_data}
+
+        self.keywords = sorted(self.schemes)
+        # Case-insensitive keywords as [(lowercase keyword, keyword)]
+        self.lowered = sorted((kw.lower(), kw) for kw in self.keywords)
+
+        # {(scheme designator, code value): [keywords]}, created on first use
+        self._keywords_by_code: dict[tuple[str, str], list[str]] | None = None
+        # {keyword: Code}, populated on lookup
+        self.codes: dict[str, Code] = {}
+
+    def keyword_for_code(self, code: Code, collection: "Collection") -> str | None:
+        """Return the keyword corresponding to `code`, or ``None`` if the
+        code isn't in the collection.
+        """
+        if self._keywords_by_code is None:
+            lookup: dict[tuple[str, str], list[str]] = {}
+            concepts = _concepts()
+            for kw, schemes in self.schemes.items():
+                for scheme in schemes:
+                    for value in concepts.get(scheme, {}).get(kw, {}):
+                        lookup.setdefault(_code_key(scheme, value), []).append(kw)
+
+            self._keywords_by_code = lookup
+
+        key = _code_key(code.scheme_designator, code.value)
+        for kw in self._keywords_by_code.get(key, []):
+            # The code value alone may not be enough to identify the concept
+            #   so confirm the match against the collection's code
+            try:
+                if getattr(collection, kw) == code:
+                    return kw
+            except (AttributeError, RuntimeError):
+                pass
+
+        return None
+
+    def search(self, filters: tuple[str, ...], prefix: bool) -> list[str]:
+        """Return a sorted list of keywords matching any of `filters`.
+
+        Parameters
+        ----------
+        filters : tuple[str, ...]
+            The case-insensitive patterns to match against.
+        prefix : bool
+            If ``True`` then only match against the start of each keyword,
+            otherwise match against any part.
+        """
+        if not filters:
+            return list(self.keywords)
+
+        patterns = [f.lower() for f in filters]
+        if prefix:
+            matches = set()
+            lowered = self.lowered
+            for pattern in patterns:
+                idx = bisect_left(lowered, (pattern, ""))
+                while idx < len(lowered) and lowered[idx][0].startswith(pattern):
+                    matches.add(lowered[idx][1])
+                    idx += 1
+
+            return sorted(matches)
+
+        return sorted(kw for low, kw in self.lowered if any(p in low for p in patterns))
 
 
 class Collection:
@@ -70,14 +169,32 @@ class Collection:
             self._name = name
             # dict[str, dict[str, tuple(str, list[int])]]
             # {'ACEInhibitor': {'41549009': ('ACE inhibitor', [3760])},
-            self._scheme_data = CONCEPTS[name]
+            self._scheme_data = _concepts()[name]
         else:
             self._name = f"CID{name[3:]}"
             # dict[str, list[str]]
             # {'SCT': ['Pericardium', 'Pleura', 'LeftPleura', 'RightPleura']}
-            self._cid_data = CID_CONCEPTS[int(name[3:])]
+            self._cid_data = _cid_concepts()[int(name[3:])]
 
         self._concepts: dict[str, Code] = {}
+        self._search_index: _SearchIndex | None = None
+
+    def _index(self) -> _SearchIndex:
+        """Return the search index for the collection.
+
+        The index is created on first use and recreated if the size of the
+        source concepts data changes.
+        """
+        if self.is_cid:
+            size = tuple(len(keywords) for keywords in self._cid_data.values())
+        else:
+            size = (len(self._scheme_data),)
+
+        index = self._search_index
+        if index is None or index.size != size:
+            index = self._search_index = _SearchIndex(self, size)
+
+        return index
 
     @property
     def concepts(self) -> dict[str, Code]:
@@ -102,14 +219,14 @@ class Collection:
             Whether the collection contains the `code`
         """
         if isinstance(item, str):
-            try:
-                code = getattr(self, item)
-            except AttributeError:
+            if item not in self._index().schemes:
                 return False
-        else:
-            code = item
 
-        return code in self.concepts.values()
+            # Resolve the code so keywords that can't be used raise
+            getattr(self, item)
+            return True
+
+        return self._index().keyword_for_code(item, self) is not None
 
     def __dir__(self) -> list[str]:
         """Return a list of available concept keywords.
@@ -123,14 +240,21 @@ class Collection:
 
         return sorted(props | meths | sr_names)
 
-    def dir(self, *filters: str) -> list[str]:
+    def dir(self, *filters: str, prefix: bool = False) -> list[str]:
         """Return an sorted list of concept keywords based on a partial match.
 
+        .. versionchanged:: 3.1
+
+            Added the `prefix` keyword parameter.
+
         Parameters
         ----------
         filters : str
             Zero or more string arguments to the function. Used for
             case-insensitive match to any part of the SR keyword.
+        prefix : bool, optional
+            If ``True`` then only match `filters` against the start of the
+            SR keyword (default ``False``).
 
         Returns
         -------
@@ -138,11 +262,7 @@ class Collection:
             The matching keywords. If no `filters` are used then all
             keywords are returned.
         """
-        # CID_CONCEPTS: Dict[int, Dict[str, List[str]]]
-        if self.is_cid:
-            return _filtered(chain.from_iterable(self._cid_data.values()), filters)
-
-        return _filtered(self._scheme_data, filters)
+        return self._index().search(filters, prefix)
 
     def __getattr__(self, name: str) -> Code:
         """Return the :class:`~pydicom.sr.Code` corresponding to `name`.
@@ -158,13 +278,20 @@ class Collection:
         pydicom.sr.Code
             The :class:`~pydicom.sr.Code` corresponding to `name`.
         """
+        index = self._index()
+        if name in index.codes:
+            return index.codes[name]
+
+        code = self._lookup(name, index)
+        index.codes[name] = code
+
+        return code
+
+    def _lookup(self, name: str, index: _SearchIndex) -> Code:
+        """Return the :class:`~pydicom.sr.Code` corresponding to `name`."""
         if self.name.startswith("CID"):
             # Try DICOM's CID collections
-            matches = [
-                scheme
-                for scheme, keywords in self._cid_data.items()
-                if name in keywords
-            ]
+            matches = index.schemes.get(name, [])
             if not matches:
                 raise AttributeError(
                     f"No matching code for keyword '{name}' in {self.name}"
@@ -178,7 +305,7 @@ class Collection:
                 )
 
             scheme = matches[0]
-            identifiers = cast(CIDValueType, CONCEPTS[scheme][name])
+            identifiers = cast(CIDValueType, _concepts()[scheme][name])
 
             if len(identifiers) == 1:
                 code, val = list(identifiers.items())[0]
@@ -298,20 +425,35 @@ class Concepts:
     .. versionadded:: 3.0
     """
 
-    def __init__(self, collections: list[Collection]) -> None:
+    def __init__(self, collections: list[Collection] | None = None) -> None:
         """Create a new concepts management class instance.
 
         Parameters
         ----------
-        collections : list[Collection]
-            A list of the available concept collections.
+        collections : list[Collection], optional
+            A list of the available concept collections. If not used then
+            collections for all the coding schemes and CIDs included with
+            *pydicom* will be created on first access.
         """
-        self._collections = {c.name: c for c in collections}
+        self._collections: dict[str, Collection] | None = None
+        if collections is not None:
+            self._collections = {c.name: c for c in collections}
+
+    def _available(self) -> dict[str, Collection]:
+        """Return the available collections as {name: collection}."""
+        if self._collections is None:
+            # Named concept collections like SNOMED-CT, etc
+            collections = [Collection(designator) for designator in _concepts()]
+            # DICOM CIDs
+            collections.extend(Collection(f"CID{cid}") for cid in _name_for_cid())
+            self._collections = {c.name: c for c in collections}
+
+        return self._collections
 
     @property
     def collections(self) -> KeysView[str]:
         """Return the names of the available concept collections."""
-        return self._collections.keys()
+        return self._available().keys()
 
     def __getattr__(self, name: str) -> Any:
         """Return the concept collection corresponding to `name`.
@@ -324,8 +466,9 @@ class Concepts:
         if name.upper().startswith("CID"):
             name = f"CID{name[3:]}"
 
-        if name in self._collections:
-            return self._collections[name]
+        collections = self._available()
+        if name in collections:
+            return collections[name]
 
         raise AttributeError(
             f"'{type(self).__name__}' object has no attribute '{name}'"
@@ -333,16 +476,26 @@ class Concepts:
 
     def schemes(self) -> list[str]:
         """Return a list of available scheme designations."""
-        return [c for c in self._collections.keys() if not c.startswith("CID")]
+        return [c for c in self._available() if not c.startswith("CID")]
 
     def CIDs(self) -> list[str]:
         """Return a list of available CID names."""
-        return [c for c in self._collections.keys() if c.startswith("CID")]
+        return [c for c in self._available() if c.startswith("CID")]
+
+
+codes = Concepts()
+
+
+_LAZY_ATTRIBUTES: dict[str, Callable[[], Any]] = {
+    "CONCEPTS": _concepts,
+    "CID_CONCEPTS": _cid_concepts,
+    "name_for_cid": _name_for_cid,
+    "cid_for_name": _cid_for_name,
+}
 
 
-# Named concept collections like SNOMED-CT, etc
-_collections = [Collection(designator) for designator in CONCEPTS]
-# DICOM CIDs
-_collections.extend(Collection(f"CID{cid}") for cid in name_for_cid)
+def __getattr__(name: str) -> Any:
+    if name in _LAZY_ATTRIBUTES:
+        return _LAZY_ATTRIBUTES[name]()
 
-codes = Concepts(_collections)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -2,7 +2,12 @@
 
 from typing import NamedTuple, Any
 
-from pydicom.sr._snomed_dict import mapping as snomed_mapping
+
+def _snomed_mapping() -> dict[str, dict[str, str]]:
+    """Return the SNOMED-CT <-> SNOMED RT mapping, importing it on first use"""
+    from pydicom.sr._snomed_dict import mapping
+
+    return mapping
 
 
 class Code(NamedTuple):
@@ -22,9 +27,9 @@ class Code(NamedTuple):
         return hash(self.scheme_designator + self.value)
 
     def __eq__(self, other: Any) -> Any:
-        if self.scheme_designator == "SRT" and self.value in snomed_mapping["SRT"]:
+        if self.scheme_designator == "SRT" and self.value in _snomed_mapping()["SRT"]:
             self_mapped = Code(
-                value=snomed_mapping["SRT"][self.value],
+                value=_snomed_mapping()["SRT"][self.value],
                 meaning="",
                 scheme_designator="SCT",
                 scheme_version=self.scheme_version,
@@ -37,9 +42,9 @@ class Code(NamedTuple):
                 scheme_version=self.scheme_version,
             )
 
-        if other.scheme_designator == "SRT" and other.value in snomed_mapping["SRT"]:
+        if other.scheme_designator == "SRT" and other.value in _snomed_mapping()["SRT"]:
             other_mapped = Code(
-                value=snomed_mapping["SRT"][other.value],
+                value=_snomed_mapping()["SRT"][other.value],
                 meaning="",
                 scheme_designator="SCT",
                 scheme_version=other.scheme_version,
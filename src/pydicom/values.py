@@ -6,16 +6,18 @@ data elements to proper python types
 import re
 from io import BytesIO
 from struct import unpack, calcsize
+from time import perf_counter
 from typing import Union, cast, Any, TypeVar
 from collections.abc import MutableSequence, Callable
 
 # don't import datetime_conversion directly
 from pydicom import config
-from pydicom.charset import default_encoding, decode_bytes
+from pydicom.charset import default_encoding, decode_bytes, _decode_default
 from pydicom.config import logger, have_numpy
 from pydicom.dataelem import empty_value_for_VR, RawDataElement
 from pydicom.errors import BytesLengthException
 from pydicom.filereader import read_sequence
+from pydicom.hooks import hooks
 from pydicom.multival import MultiValue
 from pydicom.sequence import Sequence
 from pydicom.tag import Tag, TupleTag, BaseTag
@@ -122,7 +124,7 @@ def convert_AE_string(
         The decoded 'AE' value without non-significant spaces.
     """
     # Differs from convert_string because leading spaces are non-significant
-    values = byte_string.decode(default_encoding).split("\\")
+    values = _decode_default(byte_string).split("\\")
     values = [s.strip() for s in values]
     if len(values) == 1:
         return values[0]
@@ -195,7 +197,7 @@ def convert_DA_string(
         otherwise returns :class:`str` or ``list`` of ``str``.
     """
     if config.datetime_conversion:
-        splitup = byte_string.decode(default_encoding).split("\\")
+        splitup = _decode_default(byte_string).split("\\")
         if len(splitup) == 1:
             return _DA_from_str(splitup[0])
 
@@ -250,7 +252,7 @@ def convert_DS_string(
         If :data:`~pydicom.config.use_DS_numpy` is ``True`` and numpy is not
         available
     """
-    num_string = byte_string.decode(default_encoding)
+    num_string = _decode_default(byte_string)
     # Below, go directly to DS class instance
     # rather than factory DS, but need to
     # ensure last string doesn't have
@@ -307,7 +309,7 @@ def convert_DT_string(
         returns :class:`str` or ``list`` of ``str``.
     """
     if config.datetime_conversion:
-        splitup = byte_string.decode(default_encoding).split("\\")
+        splitup = _decode_default(byte_string).split("\\")
         if len(splitup) == 1:
             return _DT_from_str(splitup[0])
 
@@ -353,7 +355,7 @@ def convert_IS_string(
         If :data:`~pydicom.config.use_IS_numpy` is ``True`` and numpy is not
         available
     """
-    num_string = byte_string.decode(default_encoding)
+    num_string = _decode_default(byte_string)
 
     if config.use_IS_numpy:
         if not have_numpy:
@@ -521,7 +523,7 @@ def convert_string(
     str or MultiValue of str
         The decoded value(s).
     """
-    return multi_string(byte_string.decode(default_encoding))
+    return multi_string(_decode_default(byte_string))
 
 
 def convert_text(
@@ -656,7 +658,7 @@ def convert_TM_string(
         otherwise returns :class:`str` or ``list`` of ``str``.
     """
     if config.datetime_conversion:
-        splitup = byte_string.decode(default_encoding).split("\\")
+        splitup = _decode_default(byte_string).split("\\")
         if len(splitup) == 1:
             return _TM_from_str(splitup[0])
 
@@ -687,7 +689,7 @@ def convert_UI(
         The decoded 'UI' element value without trailing nulls or spaces.
     """
     # Convert to str and remove any trailing nulls or spaces
-    value = byte_string.decode(default_encoding)
+    value = _decode_default(byte_string)
     return multi_string(value.rstrip("\0 "), pydicom.uid.UID)
 
 
@@ -720,7 +722,7 @@ def convert_UR_string(
     bytes or str
         The encoded 'UR' element value without any trailing spaces.
     """
-    return byte_string.decode(default_encoding).rstrip()
+    return _decode_default(byte_string).rstrip()
 
 
 def convert_value(
@@ -778,12 +780,23 @@ def convert_value(
     # Not only two cases. Also need extra info if is a raw sequence
     # Pass all encodings to the converter if needed
     try:
-        if VR == VR_.PN:
-            return converter(byte_string, encodings)
+        if VR == VR_.PN or VR in CUSTOMIZABLE_CHARSET_VR:
+            # PN, SH, LO, ST, LT, UC, UT - decoded using the character set
+            timing = hooks.timing_event
+            if timing is not None:
+                start = perf_counter()
+
+            if VR == VR_.PN:
+                value = converter(byte_string, encodings)
+            else:
+                value = converter(byte_string, encodings, VR)
+
+            if timing is not None:
+                timing(
+                    "decode_charset", perf_counter() - start, raw_data_element.length
+                )
 
-        if VR in CUSTOMIZABLE_CHARSET_VR:
-            # SH, LO, ST, LT, UC, UT - PN already done
-            return converter(byte_string, encodings, VR)
+            return value
 
         if VR != VR_.SQ:
             return converter(byte_string, is_little_endian, num_format)
@@ -2,10 +2,12 @@
 
 import importlib
 from io import BytesIO
+import json
 import logging
 from math import ceil
 from struct import pack, unpack
 from sys import byteorder
+import time
 
 import pytest
 
@@ -14,7 +16,12 @@ from pydicom.dataset import Dataset
 from pydicom.encaps import get_frame, generate_frames, encapsulate
 from pydicom.pixels import get_decoder
 from pydicom.pixels.common import PhotometricInterpretation as PI
-from pydicom.pixels.decoders import ExplicitVRLittleEndianDecoder
+from pydicom.pixels.decoders import (
+    ExplicitVRLittleEndianDecoder,
+    RLELosslessDecoder,
+    load_plugin_preferences,
+    save_plugin_preferences,
+)
 from pydicom.pixels.decoders.base import (
     DecodeRunner,
     Decoder,
@@ -1057,6 +1064,116 @@ class TestDecoder:
         with pytest.raises(ValueError, match=msg):
             decoder._validate_plugins("foo")
 
+    def test_calibrate(self):
+        """Test calibrate() sets the preferred plugins"""
+        from pydicom.pixels.decoders.native import _decode_frame
+
+        calls = []
+
+        def slow(src, runner):
+            calls.append("slow")
+            time.sleep(0.005)
+            return _decode_frame(src, runner)
+
+        def fast(src, runner):
+            calls.append("fast")
+            return _decode_frame(src, runner)
+
+        def broken(src, runner):
+            calls.append("broken")
+            raise ValueError("Bad data")
+
+        decoder = Decoder(RLELossless)
+        decoder._available = {"broken": broken, "slow": slow, "fast": fast}
+        assert () == decoder.preferred_plugins
+
+        timings = decoder.calibrate(RLE_16_1_1F.ds, nr_repeats=2)
+        assert ["fast", "slow"] == list(timings)
+        assert timings["fast"] < timings["slow"]
+        assert ("fast", "slow", "broken") == decoder.preferred_plugins
+        assert ["fast", "slow", "broken"] == list(decoder._validate_plugins())
+        assert {"slow": slow} == decoder._validate_plugins("slow")
+        assert ["broken", "slow", "slow", "fast", "fast"] == calls
+
+        # Decoding uses the fastest plugin
+        calls.clear()
+        decoder.as_buffer(RLE_16_1_1F.ds)
+        assert ["fast"] == calls
+
+    def test_calibrate_all_frames(self):
+        """Test calibrate() when decoding all frames"""
+        decoder = get_decoder(RLELossless)
+        try:
+            timings = decoder.calibrate(RLE_16_1_1F.ds, index=None, nr_repeats=1)
+            assert ["pydicom"] == list(timings)
+            assert "pydicom" == decoder.preferred_plugins[0]
+        finally:
+            decoder.set_preferred_plugins([])
+
+    def test_calibrate_raises(self):
+        """Test calibrate() raises if no plugins can decode the pixel data"""
+
+        def broken(src, runner):
+            raise ValueError("Bad data")
+
+        decoder = Decoder(RLELossless)
+        decoder._available = {"broken": broken}
+        msg = (
+            "Unable to calibrate the 'RLE Lossless' decoder as none of the "
+            "available plugins were able to decode the pixel data"
+        )
+        with pytest.raises(RuntimeError, match=msg):
+            decoder.calibrate(RLE_16_1_1F.ds)
+
+        assert () == decoder.preferred_plugins
+
+        msg = "The 'Explicit VR Little Endian' decoder doesn't use decoding plugins"
+        with pytest.raises(ValueError, match=msg):
+            Decoder(ExplicitVRLittleEndian).calibrate(RLE_16_1_1F.ds)
+
+    def test_set_preferred_plugins(self):
+        """Test set_preferred_plugins()"""
+        decoder = Decoder(RLELossless)
+        decoder._available = {"a": None, "b": None, "c": None}
+        decoder._unavailable = {"d": ("foo",)}
+
+        decoder.set_preferred_plugins(["c", "d", "c"])
+        assert ("c", "d") == decoder.preferred_plugins
+        assert ["c", "a", "b"] == list(decoder._validate_plugins())
+
+        decoder.set_preferred_plugins([])
+        assert () == decoder.preferred_plugins
+        assert ["a", "b", "c"] == list(decoder._validate_plugins())
+
+        msg = "No plugin named 'e' has been added to 'RLELosslessDecoder'"
+        with pytest.raises(ValueError, match=msg):
+            decoder.set_preferred_plugins(["a", "e"])
+
+    def test_plugin_preferences(self, tmp_path):
+        """Test save_plugin_preferences() and load_plugin_preferences()"""
+        path = tmp_path / "preferences.json"
+        assert () == RLELosslessDecoder.preferred_plugins
+        try:
+            RLELosslessDecoder.set_preferred_plugins(["pydicom", "pylibjpeg"])
+            save_plugin_preferences(path)
+            with open(path) as f:
+                assert {RLELossless: ["pydicom", "pylibjpeg"]} == json.load(f)
+
+            RLELosslessDecoder.set_preferred_plugins([])
+            with open(path, "w") as f:
+                json.dump(
+                    {
+                        RLELossless: ["foo", "pylibjpeg", "pydicom"],
+                        "1.2.3.4": ["pydicom"],
+                    },
+                    f,
+                )
+
+            load_plugin_preferences(path)
+            assert ("pylibjpeg", "pydicom") == RLELosslessDecoder.preferred_plugins
+        finally:
+            RLELosslessDecoder.set_preferred_plugins([])
+
 
 @pytest.fixture()
 def enable_logging():
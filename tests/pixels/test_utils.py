@@ -20,9 +20,22 @@ except ImportError:
     HAVE_NP = False
 
 from pydicom import dcmread, config
+from pydicom.data import get_testdata_file
 from pydicom.dataset import Dataset, FileMetaDataset
-from pydicom.encaps import get_frame, encapsulate
-from pydicom.pixels import pixel_array, iter_pixels, convert_color_space
+from pydicom.encaps import (
+    encapsulate,
+    encapsulate_extended,
+    generate_frames,
+    get_frame,
+)
+from pydicom.pixels import (
+    convert_color_space,
+    get_region_frames,
+    iter_pixels,
+    pixel_array,
+    region_array,
+    shared_pixel_array,
+)
 from pydicom.pixels.decoders.base import _PIXEL_DATA_DECODERS
 from pydicom.pixels.encoders import RLELosslessEncoder
 from pydicom.pixels.encoders.base import EncodeRunner
@@ -46,7 +59,10 @@ from pydicom.pixels.utils import (
     compress,
     decompress,
     _convert_rle_endianness,
+    _array_common,
+    _DEFAULT_TAGS,
 )
+from pydicom.pixels._shared import encapsulated_fragments, read_fragments
 from pydicom.uid import (
     EnhancedMRImageStorage,
     ExplicitVRLittleEndian,
@@ -96,6 +112,10 @@ from .pixels_reference import (
 )
 from ..test_helpers import assert_no_warning
 
+RTDOSE_RLE = get_testdata_file("rtdose_rle.dcm")
+YBR_JPEG = get_testdata_file("examples_ybr_color.dcm")
+J2K_FRAGMENTED = get_testdata_file("examples_jpeg2k.dcm")
+
 
 HAVE_PYLJ = bool(importlib.util.find_spec("pylibjpeg"))
 HAVE_RLE = bool(importlib.util.find_spec("rle"))
@@ -505,6 +525,308 @@ def test_version_check_debugging(caplog):
         assert "No module named 'foo'" in caplog.text
 
 
+def fragmented_frames(path):
+    """Return the encapsulated frames in `path` using encapsulated_fragments()"""
+    with open(path, "rb") as f:
+        _, opts = _array_common(f, list(_DEFAULT_TAGS))
+        fragments = encapsulated_fragments(
+            f, opts["number_of_frames"], opts.get("extended_offsets")
+        )
+        return [read_fragments(f, frame) for frame in fragments]
+
+
+class TestEncapsulatedFragments:
+    """Tests for _shared.encapsulated_fragments()"""
+
+    @pytest.mark.parametrize("path", [RTDOSE_RLE, YBR_JPEG, J2K_FRAGMENTED])
+    def test_frames(self, path):
+        """Test the fragment locations give the same frames as generate_frames()"""
+        ds = dcmread(path)
+        reference = list(
+            generate_frames(ds.PixelData, number_of_frames=get_nr_frames(ds))
+        )
+        assert reference == fragmented_frames(path)
+
+    def test_extended_offsets(self, tmp_path):
+        """Test using the extended offset table"""
+        ds = dcmread(RTDOSE_RLE)
+        frames = list(generate_frames(ds.PixelData, number_of_frames=15))
+        data, offsets, lengths = encapsulate_extended(frames)
+        ds.PixelData = data
+        ds.ExtendedOffsetTable = offsets
+        ds.ExtendedOffsetTableLengths = lengths
+        ds.save_as(tmp_path / "extended.dcm")
+
+        assert frames == fragmented_frames(tmp_path / "extended.dcm")
+
+    def test_eoi_markers(self, tmp_path):
+        """Test multiple fragments per frame and no basic offset table"""
+        ds = dcmread(YBR_JPEG)
+        frames = list(generate_frames(ds.PixelData, number_of_frames=30))
+        ds.PixelData = encapsulate(frames, fragments_per_frame=3, has_bot=False)
+        ds.save_as(tmp_path / "fragmented.dcm")
+
+        assert frames == fragmented_frames(tmp_path / "fragmented.dcm")
+
+
+@pytest.mark.skipif(not HAVE_NP, reason="NumPy is not available")
+class TestSharedPixelArray:
+    """Tests for shared_pixel_array()"""
+
+    @pytest.mark.parametrize("max_workers", [1, 2])
+    def test_path(self, max_workers):
+        """Test decoding encapsulated pixel data from a path"""
+        reference = pixel_array(RTDOSE_RLE)
+        with shared_pixel_array(RTDOSE_RLE, max_workers=max_workers) as arr:
+            assert reference.shape == arr.shape
+            assert reference.dtype == arr.dtype
+            assert np.array_equal(reference, arr)
+
+    @pytest.mark.parametrize("max_workers", [1, 2])
+    def test_dataset(self, max_workers):
+        """Test decoding encapsulated pixel data from a dataset"""
+        ds = dcmread(RTDOSE_RLE)
+        with shared_pixel_array(ds, max_workers=max_workers) as arr:
+            assert np.array_equal(ds.pixel_array, arr)
+
+    def test_single_frame(self):
+        """Test decoding a single frame"""
+        with shared_pixel_array(RLE_16_1_1F.path) as arr:
+            RLE_16_1_1F.test(arr)
+
+    def test_native(self):
+        """Test native pixel data is copied into the array"""
+        with shared_pixel_array(EXPL_16_1_10F.path, max_workers=2) as arr:
+            EXPL_16_1_10F.test(arr)
+
+        with shared_pixel_array(EXPL_16_1_10F.ds) as arr:
+            EXPL_16_1_10F.test(arr)
+
+    def test_raw(self):
+        """Test the `raw` kwarg"""
+        with shared_pixel_array(EXPL_8_3_1F_YBR422.path, raw=True) as arr:
+            assert np.array_equal(pixel_array(EXPL_8_3_1F_YBR422.path, raw=True), arr)
+
+    def test_array_in_use(self):
+        """Test the array remains valid if still referenced after exiting"""
+        reference = pixel_array(RTDOSE_RLE)
+        with shared_pixel_array(RTDOSE_RLE) as arr:
+            view = arr[3:5]
+
+        assert np.array_equal(reference, arr)
+        assert np.array_equal(reference[3:5], view)
+
+    def test_no_transfer_syntax(self):
+        """Test a dataset without a transfer syntax raises"""
+        ds = dcmread(RTDOSE_RLE)
+        del ds.file_meta.TransferSyntaxUID
+        msg = (
+            "Unable to decode the pixel data as the dataset's 'file_meta' has no "
+            r"\(0002,0010\) 'Transfer Syntax UID' element"
+        )
+        with pytest.raises(AttributeError, match=msg):
+            with shared_pixel_array(ds):
+                pass
+
+    def test_unsupported_transfer_syntax(self):
+        """Test an unsupported transfer syntax raises"""
+        ds = dcmread(RTDOSE_RLE)
+        ds.file_meta.TransferSyntaxUID = "1.2.3.4"
+        msg = (
+            r"Unable to decode the pixel data as a \(0002,0010\) 'Transfer Syntax "
+            "UID' value of '1.2.3.4' is not supported"
+        )
+        with pytest.raises(NotImplementedError, match=msg):
+            with shared_pixel_array(ds):
+                pass
+
+
+def tiled_dataset(total_rows=250, total_columns=300, planes=1, paths=1):
+    """Return a TILED_FULL dataset with 100 x 100 tiles and native pixel data"""
+    tiles_down, tiles_across = -(-total_rows // 100), -(-total_columns // 100)
+    nr_frames = tiles_down * tiles_across * planes * paths
+
+    ds = Dataset()
+    ds.file_meta = FileMetaDataset()
+    ds.file_meta.TransferSyntaxUID = ExplicitVRLittleEndian
+    ds.DimensionOrganizationType = "TILED_FULL"
+    ds.TotalPixelMatrixRows = total_rows
+    ds.TotalPixelMatrixColumns = total_columns
+    ds.TotalPixelMatrixFocalPlanes = planes
+    ds.NumberOfOpticalPaths = paths
+    ds.NumberOfFrames = nr_frames
+    ds.Rows = 100
+    ds.Columns = 100
+    ds.SamplesPerPixel = 1
+    ds.PhotometricInterpretation = "MONOCHROME2"
+    ds.BitsAllocated = 16
+    ds.BitsStored = 16
+    ds.HighBit = 15
+    ds.PixelRepresentation = 0
+    # Each tile's pixels are its frame index
+    ds.PixelData = b"".join(pack("<H", idx) * 10000 for idx in range(nr_frames))
+
+    return ds
+
+
+def sparse_dataset(positions):
+    """Return a TILED_SPARSE dataset with tiles at `positions`"""
+    ds = tiled_dataset()
+    ds.DimensionOrganizationType = "TILED_SPARSE"
+    ds.NumberOfFrames = len(positions)
+    ds.PixelData = b"".join(pack("<H", idx) * 10000 for idx in range(len(positions)))
+    items = []
+    for row, column in positions:
+        position = Dataset()
+        position.RowPositionInTotalImagePixelMatrix = row
+        position.ColumnPositionInTotalImagePixelMatrix = column
+        item = Dataset()
+        item.PlanePositionSlideSequence = [position]
+        items.append(item)
+
+    ds.PerFrameFunctionalGroupsSequence = items
+
+    return ds
+
+
+class TestGetRegionFrames:
+    """Tests for get_region_frames()"""
+
+    def test_tiled_full(self):
+        """Test a TILED_FULL dataset"""
+        ds = tiled_dataset()
+        assert {0: (0, 0)} == get_region_frames(ds, (0, 0, 1, 1))
+        assert {0: (0, 0)} == get_region_frames(ds, (0, 0, 100, 100))
+        assert {8: (200, 200)} == get_region_frames(ds, (249, 299, 1, 1))
+        assert {
+            1: (0, 100),
+            2: (0, 200),
+            4: (100, 100),
+            5: (100, 200),
+        } == get_region_frames(ds, (50, 150, 100, 100))
+        assert list(range(9)) == sorted(get_region_frames(ds, (0, 0, 250, 300)))
+
+    def test_focal_plane_optical_path(self):
+        """Test selecting the focal plane and optical path"""
+        ds = tiled_dataset(planes=2, paths=3)
+        assert {9: (0, 0)} == get_region_frames(ds, (0, 0, 1, 1), focal_plane=1)
+        assert {18: (0, 0)} == get_region_frames(ds, (0, 0, 1, 1), optical_path=1)
+        assert {53: (200, 200)} == get_region_frames(
+            ds, (200, 200, 1, 1), focal_plane=1, optical_path=2
+        )
+
+        msg = r"'focal_plane' must be in the range \[0, 2\)"
+        with pytest.raises(ValueError, match=msg):
+            get_region_frames(ds, (0, 0, 1, 1), focal_plane=2)
+
+        msg = r"'optical_path' must be in the range \[0, 3\)"
+        with pytest.raises(ValueError, match=msg):
+            get_region_frames(ds, (0, 0, 1, 1), optical_path=-1)
+
+    def test_tiled_sparse(self):
+        """Test using the per-frame plane positions"""
+        ds = sparse_dataset([(1, 1), (1, 151), (101, 1), (151, 201)])
+        assert {0: (0, 0)} == get_region_frames(ds, (0, 0, 10, 10))
+        assert {0: (0, 0), 1: (0, 150)} == get_region_frames(ds, (0, 99, 1, 52))
+        assert {1: (0, 150), 3: (150, 200)} == get_region_frames(ds, (99, 200, 52, 10))
+        assert {} == get_region_frames(ds, (200, 0, 50, 100))
+
+        msg = (
+            "Selecting the focal plane or optical path is only supported when "
+            r"the \(0020,9311\) 'Dimension Organization Type' is 'TILED_FULL'"
+        )
+        with pytest.raises(ValueError, match=msg):
+            get_region_frames(ds, (0, 0, 1, 1), focal_plane=1)
+
+        ds.PerFrameFunctionalGroupsSequence[2].PlanePositionSlideSequence = []
+        msg = (
+            "Unable to determine the position of the frame at index 2 as its "
+            r"\(0048,021A\) 'Plane Position \(Slide\) Sequence' is missing or "
+            "invalid"
+        )
+        with pytest.raises(AttributeError, match=msg):
+            get_region_frames(ds, (0, 0, 1, 1))
+
+    def test_invalid_region(self):
+        """Test an invalid region raises"""
+        ds = tiled_dataset()
+        msg = r"The region \(0, 0, 251, 1\) is not within the 250 x 300 total pixel"
+        with pytest.raises(ValueError, match=msg):
+            get_region_frames(ds, (0, 0, 251, 1))
+
+        for region in [(-1, 0, 1, 1), (0, 0, 0, 1), (0, 1, 1, 300)]:
+            with pytest.raises(ValueError, match="The region"):
+                get_region_frames(ds, region)
+
+    def test_missing_elements(self):
+        """Test missing required elements raises"""
+        ds = tiled_dataset()
+        del ds.TotalPixelMatrixRows
+        msg = (
+            "Unable to determine the tiled frames as the dataset has no "
+            r"\(0048,0007\) 'Total Pixel Matrix Rows' element"
+        )
+        with pytest.raises(AttributeError, match=msg):
+            get_region_frames(ds, (0, 0, 1, 1))
+
+
+@pytest.mark.skipif(not HAVE_NP, reason="NumPy is not available")
+class TestRegionArray:
+    """Tests for region_array()"""
+
+    def reference(self, ds):
+        """Return the total pixel matrix for the first focal plane and path"""
+        arr = np.zeros((300, 300), dtype="u2")
+        for index, (row, column) in get_region_frames(ds, (0, 0, 250, 300)).items():
+            arr[row : row + 100, column : column + 100] = index
+
+        return arr[:250, :300]
+
+    @pytest.mark.parametrize(
+        "region", [(0, 0, 250, 300), (50, 150, 100, 100), (99, 99, 2, 2), (7, 8, 9, 10)]
+    )
+    def test_native(self, region):
+        """Test a region of native pixel data"""
+        ds = tiled_dataset()
+        row, column, rows, columns = region
+        arr = region_array(ds, region)
+        assert (rows, columns) == arr.shape
+        assert np.array_equal(
+            self.reference(ds)[row : row + rows, column : column + columns], arr
+        )
+
+    @pytest.mark.parametrize("max_workers", [1, 2])
+    def test_rle_path(self, tmp_path, max_workers):
+        """Test a region of RLE Lossless pixel data from a path"""
+        ds = tiled_dataset()
+        reference = self.reference(ds)
+        ds.compress(RLELossless, encoding_plugin="pydicom")
+        ds.save_as(tmp_path / "tiled.dcm", enforce_file_format=True)
+
+        arr = region_array(
+            tmp_path / "tiled.dcm", (50, 150, 200, 150), max_workers=max_workers
+        )
+        assert np.array_equal(reference[50:250, 150:300], arr)
+
+    def test_focal_plane(self):
+        """Test selecting the focal plane"""
+        ds = tiled_dataset(planes=2)
+        arr = region_array(ds, (0, 0, 100, 100), focal_plane=1)
+        assert np.array_equal(np.full((100, 100), 9, dtype="u2"), arr)
+
+    def test_sparse(self):
+        """Test parts of the region not covered by frames are 0"""
+        ds = sparse_dataset([(1, 1), (151, 201)])
+        arr = region_array(ds, (50, 50, 150, 200))
+        assert (150, 200) == arr.shape
+        assert np.array_equal(np.zeros((50, 50), dtype="u2"), arr[:50, :50])
+        assert (arr[101:, 151:] == 1).all()
+        assert (arr[:50, 50:] == 0).all()
+
+        arr = region_array(ds, (200, 0, 50, 100))
+        assert np.array_equal(np.zeros((50, 100), dtype="u2"), arr)
+
+
 class TestGetJpgParameters:
     """Tests for _get_jpg_parameters()"""
 
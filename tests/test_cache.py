@@ -0,0 +1,157 @@
+# Copyright 2008-2025 pydicom authors. See LICENSE file for details.
+"""Tests for the pydicom.cache module."""
+
+from io import BytesIO
+from struct import pack
+
+import pytest
+
+from pydicom import dcmread
+from pydicom.cache import dumps, loads
+from pydicom.data import get_charset_files, get_testdata_file
+from pydicom.dataelem import DataElement, RawDataElement
+from pydicom.dataset import Dataset, FileDataset
+from pydicom.sequence import Sequence
+
+
+CT_SMALL = get_testdata_file("CT_small.dcm")
+MR_BIG = get_testdata_file("MR_small_bigendian.dcm")
+MR_IMPLICIT = get_testdata_file("MR_small_implicit.dcm")
+RTPLAN = get_testdata_file("rtplan.dcm")
+CHR_RUSSIAN = get_charset_files("chrRuss.dcm")[0]
+
+
+class TestCache:
+    """Tests for dumps() and loads()"""
+
+    @pytest.mark.parametrize("path", [CT_SMALL, MR_BIG, MR_IMPLICIT, RTPLAN])
+    def test_file_dataset(self, path):
+        """Test round trip of an unconverted FileDataset"""
+        ds = dcmread(path)
+        out = loads(dumps(ds))
+        assert isinstance(out, FileDataset)
+        assert all(isinstance(v, RawDataElement) for v in out._dict.values())
+        assert out.original_encoding == ds.original_encoding
+        assert out.original_character_set == ds.original_character_set
+        assert out.preamble == ds.preamble
+        assert out.filename == ds.filename
+        assert out.timestamp == ds.timestamp
+        assert out.fileobj_type is open
+        assert out.file_meta == ds.file_meta
+        assert out == ds
+
+    @pytest.mark.parametrize("path", [CT_SMALL, MR_BIG, MR_IMPLICIT, RTPLAN])
+    def test_converted_elements(self, path):
+        """Test converted elements are encoded using the original encoding"""
+        ds = dcmread(path)
+        for elem in ds.iterall():
+            pass
+
+        assert all(isinstance(v, DataElement) for v in ds._dict.values())
+        ds.PatientName = "Citizen^Jan"
+        out = loads(dumps(ds))
+        assert all(isinstance(v, RawDataElement) for v in out._dict.values())
+        assert all(
+            v.is_implicit_VR == ds.original_encoding[0]
+            or v.VR not in ("US", "SS", "OW")
+            for v in out._dict.values()
+        )
+        assert out == ds
+        assert "Citizen^Jan" == out.PatientName
+
+    def test_dataset(self):
+        """Test round trip of a Dataset"""
+        ds = Dataset()
+        ds.PatientName = "Citizen^Jan"
+        ds.PatientID = "12345678"
+        ds.Rows = 10
+        ds.BeamSequence = [Dataset(), Dataset()]
+        ds.BeamSequence[0].BeamNumber = 1
+        out = loads(dumps(ds))
+        assert type(out) is Dataset
+        assert (None, None) == out.original_encoding
+        assert out == ds
+        assert isinstance(out.BeamSequence, Sequence)
+        assert 1 == out.BeamSequence[0].BeamNumber
+
+    def test_ambiguous_vr(self):
+        """Test elements with an ambiguous VR are corrected"""
+        ds = Dataset()
+        ds.set_original_encoding(False, True, None)
+        ds.PixelRepresentation = 1
+        ds.add_new(0x00280106, "US or SS", -1)
+        out = loads(dumps(ds))
+        assert "US or SS" == ds["SmallestImagePixelValue"].VR
+        elem = out._dict[0x00280106]
+        assert not elem.is_implicit_VR
+        assert "SS" == elem.VR
+        assert -1 == out.SmallestImagePixelValue
+
+    def test_undefined_length_sequence(self):
+        """Test an undefined length sequence is restored"""
+        ds = dcmread(RTPLAN)
+        ds.BeamSequence.is_undefined_length = True
+        ds["BeamSequence"].is_undefined_length = True
+        out = loads(dumps(ds))
+        elem = out._dict[0x300A00B0]
+        assert 0xFFFFFFFF == elem.length
+        assert not elem.value.endswith(b"\xfe\xff\xdd\xe0\x00\x00\x00\x00")
+        assert out.BeamSequence == ds.BeamSequence
+
+    def test_character_set(self):
+        """Test text is decoded using the original character set"""
+        ds = dcmread(CHR_RUSSIAN)
+        ref = ds.PatientName
+        out = loads(dumps(ds))
+        assert ds.original_character_set == out.original_character_set
+        assert ref == out.PatientName
+
+    def test_deferred_file(self):
+        """Test deferred elements are read from the original file"""
+        ds = dcmread(CT_SMALL, defer_size=100)
+        assert ds._dict[0x7FE00010].value is None
+        data = dumps(ds)
+        assert len(data) < len(dumps(dcmread(CT_SMALL)))
+        out = loads(data)
+        assert out._dict[0x7FE00010].value is None
+        assert dcmread(CT_SMALL).PixelData == out.PixelData
+
+    def test_deferred_buffer(self):
+        """Test deferred elements are stored if read from a buffer"""
+        with open(CT_SMALL, "rb") as f:
+            ds = dcmread(BytesIO(f.read()), defer_size=100)
+
+        assert ds._dict[0x7FE00010].value is None
+        out = loads(dumps(ds))
+        assert out.filename is None
+        assert out.buffer is None
+        assert out.fileobj_type is None
+        assert out.timestamp is None
+        assert out._dict[0x7FE00010].value is not None
+        assert dcmread(CT_SMALL).PixelData == out.PixelData
+
+    def test_no_preamble(self):
+        """Test a FileDataset without a preamble"""
+        ds = dcmread(CT_SMALL)
+        ds.preamble = None
+        out = loads(dumps(ds))
+        assert out.preamble is None
+
+    def test_loads_buffer_types(self):
+        """Test loads() with bytearray and memoryview"""
+        ds = dcmread(RTPLAN)
+        data = dumps(ds)
+        assert loads(bytearray(data)) == ds
+        assert loads(memoryview(data)) == ds
+
+    def test_invalid_data(self):
+        """Test an exception is raised for invalid data"""
+        msg = "The data is not a serialized pydicom dataset"
+        with pytest.raises(ValueError, match=msg):
+            loads(b"\x00" * 128)
+
+        data = bytearray(dumps(Dataset()))
+        data[8:9] = pack("<B", 255)
+        msg = "Unsupported dataset cache format version '255'"
+        with pytest.raises(ValueError, match=msg):
+            loads(data)
@@ -538,3 +538,77 @@ class TestCharset:
         ):
             encoded = pydicom.charset.encode_string("あaｱア", ["shift_jis"])
             assert b"?a??" == encoded
+
+    def test_decode_cached(self):
+        """Test decoded values using code extensions are cached"""
+        pydicom.charset._decode_escaped_value.cache_clear()
+        value = b"\x1b$B;3ED\x1b(B^\x1b$BB@O:\x1b(B"
+        encodings = ["iso8859", "iso2022_jp"]
+        delims = pydicom.charset.TEXT_VR_DELIMS
+        for _ in range(3):
+            assert "山田^太郎" == pydicom.charset.decode_bytes(value, encodings, delims)
+
+        info = pydicom.charset._decode_escaped_value.cache_info()
+        assert 1 == info.misses
+        assert 2 == info.hits
+
+    def test_decode_cached_errors(self, allow_reading_invalid_values):
+        """Test values that fail to decode always warn"""
+        value = b"\x1b\x2d\x46\xc4\xe9\xef\xed\xf5\xf3\xe9\xef\xf2"
+        msg = "Found unknown escape sequence in encoded string value"
+        for _ in range(2):
+            with pytest.warns(UserWarning, match=msg):
+                decoded = pydicom.charset.decode_bytes(value, ["latin_1"], set())
+
+            assert "\x1b-FÄéïíõóéïò" == decoded
+
+    def test_convert_encodings_cached(self):
+        """Test conversion of valid encodings is cached"""
+        pydicom.charset._converted_encodings.clear()
+        encodings = ["ISO 2022 IR 6", "ISO 2022 IR 87"]
+        converted = pydicom.charset.convert_encodings(encodings)
+        assert ["iso8859", "iso2022_jp"] == converted
+        assert ("ISO 2022 IR 6", "ISO 2022 IR 87") in (
+            pydicom.charset._converted_encodings
+        )
+
+        # Modifying the returned value doesn't affect the cache
+        converted.append("foo")
+        assert ["iso8859", "iso2022_jp"] == pydicom.charset.convert_encodings(encodings)
+
+    def test_convert_encodings_not_cached(self):
+        """Test conversion of invalid encodings isn't cached"""
+        pydicom.charset._converted_encodings.clear()
+        msg = "Value 'GBK' cannot be used as code extension, ignoring it"
+        for _ in range(2):
+            with pytest.warns(UserWarning, match=msg):
+                pydicom.charset.convert_encodings(["ISO_IR 126", "GBK"])
+
+        assert {} == pydicom.charset._converted_encodings
+
+    def test_decode_elements(self):
+        """Test decoding multiple elements at once"""
+        elements = [
+            DataElement(0x00100010, "PN", b"Buc^J\xe9r\xf4me"),
+            DataElement(0x00081040, "LO", b"D\xe9partement"),
+            DataElement(0x00081030, "LO", b""),
+        ]
+        pydicom.charset.decode_elements(elements, "ISO_IR 100")
+        assert "Buc^Jérôme" == elements[0].value
+        assert "Département" == elements[1].value
+        assert elements[2].is_empty
+
+    def test_decode_elements_default(self):
+        """Test decoding multiple elements with the default character set"""
+        elem = DataElement(0x00081040, "LO", b"Department")
+        pydicom.charset.decode_elements([elem], None)
+        assert "Department" == elem.value
+
+    def test_python_decoder(self):
+        """Test the cached codec decoding function"""
+        decoder = pydicom.charset._python_decoder("iso_ir_126")
+        assert decoder is pydicom.charset._python_decoder("iso_ir_126")
+        assert ("Διονυσιος", 9) == decoder(b"\xc4\xe9\xef\xed\xf5\xf3\xe9\xef\xf2")
+
+        with pytest.raises(LookupError, match="unknown encoding: foo"):
+            pydicom.charset._python_decoder("foo")
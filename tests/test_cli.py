@@ -1,11 +1,17 @@
 # Copyright 2020 pydicom authors. See LICENSE file for details.
 """Tests for command-line interface"""
 
+import argparse
 from argparse import ArgumentTypeError
+import json
+import os
+import shutil
 
 import pytest
 
+from pydicom.cli import extract
 from pydicom.cli.main import filespec_parser, eval_element, main, filespec_parts
+from pydicom.data import get_testdata_file
 
 
 bad_elem_specs = (
@@ -231,3 +237,158 @@ class TestCLIcall:
         out, err = capsys.readouterr()
         assert "(0001,0001)  Private Creator" not in out
         assert err == ""
+
+
+def run_extract(args):
+    """Run the `extract` subcommand without requiring its entry point"""
+    parser = argparse.ArgumentParser(prog="pydicom")
+    extract.add_subparser(parser.add_subparsers())
+    ns = parser.parse_args(["extract", *args])
+    ns.func(ns)
+
+
+@pytest.fixture
+def extract_dir(tmp_path):
+    """Return a directory containing DICOM files"""
+    for name in ("CT_small.dcm", "MR_small.dcm", "rtplan.dcm"):
+        shutil.copyfile(get_testdata_file(name), tmp_path / name)
+
+    (tmp_path / "sub").mkdir()
+    shutil.copyfile(get_testdata_file("rtdose.dcm"), tmp_path / "sub" / "rtdose.dcm")
+
+    return tmp_path
+
+
+class TestCLIExtract:
+    """Test the `pydicom extract` command"""
+
+    @pytest.mark.parametrize("jobs", ["1", "2"])
+    def test_csv(self, extract_dir, capsys, jobs):
+        """Test extracting values as CSV"""
+        args = [
+            f"{extract_dir}/*.dcm",
+            "-e",
+            "PatientName",
+            "-e",
+            "ImageType",
+            "-e",
+            "BeamSequence[0].BeamNumber",
+            "-j",
+            jobs,
+        ]
+        run_extract(args)
+        out, err = capsys.readouterr()
+        assert "" == err
+        lines = out.splitlines()
+        assert "filename,PatientName,ImageType,BeamSequence[0].BeamNumber" == lines[0]
+        assert [
+            f"{extract_dir / 'CT_small.dcm'},CompressedSamples^CT1,"
+            "ORIGINAL\\PRIMARY\\AXIAL,",
+            f"{extract_dir / 'MR_small.dcm'},CompressedSamples^MR1,"
+            "DERIVED\\SECONDARY\\OTHER,",
+            f"{extract_dir / 'rtplan.dcm'},Last^First^mid^pre,,1",
+        ] == lines[1:]
+
+    def test_json(self, extract_dir, capsys):
+        """Test extracting values as JSON lines"""
+        args = [
+            os.fspath(extract_dir / "rtplan.dcm"),
+            os.fspath(extract_dir / "CT_small.dcm"),
+            "-f",
+            "json",
+            "-e",
+            "PatientID",
+            "-e",
+            "(0043,1013)",
+            "-e",
+            "file_meta.TransferSyntaxUID",
+            "-e",
+            "FractionGroupSequence[0].ReferencedBeamSequence",
+        ]
+        run_extract(args)
+        out, err = capsys.readouterr()
+        assert "" == err
+        plan, ct = [json.loads(line) for line in out.splitlines()]
+        assert os.fspath(extract_dir / "rtplan.dcm") == plan["filename"]
+        assert "id00001" == plan["PatientID"]
+        assert plan["(0043,1013)"] is None
+        assert "1.2.840.10008.1.2" == plan["file_meta.TransferSyntaxUID"]
+        seq = plan["FractionGroupSequence[0].ReferencedBeamSequence"]
+        assert {"vr": "IS", "Value": [1]} == seq[0]["300C0006"]
+
+        assert "1CT1" == ct["PatientID"]
+        assert [107, 21, 4, 2, 20] == ct["(0043,1013)"]
+        assert ct["FractionGroupSequence[0].ReferencedBeamSequence"] is None
+
+    def test_directory_and_file_list(self, extract_dir, capsys):
+        """Test extracting values using a directory and a list of files"""
+        run_extract([os.fspath(extract_dir), "-e", "Modality"])
+        out, _ = capsys.readouterr()
+        assert 5 == len(out.splitlines())
+        assert out.endswith(f"{extract_dir / 'sub' / 'rtdose.dcm'},RTDOSE\n")
+
+        file_list = extract_dir / "files.txt"
+        file_list.write_text(f"{extract_dir / 'rtplan.dcm'}\n-e\nModality\n")
+        run_extract([f"@{file_list}"])
+        out, _ = capsys.readouterr()
+        assert out.endswith(f"{extract_dir / 'rtplan.dcm'},RTPLAN\n")
+
+    def test_read_error(self, extract_dir, capsys):
+        """Test files that can't be read are skipped"""
+        missing = extract_dir / "missing.dcm"
+        args = [os.fspath(missing), os.fspath(extract_dir / "rtplan.dcm")]
+        run_extract([*args, "-e", "Modality"])
+        out, err = capsys.readouterr()
+        assert f"Error reading '{missing}'" in err
+        assert ["filename,Modality", f"{extract_dir / 'rtplan.dcm'},RTPLAN"] == (
+            out.splitlines()
+        )
+
+    def test_not_dicom(self, extract_dir, capsys):
+        """Test non-DICOM files are skipped"""
+        text = extract_dir / "readme.txt"
+        text.write_text("Not a DICOM file\n")
+        args = [os.fspath(text), os.fspath(extract_dir / "rtplan.dcm")]
+        run_extract([*args, "-e", "Modality"])
+        out, err = capsys.readouterr()
+        assert f"Error reading '{text}'" in err
+        assert ["filename,Modality", f"{extract_dir / 'rtplan.dcm'},RTPLAN"] == (
+            out.splitlines()
+        )
+
+    @pytest.mark.parametrize("jobs", ["0", "-1", "two"])
+    def test_bad_jobs(self, jobs, capsys):
+        """Test an invalid number of worker processes"""
+        with pytest.raises(SystemExit):
+            run_extract(["file.dcm", "-e", "Modality", f"--jobs={jobs}"])
+
+        out, err = capsys.readouterr()
+        assert "" == out
+        assert f"'{jobs}' is not a positive integer" in err
+
+    def test_bad_element(self, capsys):
+        """Test an invalid element expression"""
+        with pytest.raises(SystemExit):
+            run_extract(["file.dcm", "-e", "no_callable()"])
+
+        _, err = capsys.readouterr()
+        assert "is not valid syntax for a data element" in err
+
+    @pytest.mark.parametrize(
+        "element",
+        ["PatientNam", "BeamSequence[0].BeamNumbr", "file_meta.TransferSyntax"],
+    )
+    def test_unknown_keyword(self, element, capsys):
+        """Test an element expression with an unknown keyword"""
+        with pytest.raises(SystemExit):
+            run_extract(["file.dcm", "-e", element])
+
+        _, err = capsys.readouterr()
+        assert "is not a known DICOM keyword, tag or allowed class property" in err
+
+    def test_element_tag(self):
+        """Test the tag used to read the top-level element"""
+        assert 0x00100010 == extract.element_tag("PatientName")
+        assert 0x300A00B0 == extract.element_tag("BeamSequence[0].BeamNumber")
+        assert 0x300A00B0 == extract.element_tag("(300a,00B0)[0].(300A,00B6)")
+        assert extract.element_tag("file_meta.TransferSyntaxUID") is None
@@ -190,6 +190,14 @@ class TestCollection:
         c = Code("24028007", "SCT", "Right")
         assert c in codes.CID244
         assert c in codes.SCT
+        assert Code("24028007", "SCT", "Right", "1.0") not in codes.SCT
+        assert Code("24028007", "DCM", "Right") not in codes.SCT
+        assert Code("Foo", "SCT", "Right") not in codes.CID244
+
+        # Equivalent SNOMED RT codes
+        c = Code("R-00317", "SRT", "Mean Value of population")
+        assert c in codes.SCT
+        assert Code("373098007", "SCT", "Mean") in Collection("SCT")
 
     def test_dir(self):
         """Test dir()"""
@@ -208,6 +216,14 @@ class TestCollection:
         assert "StructureOfDescendingThoracicAorta" in matches
         assert "ThoracicSpine" in matches
 
+        assert coll.dir("thoracic", prefix=True) == ["ThoracicAorta", "ThoracicSpine"]
+        assert coll.dir("ThoracicS", "lumbo", prefix=True) == [
+            "LumboSacralSpine",
+            "ThoracicSpine",
+        ]
+        assert coll.dir("Xyz", prefix=True) == []
+        assert coll.dir(prefix=True) == coll.dir()
+
         # Check None_
         coll = Collection("CID606")
         assert "None_" in coll
@@ -238,6 +254,21 @@ class TestCollection:
         coll.foo = None
         assert coll.foo is None
 
+    def test_getattr_cached(self):
+        """Test the codes are cached after lookup"""
+        coll = Collection("CID2")
+        code = coll.Transverse
+        assert coll.Transverse is code
+
+    def test_index_updated(self, add_nonunique):
+        """Test the index is recreated if the source data changes"""
+        coll = Collection("TEST")
+        assert coll.dir() == ["Foo"]
+        CONCEPTS["TEST"]["Bar"] = {"BAR": ("Test C", [])}
+        assert coll.dir() == ["Bar", "Foo"]
+        assert "Bar" in coll
+        assert coll.Bar == Code("BAR", scheme_designator="TEST", meaning="Test C")
+
     def test_getattr_multiple_cid(self, add_multiple_cid):
         """Test Collection.Foo for a CID"""
         coll = Collection("CID99999999999")
@@ -250,6 +281,9 @@ class TestCollection:
         with pytest.raises(RuntimeError, match=msg):
             coll.Foo
 
+        with pytest.raises(RuntimeError, match=msg):
+            "Foo" in coll
+
     def test_getattr_multiple_raises_cid(self, add_nonunique_cid):
         """Test non-unique results for the keyword"""
         coll = Collection("CID99999999999")
@@ -257,6 +291,9 @@ class TestCollection:
         with pytest.raises(RuntimeError, match=msg):
             coll.Foo
 
+        with pytest.raises(RuntimeError, match=msg):
+            "Foo" in coll
+
         coll._cid_data["TEST2"] = ["Foo"]
         msg = (
             "Multiple schemes found to contain the keyword 'Foo' in CID99999999999: "
@@ -312,6 +349,15 @@ class TestConcepts:
         assert colls.schemes() == ["SCT"]
         assert colls.CIDs() == ["CID2"]
 
+    def test_init_default(self):
+        """Test the default collections are created on first access"""
+        colls = Concepts()
+        assert colls._collections is None
+        assert "SCT" in colls.schemes()
+        assert "CID2" in colls.CIDs()
+        assert isinstance(colls._collections, dict)
+        assert isinstance(colls.CID2, Collection)
+
     def test_getattr(self):
         """Test Concepts.Foo"""
         colls = Concepts([Collection("SCT"), Collection("CID2")])
@@ -325,3 +371,17 @@ class TestConcepts:
         msg = "'Concepts' object has no attribute 'Foo'"
         with pytest.raises(AttributeError, match=msg):
             colls.Foo
+
+
+def test_lazy_module_attributes():
+    """Test the dictionaries are available from the codedict module"""
+    from pydicom.sr import codedict
+
+    assert codedict.CONCEPTS is CONCEPTS
+    assert codedict.CID_CONCEPTS is CID_CONCEPTS
+    assert codedict.name_for_cid is name_for_cid
+    assert codedict.cid_for_name["AnatomicModifier"] == 2
+
+    msg = "module 'pydicom.sr.codedict' has no attribute 'Foo'"
+    with pytest.raises(AttributeError, match=msg):
+        codedict.Foo
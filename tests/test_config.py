@@ -3,6 +3,7 @@
 
 import logging
 import importlib
+from importlib.util import find_spec
 
 import pytest
 
@@ -153,3 +154,28 @@ class TestSettings:
         msg = r"VR lookup failed for the raw element with tag \(8888,0002\)"
         with pytest.raises(KeyError, match=msg):
             convert_raw_data_element(raw)
+
+    def test_json_backend(self):
+        """Test setting the JSON backend."""
+        settings = config.settings
+        assert "auto" == settings.json_backend
+        try:
+            settings.json_backend = "json"
+            assert "json" == settings.json_backend
+
+            msg = "Invalid JSON backend 'foo', must be 'auto', 'json'"
+            with pytest.raises(ValueError, match=msg):
+                settings.json_backend = "foo"
+
+            assert "json" == settings.json_backend
+        finally:
+            settings.json_backend = "auto"
+
+    @pytest.mark.skipif(find_spec("simdjson") is not None, reason="is installed")
+    def test_json_backend_unavailable(self):
+        """Test setting an unavailable JSON backend raises."""
+        msg = "The 'simdjson' JSON backend is not available"
+        with pytest.raises(ImportError, match=msg):
+            config.settings.json_backend = "simdjson"
+
+        assert "auto" == config.settings.json_backend
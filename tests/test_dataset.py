@@ -37,7 +37,7 @@ from pydicom.dataset import (
 )
 from pydicom.encaps import encapsulate
 from pydicom.errors import BytesLengthException
-from pydicom.filebase import DicomBytesIO
+from pydicom.filebase import DicomBytesIO, DicomInflateIO
 from pydicom.pixels.utils import get_image_pixel_ids
 from pydicom.sequence import Sequence
 from pydicom.tag import Tag
@@ -2514,11 +2514,11 @@ class TestFileDataset:
         assert ds.buffer is buffer
         assert ds.fileobj_type == io.BytesIO
 
-        # Deflated datasets get inflated to a DicomBytesIO() buffer
+        # Deflated datasets get inflated by a DicomInflateIO() buffer
         ds = dcmread(get_testdata_file("image_dfl.dcm"))
         assert ds.filename.endswith("image_dfl.dcm")
-        assert isinstance(ds.buffer, DicomBytesIO)
-        assert ds.fileobj_type == DicomBytesIO
+        assert isinstance(ds.buffer, DicomInflateIO)
+        assert ds.fileobj_type == DicomInflateIO
 
 
 class TestDatasetOverlayArray:
@@ -3005,6 +3005,236 @@ class TestDatasetWithBufferedData:
             copy.deepcopy(ds)
 
 
+class TestDatasetClone:
+    """Tests for Dataset.clone()"""
+
+    def test_clone(self):
+        """Test the clone matches the original"""
+        ds = Dataset()
+        ds.PatientName = "CITIZEN^Jan"
+        ds.BeamSequence = [Dataset(), Dataset()]
+        ds.BeamSequence[0].Manufacturer = "Linac, co."
+        ds.set_original_encoding(True, True, "utf-8")
+        clone = ds.clone()
+        assert type(clone) is Dataset
+        assert clone == ds
+        assert clone._dict is not ds._dict
+        assert clone.original_encoding == (True, True)
+        assert clone.original_character_set == "utf-8"
+
+    def test_elements_shared(self):
+        """Test elements are shared until accessed"""
+        ds = Dataset()
+        ds.PatientName = "CITIZEN^Jan"
+        ds.PixelData = b"\x00" * 1024
+        clone = ds.clone()
+        assert clone._dict[0x00100010] is ds._dict[0x00100010]
+        assert clone._dict[0x7FE00010] is ds._dict[0x7FE00010]
+
+        elem = clone[0x7FE00010]
+        assert elem is not ds._dict[0x7FE00010]
+        assert elem.value is ds.PixelData
+        assert clone._dict[0x00100010] is ds._dict[0x00100010]
+
+        # Accessing the original's elements gives the clone a copy instead
+        original = ds._dict[0x00100010]
+        elem = ds[0x00100010]
+        assert elem is original
+        assert elem is ds._dict[0x00100010]
+        assert clone._dict[0x00100010] is not elem
+        assert "CITIZEN^Jan" == clone.PatientName
+
+    def test_modify_clone(self):
+        """Test modifying the clone doesn't change the original"""
+        ds = Dataset()
+        ds.PatientName = "CITIZEN^Jan"
+        ds.PatientID = "12345"
+        ds.ImageType = ["ORIGINAL", "PRIMARY"]
+        clone = ds.clone()
+        clone.PatientName = "ANON"
+        clone["PatientID"].value = "54321"
+        clone.ImageType.append("AXIAL")
+        del clone.ImageType
+        clone.PatientBirthDate = "20000101"
+        assert "CITIZEN^Jan" == ds.PatientName
+        assert "12345" == ds.PatientID
+        assert ["ORIGINAL", "PRIMARY"] == ds.ImageType
+        assert "PatientBirthDate" not in ds
+
+    def test_modify_original(self):
+        """Test modifying the original doesn't change the clone"""
+        ds = Dataset()
+        ds.PatientName = "CITIZEN^Jan"
+        ds.ImageType = ["ORIGINAL", "PRIMARY"]
+        ds.PatientID = "12345"
+        clone = ds.clone()
+        ds.PatientName = "ANON"
+        ds.ImageType.append("AXIAL")
+        ds["PatientID"].value = "54321"
+        assert "CITIZEN^Jan" == clone.PatientName
+        assert ["ORIGINAL", "PRIMARY"] == clone.ImageType
+        assert "12345" == clone.PatientID
+
+        del ds.PatientName
+        ds.ImageType = ["DERIVED", "SECONDARY"]
+        assert "CITIZEN^Jan" == clone.PatientName
+        assert ["ORIGINAL", "PRIMARY"] == clone.ImageType
+
+    def test_modify_original_items(self):
+        """Test modifying the original's sequence items doesn't change the clone"""
+        ds = Dataset()
+        ds.BeamSequence = [Dataset(), Dataset()]
+        ds.BeamSequence[0].BeamName = "Beam 1"
+        ds.BeamSequence[0].ControlPointSequence = [Dataset()]
+        ds.BeamSequence[0].ControlPointSequence[0].GantryAngle = 0
+        clone = ds.clone()
+        ds.BeamSequence[0].BeamName = "CHANGED"
+        ds.BeamSequence[0].ControlPointSequence[0].GantryAngle = 90
+        ds.BeamSequence[1].BeamName = "Beam 2"
+        ds.BeamSequence.append(Dataset())
+        assert "Beam 1" == clone.BeamSequence[0].BeamName
+        assert 0 == clone.BeamSequence[0].ControlPointSequence[0].GantryAngle
+        assert "BeamName" not in clone.BeamSequence[1]
+        assert 2 == len(clone.BeamSequence)
+
+        # The clone has accessed the sequence items first
+        clone2 = ds.clone()
+        assert "CHANGED" == clone2.BeamSequence[0].BeamName
+        ds.BeamSequence[0].BeamName = "Beam A"
+        assert "CHANGED" == clone2.BeamSequence[0].BeamName
+        assert "Beam 1" == clone.BeamSequence[0].BeamName
+
+    def test_original_element_reference(self):
+        """Test element references taken before cloning update the original"""
+        ds = Dataset()
+        ds.PatientName = "CITIZEN^Jan"
+        ds.BeamSequence = [Dataset()]
+        elem = ds["PatientName"]
+        seq = ds.BeamSequence
+        clone = ds.clone()
+        assert "CITIZEN^Jan" == ds.PatientName
+        elem.value = "ANON"
+        seq.append(Dataset())
+        assert "ANON" == ds.PatientName
+        assert ds["PatientName"] is elem
+        assert ds.BeamSequence is seq
+        assert 2 == len(ds.BeamSequence)
+
+        # References taken after cloning also update the original
+        clone = ds.clone()
+        elem = ds["PatientName"]
+        ds.PatientName = "Citizen^Jan"
+        assert "Citizen^Jan" == elem.value
+        elem.value = "CITIZEN^Jan"
+        assert "CITIZEN^Jan" == ds.PatientName
+        assert "ANON" == clone.PatientName
+
+        elem = clone["PatientName"]
+        clone.PatientName = "CLONE"
+        assert "CLONE" == elem.value
+        assert "CITIZEN^Jan" == ds.PatientName
+
+    def test_sequence_items(self):
+        """Test sequence items are cloned"""
+        ds = Dataset()
+        ds.BeamSequence = [Dataset(), Dataset()]
+        ds.BeamSequence[0].BeamName = "Beam 1"
+        ds.BeamSequence[0].ControlPointSequence = [Dataset()]
+        ds.BeamSequence[0].ControlPointSequence[0].GantryAngle = 0
+        ds.BeamSequence.is_undefined_length = True
+        clone = ds.clone()
+        clone.BeamSequence[0].BeamName = "Beam A"
+        clone.BeamSequence[0].ControlPointSequence[0].GantryAngle = 90
+        clone.BeamSequence.append(Dataset())
+        assert clone.BeamSequence.is_undefined_length
+        assert "Beam 1" == ds.BeamSequence[0].BeamName
+        assert 0 == ds.BeamSequence[0].ControlPointSequence[0].GantryAngle
+        assert 2 == len(ds.BeamSequence)
+
+        ds.BeamSequence[1].BeamName = "Beam 2"
+        assert "BeamName" not in clone.BeamSequence[1]
+
+    def test_chained(self):
+        """Test cloning a clone"""
+        ds = Dataset()
+        ds.PatientName = "CITIZEN^Jan"
+        clone = ds.clone()
+        clone2 = clone.clone()
+        clone.PatientName = "ANON"
+        assert "CITIZEN^Jan" == ds.PatientName
+        assert "CITIZEN^Jan" == clone2.PatientName
+        clone2.PatientName = "ANON2"
+        assert "CITIZEN^Jan" == ds.PatientName
+        assert "ANON" == clone.PatientName
+
+    def test_chained_modify_original(self):
+        """Test modifying the original doesn't change a clone of a clone"""
+        ds = Dataset()
+        ds.PatientName = "CITIZEN^Jan"
+        clone = ds.clone()
+        clone2 = clone.clone()
+        assert "CITIZEN^Jan" == clone.PatientName
+        del clone
+        ds["PatientName"].value = "ANON"
+        assert "CITIZEN^Jan" == clone2.PatientName
+
+    def test_pickle(self):
+        """Test pickling and deep copying cloned datasets"""
+        ds = Dataset()
+        ds.PatientName = "CITIZEN^Jan"
+        ds.BeamSequence = [Dataset()]
+        ds.BeamSequence[0].BeamName = "Beam 1"
+        clone = ds.clone()
+        clone.BeamSequence[0].BeamName = "Beam A"
+        for out in (pickle.loads(pickle.dumps(clone)), copy.deepcopy(clone)):
+            assert clone == out
+            out.PatientName = "ANON"
+            out.BeamSequence[0].BeamName = "Beam B"
+            assert "CITIZEN^Jan" == clone.PatientName
+            assert "Beam A" == clone.BeamSequence[0].BeamName
+
+        out = pickle.loads(pickle.dumps(ds))
+        assert ds == out
+        out["PatientName"].value = "ANON"
+        assert "CITIZEN^Jan" == ds.PatientName
+
+    def test_file_dataset(self):
+        """Test cloning a FileDataset"""
+        ds = dcmread(get_testdata_file("rtplan.dcm"))
+        clone = ds.clone()
+        assert isinstance(clone, FileDataset)
+        assert clone.filename == ds.filename
+        assert clone.preamble == ds.preamble
+        assert clone.file_meta == ds.file_meta
+        assert clone.file_meta is not ds.file_meta
+        assert clone == ds
+
+        clone.file_meta.MediaStorageSOPInstanceUID = "1.2.3"
+        clone.BeamSequence[0].BeamName = "Beam A"
+        assert "1.2.3" != ds.file_meta.MediaStorageSOPInstanceUID
+        assert "Beam A" != ds.BeamSequence[0].BeamName
+
+    def test_private_blocks(self):
+        """Test private blocks refer to the correct dataset"""
+        ds = Dataset()
+        block = ds.private_block(0x0011, "Test", create=True)
+        block.add_new(0x01, "SH", "Value 1")
+        clone = ds.clone()
+        clone.private_block(0x0011, "Test").add_new(0x01, "SH", "Value 2")
+        assert "Value 1" == ds[0x00111001].value
+        assert "Value 2" == clone[0x00111001].value
+
+    def test_raw_elements(self):
+        """Test raw elements are converted independently"""
+        ds = dcmread(get_testdata_file("CT_small.dcm"))
+        assert isinstance(ds._dict[0x00100010], RawDataElement)
+        clone = ds.clone()
+        assert 0x00100010 not in clone._shared_elements
+        clone.PatientName = "ANON"
+        assert isinstance(ds._dict[0x00100010], RawDataElement)
+        assert "ANON" != ds.PatientName
+
+
 @pytest.fixture
 def use_future():
     original = config._use_future
@@ -18,8 +18,10 @@ from pydicom.datadict import (
     add_private_dict_entries,
     add_private_dict_entry,
     _dictionary_vr_fast,
+    _tag_for_keyword_fast,
 )
 from pydicom.datadict import add_dict_entry, add_dict_entries
+from pydicom.tag import BaseTag
 from .test_util import save_private_dict
 
 
@@ -94,6 +96,11 @@ class TestDict:
         ds = Dataset()
         ds.TestOne = 42
         ds.TestTwo = ["1", "2", "3"]
+        assert 0x10021001 == _tag_for_keyword_fast("TestOne")
+        assert "TestOne" in ds
+        assert 42 == ds.TestOne
+        del ds.TestOne
+        assert "TestOne" not in ds
 
     def test_add_entries_raises_for_private_tags(self):
         new_dict_items = {
@@ -183,3 +190,23 @@ class TestDict:
         msg = r"Tag \(50F1,0010\) not found in DICOM dictionary"
         with pytest.raises(KeyError, match=msg):
             _dictionary_vr_fast(0x50F10010)
+
+    def test_tag_for_keyword_fast(self):
+        """Test _tag_for_keyword_fast()."""
+        tag = _tag_for_keyword_fast("PatientName")
+        assert isinstance(tag, BaseTag)
+        assert 0x00100010 == tag
+        assert _tag_for_keyword_fast("PatientMane") is None
+        # Repeating group elements have no fixed tag
+        assert _tag_for_keyword_fast("OverlayData") is None
+
+    def test_private_dictionaries(self):
+        """Test the private dictionaries are available from datadict"""
+        from pydicom import datadict
+        from pydicom._private_dict import private_dictionaries
+
+        assert datadict.private_dictionaries is private_dictionaries
+
+        msg = "module 'pydicom.datadict' has no attribute 'foo'"
+        with pytest.raises(AttributeError, match=msg):
+            datadict.foo
@@ -1,12 +1,23 @@
 # Copyright 2008-2018 pydicom authors. See LICENSE file for details.
 """Test for filebase.py"""
 
+from copy import deepcopy
 from io import BytesIO
+import os
+import pickle
+import zlib
 
 import pytest
 
 from pydicom.data import get_testdata_file
-from pydicom.filebase import DicomIO, DicomFileLike, DicomFile, DicomBytesIO
+from pydicom.filebase import (
+    DicomIO,
+    DicomFileLike,
+    DicomFile,
+    DicomBytesIO,
+    DicomDeflateIO,
+    DicomInflateIO,
+)
 from pydicom.tag import Tag
 
 
@@ -298,3 +309,153 @@ class TestDicomFile:
             #   lowercase file path on Windows
             assert "ct_small.dcm" in fp.name.lower()
             assert fp.read(2) == b"\x49\x49"
+
+
+def _deflate(data):
+    compressor = zlib.compressobj(wbits=-zlib.MAX_WBITS)
+    return compressor.compress(data) + compressor.flush()
+
+
+class TestDicomInflateIO:
+    """Test filebase.DicomInflateIO class"""
+
+    def setup_method(self):
+        self.data = bytes(range(256)) * 8192  # 2 MiB
+        self.deflated = _deflate(self.data)
+
+    def test_read(self):
+        """Test reading the inflated data"""
+        src = BytesIO(b"\x00\x01" + self.deflated + b"\x00")
+        src.seek(2)
+        fp = DicomInflateIO(src)
+        assert 0 == fp.tell()
+        assert self.data[:4] == fp.read(4)
+        assert 4 == fp.tell()
+        assert self.data[4 : 300 * 1024] == fp.read(300 * 1024 - 4)
+        assert self.data[300 * 1024 :] == fp.read()
+        assert len(self.data) == fp.tell()
+        assert b"" == fp.read(10)
+
+    def test_seek(self):
+        """Test seeking in the inflated data"""
+        fp = DicomInflateIO(BytesIO(self.deflated))
+        fp.seek(1024 * 1024)
+        assert self.data[1024 * 1024 : 1024 * 1024 + 8] == fp.read(8)
+        # Only a limited amount of the inflated data is kept
+        assert len(fp.parent._data) < 1024 * 1024
+        fp.seek(-8, os.SEEK_CUR)
+        assert self.data[1024 * 1024 : 1024 * 1024 + 8] == fp.read(8)
+        # Seeking backwards past the kept data starts again
+        fp.seek(16)
+        assert self.data[16:24] == fp.read(8)
+        assert len(self.data) == fp.seek(0, os.SEEK_END)
+        assert b"" == fp.read(1)
+
+        msg = "Negative seek position -1"
+        with pytest.raises(ValueError, match=msg):
+            fp.seek(-1)
+
+    def test_closed_file(self, tmp_path):
+        """Test a closed file is re-opened when required"""
+        path = tmp_path / "deflated"
+        path.write_bytes(b"\x00\x01" + self.deflated)
+        with open(path, "rb") as f:
+            f.seek(2)
+            fp = DicomInflateIO(f)
+            assert self.data[:8] == fp.read(8)
+
+        assert f.closed
+        assert str(path) == fp.name
+        fp.seek(1024 * 1024)
+        assert self.data[1024 * 1024 : 1024 * 1024 + 8] == fp.read(8)
+
+    def test_closed_buffer_raises(self):
+        """Test an exception is raised if the buffer is closed"""
+        src = BytesIO(self.deflated)
+        fp = DicomInflateIO(src)
+        src.close()
+        msg = "Unable to read the deflated data as the buffer has been closed"
+        with pytest.raises(ValueError, match=msg):
+            fp.read(8)
+
+    def test_truncated(self):
+        """Test reading truncated deflated data"""
+        fp = DicomInflateIO(BytesIO(self.deflated[:1000]))
+        data = fp.read()
+        assert 0 < len(data) < len(self.data)
+        assert self.data.startswith(data)
+
+    def test_deepcopy(self):
+        """Test a deep copy shares the source buffer"""
+        src = BytesIO(self.deflated)
+        fp = DicomInflateIO(src)
+        fp.read(16)
+        fp2 = deepcopy(fp)
+        assert fp2.parent._buffer is src
+        assert 0 == fp2.tell()
+        assert self.data[:16] == fp2.read(16)
+        assert self.data[16:32] == fp.read(16)
+
+    def test_getvalue(self):
+        """Test getvalue() returns the inflated data"""
+        fp = DicomInflateIO(BytesIO(self.deflated))
+        fp.seek(1024 * 1024)
+        assert self.data == fp.getvalue()
+        assert 1024 * 1024 == fp.tell()
+        assert self.data[1024 * 1024 : 1024 * 1024 + 8] == fp.read(8)
+
+    def test_pickle_file(self, tmp_path):
+        """Test pickling drops the file handle and keeps the name"""
+        path = tmp_path / "deflated"
+        path.write_bytes(b"\x00\x01" + self.deflated)
+        with open(path, "rb") as f:
+            f.seek(2)
+            fp = DicomInflateIO(f)
+            assert self.data[:8] == fp.read(8)
+            fp2 = pickle.loads(pickle.dumps(fp))
+
+        assert fp2.parent._buffer is None
+        assert str(path) == fp2.name
+        assert 8 == fp2.tell()
+        assert self.data[8:16] == fp2.read(8)
+        fp2.seek(1024 * 1024)
+        assert self.data[1024 * 1024 : 1024 * 1024 + 8] == fp2.read(8)
+
+    def test_pickle_buffer(self):
+        """Test pickling keeps an unnamed buffer"""
+        fp = DicomInflateIO(BytesIO(self.deflated))
+        fp.read(16)
+        fp2 = pickle.loads(pickle.dumps(fp))
+        assert 16 == fp2.tell()
+        assert self.data[16:32] == fp2.read(16)
+
+
+class TestDicomDeflateIO:
+    """Test filebase.DicomDeflateIO class"""
+
+    def test_write(self):
+        """Test writing deflated data"""
+        data = bytes(range(256)) * 8192
+        dst = BytesIO()
+        fp = DicomDeflateIO(dst, level=9)
+        assert 0 == fp.tell()
+        assert 1024 == fp.write(data[:1024])
+        assert 1024 * 1024 == fp.write(memoryview(data[1024 : 1024 * 1024 + 1024]))
+        fp.write(data[1024 * 1024 + 1024 :])
+        assert len(data) == fp.tell()
+        nr_bytes = fp.finish()
+        assert nr_bytes == len(dst.getvalue())
+        assert data == zlib.decompress(dst.getvalue(), -zlib.MAX_WBITS)
+
+    def test_seek(self):
+        """Test only seeking to the current position is allowed"""
+        fp = DicomDeflateIO(BytesIO())
+        fp.write(b"\x00\x01")
+        assert 2 == fp.seek(2)
+        assert 2 == fp.seek(0, os.SEEK_CUR)
+        msg = "Seeking is not supported when deflating data"
+        with pytest.raises(OSError, match=msg):
+            fp.seek(0)
+
+        with pytest.raises(OSError, match=msg):
+            fp.seek(0, os.SEEK_END)
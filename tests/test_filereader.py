@@ -6,6 +6,7 @@ import io
 from io import BytesIO
 import logging
 import os
+import pickle
 import shutil
 from pathlib import Path
 from struct import unpack
@@ -28,7 +29,7 @@ from pydicom.filereader import (
 )
 from pydicom.dataelem import DataElement, convert_raw_data_element
 from pydicom.errors import InvalidDicomError
-from pydicom.filebase import DicomBytesIO
+from pydicom.filebase import DicomBytesIO, DicomInflateIO
 from pydicom.multival import MultiValue
 from pydicom.sequence import Sequence
 from pydicom.tag import Tag, TupleTag
@@ -286,7 +287,7 @@ class TestReader:
         # If we can read anything else, the decompression must have been ok.
         ds = dcmread(deflate_name)
         assert "WSD" == ds.ConversionType
-        assert isinstance(ds.buffer, DicomBytesIO)
+        assert isinstance(ds.buffer, DicomInflateIO)
         assert ds.filename == deflate_name
 
     def test_sequence_with_implicit_vr(self):
@@ -1687,9 +1688,47 @@ class TestDeferredRead:
         """Deferred values work with file-like objects."""
         path = get_testdata_file("image_dfl.dcm")
         ds = pydicom.dcmread(path, defer_size=1024)
-        assert isinstance(ds.buffer, DicomBytesIO)
+        assert isinstance(ds.buffer, DicomInflateIO)
         assert 262144 == len(ds.PixelData)
 
+    def test_deflated_deferred(self, tmp_path):
+        """Test deflated datasets are only inflated as needed."""
+        ds = dcmread(ct_name)
+        ds.PixelData = os.urandom(1024 * 1024)
+        ds.file_meta.TransferSyntaxUID = pydicom.uid.DeflatedExplicitVRLittleEndian
+        path = tmp_path / "deflated.dcm"
+        ds.save_as(path)
+        assert os.path.getsize(path) > 1024 * 1024
+
+        out = dcmread(path, stop_before_pixels=True)
+        assert "PixelData" not in out
+        assert ds.PatientName == out.PatientName
+        assert out.buffer.parent._input_tell < 256 * 1024
+
+        out = dcmread(path, defer_size=1024)
+        assert out._dict[0x7FE00010].value is None
+        assert len(out.buffer.parent._data) < 1024 * 1024
+        # The file is re-opened to read the deferred value
+        assert ds.PixelData == out.PixelData
+
+    @pytest.mark.parametrize("defer_size", [None, 1024])
+    def test_deflated_pickle(self, defer_size):
+        """Test pickling a deflated dataset."""
+        path = get_testdata_file("image_dfl.dcm")
+        ds = dcmread(path, defer_size=defer_size)
+        out = pickle.loads(pickle.dumps(ds))
+        assert path == out.filename
+        assert "WSD" == out.ConversionType
+        assert dcmread(path).PixelData == out.PixelData
+        assert out.buffer.getvalue() == ds.buffer.getvalue()
+
+        with open(path, "rb") as f:
+            ds = dcmread(f, defer_size=defer_size)
+            out = pickle.loads(pickle.dumps(ds))
+
+        assert "WSD" == out.ConversionType
+        assert dcmread(path).PixelData == out.PixelData
+
 
 class TestReadTruncatedFile:
     def testReadFileWithMissingPixelData(self):
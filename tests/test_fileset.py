@@ -1517,6 +1517,84 @@ class TestFileSet:
         assert [] == ds.DirectoryRecordSequence
         assert [] == paths
 
+    @pytest.mark.parametrize("max_workers", [None, 1])
+    def test_add_many(self, tiny, tdir, max_workers):
+        """Test FileSet.add_many() with paths."""
+        paths = [ii.path for ii in FileSet(tiny)]
+        ref = FileSet()
+        for path in paths:
+            ref.add(path)
+
+        fs = FileSet()
+        instances = fs.add_many(paths, max_workers=max_workers)
+        assert 50 == len(fs)
+        assert [ii.SOPInstanceUID for ii in ref] == [
+            ii.SOPInstanceUID for ii in instances
+        ]
+        assert all(ii.for_addition for ii in instances)
+        assert ref._tree.prettify() == fs._tree.prettify()
+        assert [ii.FileID for ii in ref] == [ii.FileID for ii in fs]
+
+        # Instances in the File Format are copied to the stage as-is
+        for path, instance in zip(paths, instances):
+            assert Path(path).read_bytes() == Path(instance.path).read_bytes()
+
+        ds, _ = write_fs(fs, tdir.name)
+        ref_ds, _ = write_fs(ref, Path(tdir.name) / "ref")
+        assert ref_ds.DirectoryRecordSequence == ds.DirectoryRecordSequence
+
+    def test_add_many_datasets(self, ct, tdir):
+        """Test FileSet.add_many() with datasets and paths."""
+        path = Path(tdir.name) / "ct.dcm"
+        ds = dcmread(get_testdata_file("CT_small.dcm"))
+        ds.SOPInstanceUID = generate_uid()
+        del ds.file_meta.ImplementationClassUID
+        ds.save_as(path)
+
+        fs = FileSet()
+        instances = fs.add_many([ct, path, ct])
+        assert 2 == len(fs)
+        assert instances[0] is instances[2]
+        assert ct.SOPInstanceUID == instances[0].SOPInstanceUID
+        assert ds.SOPInstanceUID == instances[1].SOPInstanceUID
+        assert instances[0].node.parent is instances[1].node.parent
+
+        # Instances not in the File Format are written to the stage
+        for instance in instances[:2]:
+            staged = dcmread(instance.path)
+            assert "ImplementationClassUID" in staged.file_meta
+            assert "PixelData" in staged
+
+    def test_add_many_existing(self, ct, tdir):
+        """Test FileSet.add_many() with instances already in the File-set."""
+        fs = FileSet()
+        fs.add(ct)
+        fs.write(tdir.name)
+        instance = next(iter(fs))
+        fs.remove(instance)
+        assert fs.is_staged
+
+        # Invalid instances already in the File-set are ignored
+        ct.PatientID = None
+        assert [instance, instance] == fs.add_many([ct, ct])
+        assert not fs.is_staged
+        assert 1 == len(fs)
+
+    def test_add_many_bad_dataset(self, ct, tiny):
+        """Test FileSet.add_many() doesn't add any instances if one is bad."""
+        ct.PatientID = None
+        fs = FileSet()
+        msg = (
+            r"Unable to use the default 'PATIENT' record creator: "
+            r"The instance's \(0010,0020\) 'Patient ID' element cannot be empty."
+        )
+        with pytest.raises(ValueError, match=msg):
+            fs.add_many([ii.path for ii in FileSet(tiny)] + [ct])
+
+        assert 0 == len(fs)
+        assert not fs._stage["+"]
+        assert [] == fs._tree.children
+
     def test_file_ids_unique(self, dicomdir):
         """That that the File IDs are all unique within the File-set."""
         fs = FileSet(dicomdir)
@@ -1947,6 +2025,75 @@ class TestFileSet_Load:
         sop_instances = [ii.SOPInstanceUID for ii in matches]
         assert 17 == len(list(set(sop_instances)))
 
+    def test_find_any_of(self, dicomdir):
+        """Test FileSet.find() with multiple query values."""
+        fs = FileSet(dicomdir)
+        assert 31 == len(fs.find(PatientID=["77654033", "98890234"]))
+        assert 7 == len(fs.find(PatientID=("77654033", "12345678")))
+        assert [] == fs.find(PatientID={"12345678"})
+
+        matches = fs.find(Modality=["CT", "MR"], PatientID="98890234")
+        assert matches == [
+            ii
+            for ii in fs
+            if ii.Modality in ("CT", "MR") and ii.PatientID == "98890234"
+        ]
+        assert 27 == len(fs.find(StudyDate=["20030505", "20010101"]))
+
+    def test_find_range(self, dicomdir):
+        """Test FileSet.find() with a DA or TM range."""
+        fs = FileSet(dicomdir)
+        assert 17 == len(fs.find(StudyDate="20030505-20030505"))
+        assert 17 == len(fs.find(StudyDate="20030101-"))
+        assert 14 == len(fs.find(StudyDate="-20021231"))
+        assert 31 == len(fs.find(StudyDate="19000101-20991231"))
+        assert [] == fs.find(StudyDate="20040101-20041231")
+
+        assert 10 == len(fs.find(StudyTime="-0000"))
+        assert 25 == len(fs.find(StudyTime="0000-050000"))
+
+        # Only DA and TM are range matched
+        assert [] == fs.find(PatientID="77654033-98890234")
+
+    def test_find_indexed(self, dicomdir):
+        """Test the indexed search matches a search of every record."""
+        fs = FileSet(dicomdir)
+        assert fs._index is None
+        for ii in fs:
+            matches = fs.find(SOPInstanceUID=ii.SOPInstanceUID)
+            assert [ii] == matches
+
+        assert fs._index is not None
+        for uid in fs.find_values("StudyInstanceUID"):
+            matches = fs.find(StudyInstanceUID=uid, PatientID="98890234")
+            assert matches == [
+                ii
+                for ii in fs
+                if ii.StudyInstanceUID == uid and ii.PatientID == "98890234"
+            ]
+
+        assert fs.find(SeriesInstanceUID="1.2.3") == []
+
+    def test_find_indexed_modified(self, dicomdir, ct, tdir):
+        """Test the index is updated when the File-set is modified."""
+        fs = FileSet(dicomdir)
+        assert 7 == len(fs.find(PatientID="77654033"))
+        fs.remove(fs.find(PatientID="77654033"))
+        assert fs.find(PatientID="77654033") == []
+        assert ["98890234"] == fs.find_values("PatientID")
+
+        instance = fs.add(ct)
+        assert [instance] == fs.find(SOPInstanceUID=ct.SOPInstanceUID)
+        assert [instance] == fs.find(PatientID=ct.PatientID)
+        assert ct.PatientID in fs.find_values("PatientID")
+
+        fs.clear()
+        with pytest.warns(UserWarning, match="None of the records in the DICOMDIR"):
+            assert fs.find(PatientID="98890234") == []
+
+        instance = fs.add(ct)
+        assert [instance] == fs.find(PatientID=ct.PatientID)
+
     def test_find_load(self, private):
         """Test FileSet.find(load=True)."""
         fs = FileSet(private)
@@ -1980,6 +2127,21 @@ class TestFileSet_Load:
             assert fs.find_values(k) == v
         assert fs.find_values(list(expected.keys())) == expected
 
+    def test_find_values_indexed(self, private):
+        """Test searching indexed elements matches a search of every record."""
+        fs = FileSet(private)
+        for kw in ["PatientID", "StudyInstanceUID", "Modality", 0x00100020]:
+            expected = []
+            for ii in fs:
+                if kw in ii and ii[kw].value not in expected:
+                    expected.append(ii[kw].value)
+
+            assert fs.find_values(kw) == expected
+
+        # Searching within instances doesn't use the index
+        instances = fs.find(PatientID="77654033")
+        assert ["77654033"] == fs.find_values("PatientID", instances=instances)
+
     def test_find_values_load(self, private):
         """Test FileSet.find_values(load=True)."""
         fs = FileSet(private)
@@ -2006,6 +2168,82 @@ class TestFileSet_Load:
             search_element: ["MONOCHROME1", "MONOCHROME2"]
         }
 
+    def test_load_path_encoded_records(self, dicomdir):
+        """Test loading from a path only parses records when needed."""
+        fs = FileSet(TEST_FILE)
+        ref = FileSet(dicomdir)
+        nodes = list(fs._tree)
+        assert 52 == len(nodes)
+        assert all(node._encoded is not None for node in nodes)
+        assert [ii.path for ii in fs] == [ii.path for ii in ref]
+        assert [ii.for_moving for ii in fs] == [ii.for_moving for ii in ref]
+        assert [nn.record_type for nn in fs._tree] == [
+            nn.record_type for nn in ref._tree
+        ]
+        assert [nn._offset for nn in fs._tree] == [nn._offset for nn in ref._tree]
+        assert all(node._encoded is not None for node in nodes)
+
+        # Records are parsed on access
+        instance = fs.find(PatientID="77654033")[0]
+        assert instance.node._encoded is None
+        assert "77654033" == instance.PatientID
+
+        for node, ref_node in zip(fs._tree, ref._tree):
+            assert node._encoded is None
+            assert node._record == ref_node._record
+            assert node._record.seq_item_tell == ref_node._record.seq_item_tell
+            assert 0xFFFF == node._record.RecordInUseFlag
+
+        assert str(fs) == str(ref)
+        assert dicomdir.DirectoryRecordSequence == fs._ds.DirectoryRecordSequence
+
+    def test_load_path_write(self, dicomdir_copy, tdir):
+        """Test writing a File-set loaded from a path."""
+        src, ds = dicomdir_copy
+        ref = Path(tdir.name) / "ref"
+        shutil.copytree(src.name, ref)
+
+        path = Path(src.name) / "DICOMDIR"
+        fs = FileSet(path)
+        assert fs.is_staged
+        fs.write()
+
+        # Same output as a File-set loaded from a dataset
+        fs = FileSet(dcmread(ref / "DICOMDIR"))
+        fs.write()
+        assert path.read_bytes() == (ref / "DICOMDIR").read_bytes()
+
+    def test_load_path_undefined_length(self, dicomdir_copy):
+        """Test loading from a path with undefined length records."""
+        tdir, ds = dicomdir_copy
+        for item in ds.DirectoryRecordSequence:
+            item.is_undefined_length_sequence_item = True
+
+        fs = FileSet(ds)
+        fs.write()
+        fs = FileSet(Path(tdir.name) / "DICOMDIR")
+        assert all(node._encoded is None for node in fs._tree)
+        assert 31 == len(fs)
+        assert 7 == len(fs.find(PatientID="77654033"))
+
+    def test_load_path_missing_key(self, tdir):
+        """Test loading a record missing its key element from a path raises."""
+        with open(TEST_FILE, "rb") as f:
+            data = bytearray(f.read())
+
+        # Change the first record's (0010,0020) Patient ID to (0010,0021)
+        idx = data.index(b"\x10\x00\x20\x00LO")
+        data[idx + 2 : idx + 4] = b"\x21\x00"
+        path = Path(tdir.name) / "DICOMDIR"
+        path.write_bytes(data)
+
+        msg = (
+            r"The PATIENT directory record at offset 396 is missing a required "
+            r"element"
+        )
+        with pytest.raises(ValueError, match=msg):
+            FileSet(path)
+
     def test_empty_file_id(self, dicomdir):
         """Test loading a record with an empty File ID."""
         item = dicomdir.DirectoryRecordSequence[5]
@@ -2477,6 +2715,63 @@ class TestFileSet_Modify:
         item = ds.DirectoryRecordSequence[-1]
         assert item.ReferencedFileID == ["98892003", "MR700", "4648"]
 
+    @pytest.mark.parametrize("max_workers", [None, 1, 4])
+    def test_write_max_workers(self, tiny, ct, max_workers):
+        """Test writing with a different number of worker threads"""
+        tdir, ds = temporary_fs(tiny)
+        fs = FileSet(ds)
+        fs.add(ct)
+        fs.write(max_workers=max_workers)
+        assert not fs.is_staged
+        assert 51 == len(fs)
+        for instance in fs:
+            assert instance.SOPInstanceUID == instance.load().SOPInstanceUID
+
+    def test_write_unchanged_records(self, tiny, ct, tdir):
+        """Test unchanged records are written without being parsed"""
+        t, ds = temporary_fs(tiny)
+        fs = FileSet(ds)
+        fs.write()
+        ref = Path(tdir.name) / "ref"
+        shutil.copytree(t.name, ref)
+
+        fs = FileSet(Path(t.name) / "DICOMDIR")
+        fs.add(ct)
+        # Only the new PATIENT, STUDY, SERIES and IMAGE records
+        assert 4 == sum(node._encoded is None for node in fs._tree)
+        fs.write()
+        assert 51 == len(fs)
+
+        # Same output as a File-set loaded from a dataset
+        ref_fs = FileSet(dcmread(ref / "DICOMDIR"))
+        ref_fs.add(ct)
+        ref_fs.write()
+        assert (Path(t.name) / "DICOMDIR").read_bytes() == (
+            ref / "DICOMDIR"
+        ).read_bytes()
+        assert [ii.path for ii in ref_fs] == [
+            ii.path.replace(t.name, os.fspath(ref)) for ii in fs
+        ]
+
+    def test_encode_record_unchanged(self, dicomdir):
+        """Test encoding an unchanged record uses the existing encoding"""
+        fs = FileSet(TEST_FILE)
+        node = fs._instances[0].node
+        encoded = node._encoded
+        assert encoded.value.tobytes() == node._encode_record()
+        assert encoded.next_position == node._offset_next
+        assert encoded.lower_position == node._offset_lower
+        assert node._encoded is not None
+
+        ref = FileSet(dicomdir)._instances[0].node
+        assert ref._encode_record() == node._encode_record()
+        assert ref._offset_next == node._offset_next
+        assert ref._offset_lower == node._offset_lower
+
+        # Different encoding
+        assert ref._encode_record(True) == node._encode_record(True)
+        assert node._encoded is None
+
 
 class TestFileSet_Copy:
     """Tests for copying a File-set."""
@@ -2564,6 +2859,17 @@ class TestFileSet_Copy:
         assert ds.file_meta.TransferSyntaxUID == ImplicitVRLittleEndian
         assert ds.original_encoding == (True, True)
 
+    @pytest.mark.parametrize("max_workers", [1, 4])
+    def test_copy_max_workers(self, dicomdir, tdir, max_workers):
+        """Test FileSet.copy() with a different number of worker threads"""
+        fs = FileSet(dicomdir)
+        cp = fs.copy(tdir.name, max_workers=max_workers)
+        assert 31 == len(cp)
+        assert fs.is_staged
+        for ref, instance in zip(fs, cp):
+            assert ref.SOPInstanceUID == instance.SOPInstanceUID
+            assert ref.load() == instance.load()
+
     def test_file_id(self, tiny, tdir):
         """Test that the File IDs character sets switch correctly."""
 
@@ -4,6 +4,7 @@ import tempfile
 from copy import deepcopy
 from datetime import date, datetime, time, timedelta, timezone
 from io import BytesIO
+import logging
 import os
 import sys
 from pathlib import Path
@@ -30,7 +31,7 @@ from pydicom import config, __version_info__, uid
 from pydicom.data import get_testdata_file, get_charset_files
 from pydicom.dataset import Dataset, FileDataset, FileMetaDataset
 from pydicom.dataelem import DataElement, RawDataElement
-from pydicom.filebase import DicomBytesIO
+from pydicom.filebase import DicomBytesIO, DicomFileLike
 from pydicom.filereader import dcmread, read_dataset
 from pydicom.filewriter import (
     _determine_encoding,
@@ -47,7 +48,10 @@ from pydicom.filewriter import (
     write_OWvalue,
     writers,
     dcmwrite,
+    dcmpatch,
+    dcmrewrite,
     write_string,
+    _copy_byte_range,
 )
 from pydicom.multival import MultiValue
 from pydicom.sequence import Sequence
@@ -2241,6 +2245,111 @@ class TestWriteDataset:
         with pytest.raises(AttributeError, match=msg):
             write_dataset(fp, ds)
 
+    def test_single_write(self):
+        """Test the encoded dataset is written to a file-like in one call"""
+
+        class Writer(BytesIO):
+            nr_writes = 0
+
+            def write(self, b):
+                self.nr_writes += 1
+                return super().write(b)
+
+        ds = dcmread(rtplan_name)
+        for elem in ds.iterall():
+            pass
+
+        ref = DicomBytesIO()
+        ref.is_implicit_VR = True
+        ref.is_little_endian = True
+        write_dataset(ref, ds)
+
+        buffer = Writer()
+        fp = DicomFileLike(buffer)
+        fp.is_implicit_VR = True
+        fp.is_little_endian = True
+        assert len(ref.getvalue()) == write_dataset(fp, ds)
+        assert 1 == buffer.nr_writes
+        assert ref.getvalue() == buffer.getvalue()
+
+    def test_flush_buffer(self, monkeypatch):
+        """Test the encoded dataset is written in blocks"""
+        monkeypatch.setattr("pydicom.filewriter._WRITE_BUFFER_SIZE", 1024)
+        ds = dcmread(ct_name)
+        ref = DicomBytesIO()
+        ref.is_implicit_VR = False
+        ref.is_little_endian = True
+        write_dataset(ref, ds)
+
+        chunks = []
+        fp = DicomFileLike(BytesIO())
+        fp.write = lambda b: chunks.append(bytes(b)) or len(b)
+        fp.tell = lambda: sum(len(c) for c in chunks)
+        fp.is_implicit_VR = False
+        fp.is_little_endian = True
+        write_dataset(fp, ds)
+        assert ref.getvalue() == b"".join(chunks)
+        # Pixel Data is larger than the buffer and written directly
+        lengths = [len(c) for c in chunks]
+        assert 2 * 128 * 128 in lengths
+        assert len(lengths) > 2
+        assert all(x < 3 * 1024 for x in lengths if x != 2 * 128 * 128)
+
+    def test_write_keeps_object(self, monkeypatch):
+        """Test a file-like that keeps the written objects gets bytes"""
+        monkeypatch.setattr("pydicom.filewriter._WRITE_BUFFER_SIZE", 1024)
+
+        class Writer:
+            def __init__(self):
+                self.chunks = []
+
+            def write(self, b):
+                self.chunks.append(b)
+                return len(b)
+
+            def tell(self):
+                return sum(len(c) for c in self.chunks)
+
+            def seek(self, offset, whence=0):
+                pass
+
+        ds = dcmread(ct_name)
+        ref = DicomBytesIO()
+        ref.is_implicit_VR = False
+        ref.is_little_endian = True
+        write_dataset(ref, ds)
+
+        buffer = Writer()
+        fp = DicomFileLike(buffer)
+        fp.is_implicit_VR = False
+        fp.is_little_endian = True
+        write_dataset(fp, ds)
+        assert len(buffer.chunks) > 1
+        assert not any(isinstance(c, memoryview) for c in buffer.chunks)
+        assert ref.getvalue() == b"".join(buffer.chunks)
+
+    def test_value_length_changed_to_un(self):
+        """Test an element changed to UN when written amongst other elements"""
+        ds = Dataset()
+        ds.DoseGridScaling = 1
+        ds.DoseReferencePointCoordinates = [123456.789012345] * 4500
+        ds.NominalPriorDose = 1.5
+        ds.PatientName = "Foo"
+        fp = DicomBytesIO()
+        fp.is_implicit_VR = False
+        fp.is_little_endian = True
+
+        msg = r"The data element VR is changed from 'DS' to 'UN'"
+        with pytest.warns(UserWarning, match=msg):
+            write_dataset(fp, ds)
+
+        fp.seek(0)
+        out = read_dataset(fp, False, True)
+        assert "UN" == out["DoseReferencePointCoordinates"].VR
+        assert "Foo" == out.PatientName
+        assert 1 == out.DoseGridScaling
+        assert 1.5 == out.NominalPriorDose
+
 
 class TestWriteFileMetaInfoToStandard:
     """Unit tests for writing File Meta Info to the DICOM standard."""
@@ -3353,6 +3462,306 @@ class TestWritingBufferedPixelData:
                 ds.save_as(f, little_endian=True, implicit_vr=True)
 
 
+class TestDCMRewrite:
+    """Tests for dcmrewrite()"""
+
+    @pytest.mark.parametrize(
+        "path", [ct_name, mr_implicit_name, mr_bigendian_name, jpeg_name, rtplan_name]
+    )
+    def test_matches_dcmwrite(self, path, tmp_path):
+        """Test the output matches dcmwrite()"""
+        ds = dcmread(path, defer_size=256)
+        ds.PatientName = "ANON"
+        dcmrewrite(tmp_path / "rewrite.dcm", ds)
+
+        ref = dcmread(path)
+        ref.PatientName = "ANON"
+        dcmwrite(tmp_path / "write.dcm", ref)
+
+        assert (tmp_path / "rewrite.dcm").read_bytes() == (
+            tmp_path / "write.dcm"
+        ).read_bytes()
+
+    def test_deferred_not_read(self, tmp_path, caplog):
+        """Test the unchanged deferred elements aren't read"""
+        ds = dcmread(ct_name, defer_size=256)
+        ds.PatientName = "ANON"
+        with caplog.at_level(logging.DEBUG, logger="pydicom"):
+            dcmrewrite(tmp_path / "out.dcm", ds)
+
+        assert "Copying 223 unchanged elements (38254 bytes)" in caplog.text
+        assert ds._dict[0x7FE00010].value is None
+        out = dcmread(tmp_path / "out.dcm")
+        assert "ANON" == out.PatientName
+        assert dcmread(ct_name).PixelData == out.PixelData
+
+    def test_deleted_element(self, tmp_path):
+        """Test deleting an element from the unchanged elements"""
+        ds = dcmread(ct_name, defer_size=256)
+        assert isinstance(ds._dict[0x00431028], RawDataElement)
+        del ds[0x00431028]
+        dcmrewrite(tmp_path / "out.dcm", ds)
+        out = dcmread(tmp_path / "out.dcm")
+        assert 0x00431028 not in out
+        assert 0x00431029 in out
+        assert dcmread(ct_name).PixelData == out.PixelData
+
+    def test_changed_encoding(self, tmp_path):
+        """Test the elements are written normally if the encoding changes"""
+        ds = dcmread(mr_implicit_name, defer_size=256)
+        ds.file_meta.TransferSyntaxUID = ExplicitVRLittleEndian
+        dcmrewrite(tmp_path / "out.dcm", ds)
+        out = dcmread(tmp_path / "out.dcm")
+        assert not out.original_encoding[0]
+        assert dcmread(mr_implicit_name).PixelData == out.PixelData
+
+    def test_buffers(self):
+        """Test using buffers for the source and destination"""
+        with open(ct_name, "rb") as f:
+            ds = dcmread(BytesIO(f.read()), defer_size=256)
+
+        ds.PatientName = "ANON"
+        fp = DicomBytesIO()
+        dcmrewrite(fp, ds)
+        fp.seek(0)
+        out = dcmread(fp)
+        assert "ANON" == out.PatientName
+        assert dcmread(ct_name).PixelData == out.PixelData
+
+    def test_same_file_raises(self, tmp_path):
+        """Test writing to the source file raises an exception"""
+        path = tmp_path / "ct.dcm"
+        path.write_bytes(Path(ct_name).read_bytes())
+        ds = dcmread(path, defer_size=256)
+        msg = "unable to write to the same file the dataset was read from"
+        with pytest.raises(ValueError, match=msg):
+            dcmrewrite(path, ds)
+
+    def test_modified_source(self, tmp_path):
+        """Test the elements are written normally if the source has changed"""
+        path = tmp_path / "ct.dcm"
+        path.write_bytes(Path(ct_name).read_bytes())
+        ds = dcmread(path)
+        ds.timestamp -= 10
+        dcmrewrite(tmp_path / "out.dcm", ds)
+        assert not isinstance(ds._dict[0x7FE00010], RawDataElement)
+
+    def test_truncated_source(self, tmp_path):
+        """Test the elements are written normally if the source is truncated"""
+        path = tmp_path / "ct.dcm"
+        path.write_bytes(Path(ct_name).read_bytes())
+        ds = dcmread(path)
+        ds.PatientName = "ANON"
+        pixel_data = ds.PixelData
+        stat = path.stat()
+        path.write_bytes(path.read_bytes()[:1000])
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+        dcmrewrite(tmp_path / "out.dcm", ds)
+        out = dcmread(tmp_path / "out.dcm")
+        assert "ANON" == out.PatientName
+        assert pixel_data == out.PixelData
+
+    def test_dataset_unchanged(self, tmp_path):
+        """Test the dataset and its element references aren't changed"""
+        ds = dcmread(ct_name, defer_size=256)
+        ds.PatientName = "ANON"
+        elem = ds["PatientName"]
+        elements = dict(ds._dict)
+        dcmrewrite(tmp_path / "out.dcm", ds)
+        assert elements == ds._dict
+        assert all(v is elements[k] for k, v in ds._dict.items())
+        assert not ds._lent_elements
+
+        elem.value = "CITIZEN^Jan"
+        assert "CITIZEN^Jan" == ds.PatientName
+
+    def test_overwrite(self, tmp_path):
+        """Test the overwrite keyword argument"""
+        ds = dcmread(ct_name, defer_size=256)
+        path = tmp_path / "out.dcm"
+        path.write_bytes(b"")
+        with pytest.raises(FileExistsError):
+            dcmrewrite(path, ds, overwrite=False)
+
+    def test_copy_byte_range(self, tmp_path):
+        """Test copying part of a file"""
+        src = tmp_path / "src"
+        src.write_bytes(bytes(range(256)) * 4096)
+        with open(src, "rb") as f, open(tmp_path / "dst", "wb") as g:
+            g.write(b"\x00" * 3)
+            _copy_byte_range(f, g, 10, 5000)
+            assert 5003 == g.tell()
+            g.write(b"\x01")
+
+        assert (tmp_path / "dst").read_bytes() == (
+            b"\x00" * 3 + src.read_bytes()[10:5010] + b"\x01"
+        )
+
+    @pytest.mark.parametrize("func", ["copy_file_range", "sendfile"])
+    def test_copy_byte_range_unavailable(self, func, tmp_path, monkeypatch):
+        """Test falling back to reading in chunks"""
+        monkeypatch.delattr(os, func, raising=False)
+        monkeypatch.setattr("pydicom.filewriter._COPY_CHUNK_SIZE", 1000)
+        src = tmp_path / "src"
+        src.write_bytes(bytes(range(256)) * 4096)
+        with open(src, "rb") as f, open(tmp_path / "dst", "wb") as g:
+            _copy_byte_range(f, g, 10, 5000)
+
+        assert (tmp_path / "dst").read_bytes() == src.read_bytes()[10:5010]
+
+    def test_copy_byte_range_eof(self):
+        """Test an exception is raised if the source is too short"""
+        msg = "Expected 100 bytes to copy from offset 10 but only 90 bytes"
+        with pytest.raises(EOFError, match=msg):
+            _copy_byte_range(BytesIO(b"\x00" * 100), BytesIO(), 10, 100)
+
+
+@pytest.fixture
+def ct_copy(tmp_path):
+    """Return the path to a copy of CT_small.dcm"""
+    path = tmp_path / "ct.dcm"
+    path.write_bytes(Path(ct_name).read_bytes())
+    return path
+
+
+class TestDCMPatch:
+    """Tests for dcmpatch()"""
+
+    def test_same_length(self, ct_copy):
+        """Test patching values with the same length"""
+        size = ct_copy.stat().st_size
+        ds = dcmread(ct_copy, defer_size=256)
+        instance_uid = ds.SOPInstanceUID[:-1] + "9"
+        values = {"PatientID": "ABCD", "SOPInstanceUID": instance_uid}
+        assert dcmpatch(ds, values)
+        assert size == ct_copy.stat().st_size
+        assert ct_copy.stat().st_mtime == ds.timestamp
+
+        assert isinstance(ds._dict[0x00100020], RawDataElement)
+        assert "ABCD" == ds.PatientID
+        assert instance_uid == ds.SOPInstanceUID
+        out = dcmread(ct_copy)
+        assert "ABCD" == out.PatientID
+        assert instance_uid == out.SOPInstanceUID
+        assert dcmread(ct_name).PixelData == ds.PixelData
+
+    def test_padded(self, ct_copy):
+        """Test patching shorter values that can be padded"""
+        ds = dcmread(ct_copy)
+        offset = ds._dict[0x00100010].value_tell
+        assert dcmpatch(ds, {"PatientName": "A", 0x00100020: "B"})
+        assert "A" == ds.PatientName
+        with open(ct_copy, "rb") as f:
+            f.seek(offset)
+            assert b"A" + b" " * 21 == f.read(22)
+
+        out = dcmread(ct_copy)
+        assert "A" == out.PatientName
+        assert "B" == out.PatientID
+
+    def test_converted_element(self, ct_copy):
+        """Test patching an element that's been converted"""
+        ds = dcmread(ct_copy)
+        assert "CompressedSamples^CT1" == ds.PatientName
+        assert dcmpatch(ds, {"PatientName": "ANON"})
+        assert "ANON" == ds.PatientName
+        assert "ANON" == dcmread(ct_copy).PatientName
+
+    def test_implicit_vr(self, tmp_path):
+        """Test patching an implicit VR dataset"""
+        path = tmp_path / "mr.dcm"
+        path.write_bytes(Path(mr_implicit_name).read_bytes())
+        ds = dcmread(path)
+        assert dcmpatch(ds, {"PatientName": "ANON"})
+        assert "ANON" == dcmread(path).PatientName
+
+    def test_file_meta(self, ct_copy):
+        """Test patching a File Meta Information element"""
+        ds = dcmread(ct_copy)
+        instance_uid = ds.file_meta.MediaStorageSOPInstanceUID[:-1] + "9"
+        assert dcmpatch(ds, {"MediaStorageSOPInstanceUID": instance_uid})
+        assert instance_uid == ds.file_meta.MediaStorageSOPInstanceUID
+        assert instance_uid == dcmread(ct_copy).file_meta.MediaStorageSOPInstanceUID
+
+    def test_rewrite(self, ct_copy):
+        """Test the file is written again if the values don't fit"""
+        ds = dcmread(ct_copy, defer_size=256)
+        values = {"SOPInstanceUID": "1.2.3", "StudyDescription": "Study"}
+        assert not dcmpatch(ds, values)
+        assert "1.2.3" == ds.SOPInstanceUID
+        out = dcmread(ct_copy)
+        assert "1.2.3" == out.SOPInstanceUID
+        assert "Study" == out.StudyDescription
+        assert ct_copy.stat().st_mtime == ds.timestamp
+        assert [ct_copy.name] == os.listdir(ct_copy.parent)
+
+        # Deferred elements are read from the new file
+        assert ds._dict[0x7FE00010].value is None
+        assert dcmread(ct_name).PixelData == ds.PixelData
+
+    def test_unknown_tag_raises(self, ct_copy):
+        """Test adding an element with an unknown VR raises"""
+        original = ct_copy.read_bytes()
+        ds = dcmread(ct_copy)
+        msg = (
+            r"unable to add the element with tag \(0009,1099\) as its VR can't "
+            "be determined, use a 'DataElement' for the value instead"
+        )
+        with pytest.raises(ValueError, match=msg):
+            dcmpatch(ds, {"PatientID": "1234567890", 0x00091099: "abc"})
+
+        assert "1234567890" != ds.PatientID
+        assert original == ct_copy.read_bytes()
+
+        msg = r"the tag of the element used for \(0009,1099\) doesn't match"
+        with pytest.raises(ValueError, match=msg):
+            dcmpatch(ds, {0x00091099: DataElement(0x00091098, "LO", "abc")})
+
+    def test_data_element(self, ct_copy):
+        """Test using a DataElement for the value"""
+        ds = dcmread(ct_copy)
+        values = {
+            0x00091099: DataElement(0x00091099, "LO", "abc"),
+            "PatientID": DataElement(0x00100020, "LO", "ABCD"),
+        }
+        assert not dcmpatch(ds, values)
+        out = dcmread(ct_copy)
+        assert "abc" == out[0x00091099].value
+        assert "ABCD" == out.PatientID
+
+        ds = dcmread(ct_copy)
+        assert dcmpatch(ds, {"PatientID": DataElement(0x00100020, "LO", "1234")})
+        assert "1234" == dcmread(ct_copy).PatientID
+
+    def test_no_rewrite_raises(self, ct_copy):
+        """Test an exception is raised if rewriting isn't allowed"""
+        original = ct_copy.read_bytes()
+        ds = dcmread(ct_copy)
+        msg = "unable to change the element values in-place"
+        with pytest.raises(ValueError, match=msg):
+            dcmpatch(ds, {"PatientID": "1234567890"}, allow_rewrite=False)
+
+        assert original == ct_copy.read_bytes()
+
+    def test_not_from_file_raises(self):
+        """Test an exception is raised if not read from file"""
+        with open(ct_name, "rb") as f:
+            ds = dcmread(BytesIO(f.read()))
+
+        msg = "the dataset must have been read from a file that still exists"
+        with pytest.raises(ValueError, match=msg):
+            dcmpatch(ds, {"PatientID": "1"})
+
+    def test_modified_raises(self, ct_copy):
+        """Test an exception is raised if the file has been modified"""
+        ds = dcmread(ct_copy)
+        ds.timestamp -= 10
+        msg = "the file has been modified since the dataset was read"
+        with pytest.raises(ValueError, match=msg):
+            dcmpatch(ds, {"PatientID": "1"})
+
+
 @pytest.fixture
 def use_future():
     original = config._use_future
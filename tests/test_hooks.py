@@ -1,8 +1,26 @@
 """Tests for the hooks module."""
 
+import os
+
 import pytest
 
-from pydicom.hooks import hooks, raw_element_vr, raw_element_value
+try:
+    import numpy as np
+
+    HAVE_NP = True
+except ImportError:
+    HAVE_NP = False
+
+from pydicom import dcmread
+from pydicom.data import get_charset_files, get_testdata_file
+from pydicom.encaps import generate_frames, get_frame
+from pydicom.hooks import (
+    hooks,
+    raw_element_vr,
+    raw_element_value,
+    TimingCollector,
+    TIMING_BINS,
+)
 
 
 @pytest.fixture
@@ -11,12 +29,14 @@ def reset_hooks():
         hooks.raw_element_vr,
         hooks.raw_element_value,
         hooks.raw_element_kwargs,
+        hooks.timing_event,
     )
     yield
     (
         hooks.raw_element_vr,
         hooks.raw_element_value,
         hooks.raw_element_kwargs,
+        hooks.timing_event,
     ) = original
 
 
@@ -63,9 +83,181 @@ class TestHooks:
         assert hooks.raw_element_vr == foo
         assert hooks.raw_element_value == bar
 
+    def test_register_timing_event(self, reset_hooks):
+        """Test setting and removing the timing event callback."""
+        assert hooks.timing_event is None
+
+        def foo(stage, elapsed, nbytes):
+            pass
+
+        hooks.register_callback("timing_event", foo)
+        assert hooks.timing_event == foo
+        hooks.register_callback("timing_event", None)
+        assert hooks.timing_event is None
+
     def test_register_kwargs(self, reset_hooks):
         """Test setting the kwargs for a hook function"""
         d = {"a": 1, 2: "foo"}
         assert hooks.raw_element_kwargs == {}
         hooks.register_kwargs("raw_element_kwargs", d)
         assert hooks.raw_element_kwargs == d
+
+
+class TestTimingCollector:
+    """Tests for TimingCollector"""
+
+    def test_aggregate(self):
+        """Test the events are aggregated per stage."""
+        collector = TimingCollector()
+        assert TIMING_BINS == collector.bins
+        collector("foo", 2e-6, 10)
+        collector("foo", 5e-4, 30)
+        collector("bar", 20.0, 0)
+
+        foo = collector.stages["foo"]
+        assert 2 == foo.count
+        assert 40 == foo.nbytes
+        assert foo.total == pytest.approx(5.02e-4)
+        assert foo.mean == pytest.approx(2.51e-4)
+        assert 2e-6 == foo.minimum
+        assert 5e-4 == foo.maximum
+        assert foo.throughput == pytest.approx(40 / 5.02e-4)
+        assert [0, 1, 0, 1, 0, 0, 0, 0, 0] == foo.histogram
+
+        bar = collector.stages["bar"]
+        assert 0.0 == bar.throughput
+        assert [0, 0, 0, 0, 0, 0, 0, 0, 1] == bar.histogram
+
+        collector.clear()
+        assert {} == collector.stages
+
+    def test_bins(self):
+        """Test using custom histogram bins."""
+        collector = TimingCollector(bins=[1.0, 0.1])
+        assert (0.1, 1.0) == collector.bins
+        collector("foo", 0.1, 0)
+        collector("foo", 0.5, 0)
+        collector("foo", 0.5, 0)
+        assert [1, 2, 0] == collector.stages["foo"].histogram
+
+    def test_summary(self):
+        """Test the summary table."""
+        collector = TimingCollector(bins=[1e-3])
+        collector("read_meta", 2e-4, 2000)
+        collector("read_dataset", 2.5, 10_000_000)
+        lines = collector.summary().splitlines()
+        assert 3 == len(lines)
+        assert lines[0].split() == [
+            "stage",
+            "count",
+            "total",
+            "mean",
+            "min",
+            "max",
+            "MB/s",
+            "<=1",
+            "ms",
+            ">1",
+            "ms",
+        ]
+        assert lines[1].split() == (
+            ["read_meta", "1"] + ["200", "us"] * 4 + ["10.0", "1", "0"]
+        )
+        assert lines[2].split() == (
+            ["read_dataset", "1"] + ["2.5", "s"] * 4 + ["4.0", "0", "1"]
+        )
+
+    def test_context_manager(self, reset_hooks):
+        """Test using the collector as a context manager."""
+
+        def foo(stage, elapsed, nbytes):
+            pass
+
+        hooks.register_callback("timing_event", foo)
+        with TimingCollector() as collector:
+            assert hooks.timing_event is collector
+            with TimingCollector() as nested:
+                assert hooks.timing_event is nested
+
+            assert hooks.timing_event is collector
+
+        assert hooks.timing_event is foo
+
+    def test_read(self, reset_hooks):
+        """Test the events when reading a dataset."""
+        path = get_testdata_file("CT_small.dcm")
+        with TimingCollector() as collector:
+            ds = dcmread(path, defer_size=256)
+
+        assert {"read_meta", "read_dataset"} <= set(collector.stages)
+        meta = collector.stages["read_meta"]
+        assert 1 == meta.count
+        # Preamble, prefix and the File Meta Information
+        assert 128 + 4 + 12 + ds.file_meta.FileMetaInformationGroupLength == (
+            meta.nbytes
+        )
+        dataset = collector.stages["read_dataset"]
+        assert 1 == dataset.count
+        assert os.path.getsize(path) == meta.nbytes + dataset.nbytes
+
+        length = ds.get_item("PatientName").length
+        collector.clear()
+        with collector:
+            ds.PixelData
+            ds.PatientName
+            ds.Rows
+
+        assert 1 == collector.stages["read_deferred"].count
+        assert 32768 == collector.stages["read_deferred"].nbytes
+        assert 3 == collector.stages["convert_element"].count
+        # Only the PN element is decoded using the character set
+        assert 1 == collector.stages["decode_charset"].count
+        assert length == collector.stages["decode_charset"].nbytes
+
+    def test_read_disabled(self, reset_hooks):
+        """Test no events are recorded after the collector is removed."""
+        collector = TimingCollector()
+        with collector:
+            pass
+
+        ds = dcmread(get_charset_files("chrRuss.dcm")[0])
+        ds.PatientName
+        assert {} == collector.stages
+
+    def test_extract_frame(self, reset_hooks):
+        """Test the events when getting encapsulated frames."""
+        ds = dcmread(get_testdata_file("MR_small_RLE.dcm"))
+        with TimingCollector() as collector:
+            frames = list(generate_frames(ds.PixelData, number_of_frames=1))
+            frame = get_frame(ds.PixelData, 0, number_of_frames=1)
+
+        assert [frame] == frames
+        extract = collector.stages["extract_frame"]
+        assert 2 == extract.count
+        assert sum(len(f) for f in frames) + len(frame) == extract.nbytes
+
+    @pytest.mark.skipif(not HAVE_NP, reason="NumPy is not available")
+    def test_decode_frame(self, reset_hooks):
+        """Test the events when decoding pixel data."""
+        ds = dcmread(get_testdata_file("SC_rgb_rle.dcm"))
+        with TimingCollector() as collector:
+            arr = ds.pixel_array
+
+        decode = collector.stages["decode_frame"]
+        assert 1 == decode.count
+        assert arr.nbytes == decode.nbytes
+        assert 1 == collector.stages["extract_frame"].count
+
+    @pytest.mark.skipif(not HAVE_NP, reason="NumPy is not available")
+    def test_convert_color_space(self, reset_hooks):
+        """Test the events when converting the color space."""
+        from pydicom.pixels import convert_color_space
+
+        arr = np.zeros((10, 10, 3), dtype="u1")
+        with TimingCollector() as collector:
+            convert_color_space(arr, "RGB", "YBR_FULL")
+            convert_color_space(arr, "RGB", "RGB")
+
+        stage = collector.stages["convert_color_space"]
+        assert 1 == stage.count
+        assert 300 == stage.nbytes
@@ -1,14 +1,22 @@
 # Copyright 2008-2019 pydicom authors. See LICENSE file for details.
+import asyncio
+from importlib.util import find_spec
+from io import BytesIO, StringIO
+import copy
+import gc
 import json
 import logging
 from unittest import mock
+import weakref
 
 import pytest
 
-from pydicom import dcmread
+from pydicom import config, dcmread
 from pydicom.data import get_testdata_file
 from pydicom.dataelem import DataElement, RawDataElement
 from pydicom.dataset import Dataset
+from pydicom import jsonrep
+from pydicom.jsonrep import dump_json, iter_json, iter_json_array
 from pydicom.tag import Tag, BaseTag
 from pydicom.valuerep import PersonName
 
@@ -387,6 +395,83 @@ class TestSequence:
         assert ds == ds2
 
 
+class TestBackend:
+    """Tests for the JSON parser backends"""
+
+    @pytest.fixture
+    def backend(self):
+        original = config.settings.json_backend
+        yield
+        config.settings.json_backend = original
+        jsonrep._json_loader.cache_clear()
+
+    def test_json(self, backend):
+        """Test using the json module."""
+        config.settings.json_backend = "json"
+        assert json.loads is jsonrep._json_loader("json")
+        assert {"a": [1, None]} == jsonrep.loads('{"a": [1, null]}')
+        assert {"a": 1} == jsonrep.loads(b'{"a": 1}')
+        with pytest.raises(ValueError):
+            jsonrep.loads("{")
+
+    def test_auto_fallback(self, backend, monkeypatch):
+        """Test the json module is used when no other backends are available."""
+
+        def missing():
+            raise ImportError()
+
+        jsonrep._json_loader.cache_clear()
+        monkeypatch.setattr(
+            jsonrep, "_JSON_BACKENDS", {"orjson": missing, "simdjson": missing}
+        )
+        assert json.loads is jsonrep._json_loader("auto")
+
+    @pytest.mark.skipif(find_spec("orjson") is None, reason="orjson not installed")
+    def test_orjson(self, backend):
+        """Test using orjson."""
+        import orjson
+
+        config.settings.json_backend = "orjson"
+        assert orjson.loads is jsonrep._json_loader("orjson")
+        assert orjson.loads is jsonrep._json_loader("auto")
+        assert {"a": [1, None]} == jsonrep.loads('{"a": [1, null]}')
+        with pytest.raises(ValueError):
+            jsonrep.loads("{")
+
+        # Falls back to the json module if orjson is too strict
+        assert [2**64] == jsonrep.loads("[18446744073709551616]")
+        assert jsonrep.loads("[NaN]")[0] != jsonrep.loads("[NaN]")[0]
+
+        ds = Dataset()
+        ds.PatientName = "Jane^Doe"
+        ds.add_new(0x00091010, "FD", [1.5, float("nan")])
+        ds_json = ds.to_json()
+        ds2 = Dataset.from_json(ds_json)
+        assert "Jane^Doe" == ds2.PatientName
+        assert 1.5 == ds2[0x00091010].value[0]
+
+    def test_from_json_values(self, backend):
+        """Test decoding multi-valued elements using each backend."""
+        ds_json = (
+            '{"00091001": {"vr": "CS", "Value": ["A", null, "C"]}, '
+            '"00091002": {"vr": "US", "Value": [1, null, 3]}, '
+            '"00091003": {"vr": "FD", "Value": [1, 2.5]}, '
+            '"00091004": {"vr": "LO", "Value": ["A", "B"]}}'
+        )
+        backends = ["auto", "json"]
+        if find_spec("orjson"):
+            backends.append("orjson")
+
+        for name in backends:
+            config.settings.json_backend = name
+            ds = Dataset.from_json(ds_json)
+            assert ["A", "", "C"] == ds[0x00091001].value
+            assert [1, None, 3] == ds[0x00091002].value
+            assert [1.0, 2.5] == ds[0x00091003].value
+            assert isinstance(ds[0x00091003].value[0], float)
+            assert ["A", "B"] == ds[0x00091004].value
+
+
 class TestBinary:
     def test_inline_binary(self):
         ds = Dataset()
@@ -519,6 +604,33 @@ class TestBinary:
 
         assert b"xyzzy" == ds[0x003A0200].value[0][0x54001010].value
 
+    def test_bulk_data_reader_not_kept(self):
+        """Test the bulk data reader isn't kept alive after use"""
+
+        class Reader:
+            def __call__(self, value):
+                return b"xyzzy"
+
+        class SlotsReader:
+            __slots__ = ()
+
+            def __call__(self, tag, vr, value):
+                return b"xyzzy"
+
+        json_data = {"00091002": {"vr": "OB", "BulkDataURI": "https://a.dummy.url"}}
+        reader = Reader()
+        ref = weakref.ref(reader)
+        ds = Dataset.from_json(json_data, reader)
+        assert b"xyzzy" == ds[0x00091002].value
+
+        del reader
+        gc.collect()
+        assert ref() is None
+
+        # Callables that can't be weakly referenced are still supported
+        ds = Dataset.from_json(json_data, SlotsReader())
+        assert b"xyzzy" == ds[0x00091002].value
+
 
 class TestNumeric:
     def test_numeric_values(self):
@@ -576,3 +688,333 @@ class TestNumeric:
         assert isinstance(ds_json["00091014"]["Value"][0], int)
         assert isinstance(ds_json["00091015"]["Value"][0], float)
         assert isinstance(ds_json["00091102"]["Value"][0], int)
+
+
+class TestStreaming:
+    """Tests for the streaming JSON encoder"""
+
+    def test_iter_json_matches_to_json_dict(self, disable_value_validation):
+        """Test the streamed output matches the JSON dict."""
+        ds = dcmread(get_testdata_file("CT_small.dcm"))
+        ds.ReferencedImageSequence = [Dataset(), Dataset()]
+        ds.ReferencedImageSequence[1].ReferencedSOPInstanceUID = "1.2.3"
+        ds.ReferencedStudySequence = []
+
+        def handler(elem):
+            return f"https://example.com/{elem.tag:08X}"
+
+        ref = json.dumps(ds.to_json_dict(), sort_keys=True)
+        assert ref == "".join(iter_json(ds))
+        assert ref == ds.to_json()
+
+        ref = json.dumps(ds.to_json_dict(256, handler), sort_keys=True)
+        assert ref == "".join(iter_json(ds, 256, handler))
+        assert ref == ds.to_json(256, handler)
+
+    def test_inline_binary_chunks(self, monkeypatch):
+        """Test binary values are base64 encoded in chunks."""
+        monkeypatch.setattr(jsonrep, "_BINARY_CHUNK_SIZE", 3)
+        ds = Dataset()
+        ds.add_new(0x00091002, "OB", b"BinaryContent")
+        ds.add_new(0x00091003, "OB", b"")
+        chunks = list(iter_json(ds))
+        assert "QmluYXJ5Q29udGVudA==" == "".join(chunks[3:8])
+        assert {
+            "00091002": {"vr": "OB", "InlineBinary": "QmluYXJ5Q29udGVudA=="},
+            "00091003": {"vr": "OB"},
+        } == json.loads("".join(chunks))
+
+    def test_buffered_binary(self, monkeypatch):
+        """Test encoding buffered binary values."""
+        monkeypatch.setattr(jsonrep, "_BINARY_CHUNK_SIZE", 3)
+        buffer = BytesIO(b"BinaryContent")
+        buffer.seek(4)
+        ds = Dataset()
+        ds.add_new(0x00091002, "OB", buffer)
+
+        out = json.loads("".join(iter_json(ds)))
+        assert "QmluYXJ5Q29udGVudA==" == out["00091002"]["InlineBinary"]
+        assert 4 == buffer.tell()
+
+        out = json.loads("".join(iter_json(ds, 4, lambda elem: "https://a")))
+        assert {"vr": "OB", "BulkDataURI": "https://a"} == out["00091002"]
+
+    def test_iter_json_array(self):
+        """Test encoding multiple datasets as an array."""
+        consumed = []
+
+        def datasets():
+            for idx in range(3):
+                ds = Dataset()
+                ds.PatientID = str(idx)
+                consumed.append(idx)
+                yield ds
+
+        chunks = iter_json_array(datasets())
+        assert "[" == next(chunks)
+        assert [] == consumed
+        out = json.loads("[" + "".join(chunks))
+        assert ["0", "1", "2"] == [ds["00100020"]["Value"][0] for ds in out]
+        assert "[]" == "".join(iter_json_array([]))
+
+    def test_dump_json(self):
+        """Test writing to a file-like."""
+        ds = Dataset()
+        ds.PatientName = "Jane^Doe"
+
+        fp = StringIO()
+        dump_json(ds, fp)
+        assert ds.to_json() == fp.getvalue()
+
+        fp = StringIO()
+        dump_json([ds, ds], fp)
+        assert f"[{ds.to_json()}, {ds.to_json()}]" == fp.getvalue()
+
+    def test_suppress_invalid_tags(self, caplog):
+        """Test suppressing invalid tags in datasets and sequence items."""
+        raw = RawDataElement(Tag(0x00082128), "IS", 4, b"5.25", 0, True, True)
+        item = Dataset()
+        item[0x00082128] = raw
+        item.PatientID = "1234"
+        ds = Dataset()
+        ds[0x00082128] = raw
+        ds.ReferencedImageSequence = [item]
+
+        with config.strict_reading():
+            with pytest.raises(ValueError, match="Invalid value for VR IS"):
+                "".join(iter_json(ds))
+
+        with caplog.at_level(logging.WARNING, logger="pydicom"):
+            out = json.loads("".join(iter_json(ds, suppress_invalid_tags=True)))
+
+        assert "00082128" not in out
+        item_out = out["00081140"]["Value"][0]
+        assert "00082128" not in item_out
+        assert "00100020" in item_out
+        assert "Error while processing tag 00082128" in caplog.text
+
+        # The same tags are dropped with and without a dump handler
+        assert out == ds.to_json_dict(suppress_invalid_tags=True)
+        assert out == json.loads(ds.to_json(suppress_invalid_tags=True))
+        assert out == json.loads(
+            ds.to_json(dump_handler=json.dumps, suppress_invalid_tags=True)
+        )
+
+
+class TestDeferredConversion:
+    """Tests for Dataset.from_json() with defer_conversion"""
+
+    def test_matches_eager(self, disable_value_validation):
+        """Test the deferred dataset matches the converted one."""
+        for name in ("rtplan.dcm", "CT_small.dcm"):
+            ds_json = dcmread(get_testdata_file(name)).to_json()
+            ds = Dataset.from_json(ds_json)
+            deferred = Dataset.from_json(ds_json, defer_conversion=True)
+            assert ds == deferred
+            assert str(ds) == str(deferred)
+            assert ds_json == deferred.to_json()
+
+            deferred = Dataset.from_json(ds_json, defer_conversion=True)
+            for elem, deferred_elem in zip(ds, deferred):
+                assert elem.private_creator == deferred_elem.private_creator
+
+    def test_conversion_on_access(self):
+        """Test values are only converted when accessed."""
+        calls = []
+
+        def handler(value):
+            calls.append(value)
+            return b"xyzzy"
+
+        ds_json = {
+            "00091002": {"vr": "OB", "BulkDataURI": "https://a.dummy.url"},
+            "00100010": {"vr": "PN", "Value": [{"Alphabetic": "Jane^Doe"}]},
+            "00082128": {"vr": "IS", "Value": ["Invalid"]},
+        }
+        ds = Dataset.from_json(ds_json, handler, defer_conversion=True)
+        assert [] == calls
+        assert 3 == len(ds)
+        assert "PatientName" in ds
+
+        assert "Jane^Doe" == ds.PatientName
+        assert isinstance(ds.PatientName, PersonName)
+        assert [] == calls
+        assert b"xyzzy" == ds[0x00091002].value
+        assert ["https://a.dummy.url"] == calls
+        assert b"xyzzy" == ds[0x00091002].value
+        assert 1 == len(calls)
+
+        with pytest.raises(ValueError, match="invalid literal for int"):
+            ds[0x00082128].value
+
+    def test_sequence(self):
+        """Test sequence items are also deferred."""
+        ds_json = {
+            "300A00B0": {
+                "vr": "SQ",
+                "Value": [
+                    {
+                        "300A00B2": {"vr": "SH", "Value": ["unit001"]},
+                        "300A00B4": {"vr": "DS", "Value": [1000.0]},
+                    },
+                    None,
+                ],
+            }
+        }
+        ds = Dataset.from_json(ds_json, defer_conversion=True)
+        seq = ds.BeamSequence
+        assert 2 == len(seq)
+        assert "unit001" == seq[0].TreatmentMachineName
+        assert 1000.0 == seq[0].SourceAxisDistance
+        assert 0 == len(seq[1])
+        assert ds == Dataset.from_json(ds_json)
+
+    def test_set_value_before_access(self):
+        """Test setting the value discards the JSON value."""
+        ds_json = {"00100020": {"vr": "LO", "Value": ["12345"]}}
+        ds = Dataset.from_json(ds_json, defer_conversion=True)
+        ds.PatientID = "54321"
+        assert "54321" == ds.PatientID
+        assert "_json" not in ds["PatientID"].__dict__
+
+        ds = Dataset.from_json(ds_json, defer_conversion=True)
+        ds["PatientID"].value = "67890"
+        assert "67890" == ds.PatientID
+
+    def test_copy(self):
+        """Test copying deferred datasets."""
+        ds_json = {"00100020": {"vr": "LO", "Value": ["12345"]}}
+        ds = Dataset.from_json(ds_json, defer_conversion=True)
+        assert not ds["PatientID"].is_buffered
+        ds_copy = copy.deepcopy(ds)
+        assert "12345" == ds_copy.PatientID
+        assert "12345" == ds.PatientID
+
+    def test_un_not_deferred(self):
+        """Test UN elements are converted immediately as the VR may change."""
+        ds_json = {"00185100": {"vr": "UN", "InlineBinary": "SEZTIA=="}}
+        ds = Dataset.from_json(ds_json, defer_conversion=True)
+        assert "CS" == ds["PatientPosition"].VR
+        assert "HFS" == ds.PatientPosition
+
+
+class TestBulkDataBatch:
+    """Tests for retrieving bulk data in batches"""
+
+    ds_json = {
+        "00091002": {"vr": "OB", "BulkDataURI": "https://a.dummy.url/1"},
+        "00091003": {"vr": "OB", "BulkDataURI": ["https://a.dummy.url/2"]},
+        "00091004": {"vr": "OB", "InlineBinary": "QmluYXJ5Q29udGVudA=="},
+        "003A0200": {
+            "vr": "SQ",
+            "Value": [
+                {"54001010": {"vr": "OW", "BulkDataURI": "https://a.dummy.url/3"}},
+                {"54001010": {"vr": "OW", "BulkDataURI": "https://a.dummy.url/3"}},
+                None,
+            ],
+        },
+    }
+
+    def test_batch_handler(self):
+        """Test the batch handler is called once for all the URIs."""
+        calls = []
+
+        def batch_handler(uris):
+            calls.append(uris)
+            return [uri[2][-1].encode() * 2 for uri in uris]
+
+        ds = Dataset.from_json(self.ds_json, bulk_data_uri_batch_handler=batch_handler)
+        assert [
+            [
+                ("00091002", "OB", "https://a.dummy.url/1"),
+                ("00091003", "OB", "https://a.dummy.url/2"),
+                ("54001010", "OW", "https://a.dummy.url/3"),
+            ]
+        ] == calls
+        assert b"11" == ds[0x00091002].value
+        assert b"22" == ds[0x00091003].value
+        assert b"BinaryContent" == ds[0x00091004].value
+        seq = ds[0x003A0200].value
+        assert b"33" == seq[0][0x54001010].value
+        assert b"33" == seq[1][0x54001010].value
+
+    def test_batch_handler_no_uris(self):
+        """Test the batch handler isn't called if there are no URIs."""
+
+        def batch_handler(uris):
+            raise RuntimeError("called")
+
+        ds_json = {"00100020": {"vr": "LO", "Value": ["12345"]}}
+        ds = Dataset.from_json(ds_json, bulk_data_uri_batch_handler=batch_handler)
+        assert "12345" == ds.PatientID
+
+    def test_batch_handler_deferred(self):
+        """Test the batch handler is called on access when deferred."""
+        calls = []
+
+        def batch_handler(uris):
+            calls.append(uris)
+            return [b"xyzzy"] * len(uris)
+
+        ds = Dataset.from_json(
+            self.ds_json,
+            bulk_data_uri_batch_handler=batch_handler,
+            defer_conversion=True,
+        )
+        assert [] == calls
+        assert b"xyzzy" == ds[0x00091003].value
+        assert [[("00091003", "OB", "https://a.dummy.url/2")]] == calls
+        assert b"xyzzy" == ds[0x003A0200].value[0][0x54001010].value
+        assert 2 == len(calls)
+
+    def test_batch_handler_invalid(self):
+        """Test invalid batch handler usage raises."""
+        msg = "Only one of 'bulk_data_uri_handler' and 'bulk_data_uri_batch_handler'"
+        with pytest.raises(ValueError, match=msg):
+            Dataset.from_json(
+                self.ds_json,
+                lambda uri: b"",
+                bulk_data_uri_batch_handler=lambda uris: [],
+            )
+
+        msg = (
+            "The bulk data batch handler returned 0 values for 3 'BulkDataURI' "
+            "elements"
+        )
+        with pytest.raises(ValueError, match=msg):
+            Dataset.from_json(self.ds_json, bulk_data_uri_batch_handler=lambda x: [])
+
+    def test_concurrent_handler(self):
+        """Test retrieving the values using a thread pool."""
+
+        def handler(tag, vr, uri):
+            return f"{tag}{uri[-1]}".encode()
+
+        batch = jsonrep.concurrent_bulk_data_handler(handler, max_workers=2)
+        ds = Dataset.from_json(self.ds_json, bulk_data_uri_batch_handler=batch)
+        assert b"000910021" == ds[0x00091002].value
+        assert b"540010103" == ds[0x003A0200].value[1][0x54001010].value
+
+    def test_concurrent_async_handler(self):
+        """Test retrieving the values using a coroutine function."""
+        active = []
+        peak = []
+
+        async def handler(uri):
+            active.append(uri)
+            peak.append(len(active))
+            await asyncio.sleep(0.01)
+            active.remove(uri)
+            return uri[-1].encode()
+
+        batch = jsonrep.concurrent_bulk_data_handler(handler)
+        ds = Dataset.from_json(self.ds_json, bulk_data_uri_batch_handler=batch)
+        assert b"1" == ds[0x00091002].value
+        assert b"3" == ds[0x003A0200].value[0][0x54001010].value
+        assert 3 == max(peak)
+
+        peak.clear()
+        batch = jsonrep.concurrent_bulk_data_handler(handler, max_workers=1)
+        ds = Dataset.from_json(self.ds_json, bulk_data_uri_batch_handler=batch)
+        assert b"2" == ds[0x00091003].value
+        assert 1 == max(peak)